@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Analytics aggregation benchmark.
+
+Compares, on synthetic project issues that are already downloaded and decoded:
+- the previous AnalyticsManager loops: datetime.strptime on every timestamp,
+  Counters over nested dicts, two full sorts for the median and p90, and a
+  status distribution that rescans every issue for every time bucket
+- the columnar pipeline in mcp_atlassian.issue_frame: one flattening pass,
+  vectorized timestamp parsing and grouped pandas/numpy aggregations
+
+The workload is what get_project_metrics and a daily-bucketed
+generate_trend_report compute for one project. Logged time is aggregated by
+the worklog store (mcp_atlassian.worklog_store) and is not part of it.
+
+Usage:
+    python benchmarks/analytics_benchmark.py [--issues 20000] [--days 30] [--runs 3] [--json results.json]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from mcp_atlassian.issue_frame import (  # noqa: E402
+    bucket_counts, format_dates, issues_to_frame, rank_percentiles, resolution_days,
+    status_timeline, value_counts
+)
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+STATUSES = [("Open", "new"), ("In Progress", "indeterminate"), ("In Review", "indeterminate"), ("Done", "done")]
+
+
+def timestamp(moment):
+    """Format a datetime the way Jira does."""
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}+0000"
+
+
+def build_issues(count, days, seed=7):
+    """Generate issues created over the last year, some resolved."""
+    rng = random.Random(seed)
+    now = datetime.datetime.now()
+    issues = []
+    for n in range(count):
+        created = now - datetime.timedelta(days=rng.random() * 365)
+        resolved = created + datetime.timedelta(days=rng.expovariate(1 / 12)) if rng.random() < 0.7 else None
+        if resolved and resolved > now:
+            resolved = None
+        status = STATUSES[3] if resolved else STATUSES[rng.randrange(3)]
+        issues.append({"id": str(n), "key": f"OPS-{n}", "fields": {
+            "issuetype": {"name": rng.choice(["Bug", "Task", "Story", "Sub-task"])},
+            "status": {"name": status[0], "statusCategory": {"key": status[1]}},
+            "priority": {"name": rng.choice(["Highest", "High", "Medium", "Low"])},
+            "assignee": {"displayName": f"User {rng.randrange(40)}"},
+            "created": timestamp(created),
+            "resolutiondate": timestamp(resolved) if resolved else None,
+            "timetracking": {"originalEstimateSeconds": rng.choice([0, 3600, 7200]),
+                             "timeSpentSeconds": rng.choice([0, 1800, 3600, 5400])},
+        }})
+    return issues, [now - datetime.timedelta(days=days - i) for i in range(days + 1)]
+
+
+def legacy_report(issues, buckets):
+    """The previous per-issue loops."""
+    issue_types = Counter(i["fields"].get("issuetype", {}).get("name", "Unknown") for i in issues)
+    statuses = Counter(i["fields"].get("status", {}).get("name", "Unknown") for i in issues)
+    resolution_times = []
+    for issue in issues:
+        created, resolved = issue["fields"].get("created"), issue["fields"].get("resolutiondate")
+        if created and resolved:
+            delta = (datetime.datetime.strptime(resolved, TIMESTAMP_FORMAT)
+                     - datetime.datetime.strptime(created, TIMESTAMP_FORMAT))
+            resolution_times.append(delta.total_seconds() / 86400)
+    median = sorted(resolution_times)[len(resolution_times) // 2]
+    p90 = sorted(resolution_times)[int(len(resolution_times) * 0.9)]
+
+    for issue in issues:
+        fields = issue["fields"]
+        fields["created_date"] = datetime.datetime.strptime(fields["created"], TIMESTAMP_FORMAT).replace(tzinfo=None)
+        if fields.get("resolutiondate"):
+            fields["resolved_date"] = datetime.datetime.strptime(
+                fields["resolutiondate"], TIMESTAMP_FORMAT).replace(tzinfo=None)
+    status_counts = []
+    for bucket in buckets:
+        counts = {}
+        for issue in issues:
+            fields = issue["fields"]
+            if fields["created_date"] <= bucket:
+                resolved = fields.get("resolved_date")
+                status = "Done" if resolved and resolved <= bucket else fields["status"]["name"]
+                counts[status] = counts.get(status, 0) + 1
+        status_counts.append(counts)
+    return issue_types, statuses, median, p90, status_counts
+
+
+def columnar_report(issues, buckets):
+    """The columnar pipeline."""
+    frame = issues_to_frame(issues)
+
+    issue_types, statuses = value_counts(frame["issue_type"]), value_counts(frame["status"])
+    median, p90 = rank_percentiles(resolution_days(frame).dropna().to_numpy(), [0.5, 0.9])
+
+    created = bucket_counts(format_dates(frame["created"], "%Y-%m-%d"), [])
+    status_counts = status_timeline(frame, buckets)
+    return issue_types, statuses, median, p90, created, status_counts
+
+
+def time_report(report, issues, buckets, runs):
+    """Median wall time of a report over several runs (each on a fresh copy of the issues)."""
+    samples = []
+    for _ in range(runs):
+        copy = json.loads(json.dumps(issues))
+        start = time.perf_counter()
+        result = report(copy, buckets)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, default=20000, help="Number of synthetic issues")
+    parser.add_argument("--days", type=int, default=30, help="Daily buckets in the status distribution")
+    parser.add_argument("--runs", type=int, default=3, help="Runs to time (median is reported)")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    issues, buckets = build_issues(args.issues, args.days)
+    legacy_seconds, legacy = time_report(legacy_report, issues, buckets, args.runs)
+    columnar_seconds, columnar = time_report(columnar_report, issues, buckets, args.runs)
+
+    # Both paths must agree before their timings mean anything
+    assert np.isclose(legacy[2], columnar[2]) and np.isclose(legacy[3], columnar[3])
+    assert legacy[-1] == columnar[-1]
+
+    print(f"Issues:                 {len(issues):8d} ({len(buckets)} buckets)")
+    print(f"Previous loops:         {legacy_seconds * 1000:8.1f} ms (median of {args.runs})")
+    print(f"Columnar pipeline:      {columnar_seconds * 1000:8.1f} ms (median of {args.runs})")
+    print(f"Ratio:                  {legacy_seconds / columnar_seconds:8.2f}x")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({
+                "issues": len(issues),
+                "buckets": len(buckets),
+                "runs": args.runs,
+                "legacy_seconds": legacy_seconds,
+                "columnar_seconds": columnar_seconds,
+            }, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
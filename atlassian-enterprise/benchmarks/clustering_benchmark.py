@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Issue clustering benchmark.
+
+Compares, on synthetic clustering features of resolved issues:
+- the exact path detect_issue_patterns uses for small projects: StandardScaler
+  and KMeans with 10 restarts for every candidate cluster count
+- the scalable path in mcp_atlassian.issue_clustering: a streaming scaler,
+  MiniBatchKMeans on a reservoir sample and batched nearest-centroid scoring
+- a rerun of the scalable path after 1% of the issues changed, which reuses
+  the persisted model and only scores the changed issues
+
+The exact path is skipped above --exact-limit issues, where it takes minutes.
+
+Usage:
+    python benchmarks/clustering_benchmark.py [--sizes 1000 10000 100000] [--exact-limit 20000] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.metrics import adjusted_rand_score
+from sklearn.preprocessing import StandardScaler
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from mcp_atlassian.issue_clustering import ScalableClustering  # noqa: E402
+
+FEATURES = ['comment_count', 'word_count', 'priority', 'cycle_time',
+            'original_estimate', 'time_spent', 'label_count', 'component_count']
+
+# Typical issue profiles: quick fixes, routine work and long discussed features
+PROFILES = np.array([
+    [1, 40, 3, 1, 2, 2, 1, 1],
+    [4, 150, 3, 8, 8, 10, 2, 1],
+    [15, 600, 2, 40, 24, 60, 4, 3],
+])
+
+
+def build_features(count, seed=7):
+    """Generate clustering features of resolved issues drawn from a few profiles."""
+    rng = np.random.default_rng(seed)
+    profiles = PROFILES[rng.integers(0, len(PROFILES), count)]
+    values = np.abs(profiles * rng.lognormal(0, 0.35, profiles.shape))
+    features = pd.DataFrame(values, columns=FEATURES)
+    features["priority"] = profiles[:, 2]
+    return pd.Series([f"OPS-{n}" for n in range(count)]), features
+
+
+def exact_clustering(features):
+    """The exact path: elbow over KMeans(n_init=10), then a final fit."""
+    scaled = StandardScaler().fit_transform(features)
+    wcss = [
+        KMeans(n_clusters=k, init='k-means++', max_iter=300, n_init=10, random_state=42).fit(scaled).inertia_
+        for k in range(1, min(6, len(features) // 5) + 1)
+    ]
+    drops = [wcss[i] - wcss[i + 1] for i in range(len(wcss) - 1)]
+    optimal_k = drops.index(max(drops)) + 2 if drops else 2
+    return KMeans(n_clusters=optimal_k, init='k-means++', max_iter=300, n_init=10, random_state=42).fit(scaled).labels_
+
+
+def timed(func, *args):
+    """Wall time and result of one call."""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run_size(count, exact_limit):
+    """Time every path for one project size."""
+    keys, features = build_features(count)
+    result = {"issues": count}
+
+    with tempfile.TemporaryDirectory() as models_dir:
+        clustering = ScalableClustering(models_dir)
+        result["scalable_seconds"], (labels, run) = timed(clustering.cluster, "OPS", keys, features)
+        result["num_clusters"] = run["num_clusters"]
+
+        changed = features.copy()
+        rows = np.random.default_rng(1).choice(count, max(1, count // 100), replace=False)
+        changed.loc[rows, "comment_count"] += 1
+        result["rerun_seconds"], (_, rerun) = timed(clustering.cluster, "OPS", keys, changed)
+        result["rerun_scored_issues"] = rerun["scored_issues"]
+
+    if count <= exact_limit:
+        result["exact_seconds"], exact_labels = timed(exact_clustering, features)
+        result["agreement"] = adjusted_rand_score(exact_labels, labels)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Project sizes in issues")
+    parser.add_argument("--exact-limit", type=int, default=20000, help="Largest size to run the exact path on")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results = [run_size(count, args.exact_limit) for count in args.sizes]
+
+    print(f"{'Issues':>8} {'Clusters':>8} {'Exact':>10} {'Scalable':>10} {'Rerun':>10} {'Rescored':>9} {'ARI':>6}")
+    for r in results:
+        exact = f"{r['exact_seconds'] * 1000:8.0f}ms" if "exact_seconds" in r else f"{'skipped':>10}"
+        agreement = f"{r['agreement']:6.3f}" if "agreement" in r else f"{'-':>6}"
+        print(f"{r['issues']:8d} {r['num_clusters']:8d} {exact} {r['scalable_seconds'] * 1000:8.0f}ms "
+              f"{r['rerun_seconds'] * 1000:8.0f}ms {r['rerun_scored_issues']:9d} {agreement}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
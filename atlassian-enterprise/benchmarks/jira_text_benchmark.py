@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Jira text cleaning benchmark.
+
+Compares, on a bulk export of issue descriptions and comments:
+- the previous TextPreprocessor.clean_jira_text path: mentions found with
+  re.findall and each replaced with str.replace, then every smart link
+  replaced with str.replace (one full copy of the text per link)
+- the single-pass tokenizer in mcp_atlassian.jira_markup, which also converts
+  the wiki markup (headings, code and noformat blocks, tables, links) that the
+  previous path left untouched
+
+Usage:
+    python benchmarks/jira_text_benchmark.py [--issues 10000] [--runs 3] [--file issues.json] [--json results.json]
+
+By default synthetic issue bodies are generated from templates modelled on
+real tickets: short bug reports, incident write-ups, and release notes that
+link hundreds of issues (where the previous path is quadratic). Pass --file with a JSON list of issues
+(a Jira search response or a list of issue objects) to benchmark real
+descriptions and comments instead; ADF (API v3) bodies are skipped.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from mcp_atlassian.jira_markup import MENTION_PATTERN, jira_markup_to_markdown  # noqa: E402
+
+BASE_URL = "https://example.atlassian.net"
+
+SHORT_TEMPLATE = """Customer reports that *checkout* fails intermittently. Assigned to [~accountid:557058:{n:08d}].
+See [OPS-{n} Checkout errors|{base}/browse/OPS-{n}?focusedCommentId=1|smart-link] for the original report."""
+
+INCIDENT_TEMPLATE = """h2. Summary
+Checkout latency for service_{n} spiked to 4s after the 14:05 deploy. [~accountid:557058:{n:08d}] is incident
+commander, [~accountid:557058:{m:08d}] is on comms.
+
+h3. Timeline
+# 14:05 deploy of build {n}
+# 14:12 alert fired, see [dashboard|https://grafana.example.com/d/checkout?var-service=service_{n}]
+## paged [~accountid:557058:{n:08d}]
+# 14:40 rolled back
+
+h3. Impact
+||Region||Error rate||Requests||
+|eu-west-1|4.2%|1,204,000|
+|us-east-1|1.1%|3,880,000|
+|ap-south-1|0.3%|402,000|
+
+h3. Logs
+{{code:java}}
+java.lang.IllegalStateException: pool exhausted (max=50)
+    at com.example.checkout.Pool.acquire(Pool.java:{n})
+    at com.example.checkout.Service.handle(Service.java:88)
+{{code}}
+
+{{noformat}}
+2024-05-0{d} 14:12:01 WARN  checkout-{n} p99=4012ms
+2024-05-0{d} 14:12:02 ERROR checkout-{n} pool exhausted
+{{noformat}}
+
+h3. Follow-ups
+* [OPS-{n} Raise pool size|{base}/browse/OPS-{n}|smart-link]
+* [Runbook|{base}/wiki/spaces/OPS/pages/{n}/OPS-{n}+Checkout+Runbook?atlOrigin=x|smart-link]
+* {{color:red}}Do not redeploy{{color}} until [~accountid:557058:{m:08d}] signs off
+* -Increase timeout- (rejected)
+
+{{quote}}The pool size was never load tested. -- postmortem{{quote}}
+"""
+
+RELEASE_NOTE_LINE = ("* [REL-{i} {title}|{base}/browse/REL-{i}?atlOrigin=release|smart-link] "
+                     "by [~accountid:557058:{a:08d}], reviewed by [~accountid:557058:{b:08d}]")
+
+
+def build_release_notes(n, links=400):
+    """A long release-notes description listing hundreds of linked issues."""
+    lines = [f"h1. Release {n}", "", "h2. Included issues"]
+    lines += [
+        RELEASE_NOTE_LINE.format(i=n * links + i, title="Fix checkout_timeout handling", a=i % 50, b=(i + 7) % 50,
+                                 base=BASE_URL)
+        for i in range(links)
+    ]
+    return "\n".join(lines)
+
+
+def build_issue_bodies(count):
+    """Generate issue descriptions: mostly short ones, some long incident write-ups and release notes."""
+    bodies = []
+    for n in range(count):
+        if n % 200 == 0:
+            bodies.append(build_release_notes(n))
+            continue
+        template = INCIDENT_TEMPLATE if n % 4 == 0 else SHORT_TEMPLATE
+        # The double braces above keep the wiki macros out of str.format
+        bodies.append(template.format(n=n, m=n + 1, d=n % 9 + 1, base=BASE_URL))
+    return bodies
+
+
+def load_issue_bodies(path):
+    """Load the descriptions and comments of exported issues."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    issues = data.get("issues", []) if isinstance(data, dict) else data
+
+    bodies = []
+    for issue in issues:
+        fields = issue.get("fields", {})
+        texts = [fields.get("description")]
+        texts += [comment.get("body") for comment in (fields.get("comment") or {}).get("comments", [])]
+        bodies.extend(text for text in texts if isinstance(text, str) and text)
+    return bodies
+
+
+def legacy_clean(text, display_names):
+    """The previous clean_jira_text path (mentions and smart links only)."""
+    for account_id in dict.fromkeys(re.findall(r"\[~accountid:(.*?)\]", text)):
+        display_name = display_names.get(account_id)
+        text = text.replace(f"[~accountid:{account_id}]", f"@{display_name}" if display_name else f"User:{account_id}")
+
+    for match in re.finditer(r"\[(.*?)\|(.*?)\|smart-link\]", text):
+        full_match, link_text, link_url = match.group(0), match.group(1), match.group(2)
+        issue_key_match = re.search(r"browse/([A-Z]+-\d+)", link_url)
+        confluence_match = re.search(r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)", link_url)
+        if issue_key_match:
+            issue_key = issue_key_match.group(1)
+            text = text.replace(full_match, f"[{issue_key}]({BASE_URL}/browse/{issue_key})")
+        elif confluence_match:
+            title = re.sub(r"^[A-Z]+-\d+\s+", "", confluence_match.group(1).replace("+", " "))
+            text = text.replace(full_match, f"[{title}]({link_url})")
+        else:
+            text = text.replace(full_match, f"[{link_text}]({link_url.split('?')[0]})")
+
+    return text.strip()
+
+
+def single_pass_clean(text, display_names):
+    """The single-pass tokenizer."""
+    return jira_markup_to_markdown(text, base_url=BASE_URL, user_name=display_names.get).strip()
+
+
+def time_cleaning(clean, bodies, display_names, runs):
+    """Median wall time of cleaning every body over several runs."""
+    samples = []
+    output_size = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        output_size = sum(len(clean(body, display_names)) for body in bodies)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), output_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, default=10000, help="Number of synthetic issue bodies")
+    parser.add_argument("--runs", type=int, default=3, help="Runs to time (median is reported)")
+    parser.add_argument("--file", help="Benchmark the issues in this JSON export instead of synthetic ones")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    bodies = load_issue_bodies(args.file) if args.file else build_issue_bodies(args.issues)
+    if not bodies:
+        parser.error("no wiki-markup bodies to benchmark")
+
+    # Mentions are resolved in bulk before cleaning in both paths
+    display_names = {
+        account_id: f"User {i}"
+        for i, account_id in enumerate(dict.fromkeys(a for body in bodies for a in MENTION_PATTERN.findall(body)))
+    }
+
+    total_mb = sum(len(body.encode("utf-8")) for body in bodies) / (1024 * 1024)
+    legacy_seconds, legacy_size = time_cleaning(legacy_clean, bodies, display_names, args.runs)
+    single_pass_seconds, single_pass_size = time_cleaning(single_pass_clean, bodies, display_names, args.runs)
+
+    print(f"Bodies:                 {len(bodies):8d} ({total_mb:.2f} MB)")
+    print(f"Previous regex path:    {legacy_seconds * 1000:8.1f} ms "
+          f"({len(bodies) / legacy_seconds:,.0f} bodies/s, median of {args.runs})")
+    print(f"Single-pass tokenizer:  {single_pass_seconds * 1000:8.1f} ms "
+          f"({len(bodies) / single_pass_seconds:,.0f} bodies/s, median of {args.runs})")
+    print(f"Ratio:                  {legacy_seconds / single_pass_seconds:8.2f}x")
+    print(f"Output size:            {legacy_size / 1024:8.0f} KB vs {single_pass_size / 1024:.0f} KB")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({
+                "bodies": len(bodies),
+                "total_mb": total_mb,
+                "runs": args.runs,
+                "legacy_seconds": legacy_seconds,
+                "single_pass_seconds": single_pass_seconds,
+            }, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
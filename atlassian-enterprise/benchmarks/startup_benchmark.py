@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the MCP Atlassian server.
+
+Measures, in fresh interpreters:
+- wall time to import mcp_atlassian.server
+- wall time until the first list_tools response
+- per-module import time (from ``python -X importtime``)
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--top 25] [--json results.json]
+
+Dummy credentials are set for every service so that all tool families are
+registered; no network requests are made.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+
+# Credentials for every service, so all tool families are listed
+BENCHMARK_ENV = {
+    "CONFLUENCE_URL": "https://example.atlassian.net/wiki",
+    "CONFLUENCE_USERNAME": "benchmark@example.com",
+    "CONFLUENCE_API_TOKEN": "benchmark-token",
+    "JIRA_URL": "https://example.atlassian.net",
+    "JIRA_USERNAME": "benchmark@example.com",
+    "JIRA_API_TOKEN": "benchmark-token",
+    "BITBUCKET_URL": "https://api.bitbucket.org/2.0",
+    "BITBUCKET_WORKSPACE": "benchmark",
+    "BITBUCKET_USERNAME": "benchmark",
+    "BITBUCKET_APP_PASSWORD": "benchmark-password",
+}
+
+# Runs in the child interpreter and prints timings as JSON
+TIMING_SCRIPT = """
+import asyncio, json, time
+start = time.perf_counter()
+import mcp_atlassian.server as server
+imported = time.perf_counter()
+tools = asyncio.run(server.list_tools())
+listed = time.perf_counter()
+print(json.dumps({
+    "import_seconds": imported - start,
+    "first_list_tools_seconds": listed - start,
+    "tool_count": len(tools),
+}))
+"""
+
+
+def _child_env():
+    """Environment for the child interpreters."""
+    env = dict(os.environ)
+    env.update(BENCHMARK_ENV)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_startup(runs):
+    """Time server import and the first list_tools call over several runs."""
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMING_SCRIPT],
+            env=_child_env(), cwd=SRC_DIR, capture_output=True, text=True, check=True
+        )
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    return {
+        "runs": runs,
+        "tool_count": samples[-1]["tool_count"],
+        "import_seconds": statistics.median(s["import_seconds"] for s in samples),
+        "first_list_tools_seconds": statistics.median(s["first_list_tools_seconds"] for s in samples),
+    }
+
+
+def measure_module_imports():
+    """
+    Get per-module import times for mcp_atlassian.server.
+
+    Returns:
+        List of {"module", "self_ms", "cumulative_ms"} sorted by cumulative time
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mcp_atlassian.server"],
+        env=_child_env(), cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = (part.strip() for part in line[len("import time:"):].split("|"))
+        modules.append({
+            "module": module,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+
+    modules.sort(key=lambda m: m["cumulative_ms"], reverse=True)
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time (median is reported)")
+    parser.add_argument("--top", type=int, default=25, help="Number of slowest modules to list")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    startup = measure_startup(args.runs)
+    modules = measure_module_imports()
+
+    print(f"Server import:        {startup['import_seconds'] * 1000:8.1f} ms (median of {args.runs})")
+    print(f"First list_tools:     {startup['first_list_tools_seconds'] * 1000:8.1f} ms ({startup['tool_count']} tools)")
+    print()
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for module in modules[:args.top]:
+        print(f"{module['cumulative_ms']:14.1f} {module['self_ms']:9.1f}  {module['module']}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"startup": startup, "modules": modules}, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Storage-format to markdown conversion benchmark.
+
+Compares, on large Confluence pages:
+- the previous path: BeautifulSoup (html.parser) tree, serialized back to a
+  string, then converted by markdownify
+- the single-pass converter in mcp_atlassian.storage_format
+
+Usage:
+    python benchmarks/storage_conversion_benchmark.py [--size-mb 1.5] [--runs 5] [--file page.xml] [--json results.json]
+
+By default a synthetic page is generated with headings, paragraphs, user
+mentions, page links, code macros, info panels and large tables. Pass --file
+to benchmark an exported storage-format body instead.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from markdownify import markdownify as md  # noqa: E402
+
+from mcp_atlassian.storage_format import storage_to_markdown  # noqa: E402
+
+SECTION_TEMPLATE = """
+<h2>Section {n}: service_{n} runbook</h2>
+<p>Owner: <ac:link><ri:user ri:account-id="557058:{n:08d}" /></ac:link>. See
+<ac:link><ri:page ri:content-title="Escalation Policy {n}" /></ac:link> and
+<a href="https://status.example.com/services/{n}">the status page</a> before <strong>restarting</strong>
+anything. <em>Never</em> skip the <code>drain_traffic</code> step.</p>
+<ac:structured-macro ac:name="info"><ac:parameter ac:name="title">Before you start</ac:parameter>
+<ac:rich-text-body><p>Check the on-call channel.</p><ul><li>Confirm the alert</li><li>Page the owner
+<ul><li>Use the escalation tool</li></ul></li></ul></ac:rich-text-body></ac:structured-macro>
+<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">bash</ac:parameter>
+<ac:plain-text-body><![CDATA[kubectl -n prod-{n} rollout restart deployment/service-{n}
+kubectl -n prod-{n} rollout status deployment/service-{n} --timeout=300s]]></ac:plain-text-body>
+</ac:structured-macro>
+<table><tbody>
+<tr><th>Host</th><th>Region</th><th>CPU</th><th>Memory</th><th>Status</th><th>Notes</th></tr>
+{rows}
+</tbody></table>
+"""
+
+ROW_TEMPLATE = (
+    "<tr><td>host-{n}-{r}.prod</td><td>eu-west-{r}</td><td>{cpu}%</td><td>{mem} GiB</td>"
+    "<td><ac:structured-macro ac:name=\"status\"><ac:parameter ac:name=\"title\">OK</ac:parameter>"
+    "</ac:structured-macro></td><td><p>Last checked by <strong>automation</strong></p></td></tr>"
+)
+
+
+def build_page(size_bytes, rows_per_table=40):
+    """Generate a storage-format page of at least size_bytes."""
+    sections = []
+    size = 0
+    n = 0
+    while size < size_bytes:
+        rows = "\n".join(
+            ROW_TEMPLATE.format(n=n, r=r, cpu=(n * 7 + r) % 100, mem=(r % 64) + 1)
+            for r in range(rows_per_table)
+        )
+        section = SECTION_TEMPLATE.format(n=n, rows=rows)
+        sections.append(section)
+        size += len(section.encode("utf-8"))
+        n += 1
+    return "".join(sections)
+
+
+def legacy_convert(content):
+    """The previous conversion path: BeautifulSoup tree, serialized, then markdownify."""
+    soup = BeautifulSoup(content, "html.parser")
+    return md(str(soup))
+
+
+def single_pass_convert(content):
+    """The single-pass storage-format converter."""
+    return storage_to_markdown(content, user_name=lambda account_id: "Test User",
+                               base_url="https://example.atlassian.net/wiki", space_key="OPS")
+
+
+def time_conversion(convert, content, runs):
+    """Median wall time of a conversion over several runs."""
+    samples = []
+    output = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = convert(content)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=1.5, help="Size of the synthetic page in MB")
+    parser.add_argument("--runs", type=int, default=5, help="Conversions to time (median is reported)")
+    parser.add_argument("--file", help="Benchmark this storage-format file instead of a synthetic page")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            content = f.read()
+    else:
+        content = build_page(int(args.size_mb * 1024 * 1024))
+
+    page_mb = len(content.encode("utf-8")) / (1024 * 1024)
+    legacy_seconds, legacy_output = time_conversion(legacy_convert, content, args.runs)
+    single_pass_seconds, single_pass_output = time_conversion(single_pass_convert, content, args.runs)
+
+    print(f"Page size:              {page_mb:8.2f} MB")
+    print(f"BeautifulSoup+markdownify: {legacy_seconds * 1000:8.1f} ms (median of {args.runs})")
+    print(f"Single-pass converter:  {single_pass_seconds * 1000:8.1f} ms (median of {args.runs})")
+    print(f"Speedup:                {legacy_seconds / single_pass_seconds:8.1f}x")
+    print(f"Output size:            {len(legacy_output) / 1024:8.0f} KB vs {len(single_pass_output) / 1024:.0f} KB")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({
+                "page_mb": page_mb,
+                "runs": args.runs,
+                "legacy_seconds": legacy_seconds,
+                "single_pass_seconds": single_pass_seconds,
+            }, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,6 @@
 import asyncio
 
 from . import server
-from .confluence import ConfluenceFetcher
-from .jira import JiraFetcher
 
 # We'll comment out the imports that may be causing issues
 # but keep them here for future reference
@@ -17,6 +15,17 @@ from .jira import JiraFetcher
 __version__ = "0.3.0"
 
 
+def __getattr__(name):
+    """Import the fetcher classes on first access to keep package import cheap."""
+    if name == "ConfluenceFetcher":
+        from .confluence import ConfluenceFetcher
+        return ConfluenceFetcher
+    if name == "JiraFetcher":
+        from .jira import JiraFetcher
+        return JiraFetcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main():
     """Main entry point for the package."""
     asyncio.run(server.main())
@@ -0,0 +1,361 @@
+"""
+Atlassian Document Format (ADF) rendering for MCP Atlassian.
+
+Jira REST API v3 returns rich text fields (issue descriptions, comment bodies,
+environment, custom text areas) as ADF JSON trees instead of strings. This
+module renders those trees to markdown directly, without asking Jira for
+server-side rendered HTML and converting that a second time.
+
+Rendering walks the tree with an explicit stack rather than recursion, so
+deeply nested documents cannot exhaust the interpreter's recursion limit.
+"""
+
+import re
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.adf")
+
+# Nodes whose children are inline content joined without separators
+INLINE_CONTAINERS = frozenset(["paragraph", "heading", "taskItem", "decisionItem", "caption"])
+
+# Nodes whose text is emitted verbatim
+LITERAL_NODES = frozenset(["codeBlock"])
+
+# Nodes that carry no readable content
+SKIPPED_NODES = frozenset(["placeholder", "extension", "inlineExtension", "unsupportedBlock", "unsupportedInline"])
+
+# Marks applied to text, innermost first
+MARK_ORDER = ("code", "strong", "em", "strike", "link")
+MARK_MARKERS = {"strong": "**", "em": "*", "strike": "~~"}
+
+# Labels for panel types
+PANEL_LABELS = {
+    "info": "Info",
+    "note": "Note",
+    "warning": "Warning",
+    "success": "Success",
+    "error": "Error",
+    "tip": "Tip",
+}
+
+ESCAPE_PATTERN = re.compile(r"([*_])")
+ISSUE_KEY_PATTERN = re.compile(r"/browse/([A-Z][A-Z0-9_]+-\d+)")
+
+
+def is_adf(value: Any) -> bool:
+    """Check whether a field value is an ADF document."""
+    return isinstance(value, dict) and value.get("type") == "doc"
+
+
+class _Frame:
+    """A node whose children are being rendered."""
+
+    __slots__ = ("node", "parent", "index", "parts", "literal", "data")
+
+    def __init__(self, node: Dict, parent: Optional["_Frame"]):
+        self.node = node
+        self.parent = parent
+        self.index = 0
+        self.parts: List[str] = []
+        self.data: Dict = {}
+        self.literal = node.get("type") in LITERAL_NODES or (parent is not None and parent.literal)
+
+
+class AdfRenderer:
+    """Iterative ADF to markdown renderer."""
+
+    def __init__(self, user_name: Optional[Callable[[str], Optional[str]]] = None):
+        """
+        Initialize the AdfRenderer.
+
+        Args:
+            user_name: Function returning the display name of an account ID,
+                used for mentions that carry no text of their own
+        """
+        self.user_name = user_name
+
+    def render(self, document: Dict) -> str:
+        """
+        Render an ADF document (or any ADF node) to markdown.
+
+        Args:
+            document: ADF node, usually of type 'doc'
+
+        Returns:
+            The rendered markdown
+        """
+        if not isinstance(document, dict):
+            return ""
+
+        stack = [_Frame(document, None)]
+        result = ""
+        while stack:
+            frame = stack[-1]
+            children = frame.node.get("content") or []
+
+            if frame.index < len(children):
+                child = children[frame.index]
+                frame.index += 1
+                if not isinstance(child, dict) or child.get("type") in SKIPPED_NODES:
+                    continue
+                if child.get("content"):
+                    stack.append(_Frame(child, frame))
+                else:
+                    frame.parts.append(self._render_leaf(child, frame))
+                continue
+
+            stack.pop()
+            rendered = self._render_container(frame)
+            if stack:
+                stack[-1].parts.append(rendered)
+            else:
+                result = rendered
+
+        return result.strip()
+
+    # Leaf nodes
+
+    def _render_leaf(self, node: Dict, parent: _Frame) -> str:
+        node_type = node.get("type")
+        attrs = node.get("attrs") or {}
+
+        if node_type == "text":
+            return self._render_text(node, parent.literal)
+        if node_type == "hardBreak":
+            return "\n" if parent.literal else "  \n"
+        if node_type == "rule":
+            return "---"
+        if node_type == "mention":
+            return self._render_mention(attrs)
+        if node_type == "emoji":
+            return attrs.get("text") or attrs.get("shortName", "")
+        if node_type in ("inlineCard", "blockCard", "embedCard"):
+            return self._render_card(attrs)
+        if node_type == "date":
+            return self._render_date(attrs)
+        if node_type == "status":
+            return f"**[{self._escape(attrs.get('text', ''))}]**" if attrs.get("text") else ""
+        if node_type == "media":
+            return self._render_media(attrs)
+        return ""
+
+    def _render_text(self, node: Dict, literal: bool) -> str:
+        text = node.get("text", "")
+        if not text or literal:
+            return text
+
+        marks = {mark.get("type"): mark.get("attrs") or {} for mark in node.get("marks") or []}
+        if "code" in marks:
+            ticks = "``" if "`" in text else "`"
+            text = f"{ticks}{text}{ticks}"
+        else:
+            text = self._escape(text)
+
+        for mark in MARK_ORDER[1:]:
+            if mark not in marks:
+                continue
+            if mark == "link":
+                href = marks[mark].get("href", "")
+                if href:
+                    text = f"[{text}]({href})"
+            else:
+                text = self._wrap(text, MARK_MARKERS[mark])
+        return text
+
+    def _render_mention(self, attrs: Dict) -> str:
+        text = attrs.get("text", "")
+        if text:
+            return text if text.startswith("@") else f"@{text}"
+
+        account_id = attrs.get("id", "")
+        display_name = self.user_name(account_id) if self.user_name and account_id else None
+        return f"@{display_name}" if display_name else f"@user_{account_id}"
+
+    def _render_card(self, attrs: Dict) -> str:
+        url = attrs.get("url") or (attrs.get("data") or {}).get("url", "")
+        if not url:
+            return ""
+        issue_key = ISSUE_KEY_PATTERN.search(url)
+        return f"[{issue_key.group(1) if issue_key else url}]({url})"
+
+    @staticmethod
+    def _render_date(attrs: Dict) -> str:
+        try:
+            timestamp = int(attrs.get("timestamp")) / 1000
+            return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+        except (TypeError, ValueError):
+            return ""
+
+    def _render_media(self, attrs: Dict) -> str:
+        alt = self._escape(attrs.get("alt", ""))
+        if attrs.get("type") == "external" and attrs.get("url"):
+            return f"![{alt}]({attrs['url']})"
+        return f"[attachment: {alt}]" if alt else "[attachment]"
+
+    # Container nodes
+
+    def _render_container(self, frame: _Frame) -> str:
+        node = frame.node
+        node_type = node.get("type")
+        attrs = node.get("attrs") or {}
+
+        if node_type in INLINE_CONTAINERS:
+            text = "".join(frame.parts).strip()
+            if node_type == "heading" and text:
+                level = min(max(int(attrs.get("level") or 1), 1), 6)
+                return f"{'#' * level} {text}"
+            if node_type == "taskItem":
+                return f"{'- [x]' if attrs.get('state') == 'DONE' else '- [ ]'} {text}"
+            if node_type == "decisionItem":
+                return f"- {text}"
+            return text
+
+        if node_type == "codeBlock":
+            code = "".join(frame.parts)
+            fence = "````" if "```" in code else "```"
+            return f"{fence}{attrs.get('language') or ''}\n{code}\n{fence}"
+        if node_type in ("bulletList", "orderedList"):
+            return self._render_list(frame, attrs)
+        if node_type == "listItem":
+            return self._render_list_item(frame)
+        if node_type in ("taskList", "decisionList"):
+            return "\n".join(part for part in frame.parts if part)
+        if node_type == "blockquote":
+            return self._quote(self._join_blocks(frame.parts))
+        if node_type == "panel":
+            return self._quote(self._join_blocks(frame.parts), PANEL_LABELS.get(attrs.get("panelType"), ""))
+        if node_type in ("expand", "nestedExpand"):
+            title = self._escape(attrs.get("title") or "Details")
+            return self._join_blocks([f"**{title}**"] + frame.parts)
+        if node_type == "table":
+            return self._render_table(frame)
+        if node_type == "tableRow":
+            return self._render_table_row(frame)
+        if node_type in ("tableCell", "tableHeader"):
+            cell = self._join_blocks(frame.parts)
+            return re.sub(r"\s*\n\s*", "<br>", cell).replace("|", "\\|")
+        if node_type in ("mediaSingle", "mediaGroup"):
+            return " ".join(part for part in frame.parts if part)
+        return self._join_blocks(frame.parts)
+
+    def _render_list(self, frame: _Frame, attrs: Dict) -> str:
+        ordered = frame.node.get("type") == "orderedList"
+        start = int(attrs.get("order") or 1)
+        lines = []
+        for i, item in enumerate(part for part in frame.parts if part):
+            marker = f"{start + i}. " if ordered else "- "
+            indent = " " * len(marker)
+            item_lines = item.split("\n")
+            lines.append(marker + item_lines[0])
+            lines.extend(f"{indent}{line}" if line else "" for line in item_lines[1:])
+        return "\n".join(lines)
+
+    def _render_list_item(self, frame: _Frame) -> str:
+        # Keep list items tight: nested lists and paragraphs on consecutive lines
+        return "\n".join(part for part in frame.parts if part)
+
+    def _render_table_row(self, frame: _Frame) -> str:
+        cells = list(frame.parts)
+        if frame.parent is not None and frame.parent.node.get("type") == "table":
+            table = frame.parent
+            if "width" not in table.data:
+                table.data["width"] = max(
+                    len(row.get("content") or []) for row in table.node["content"] if isinstance(row, dict)
+                )
+            cells += [""] * (table.data["width"] - len(cells))
+        return f"| {' | '.join(cells)} |"
+
+    def _render_table(self, frame: _Frame) -> str:
+        rows = [part for part in frame.parts if part]
+        if not rows:
+            return ""
+
+        separator = f"| {' | '.join(['---'] * frame.data.get('width', 1))} |"
+        return "\n".join([rows[0], separator] + rows[1:])
+
+    # Helpers
+
+    @staticmethod
+    def _join_blocks(parts: List[str]) -> str:
+        return "\n\n".join(part.strip("\n") for part in parts if part and part.strip())
+
+    @staticmethod
+    def _quote(text: str, label: str = "") -> str:
+        if label:
+            text = f"**{label}**\n\n{text}" if text else f"**{label}**"
+        return "\n".join(f"> {line}" if line else ">" for line in text.split("\n"))
+
+    @staticmethod
+    def _wrap(text: str, marker: str) -> str:
+        stripped = text.strip()
+        if not stripped:
+            return text
+        leading = text[:len(text) - len(text.lstrip())]
+        trailing = text[len(text.rstrip()):]
+        return f"{leading}{marker}{stripped}{marker}{trailing}"
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        return ESCAPE_PATTERN.sub(r"\\\1", text)
+
+
+def collect_mention_ids(document: Dict) -> List[str]:
+    """
+    Get the account IDs of mentions that carry no display text.
+
+    Args:
+        document: ADF document
+
+    Returns:
+        Account IDs in document order, without duplicates
+    """
+    account_ids = []
+    stack = [document] if isinstance(document, dict) else []
+    while stack:
+        node = stack.pop()
+        if node.get("type") == "mention":
+            attrs = node.get("attrs") or {}
+            if attrs.get("id") and not attrs.get("text"):
+                account_ids.append(attrs["id"])
+        stack.extend(reversed([child for child in node.get("content") or [] if isinstance(child, dict)]))
+    return list(dict.fromkeys(account_ids))
+
+
+def adf_to_markdown(document: Dict, user_name: Optional[Callable[[str], Optional[str]]] = None) -> str:
+    """
+    Render an ADF document to markdown.
+
+    Args:
+        document: ADF document
+        user_name: Function returning the display name of an account ID
+
+    Returns:
+        The rendered markdown
+    """
+    return AdfRenderer(user_name=user_name).render(document)
+
+
+def field_text(value: Any) -> str:
+    """
+    Get the text of a Jira rich text field from either API version.
+
+    REST API v2 returns these fields as wiki-markup strings and v3 as ADF
+    documents; both are returned as strings so that text features can treat
+    them alike.
+
+    Args:
+        value: Field value (string, ADF document or None)
+
+    Returns:
+        The field text
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if is_adf(value):
+        return adf_to_markdown(value)
+    return str(value)
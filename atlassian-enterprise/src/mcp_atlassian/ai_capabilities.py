@@ -12,32 +12,240 @@ import json
 import time
 import logging
 import datetime
+import threading
 from typing import Dict, List, Optional, Any, Callable, Union, Tuple, Set
 from collections import Counter, defaultdict
 
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import KMeans
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
+import pandas as pd
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
 import joblib
 
+from .adf import field_text
 from .auth import with_auth_client, AuthenticatedClient
+from .issue_mirror import issue_mirror
+from .process_pool import process_pool
+from .similarity_index import SimilarityIndex
+from .training_jobs import training_jobs, write_progress
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian.ai_capabilities")
 
-# Initialize NLTK resources if not already downloaded
-try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon', quiet=True)
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
+# Number of most recent issues used to train a model
+TRAINING_SAMPLE_SIZE = 500
+
+# Kinds of content suggest_content can suggest
+SUGGESTION_CONTENT_TYPES = ("description", "comment", "solution")
+
+# Labels an issue classifier can be trained to predict
+CLASSIFIER_MODEL_TYPES = ("issue_type", "priority", "component")
+
+# Random forest training (ATLASSIAN_TRAINING_N_JOBS sets the cores used, -1 for all). Fits run
+# on the worker processes, so by default each one gets an equal share of the cores
+FOREST_TREES = 100
+FOREST_PROGRESS_STEPS = 10  # trees are grown in this many rounds to report progress
+TRAINING_N_JOBS = int(os.getenv(
+    "ATLASSIAN_TRAINING_N_JOBS", max(1, (os.cpu_count() or 1) // max(1, process_pool.max_workers))
+))
+
+
+def _ensure_nltk_data():
+    """Download the NLTK sentiment lexicon if it is not already installed."""
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        logger.info("Downloading NLTK vader_lexicon")
+        nltk.download('vader_lexicon', quiet=True)
+
+
+def _suggestion_content(fields: Dict, content_type: str) -> str:
+    """
+    Get the content of an issue that can be suggested, if it is substantial.
+    
+    Args:
+        fields: Issue fields
+        content_type: Type of content (description, comment, solution)
+        
+    Returns:
+        The content, or an empty string if the issue has none worth suggesting
+    """
+    if content_type == "description":
+        content = field_text(fields.get("description"))
+    elif content_type == "comment":
+        comments = [field_text(c.get("body")) for c in fields.get("comment", {}).get("comments", [])]
+        # Get the most relevant comment (longest)
+        content = max(comments, key=len, default="")
+    else:
+        # Look for resolution or a comment containing solution keywords
+        resolution = (fields.get("resolution") or {}).get("description", "")
+        
+        # Try to find a solution comment
+        solution_comment = ""
+        comments = fields.get("comment", {}).get("comments", [])
+        for comment in comments:
+            body = field_text(comment.get("body"))
+            if any(kw in body.lower() for kw in ["solution", "resolve", "fixed", "implemented", "workaround"]):
+                solution_comment = body
+                break
+                
+        content = resolution if len(resolution) > len(solution_comment) else solution_comment
+        
+    # Only suggest substantial content
+    return content if content and len(content.strip()) > 30 else ""  # Minimum content length
+
+
+def _describe_for_suggestions(issue: Dict) -> Tuple[str, List[str]]:
+    """Index an issue by its summary, tagged with the kinds of content it can suggest."""
+    fields = issue.get("fields", {})
+    tags = [content_type for content_type in SUGGESTION_CONTENT_TYPES if _suggestion_content(fields, content_type)]
+    return fields.get("summary") or "", tags
+
+
+def _save_models(models: Dict[str, Any]) -> None:
+    """Write model files, each replacing its previous version atomically."""
+    temp_paths = {}
+    for path, model in models.items():
+        temp_paths[path] = f"{path}.{os.getpid()}.tmp"
+        joblib.dump(model, temp_paths[path])
+    for path, temp_path in temp_paths.items():
+        os.replace(temp_path, path)
+
+
+def _fit_forest(X_train: Any, y_train: List, progress_path: str, start: float, end: float) -> RandomForestClassifier:
+    """
+    Fit a random forest, reporting progress as the trees are grown.
+    
+    The forest is grown in rounds with warm_start, which gives the same
+    trees as fitting them all at once.
+    """
+    clf = RandomForestClassifier(n_estimators=0, warm_start=True, random_state=42, n_jobs=TRAINING_N_JOBS)
+    step = max(1, FOREST_TREES // FOREST_PROGRESS_STEPS)
+    for trees in range(step, FOREST_TREES + step, step):
+        trees = min(trees, FOREST_TREES)
+        clf.set_params(n_estimators=trees)
+        clf.fit(X_train, y_train)
+        write_progress(progress_path, start + (end - start) * trees / FOREST_TREES,
+                       f"training ({trees}/{FOREST_TREES} trees)")
+    clf.set_params(warm_start=False)
+    return clf
+
+
+def _fit_issue_classifier(X_text: List[str], y_labels: List[str], model_path: str, vectorizer_path: str,
+                          progress_path: str) -> Tuple[Any, TfidfVectorizer, float, Optional[List]]:
+    """
+    Fit, evaluate and save an issue classifier.
+    
+    A module-level function, so it can run in a worker process.
+    
+    Returns:
+        Tuple of the classifier, its vectorizer, the test accuracy and the top features
+    """
+    unique_labels = set(y_labels)
+    
+    # Create vectorizer and transform text data
+    vectorizer = TfidfVectorizer(
+        max_features=5000, 
+        min_df=2, 
+        max_df=0.8,
+        ngram_range=(1, 2)
+    )
+    X_tfidf = vectorizer.fit_transform(X_text)
+    
+    # Train-test split
+    X_train, X_test, y_train, y_test = train_test_split(
+        X_tfidf, y_labels, test_size=0.2, random_state=42, stratify=y_labels if len(unique_labels) > 1 else None
+    )
+    
+    # Train classifier
+    if len(unique_labels) > 2:  # Multiclass
+        clf = _fit_forest(X_train, y_train, progress_path, 0.3, 0.9)
+    else:  # Binary
+        clf = LogisticRegression(random_state=42)
+        clf.fit(X_train, y_train)
+        
+    # Evaluate classifier
+    write_progress(progress_path, 0.9, "evaluating")
+    accuracy = clf.score(X_test, y_test)
+    
+    # Save models
+    write_progress(progress_path, 0.95, "saving")
+    _save_models({vectorizer_path: vectorizer, model_path: clf})
+    
+    # Get feature importance
+    feature_importance = None
+    if hasattr(clf, 'feature_importances_'):
+        # For Random Forest
+        feature_names = vectorizer.get_feature_names_out()
+        importance = clf.feature_importances_
+        feature_importance = sorted(
+            [(feature_names[i], importance[i]) for i in range(len(feature_names))],
+            key=lambda x: x[1],
+            reverse=True
+        )[:20]  # Top 20 features
+    elif hasattr(clf, 'coef_'):
+        # For LogisticRegression
+        feature_names = vectorizer.get_feature_names_out()
+        importance = clf.coef_[0]
+        feature_importance = sorted(
+            [(feature_names[i], importance[i]) for i in range(len(feature_names))],
+            key=lambda x: abs(x[1]),
+            reverse=True
+        )[:20]  # Top 20 features
+        
+    return clf, vectorizer, accuracy, feature_importance
+
+
+def _fit_sla_predictor(X_df: pd.DataFrame, y_data: List[int], model_path: str,
+                       progress_path: str) -> Tuple[Dict, float, Optional[List]]:
+    """
+    Fit, evaluate and save an SLA predictor.
+    
+    A module-level function, so it can run in a worker process.
+    
+    Returns:
+        Tuple of the model info (model, feature columns, training date), the
+        test accuracy and the top features
+    """
+    # Train-test split
+    X_train, X_test, y_train, y_test = train_test_split(X_df, y_data, test_size=0.2, random_state=42)
+    
+    # Train model
+    clf = _fit_forest(X_train, y_train, progress_path, 0.3, 0.9)
+    
+    # Evaluate model
+    write_progress(progress_path, 0.9, "evaluating")
+    accuracy = clf.score(X_test, y_test)
+    
+    # Save column names to ensure correct feature order during prediction
+    column_names = X_df.columns.tolist()
+    
+    model_info = {
+        "model": clf,
+        "columns": column_names,
+        "training_date": datetime.datetime.now().isoformat()
+    }
+    
+    # Save model and preprocessing info
+    write_progress(progress_path, 0.95, "saving")
+    _save_models({model_path: model_info})
+    
+    # Feature importance
+    feature_importance = None
+    if hasattr(clf, 'feature_importances_'):
+        importance = clf.feature_importances_
+        feature_importance = sorted(
+            [(column_names[i], importance[i]) for i in range(len(column_names))],
+            key=lambda x: x[1],
+            reverse=True
+        )[:10]  # Top 10 features
+        
+    return model_info, accuracy, feature_importance
 
 
 class AICapabilitiesManager:
@@ -64,18 +272,36 @@ class AICapabilitiesManager:
             
         os.makedirs(self.models_dir, exist_ok=True)
         
-        # Initialize sentiment analyzer
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
+        # The sentiment analyzer (and the NLTK data it needs) is loaded on first use
+        self._sentiment_analyzer = None
         
         # Cache for trained models
         self._classifier_models = {}
         self._sla_prediction_models = {}
         self._vectorizers = {}
         
+        # Guards model swaps by training jobs
+        self.lock = threading.RLock()
+        
+        # Content suggestion index of every project, kept next to the models
+        self.similarity_index = SimilarityIndex(self.models_dir)
+        
+    @property
+    def sentiment_analyzer(self) -> SentimentIntensityAnalyzer:
+        """Sentiment analyzer, created on first use."""
+        if self._sentiment_analyzer is None:
+            _ensure_nltk_data()
+            self._sentiment_analyzer = SentimentIntensityAnalyzer()
+        return self._sentiment_analyzer
+        
     @with_auth_client("jira")
     def train_issue_classifier(self, client: AuthenticatedClient, project_key: str, model_type: str = "issue_type") -> Dict:
         """
-        Train a classifier model for automatic issue classification.
+        Start training a classifier model for automatic issue classification.
+        
+        Training runs as a background job; poll get_training_job with the
+        returned job ID for its progress and results. The new model replaces
+        the previous one once training succeeds.
         
         Args:
             client: Authenticated client
@@ -83,29 +309,31 @@ class AICapabilitiesManager:
             model_type: Type of classifier to train (issue_type, priority, component)
             
         Returns:
-            Dict containing training results
+            Dict containing the status of the training job
         """
-        # Get training data from Jira
-        jql = f"project = {project_key} ORDER BY created DESC"
-        response = client.request(
-            "GET", 
-            f"{os.environ.get('JIRA_URL')}/rest/api/2/search",
-            params={
-                "jql": jql,
-                "maxResults": 500,  # Get a good sample size
-                "fields": "summary,description,issuetype,priority,components,labels"
-            }
+        if model_type not in CLASSIFIER_MODEL_TYPES:
+            return {"error": f"Unsupported model type: {model_type}"}
+            
+        return training_jobs.submit(
+            "issue_classifier", project_key, f"{project_key}_{model_type}_classifier",
+            lambda progress_path: self._train_issue_classifier(client, project_key, model_type, progress_path)
         )
         
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch training data: {response.text}")
+    def _train_issue_classifier(self, client: AuthenticatedClient, project_key: str, model_type: str,
+                                progress_path: str) -> Dict:
+        """Train an issue classifier (run as a training job)."""
+        # Get training data from the issue mirror (newest issues first)
+        write_progress(progress_path, 0.05, "fetching issues")
+        try:
+            issues = issue_mirror.get_project_issues(client, project_key)[:TRAINING_SAMPLE_SIZE]
+        except ValueError as e:
+            logger.error(f"Failed to fetch training data: {e}")
             return {"error": "Failed to fetch training data"}
-            
-        issues = response.json().get("issues", [])
         if len(issues) < 20:
             return {"error": "Insufficient training data. Need at least 20 issues."}
             
         # Prepare training data based on model type
+        write_progress(progress_path, 0.2, "preparing training data")
         X_text = []
         y_labels = []
         
@@ -114,7 +342,7 @@ class AICapabilitiesManager:
             
             # Combine summary and description for text features
             summary = fields.get("summary", "")
-            description = fields.get("description", "") or ""
+            description = field_text(fields.get("description"))
             combined_text = f"{summary}\n{description}"
             
             # Skip if text is too short
@@ -128,12 +356,10 @@ class AICapabilitiesManager:
                 label = fields.get("issuetype", {}).get("name", "Unknown")
             elif model_type == "priority":
                 label = fields.get("priority", {}).get("name", "Medium")
-            elif model_type == "component":
+            else:  # component
                 components = fields.get("components", [])
                 # Use the first component if available, otherwise 'None'
                 label = components[0].get("name", "None") if components else "None"
-            else:
-                return {"error": f"Unsupported model type: {model_type}"}
                 
             y_labels.append(label)
             
@@ -146,66 +372,26 @@ class AICapabilitiesManager:
         if len(unique_labels) < 2:
             return {"error": f"Need at least 2 unique {model_type} values for classification"}
             
-        # Create vectorizer and transform text data
-        vectorizer = TfidfVectorizer(
-            max_features=5000, 
-            min_df=2, 
-            max_df=0.8,
-            ngram_range=(1, 2)
-        )
-        X_tfidf = vectorizer.fit_transform(X_text)
+        # Fit, evaluate and save the model in a worker process
+        model_name = f"{project_key}_{model_type}_classifier"
+        model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
+        vectorizer_path = os.path.join(self.models_dir, f"{model_name}_vectorizer.joblib")
         
-        # Train-test split
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_tfidf, y_labels, test_size=0.2, random_state=42, stratify=y_labels if len(unique_labels) > 1 else None
-        )
+        write_progress(progress_path, 0.3, "training")
+        fitted = process_pool.run_all({
+            "fit": (_fit_issue_classifier, (X_text, y_labels, model_path, vectorizer_path, progress_path), {})
+        })["fit"]
+        if isinstance(fitted, Exception):
+            raise fitted
+        clf, vectorizer, accuracy, feature_importance = fitted
         
-        # Train classifier
-        if len(unique_labels) > 2:  # Multiclass
-            clf = RandomForestClassifier(n_estimators=100, random_state=42)
-        else:  # Binary
-            clf = LogisticRegression(random_state=42)
+        # Swap the new model in; classify_issue reads the model and its vectorizer together
+        with self.lock:
+            self._classifier_models[model_name] = clf
+            self._vectorizers[model_name] = vectorizer
             
-        clf.fit(X_train, y_train)
-        
-        # Evaluate classifier
-        accuracy = clf.score(X_test, y_test)
-        
         # Calculate class distribution
         class_distribution = Counter(y_labels)
-        
-        # Save models
-        model_name = f"{project_key}_{model_type}_classifier"
-        model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
-        vectorizer_path = os.path.join(self.models_dir, f"{model_name}_vectorizer.joblib")
-        
-        joblib.dump(clf, model_path)
-        joblib.dump(vectorizer, vectorizer_path)
-        
-        # Store in cache
-        self._classifier_models[model_name] = clf
-        self._vectorizers[model_name] = vectorizer
-        
-        # Get feature importance
-        feature_importance = None
-        if hasattr(clf, 'feature_importances_'):
-            # For Random Forest
-            feature_names = vectorizer.get_feature_names_out()
-            importance = clf.feature_importances_
-            feature_importance = sorted(
-                [(feature_names[i], importance[i]) for i in range(len(feature_names))],
-                key=lambda x: x[1],
-                reverse=True
-            )[:20]  # Top 20 features
-        elif hasattr(clf, 'coef_'):
-            # For LogisticRegression
-            feature_names = vectorizer.get_feature_names_out()
-            importance = clf.coef_[0]
-            feature_importance = sorted(
-                [(feature_names[i], importance[i]) for i in range(len(feature_names))],
-                key=lambda x: abs(x[1]),
-                reverse=True
-            )[:20]  # Top 20 features
             
         return {
             "model_type": model_type,
@@ -235,26 +421,27 @@ class AICapabilitiesManager:
         model_name = f"{project_key}_{model_type}_classifier"
         
         # Load model from cache or disk
-        clf = self._classifier_models.get(model_name)
-        vectorizer = self._vectorizers.get(model_name)
-        
-        if clf is None or vectorizer is None:
-            # Try to load from disk
-            model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
-            vectorizer_path = os.path.join(self.models_dir, f"{model_name}_vectorizer.joblib")
-            
-            try:
-                clf = joblib.load(model_path)
-                vectorizer = joblib.load(vectorizer_path)
+        with self.lock:
+            clf = self._classifier_models.get(model_name)
+            vectorizer = self._vectorizers.get(model_name)
+            
+            if clf is None or vectorizer is None:
+                # Try to load from disk
+                model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
+                vectorizer_path = os.path.join(self.models_dir, f"{model_name}_vectorizer.joblib")
                 
-                # Update cache
-                self._classifier_models[model_name] = clf
-                self._vectorizers[model_name] = vectorizer
-            except FileNotFoundError:
-                return {
-                    "error": f"No trained model found for {project_key} {model_type}",
-                    "recommendation": f"Train a model first using train_issue_classifier"
-                }
+                try:
+                    clf = joblib.load(model_path)
+                    vectorizer = joblib.load(vectorizer_path)
+                    
+                    # Update cache
+                    self._classifier_models[model_name] = clf
+                    self._vectorizers[model_name] = vectorizer
+                except FileNotFoundError:
+                    return {
+                        "error": f"No trained model found for {project_key} {model_type}",
+                        "recommendation": f"Train a model first using train_issue_classifier"
+                    }
                 
         # Preprocess and vectorize text
         X_tfidf = vectorizer.transform([text])
@@ -299,97 +486,41 @@ class AICapabilitiesManager:
         Returns:
             Dict containing suggested content
         """
-        # Get recent issues from the project
-        jql = f"project = {project_key} ORDER BY created DESC"
-        response = client.request(
-            "GET", 
-            f"{os.environ.get('JIRA_URL')}/rest/api/2/search",
-            params={
-                "jql": jql,
-                "maxResults": 100,
-                "fields": "summary,description,comment,resolution,issuetype"
-            }
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch issues for content suggestion: {response.text}")
+        if content_type not in SUGGESTION_CONTENT_TYPES:
+            return {"error": f"Unsupported content type: {content_type}"}
+            
+        # Index every issue of the project (only new and changed issues are vectorized)
+        try:
+            issues = issue_mirror.get_project_issues(client, project_key)
+        except ValueError as e:
+            logger.error(f"Failed to fetch issues for content suggestion: {e}")
             return {"error": "Failed to fetch issues for content suggestion"}
-            
-        issues = response.json().get("issues", [])
         if not issues:
             return {"error": "No issues found for content suggestion"}
-            
-        # Process issues to extract relevant content
-        issue_data = []
-        for issue in issues:
-            fields = issue.get("fields", {})
-            
-            summary = fields.get("summary", "")
-            
-            # Get content based on content_type
-            if content_type == "description":
-                content = fields.get("description", "")
-            elif content_type == "comment":
-                comments = fields.get("comment", {}).get("comments", [])
-                # Get the most relevant comment (longest)
-                content = max(comments, key=lambda c: len(c.get("body", "")), default={}).get("body", "") if comments else ""
-            elif content_type == "solution":
-                # Look for resolution or a comment containing solution keywords
-                resolution = fields.get("resolution", {}).get("description", "")
-                
-                # Try to find a solution comment
-                solution_comment = ""
-                comments = fields.get("comment", {}).get("comments", [])
-                for comment in comments:
-                    body = comment.get("body", "").lower()
-                    if any(kw in body for kw in ["solution", "resolve", "fixed", "implemented", "workaround"]):
-                        solution_comment = comment.get("body", "")
-                        break
-                        
-                content = resolution if len(resolution) > len(solution_comment) else solution_comment
-            else:
-                return {"error": f"Unsupported content type: {content_type}"}
-                
-            # Only include issues that have the requested content
-            if content and len(content.strip()) > 30:  # Minimum content length
-                issue_data.append({
-                    "key": issue.get("key"),
-                    "summary": summary,
-                    "content": content,
-                    "issue_type": fields.get("issuetype", {}).get("name", "Unknown")
-                })
-                
-        if not issue_data:
+        self.similarity_index.update(project_key, issues, _describe_for_suggestions)
+        
+        # Get top 3 suggestions among issues that have the requested content
+        matches = self.similarity_index.search(
+            project_key, query, tag=content_type, limit=3, min_score=0.1  # Minimum similarity threshold
+        )
+        if not matches and not self.similarity_index.count(project_key, tag=content_type):
             return {"error": f"No issues found with substantial {content_type} content"}
             
-        # Create vectorizer for text similarity
-        vectorizer = TfidfVectorizer(max_features=5000, ngram_range=(1, 2))
-        
-        # Create document corpus and vectorize
-        summaries = [item["summary"] for item in issue_data]
-        summaries_matrix = vectorizer.fit_transform(summaries)
-        
-        # Vectorize query
-        query_vector = vectorizer.transform([query])
-        
-        # Calculate similarity scores
-        similarity_scores = cosine_similarity(query_vector, summaries_matrix).flatten()
-        
-        # Rank results by similarity
-        ranked_indices = similarity_scores.argsort()[::-1]
-        
-        # Get top 3 suggestions
+        issues_by_key = {issue.get("key"): issue for issue in issues}
         suggestions = []
-        for idx in ranked_indices[:3]:
-            if similarity_scores[idx] > 0.1:  # Minimum similarity threshold
-                suggestion = {
-                    "issue_key": issue_data[idx]["key"],
-                    "similarity": round(float(similarity_scores[idx]), 3),
-                    "summary": issue_data[idx]["summary"],
-                    "content": issue_data[idx]["content"],
-                    "issue_type": issue_data[idx]["issue_type"]
-                }
-                suggestions.append(suggestion)
+        for issue_key, similarity in matches:
+            # A concurrent call may have indexed issues newer than this read of the mirror
+            issue = issues_by_key.get(issue_key)
+            if issue is None:
+                continue
+            fields = issue.get("fields", {})
+            suggestions.append({
+                "issue_key": issue_key,
+                "similarity": round(similarity, 3),
+                "summary": fields.get("summary", ""),
+                "content": _suggestion_content(fields, content_type),
+                "issue_type": fields.get("issuetype", {}).get("name", "Unknown")
+            })
                 
         if not suggestions:
             return {"message": "No relevant content suggestions found"}
@@ -431,7 +562,7 @@ class AICapabilitiesManager:
                 return {"error": f"Failed to fetch comments for issue {issue_key}"}
                 
             comments_data = response.json().get("comments", [])
-            comments = [comment.get("body", "") for comment in comments_data]
+            comments = [field_text(comment.get("body")) for comment in comments_data]
             
             # Also get the issue description
             issue_response = client.request(
@@ -442,7 +573,7 @@ class AICapabilitiesManager:
             
             if issue_response.status_code == 200:
                 fields = issue_response.json().get("fields", {})
-                description = fields.get("description", "")
+                description = field_text(fields.get("description"))
                 summary = fields.get("summary", "")
                 
                 if description:
@@ -509,37 +640,47 @@ class AICapabilitiesManager:
     @with_auth_client("jira")
     def train_sla_predictor(self, client: AuthenticatedClient, project_key: str) -> Dict:
         """
-        Train a model to predict SLA breaches based on historical data.
+        Start training a model to predict SLA breaches based on historical data.
+        
+        Training runs as a background job; poll get_training_job with the
+        returned job ID for its progress and results. The new model replaces
+        the previous one once training succeeds.
         
         Args:
             client: Authenticated client
             project_key: Project key to use for training
             
         Returns:
-            Dict containing training results
+            Dict containing the status of the training job
         """
-        # Get historical SLA data
-        # This requires a custom field for SLA or resolution time data
-        jql = f"project = {project_key} AND resolution IS NOT EMPTY ORDER BY resolved DESC"
-        response = client.request(
-            "GET", 
-            f"{os.environ.get('JIRA_URL')}/rest/api/2/search",
-            params={
-                "jql": jql,
-                "maxResults": 500,
-                "fields": "summary,description,created,resolutiondate,issuetype,priority,reporter,assignee,components,labels,customfield_10000"
-            }
+        return training_jobs.submit(
+            "sla_predictor", project_key, f"{project_key}_sla_predictor",
+            lambda progress_path: self._train_sla_predictor(client, project_key, progress_path)
         )
         
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch SLA training data: {response.text}")
+    def _train_sla_predictor(self, client: AuthenticatedClient, project_key: str, progress_path: str) -> Dict:
+        """Train an SLA predictor (run as a training job)."""
+        # Get historical SLA data from the issue mirror, most recently resolved first
+        # This requires a custom field for SLA or resolution time data
+        write_progress(progress_path, 0.05, "fetching issues")
+        try:
+            issues = issue_mirror.get_project_issues(client, project_key)
+        except ValueError as e:
+            logger.error(f"Failed to fetch SLA training data: {e}")
             return {"error": "Failed to fetch SLA training data"}
-            
-        issues = response.json().get("issues", [])
+        resolved = [issue for issue in issues if issue.get("fields", {}).get("resolutiondate")]
+        resolved.sort(
+            key=lambda issue: datetime.datetime.strptime(
+                issue["fields"]["resolutiondate"], "%Y-%m-%dT%H:%M:%S.%f%z"
+            ),
+            reverse=True
+        )
+        issues = resolved[:TRAINING_SAMPLE_SIZE]
         if len(issues) < 30:
             return {"error": f"Insufficient training data. Need at least 30 resolved issues in {project_key}."}
             
         # Prepare training data
+        write_progress(progress_path, 0.2, "preparing training data")
         X_data = []
         y_data = []
         
@@ -568,7 +709,7 @@ class AICapabilitiesManager:
             
             # Text length features
             summary = fields.get("summary", "")
-            description = fields.get("description", "") or ""
+            description = field_text(fields.get("description"))
             summary_length = len(summary.split())
             description_length = len(description.split()) if description else 0
             
@@ -618,7 +759,6 @@ class AICapabilitiesManager:
                     y_data.append(1 if resolution_time_hours <= 72 else 0)
                     
         # Convert feature dictionaries to proper format
-        import pandas as pd
         X_df = pd.DataFrame(X_data)
         
         # One-hot encode categorical features
@@ -628,47 +768,25 @@ class AICapabilitiesManager:
         if len(X_df) < 30:
             return {"error": "Insufficient training data after preprocessing"}
             
-        # Train-test split
-        X_train, X_test, y_train, y_test = train_test_split(X_df, y_data, test_size=0.2, random_state=42)
-        
-        # Train model
-        clf = RandomForestClassifier(n_estimators=100, random_state=42)
-        clf.fit(X_train, y_train)
+        # Fit, evaluate and save the model in a worker process
+        model_name = f"{project_key}_sla_predictor"
+        model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
         
-        # Evaluate model
-        accuracy = clf.score(X_test, y_test)
+        write_progress(progress_path, 0.3, "training")
+        fitted = process_pool.run_all({
+            "fit": (_fit_sla_predictor, (X_df, y_data, model_path, progress_path), {})
+        })["fit"]
+        if isinstance(fitted, Exception):
+            raise fitted
+        model_info, accuracy, feature_importance = fitted
         
+        # Swap the new model in
+        with self.lock:
+            self._sla_prediction_models[model_name] = model_info
+            
         # Calculate class distribution
         sla_met_count = sum(y_data)
         sla_breached_count = len(y_data) - sla_met_count
-        
-        # Save model and preprocessing info
-        model_name = f"{project_key}_sla_predictor"
-        model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
-        
-        # Save column names to ensure correct feature order during prediction
-        column_names = X_df.columns.tolist()
-        
-        model_info = {
-            "model": clf,
-            "columns": column_names,
-            "training_date": datetime.datetime.now().isoformat()
-        }
-        
-        joblib.dump(model_info, model_path)
-        
-        # Store in cache
-        self._sla_prediction_models[model_name] = model_info
-        
-        # Feature importance
-        feature_importance = None
-        if hasattr(clf, 'feature_importances_'):
-            importance = clf.feature_importances_
-            feature_importance = sorted(
-                [(column_names[i], importance[i]) for i in range(len(column_names))],
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]  # Top 10 features
             
         return {
             "project_key": project_key,
@@ -682,6 +800,34 @@ class AICapabilitiesManager:
             "top_features": feature_importance
         }
         
+    def get_training_job(self, job_id: str) -> Dict:
+        """
+        Get the status, progress and results of a training job.
+        
+        Args:
+            job_id: Job ID returned when training was started
+            
+        Returns:
+            Dict containing the job status
+        """
+        job = training_jobs.get(job_id)
+        if job is None:
+            return {"error": f"Unknown training job: {job_id}"}
+        return job
+        
+    def list_training_jobs(self, project_key: Optional[str] = None) -> Dict:
+        """
+        List recent training jobs.
+        
+        Args:
+            project_key: Only list the jobs of this project (optional)
+            
+        Returns:
+            Dict containing the jobs, most recently started first
+        """
+        jobs = training_jobs.list(project_key)
+        return {"jobs": jobs, "count": len(jobs)}
+        
     @with_auth_client("jira")
     def predict_sla(self, client: AuthenticatedClient, issue_key: str = None, 
                    issue_data: Optional[Dict] = None) -> Dict:
@@ -724,20 +870,21 @@ class AICapabilitiesManager:
             
         # Load SLA prediction model
         model_name = f"{project_key}_sla_predictor"
-        model_info = self._sla_prediction_models.get(model_name)
-        
-        if not model_info:
-            # Try to load from disk
-            model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
-            
-            try:
-                model_info = joblib.load(model_path)
-                self._sla_prediction_models[model_name] = model_info
-            except FileNotFoundError:
-                return {
-                    "error": f"No trained SLA prediction model found for {project_key}",
-                    "recommendation": f"Train a model first using train_sla_predictor"
-                }
+        with self.lock:
+            model_info = self._sla_prediction_models.get(model_name)
+            
+            if not model_info:
+                # Try to load from disk
+                model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
+                
+                try:
+                    model_info = joblib.load(model_path)
+                    self._sla_prediction_models[model_name] = model_info
+                except FileNotFoundError:
+                    return {
+                        "error": f"No trained SLA prediction model found for {project_key}",
+                        "recommendation": f"Train a model first using train_sla_predictor"
+                    }
                 
         clf = model_info["model"]
         columns = model_info["columns"]
@@ -754,7 +901,7 @@ class AICapabilitiesManager:
         
         # Text length features
         summary = fields.get("summary", "")
-        description = fields.get("description", "") or ""
+        description = field_text(fields.get("description"))
         summary_length = len(summary.split())
         description_length = len(description.split()) if description else 0
         
@@ -785,7 +932,6 @@ class AICapabilitiesManager:
                 features[col] = 1 if issue_type == type_value else 0
                 
         # Create DataFrame with the same columns as training data
-        import pandas as pd
         X_pred = pd.DataFrame([features])
         
         # Ensure all columns from training are present (with 0s if missing)
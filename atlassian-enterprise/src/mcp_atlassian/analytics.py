@@ -14,21 +14,73 @@ import logging
 import tempfile
 import datetime
 from typing import Dict, List, Optional, Any, Callable, Union, Tuple, Set
-from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 
 from .auth import with_auth_client, AuthenticatedClient
+from .chart_renderer import chart_renderer, chart_spec
+from .issue_frame import (
+    PRIORITY_LEVELS, bucket_counts, format_dates, issues_to_frame, rank_percentiles, resolution_days,
+    status_timeline, value_counts
+)
+from .issue_clustering import ScalableClustering
+from .issue_mirror import issue_mirror
+from .markdown_storage import markdown_to_storage
+from .process_pool import process_pool
+from .worklog_store import worklog_store
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian.analytics")
 
+# Constants
+CHART_UPLOAD_CONCURRENCY = 4  # chart attachments uploaded at a time when publishing a report
+SCALABLE_CLUSTERING_MIN_ISSUES = int(
+    os.getenv("ATLASSIAN_SCALABLE_CLUSTERING_MIN_ISSUES", 5000)
+)  # resolved issues from which pattern detection clusters with persisted mini-batch centroids
+
+# Snapshot parts each report section reads: the issue frame, description word counts and worklog totals
+REPORT_SECTIONS = {
+    "project_metrics": {"frame"},
+    "time_tracking": {"frame", "worklogs"},
+    "issue_patterns": {"frame", "text"},
+    "trends": {"frame"},
+}
+
+# Sections of each custom report type, as (result name, section, section options)
+REPORT_PLANS = {
+    "comprehensive": [
+        ("project_metrics", "project_metrics", {}),
+        ("time_tracking", "time_tracking", {}),
+        ("issue_patterns", "issue_patterns", {}),
+        ("trends", "trends", {"time_range": "3m"}),
+    ],
+    "velocity": [
+        ("project_metrics", "project_metrics", {}),
+        ("trends_1m", "trends", {"time_range": "1m"}),
+        ("trends_3m", "trends", {"time_range": "3m"}),
+        ("trends_6m", "trends", {"time_range": "6m"}),
+    ],
+    "efficiency": [
+        ("time_tracking", "time_tracking", {}),
+        ("project_metrics", "project_metrics", {}),
+        ("issue_patterns", "issue_patterns", {}),
+    ],
+    "quality": [
+        ("project_metrics", "project_metrics", {}),
+        ("trends", "trends", {"time_range": "3m"}),
+    ],
+}
+
+
+def _run_report_section(data_dir: str, section: str, snapshot: Dict, options: Dict) -> Dict:
+    """Run one report section (a module-level function, so it can run in a worker process)."""
+    return getattr(AnalyticsManager(data_dir), f"_{section}_section")(snapshot, **options)
+
 
 class AnalyticsManager:
     """
@@ -54,10 +106,12 @@ class AnalyticsManager:
             
         os.makedirs(self.data_dir, exist_ok=True)
         
-        # Cached data
-        self._issue_cache = {}
+        # Cached data (project issues are kept in the shared issue_mirror)
         self._time_tracking_cache = {}
         
+        # Clustering models of large projects, persisted next to the reports
+        self.clustering = ScalableClustering(os.path.join(self.data_dir, "models"))
+        
     @with_auth_client("jira")
     def get_project_metrics(self, client: AuthenticatedClient, project_key: str) -> Dict:
         """
@@ -70,69 +124,53 @@ class AnalyticsManager:
         Returns:
             Dict containing project metrics
         """
-        # Get all issues in the project
-        issues = self._get_all_project_issues(client, project_key)
-        
-        # Calculate metrics
-        issue_types = Counter(issue.get("fields", {}).get("issuetype", {}).get("name", "Unknown") 
-                             for issue in issues)
+        try:
+            snapshot = self._build_snapshot(client, project_key, REPORT_SECTIONS["project_metrics"])
+        except ValueError as e:
+            logger.error(f"Failed to fetch project issues: {e}")
+            return {"error": "Failed to fetch project issues"}
+        return self._project_metrics_section(snapshot)
         
-        statuses = Counter(issue.get("fields", {}).get("status", {}).get("name", "Unknown") 
-                          for issue in issues)
+    def _project_metrics_section(self, snapshot: Dict) -> Dict:
+        """Compute project metrics from a project snapshot."""
+        project_key = snapshot["project_key"]
+        df = snapshot["frame"]
         
-        priorities = Counter(issue.get("fields", {}).get("priority", {}).get("name", "Unknown") 
-                            for issue in issues)
+        # Calculate metrics
+        issue_types = value_counts(df["issue_type"])
+        statuses = value_counts(df["status"])
+        priorities = value_counts(df["priority"])
         
         # Calculate creation velocity (issues per week)
-        created_dates = [datetime.datetime.strptime(
-                            issue.get("fields", {}).get("created", "2023-01-01T00:00:00.000+0000"),
-                            "%Y-%m-%dT%H:%M:%S.%f%z"
-                         ).date() 
-                         for issue in issues]
-        
-        if created_dates:
-            min_date = min(created_dates)
-            max_date = max(created_dates)
-            date_range = (max_date - min_date).days
+        created_dates = df["created"].dropna().dt.normalize()
+        if not created_dates.empty:
+            date_range = (created_dates.max() - created_dates.min()).days
             if date_range > 0:
-                velocity_per_week = len(issues) / (date_range / 7)
+                velocity_per_week = len(df) / (date_range / 7)
             else:
-                velocity_per_week = len(issues)
+                velocity_per_week = len(df)
         else:
             velocity_per_week = 0
             
         # Calculate resolution time statistics (in days)
-        resolution_times = []
-        for issue in issues:
-            created = issue.get("fields", {}).get("created")
-            resolved = issue.get("fields", {}).get("resolutiondate")
-            
-            if created and resolved:
-                created_date = datetime.datetime.strptime(created, "%Y-%m-%dT%H:%M:%S.%f%z")
-                resolved_date = datetime.datetime.strptime(resolved, "%Y-%m-%dT%H:%M:%S.%f%z")
-                resolution_time = (resolved_date - created_date).total_seconds() / (24 * 3600)  # days
-                resolution_times.append(resolution_time)
-                
-        if resolution_times:
-            avg_resolution_time = sum(resolution_times) / len(resolution_times)
-            median_resolution_time = sorted(resolution_times)[len(resolution_times) // 2]
-            p90_resolution_time = sorted(resolution_times)[int(len(resolution_times) * 0.9)]
+        resolution_times = resolution_days(df).dropna().to_numpy()
+        if resolution_times.size:
+            avg_resolution_time = float(resolution_times.mean())
+            median_resolution_time, p90_resolution_time = rank_percentiles(resolution_times, [0.5, 0.9])
         else:
             avg_resolution_time = 0
             median_resolution_time = 0
             p90_resolution_time = 0
             
         # Calculate completion rate
-        completed_issues = sum(1 for issue in issues 
-                             if issue.get("fields", {}).get("status", {}).get("statusCategory", {}).get("key") == "done")
-        completion_rate = completed_issues / len(issues) if issues else 0
+        completion_rate = float((df["status_category"] == "done").mean()) if len(df) else 0
         
         return {
             "project_key": project_key,
-            "total_issues": len(issues),
-            "issue_types": dict(issue_types),
-            "statuses": dict(statuses),
-            "priorities": dict(priorities),
+            "total_issues": len(df),
+            "issue_types": issue_types,
+            "statuses": statuses,
+            "priorities": priorities,
             "velocity_per_week": round(velocity_per_week, 2),
             "resolution_time": {
                 "average": round(avg_resolution_time, 2),
@@ -154,74 +192,36 @@ class AnalyticsManager:
         Returns:
             Dict containing time tracking analysis
         """
-        # Get all issues with time tracking information
-        jql = f"project = {project_key} AND worklog IS NOT EMPTY"
-        response = client.request(
-            "GET", 
-            f"{os.environ.get('JIRA_URL')}/rest/api/2/search",
-            params={
-                "jql": jql,
-                "maxResults": 1000,
-                "fields": "summary,issuetype,created,timetracking,worklog,assignee"
-            }
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch time tracking data: {response.text}")
+        try:
+            snapshot = self._build_snapshot(client, project_key, REPORT_SECTIONS["time_tracking"])
+        except ValueError as e:
+            logger.error(f"Failed to fetch project issues: {e}")
+            return {"error": "Failed to fetch project issues"}
+        return self._time_tracking_section(snapshot)
+        
+    def _time_tracking_section(self, snapshot: Dict) -> Dict:
+        """Compute the time tracking analysis from a project snapshot."""
+        # Estimates come from the mirrored issues, logged time from the complete worklog store
+        project_key = snapshot["project_key"]
+        worklog_totals = snapshot["worklogs"]
+        if worklog_totals is None:
             return {"error": "Failed to fetch time tracking data"}
             
-        issues = response.json().get("issues", [])
-        
-        # Process worklog data
-        time_by_user = defaultdict(int)
-        time_by_issue_type = defaultdict(int)
-        time_by_day = defaultdict(int)
-        time_by_week = defaultdict(int)
-        total_estimated = 0
-        total_logged = 0
-        estimation_accuracy = []
-        
-        for issue in issues:
-            issue_type = issue.get("fields", {}).get("issuetype", {}).get("name", "Unknown")
-            
-            # Get original estimate and logged time
-            time_tracking = issue.get("fields", {}).get("timetracking", {})
-            original_estimate_seconds = time_tracking.get("originalEstimateSeconds", 0) or 0
-            time_spent_seconds = time_tracking.get("timeSpentSeconds", 0) or 0
-            
-            total_estimated += original_estimate_seconds
-            total_logged += time_spent_seconds
-            
-            # Calculate estimation accuracy if both values exist
-            if original_estimate_seconds > 0 and time_spent_seconds > 0:
-                accuracy = time_spent_seconds / original_estimate_seconds
-                estimation_accuracy.append({
-                    "issue_key": issue.get("key"),
-                    "original_estimate": original_estimate_seconds,
-                    "time_spent": time_spent_seconds,
-                    "accuracy": accuracy
-                })
-                
-            # Aggregate time by issue type
-            time_by_issue_type[issue_type] += time_spent_seconds
-            
-            # Process individual worklog entries
-            worklogs = issue.get("fields", {}).get("worklog", {}).get("worklogs", [])
-            for worklog in worklogs:
-                # Aggregate time by user
-                author = worklog.get("author", {}).get("displayName", "Unknown")
-                time_spent = worklog.get("timeSpentSeconds", 0)
-                time_by_user[author] += time_spent
-                
-                # Aggregate time by day and week
-                started = worklog.get("started", "")
-                if started:
-                    started_date = datetime.datetime.strptime(started, "%Y-%m-%dT%H:%M:%S.%f%z").date()
-                    day_key = started_date.isoformat()
-                    week_key = f"{started_date.year}-W{started_date.strftime('%U')}"
-                    
-                    time_by_day[day_key] += time_spent
-                    time_by_week[week_key] += time_spent
+        df = snapshot["frame"]
+        df = df[df["time_spent"] > 0]
+        
+        total_estimated = float(df["original_estimate"].sum())
+        total_logged = float(df["time_spent"].sum())
+        
+        # Calculate estimation accuracy where both values exist
+        estimated = df[df["original_estimate"] > 0]
+        accuracy = estimated["time_spent"] / estimated["original_estimate"]
+        estimation_accuracy = pd.DataFrame({
+            "issue_key": estimated["key"],
+            "original_estimate": estimated["original_estimate"] / 3600,
+            "time_spent": estimated["time_spent"] / 3600,
+            "accuracy": accuracy,
+        }).to_dict(orient="records")
         
         # Calculate efficiency metrics
         if total_estimated > 0:
@@ -229,26 +229,19 @@ class AnalyticsManager:
         else:
             overall_accuracy = 0
             
-        # Convert seconds to hours for all metrics
-        time_by_user = {user: time / 3600 for user, time in time_by_user.items()}
-        time_by_issue_type = {itype: time / 3600 for itype, time in time_by_issue_type.items()}
-        time_by_day = {day: time / 3600 for day, time in time_by_day.items()}
-        time_by_week = {week: time / 3600 for week, time in time_by_week.items()}
-        
-        for item in estimation_accuracy:
-            item["original_estimate"] = item["original_estimate"] / 3600
-            item["time_spent"] = item["time_spent"] / 3600
-            
-        # Sort time by day and week chronologically
-        time_by_day = dict(sorted(time_by_day.items()))
-        time_by_week = dict(sorted(time_by_week.items()))
+        # Hours by user, issue type, day and week of the worklog entries (buckets are
+        # sorted, so days and weeks are chronological)
+        time_by_user, time_by_issue_type, time_by_day, time_by_week = (
+            {bucket: seconds / 3600 for bucket, seconds in worklog_totals[dimension].items()}
+            for dimension in ("user", "type", "day", "week")
+        )
         
         # Generate insights
         insights = []
         
         # Insight: Overestimation/underestimation pattern
         if estimation_accuracy:
-            avg_accuracy = sum(item["accuracy"] for item in estimation_accuracy) / len(estimation_accuracy)
+            avg_accuracy = float(accuracy.mean())
             if avg_accuracy > 1.2:
                 insights.append("Tasks are consistently underestimated. Consider adding buffer to estimates.")
             elif avg_accuracy < 0.8:
@@ -283,7 +276,7 @@ class AnalyticsManager:
         
         return {
             "project_key": project_key,
-            "total_issues_with_time_tracking": len(issues),
+            "total_issues_with_time_tracking": len(df),
             "total_time_estimated_hours": round(total_estimated / 3600, 2),
             "total_time_logged_hours": round(total_logged / 3600, 2),
             "overall_estimation_accuracy": round(overall_accuracy, 2),
@@ -307,142 +300,88 @@ class AnalyticsManager:
         Returns:
             Dict containing issue patterns and insights
         """
-        # Get all issues with extended fields
-        issues = self._get_all_project_issues(client, project_key, fields=[
-            "summary", "description", "issuetype", "status", "priority", 
-            "assignee", "reporter", "created", "updated", "resolutiondate",
-            "comment", "labels", "components", "timetracking", "duedate"
-        ])
-        
-        if not issues:
+        try:
+            snapshot = self._build_snapshot(client, project_key, REPORT_SECTIONS["issue_patterns"])
+        except ValueError as e:
+            logger.error(f"Failed to fetch project issues: {e}")
+            return {"error": "Failed to fetch project issues"}
+        return self._issue_patterns_section(snapshot)
+        
+    def _issue_patterns_section(self, snapshot: Dict) -> Dict:
+        """Detect issue patterns from a project snapshot (with description word counts)."""
+        project_key = snapshot["project_key"]
+        frame = snapshot["frame"]
+        
+        if frame.empty:
             return {"error": "No issues found for pattern analysis"}
             
         # Extract features for pattern analysis
-        issue_data = []
-        for issue in issues:
-            fields = issue.get("fields", {})
-            
-            # Calculate cycle time (resolution time) in days
-            created = fields.get("created")
-            resolved = fields.get("resolutiondate")
-            cycle_time = None
-            
-            if created and resolved:
-                created_date = datetime.datetime.strptime(created, "%Y-%m-%dT%H:%M:%S.%f%z")
-                resolved_date = datetime.datetime.strptime(resolved, "%Y-%m-%dT%H:%M:%S.%f%z")
-                cycle_time = (resolved_date - created_date).total_seconds() / (24 * 3600)  # days
-            
-            # Calculate comment count
-            comments = fields.get("comment", {}).get("comments", [])
-            comment_count = len(comments)
-            
-            # Calculate word count in description
-            description = fields.get("description") or ""
-            word_count = len(re.findall(r'\w+', description)) if description else 0
-            
-            # Get time tracking data
-            time_tracking = fields.get("timetracking", {})
-            original_estimate = time_tracking.get("originalEstimateSeconds", 0) or 0
-            time_spent = time_tracking.get("timeSpentSeconds", 0) or 0
-            
-            # Extract assignee and reporter
-            assignee = fields.get("assignee", {}).get("displayName", "Unassigned")
-            reporter = fields.get("reporter", {}).get("displayName", "Unknown")
-            
-            # Get priority level
-            priority = fields.get("priority", {}).get("name", "Medium")
-            priority_map = {"Highest": 5, "High": 4, "Medium": 3, "Low": 2, "Lowest": 1}
-            priority_value = priority_map.get(priority, 3)
-            
-            # Count labels
-            labels = fields.get("labels", [])
-            label_count = len(labels)
-            
-            # Count components
-            components = fields.get("components", [])
-            component_count = len(components)
-            
-            # Get issue type
-            issue_type = fields.get("issuetype", {}).get("name", "Unknown")
-            
-            # Create feature row
-            row = {
-                "key": issue.get("key"),
-                "issue_type": issue_type,
-                "priority": priority_value,
-                "comment_count": comment_count,
-                "word_count": word_count,
-                "label_count": label_count,
-                "component_count": component_count,
-                "original_estimate": original_estimate / 3600 if original_estimate else 0,  # hours
-                "time_spent": time_spent / 3600 if time_spent else 0,  # hours
-                "cycle_time": cycle_time if cycle_time is not None else 0,
-                "assignee": assignee,
-                "reporter": reporter
-            }
-            
-            issue_data.append(row)
-            
-        # Convert to DataFrame
-        if not issue_data:
-            return {"error": "Failed to extract issue features for pattern analysis"}
-            
-        df = pd.DataFrame(issue_data)
+        cycle_time = resolution_days(frame)
+        df = pd.DataFrame({
+            "key": frame["key"],
+            "issue_type": frame["issue_type"].astype(object).fillna("Unknown"),
+            "priority": frame["priority"].astype(object).map(PRIORITY_LEVELS).fillna(3).astype("int64"),
+            "comment_count": frame["comment_count"],
+            "word_count": frame["word_count"],
+            "label_count": frame["label_count"],
+            "component_count": frame["component_count"],
+            "original_estimate": frame["original_estimate"] / 3600,  # hours
+            "time_spent": frame["time_spent"] / 3600,  # hours
+            "cycle_time": cycle_time.fillna(0),  # days
+            "assignee": frame["assignee"].astype(object).fillna("Unassigned"),
+            "reporter": frame["reporter"].astype(object).fillna("Unknown"),
+        })
         
         # Group by assignee and issue type to find specialization patterns
-        assignee_specialization = df.groupby(['assignee', 'issue_type']).size().reset_index(name='count')
-        assignee_specialization = assignee_specialization.sort_values(['assignee', 'count'], ascending=[True, False])
-        
-        primary_issue_types = {}
-        for assignee in df['assignee'].unique():
-            if assignee == "Unassigned":
-                continue
-                
-            assignee_issues = assignee_specialization[assignee_specialization['assignee'] == assignee]
-            if not assignee_issues.empty:
-                top_issue = assignee_issues.iloc[0]
-                total_issues = df[df['assignee'] == assignee].shape[0]
-                if total_issues > 0:
-                    specialization_ratio = top_issue['count'] / total_issues
-                    if specialization_ratio > 0.6:  # 60% or more of one type
-                        primary_issue_types[assignee] = {
-                            "issue_type": top_issue['issue_type'],
-                            "count": int(top_issue['count']),
-                            "total": total_issues,
-                            "specialization_ratio": round(specialization_ratio, 2)
-                        }
+        type_counts = df[df['assignee'] != "Unassigned"].groupby(['assignee', 'issue_type']).size()
+        type_counts = type_counts[type_counts > 0].sort_values(ascending=False, kind="stable")
+        top_types = type_counts.groupby(level='assignee', sort=False).head(1).reset_index(name='type_count')
+        top_types['total'] = top_types['assignee'].map(type_counts.groupby(level='assignee').sum())
+        top_types['specialization_ratio'] = top_types['type_count'] / top_types['total']
+        
+        primary_issue_types = {
+            row.assignee: {
+                "issue_type": row.issue_type,
+                "count": int(row.type_count),
+                "total": int(row.total),
+                "specialization_ratio": round(float(row.specialization_ratio), 2)
+            }
+            for row in top_types[top_types['specialization_ratio'] > 0.6].itertuples(index=False)  # 60% or more of one type
+        }
         
         # Find cycle time patterns by issue type
-        cycle_time_by_type = df[df['cycle_time'] > 0].groupby('issue_type')['cycle_time'].agg(['mean', 'median', 'count']).reset_index()
+        resolved_df = df[df['cycle_time'] > 0]
+        cycle_time_by_type = resolved_df.groupby('issue_type')['cycle_time'].agg(['mean', 'median', 'count']).reset_index()
         cycle_time_by_type = cycle_time_by_type[cycle_time_by_type['count'] >= 5]  # Only include types with enough samples
         cycle_time_by_type = cycle_time_by_type.sort_values('mean', ascending=False)
         
-        # Identify outliers in cycle time
-        outliers = []
-        for issue_type in cycle_time_by_type['issue_type'].unique():
-            type_df = df[(df['issue_type'] == issue_type) & (df['cycle_time'] > 0)]
-            if len(type_df) >= 5:  # Need enough data for meaningful analysis
-                mean = type_df['cycle_time'].mean()
-                std = type_df['cycle_time'].std()
-                
-                # Find outliers (> 2 standard deviations from mean)
-                if std > 0:
-                    for _, row in type_df[type_df['cycle_time'] > mean + 2*std].iterrows():
-                        outliers.append({
-                            "key": row['key'],
-                            "issue_type": issue_type,
-                            "cycle_time": round(float(row['cycle_time']), 2),
-                            "average_for_type": round(float(mean), 2),
-                            "standard_deviation": round(float(std), 2),
-                            "z_score": round(float((row['cycle_time'] - mean) / std), 2)
-                        })
+        # Identify outliers in cycle time (> 2 standard deviations from the mean of their type)
+        type_stats = resolved_df.groupby('issue_type')['cycle_time'].agg(['mean', 'std', 'count'])
+        stats = type_stats.reindex(resolved_df['issue_type']).set_axis(resolved_df.index)
+        outlier_mask = (stats['count'] >= 5) & (stats['std'] > 0) & (resolved_df['cycle_time'] > stats['mean'] + 2 * stats['std'])
+        outlier_df = pd.concat([resolved_df[['key', 'issue_type', 'cycle_time']], stats[['mean', 'std']]], axis=1)[outlier_mask]
+        outlier_df = outlier_df.rename(columns={'mean': 'average_for_type', 'std': 'standard_deviation'})
+        outlier_df['type_rank'] = outlier_df['issue_type'].map(
+            {issue_type: rank for rank, issue_type in enumerate(cycle_time_by_type['issue_type'])}
+        )
+        outliers = [
+            {
+                "key": row.key,
+                "issue_type": row.issue_type,
+                "cycle_time": round(float(row.cycle_time), 2),
+                "average_for_type": round(float(row.average_for_type), 2),
+                "standard_deviation": round(float(row.standard_deviation), 2),
+                "z_score": round(float((row.cycle_time - row.average_for_type) / row.standard_deviation), 2)
+            }
+            for row in outlier_df.sort_values('type_rank', kind="stable").itertuples(index=False)
+        ]
         
         # Identify estimation accuracy patterns
         estimation_patterns = []
         estimate_df = df[(df['original_estimate'] > 0) & (df['time_spent'] > 0)]
         
         if not estimate_df.empty:
-            estimate_df['accuracy_ratio'] = estimate_df['time_spent'] / estimate_df['original_estimate']
+            estimate_df = estimate_df.assign(accuracy_ratio=estimate_df['time_spent'] / estimate_df['original_estimate'])
             
             # Group by issue type
             accuracy_by_type = estimate_df.groupby('issue_type')['accuracy_ratio'].agg(['mean', 'count']).reset_index()
@@ -480,29 +419,39 @@ class AnalyticsManager:
                         if feature in cluster_df.columns:
                             cluster_df[feature] = cluster_df[feature].fillna(0)
                     
-                    # Normalize the data
-                    scaler = StandardScaler()
-                    scaled_data = scaler.fit_transform(cluster_df[features])
-                    
-                    # Determine optimal number of clusters (using simplified method)
-                    max_clusters = min(6, len(cluster_df) // 5)  # Limit max clusters based on data size
-                    wcss = []
-                    for i in range(1, max_clusters + 1):
-                        kmeans = KMeans(n_clusters=i, init='k-means++', max_iter=300, n_init=10, random_state=42)
-                        kmeans.fit(scaled_data)
-                        wcss.append(kmeans.inertia_)
-                    
-                    # Simple elbow method - identify largest drop in WCSS
-                    drops = [wcss[i] - wcss[i+1] for i in range(len(wcss)-1)]
-                    if drops:
-                        optimal_k = drops.index(max(drops)) + 2  # +2 because we start from 1 and need to offset the index
+                    if len(cluster_df) >= SCALABLE_CLUSTERING_MIN_ISSUES:
+                        # Large projects: sample-fitted mini-batch centroids, persisted so
+                        # reruns only score new or changed issues
+                        cluster_labels, run = self.clustering.cluster(
+                            project_key, cluster_df['key'], cluster_df[features]
+                        )
+                        optimal_k = run["num_clusters"]
+                        method = "MiniBatchKMeans"
                     else:
-                        optimal_k = 2
-                    
-                    # Apply KMeans with optimal k
-                    kmeans = KMeans(n_clusters=optimal_k, init='k-means++', max_iter=300, n_init=10, random_state=42)
-                    kmeans.fit(scaled_data)
-                    cluster_labels = kmeans.labels_
+                        # Normalize the data
+                        scaler = StandardScaler()
+                        scaled_data = scaler.fit_transform(cluster_df[features])
+                        
+                        # Determine optimal number of clusters (using simplified method)
+                        max_clusters = min(6, len(cluster_df) // 5)  # Limit max clusters based on data size
+                        wcss = []
+                        for i in range(1, max_clusters + 1):
+                            kmeans = KMeans(n_clusters=i, init='k-means++', max_iter=300, n_init=10, random_state=42)
+                            kmeans.fit(scaled_data)
+                            wcss.append(kmeans.inertia_)
+                        
+                        # Simple elbow method - identify largest drop in WCSS
+                        drops = [wcss[i] - wcss[i+1] for i in range(len(wcss)-1)]
+                        if drops:
+                            optimal_k = drops.index(max(drops)) + 2  # +2 because we start from 1 and need to offset the index
+                        else:
+                            optimal_k = 2
+                        
+                        # Apply KMeans with optimal k
+                        kmeans = KMeans(n_clusters=optimal_k, init='k-means++', max_iter=300, n_init=10, random_state=42)
+                        kmeans.fit(scaled_data)
+                        cluster_labels = kmeans.labels_
+                        method = "KMeans"
                     
                     # Add cluster labels to dataframe
                     cluster_df['cluster'] = cluster_labels
@@ -571,7 +520,7 @@ class AnalyticsManager:
                             insight["interpretation"] = "No distinctive characteristics identified"
                     
                     clustering_results = {
-                        "method": "KMeans",
+                        "method": method,
                         "num_clusters": optimal_k,
                         "insights": cluster_insights
                     }
@@ -602,6 +551,17 @@ class AnalyticsManager:
         Returns:
             Dict containing trend analysis
         """
+        try:
+            snapshot = self._build_snapshot(client, project_key, REPORT_SECTIONS["trends"])
+        except ValueError as e:
+            logger.error(f"Failed to fetch project issues: {e}")
+            return {"error": "Failed to fetch project issues"}
+        return self._trends_section(snapshot, time_range)
+        
+    def _trends_section(self, snapshot: Dict, time_range: str = "6m") -> Dict:
+        """Compute the trend report for a time range from a project snapshot."""
+        project_key = snapshot["project_key"]
+        
         # Parse time range
         range_value = int(time_range[:-1])
         range_unit = time_range[-1]
@@ -615,38 +575,12 @@ class AnalyticsManager:
         else:
             return {"error": "Invalid time range format. Use format like '1w', '1m', '6m', '1y'"}
             
-        jql = f"project = {project_key} AND created >= '{start_date.strftime('%Y-%m-%d')}'"
-        response = client.request(
-            "GET", 
-            f"{os.environ.get('JIRA_URL')}/rest/api/2/search",
-            params={
-                "jql": jql,
-                "maxResults": 1000,
-                "fields": "summary,issuetype,created,updated,status,priority,assignee,resolutiondate"
-            }
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch trend data: {response.text}")
-            return {"error": "Failed to fetch trend data"}
-            
-        issues = response.json().get("issues", [])
-        if not issues:
+        # Issues created in the range
+        df = snapshot["frame"]
+        start_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        df = df[df["created"] >= start_day]
+        if df.empty:
             return {"message": "No issues found in the specified time range"}
-            
-        # Convert dates to datetime objects
-        for issue in issues:
-            fields = issue.get("fields", {})
-            if "created" in fields:
-                fields["created_date"] = datetime.datetime.strptime(
-                    fields["created"], 
-                    "%Y-%m-%dT%H:%M:%S.%f%z"
-                ).replace(tzinfo=None)
-            if "resolutiondate" in fields and fields["resolutiondate"]:
-                fields["resolved_date"] = datetime.datetime.strptime(
-                    fields["resolutiondate"], 
-                    "%Y-%m-%dT%H:%M:%S.%f%z"
-                ).replace(tzinfo=None)
                 
         # Determine appropriate time buckets based on range
         if range_unit == "w" or (range_unit == "m" and range_value <= 1):
@@ -699,182 +633,99 @@ class AnalyticsManager:
                 else:
                     current = current.replace(month=current.month + 1)
         
-        # Initialize data structures for trend analysis
-        created_by_bucket = {bucket.strftime(bucket_format): 0 for bucket in date_buckets}
-        resolved_by_bucket = {bucket.strftime(bucket_format): 0 for bucket in date_buckets}
-        created_by_type = {}
-        status_counts_by_bucket = {}
+        # Count created and resolved issues per bucket
+        bucket_keys = [bucket.strftime(bucket_format) for bucket in date_buckets]
+        created_buckets = format_dates(df["created"], bucket_format)
+        created_by_bucket = bucket_counts(created_buckets, bucket_keys)
+        resolved_by_bucket = bucket_counts(format_dates(df["resolved"], bucket_format), bucket_keys)
+        
+        # Count created issues by type and bucket
+        issue_types = df["issue_type"].astype(object).fillna("Unknown")
+        created_by_type = {
+            issue_type: bucket_counts(type_buckets, bucket_keys)
+            for issue_type, type_buckets in created_buckets.groupby(issue_types, sort=False)
+        }
         
-        # Process issues
-        for issue in issues:
-            fields = issue.get("fields", {})
-            
-            # Count created issues by bucket
-            if "created_date" in fields:
-                bucket_key = fields["created_date"].strftime(bucket_format)
-                created_by_bucket[bucket_key] = created_by_bucket.get(bucket_key, 0) + 1
-                
-                # Count by issue type
-                issue_type = fields.get("issuetype", {}).get("name", "Unknown")
-                if issue_type not in created_by_type:
-                    created_by_type[issue_type] = {bucket.strftime(bucket_format): 0 for bucket in date_buckets}
-                created_by_type[issue_type][bucket_key] = created_by_type[issue_type].get(bucket_key, 0) + 1
-            
-            # Count resolved issues by bucket
-            if "resolved_date" in fields:
-                bucket_key = fields["resolved_date"].strftime(bucket_format)
-                resolved_by_bucket[bucket_key] = resolved_by_bucket.get(bucket_key, 0) + 1
-        
-        # Status distribution over time
-        status_counts = {}
-        for bucket in date_buckets:
-            bucket_key = bucket.strftime(bucket_format)
-            status_counts[bucket_key] = {}
-            
-            # Calculate status distribution at the end of this bucket
-            for issue in issues:
-                fields = issue.get("fields", {})
-                created_date = fields.get("created_date")
-                
-                if created_date and created_date <= bucket:
-                    status = fields.get("status", {}).get("name", "Unknown")
-                    
-                    # Check if it was resolved before the end of this bucket
-                    resolved_date = fields.get("resolved_date", None)
+        # Status distribution at the end of each bucket
+        status_counts = dict(zip(bucket_keys, status_timeline(df, date_buckets)))
                     
-                    current_status = status
-                    if resolved_date and resolved_date <= bucket:
-                        current_status = "Done"
-                    
-                    status_counts[bucket_key][current_status] = status_counts[bucket_key].get(current_status, 0) + 1
-                    
-        # Calculate velocity metrics
-        velocity_trend = []
-        for i, bucket in enumerate(date_buckets):
-            if i > 0:  # Skip first bucket as we need previous data
-                bucket_key = bucket.strftime(bucket_format)
-                prev_bucket_key = date_buckets[i-1].strftime(bucket_format)
-                
-                created = created_by_bucket.get(bucket_key, 0)
-                resolved = resolved_by_bucket.get(bucket_key, 0)
-                
-                # Calculate total issues and backlog growth
-                total_created_to_date = sum(created_by_bucket.get(date_buckets[j].strftime(bucket_format), 0) 
-                                          for j in range(i+1))
-                total_resolved_to_date = sum(resolved_by_bucket.get(date_buckets[j].strftime(bucket_format), 0) 
-                                           for j in range(i+1))
-                backlog_size = total_created_to_date - total_resolved_to_date
-                backlog_growth = backlog_size - (total_created_to_date - total_resolved_to_date - 
-                                              (created - resolved))
-                
-                velocity_trend.append({
-                    "period": bucket_key,
-                    "created": created,
-                    "resolved": resolved,
-                    "net_change": resolved - created,
-                    "backlog_size": backlog_size,
-                    "backlog_growth": backlog_growth
-                })
+        # Calculate velocity metrics from cumulative created and resolved counts
+        created_counts = np.array([created_by_bucket[key] for key in bucket_keys])
+        resolved_counts = np.array([resolved_by_bucket[key] for key in bucket_keys])
+        backlog_sizes = np.cumsum(created_counts) - np.cumsum(resolved_counts)
+        
+        velocity_trend = [
+            {
+                "period": bucket_keys[i],
+                "created": int(created_counts[i]),
+                "resolved": int(resolved_counts[i]),
+                "net_change": int(resolved_counts[i] - created_counts[i]),
+                "backlog_size": int(backlog_sizes[i]),
+                "backlog_growth": int(created_counts[i] - resolved_counts[i])
+            }
+            for i in range(1, len(bucket_keys))  # Skip first bucket as we need previous data
+        ]
                 
         # Generate visualizations
         chart_files = {}
-        try:
-            # Create dates for plotting
-            if bucket_unit == "day":
-                x_dates = [bucket.strftime("%m-%d") for bucket in date_buckets]
-            elif bucket_unit == "week":
-                x_dates = [f"W{bucket.strftime('%U')}" for bucket in date_buckets]
-            else:
-                x_dates = [bucket.strftime("%b %Y") for bucket in date_buckets]
-                
-            # Velocity chart
-            plt.figure(figsize=(12, 6))
-            created_values = [created_by_bucket.get(bucket.strftime(bucket_format), 0) for bucket in date_buckets]
-            resolved_values = [resolved_by_bucket.get(bucket.strftime(bucket_format), 0) for bucket in date_buckets]
-            
-            plt.bar(x_dates, created_values, color='blue', alpha=0.6, label='Created')
-            plt.bar(x_dates, resolved_values, color='green', alpha=0.6, label='Resolved')
-            
-            plt.title(f"Issue Velocity for {project_key} ({time_range})")
-            plt.xlabel("Time Period")
-            plt.ylabel("Number of Issues")
-            plt.xticks(rotation=45)
-            plt.legend()
-            plt.tight_layout()
-            
-            # Save chart to file
-            velocity_chart_path = os.path.join(self.data_dir, f"{project_key}_velocity_{time_range}.png")
-            plt.savefig(velocity_chart_path)
-            plt.close()
-            chart_files["velocity_chart"] = velocity_chart_path
-            
-            # Status distribution chart (stacked area)
-            plt.figure(figsize=(12, 6))
-            
-            # Extract all unique statuses
-            all_statuses = set()
-            for bucket_data in status_counts.values():
-                all_statuses.update(bucket_data.keys())
-                
-            # Create data for stacked area chart
-            status_data = {status: [] for status in all_statuses}
-            for bucket in date_buckets:
-                bucket_key = bucket.strftime(bucket_format)
-                bucket_status_counts = status_counts.get(bucket_key, {})
-                
-                for status in all_statuses:
-                    status_data[status].append(bucket_status_counts.get(status, 0))
-            
-            # Plot stacked area
-            plt.stackplot(x_dates, 
-                         [status_data[status] for status in all_statuses],
-                         labels=list(all_statuses),
-                         alpha=0.7)
-            
-            plt.title(f"Issue Status Distribution for {project_key} ({time_range})")
-            plt.xlabel("Time Period")
-            plt.ylabel("Number of Issues")
-            plt.xticks(rotation=45)
-            plt.legend(loc='upper left')
-            plt.tight_layout()
-            
-            # Save chart to file
-            status_chart_path = os.path.join(self.data_dir, f"{project_key}_status_{time_range}.png")
-            plt.savefig(status_chart_path)
-            plt.close()
-            chart_files["status_chart"] = status_chart_path
-            
-            # Issue type distribution chart
-            plt.figure(figsize=(12, 6))
-            
-            # Get the top 5 issue types by total count
-            issue_type_totals = {
-                issue_type: sum(counts.values()) 
-                for issue_type, counts in created_by_type.items()
-            }
-            top_types = sorted(issue_type_totals.items(), key=lambda x: x[1], reverse=True)[:5]
-            top_type_names = [t[0] for t in top_types]
-            
-            # Plot lines for top issue types
-            for issue_type in top_type_names:
-                type_counts = [created_by_type[issue_type].get(bucket.strftime(bucket_format), 0) 
-                              for bucket in date_buckets]
-                plt.plot(x_dates, type_counts, marker='o', label=issue_type)
-            
-            plt.title(f"Issue Types Over Time for {project_key} ({time_range})")
-            plt.xlabel("Time Period")
-            plt.ylabel("Number of Issues Created")
-            plt.xticks(rotation=45)
-            plt.legend()
-            plt.tight_layout()
-            
-            # Save chart to file
-            type_chart_path = os.path.join(self.data_dir, f"{project_key}_types_{time_range}.png")
-            plt.savefig(type_chart_path)
-            plt.close()
-            chart_files["type_chart"] = type_chart_path
+        
+        # Create dates for plotting
+        if bucket_unit == "day":
+            x_dates = [bucket.strftime("%m-%d") for bucket in date_buckets]
+        elif bucket_unit == "week":
+            x_dates = [f"W{bucket.strftime('%U')}" for bucket in date_buckets]
+        else:
+            x_dates = [bucket.strftime("%b %Y") for bucket in date_buckets]
             
-        except Exception as e:
+        # Velocity chart
+        created_values = [created_by_bucket.get(bucket.strftime(bucket_format), 0) for bucket in date_buckets]
+        resolved_values = [resolved_by_bucket.get(bucket.strftime(bucket_format), 0) for bucket in date_buckets]
+        
+        # Status distribution chart (stacked area), in a stable status order so unchanged charts hit the cache
+        all_statuses = sorted({status for bucket_data in status_counts.values() for status in bucket_data})
+        status_data = {
+            status: [status_counts.get(bucket.strftime(bucket_format), {}).get(status, 0) for bucket in date_buckets]
+            for status in all_statuses
+        }
+        
+        # Issue type distribution chart for the top 5 issue types by total count
+        issue_type_totals = {
+            issue_type: sum(counts.values()) 
+            for issue_type, counts in created_by_type.items()
+        }
+        top_types = sorted(issue_type_totals.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_type_names = [t[0] for t in top_types]
+        
+        chart_specs = {
+            "velocity_chart": chart_spec(
+                "bar", f"Issue Velocity for {project_key} ({time_range})", "Time Period", "Number of Issues", x_dates,
+                [{"label": "Created", "values": created_values, "color": "blue"},
+                 {"label": "Resolved", "values": resolved_values, "color": "green"}]
+            ),
+            "status_chart": chart_spec(
+                "stack", f"Issue Status Distribution for {project_key} ({time_range})", "Time Period",
+                "Number of Issues", x_dates,
+                [{"label": status, "values": status_data[status]} for status in all_statuses],
+                legend_loc="upper left"
+            ),
+            "type_chart": chart_spec(
+                "line", f"Issue Types Over Time for {project_key} ({time_range})", "Time Period",
+                "Number of Issues Created", x_dates,
+                [{"label": issue_type,
+                  "values": [created_by_type[issue_type].get(bucket.strftime(bucket_format), 0) for bucket in date_buckets]}
+                 for issue_type in top_type_names]
+            ),
+        }
+        
+        # Charts are rendered in worker processes and cached by content, then saved with the report
+        chart_file_names = {"velocity_chart": "velocity", "status_chart": "status", "type_chart": "types"}
+        try:
+            for chart_name, image in chart_renderer.render_many(chart_specs).items():
+                chart_path = os.path.join(self.data_dir, f"{project_key}_{chart_file_names[chart_name]}_{time_range}.png")
+                with open(chart_path, "wb") as f:
+                    f.write(image)
+                chart_files[chart_name] = chart_path
+        except (OSError, ValueError) as e:
             logger.error(f"Error generating trend charts: {str(e)}")
             
         # Identify trends and insights
@@ -963,7 +814,7 @@ class AnalyticsManager:
         return {
             "project_key": project_key,
             "time_range": time_range,
-            "total_issues": len(issues),
+            "total_issues": len(df),
             "velocity_trend": velocity_trend,
             "created_by_period": created_by_bucket,
             "resolved_by_period": resolved_by_bucket,
@@ -995,31 +846,43 @@ class AnalyticsManager:
             "generated_at": datetime.datetime.now().isoformat(),
         }
         
+        # Fetch the project once for every section of the report and run the sections in parallel
+        plan = REPORT_PLANS.get(report_type, [])
+        results = {}
+        if plan:
+            parts = set().union(*(REPORT_SECTIONS[section] for _, section, _ in plan))
+            try:
+                snapshot = self._get_report_snapshot(project_key, parts)
+            except ValueError as e:
+                logger.error(f"Failed to fetch project issues: {e}")
+                return {"error": "Failed to fetch project issues"}
+            results = self._run_sections(snapshot, plan)
+            
         # Generate report based on type
         if report_type == "comprehensive":
             # Project metrics
-            metrics = self.get_project_metrics(project_key)
+            metrics = results["project_metrics"]
             if "error" not in metrics:
                 report["project_metrics"] = metrics
                 
             # Time tracking analysis
-            time_tracking = self.analyze_time_tracking(project_key)
+            time_tracking = results["time_tracking"]
             if "error" not in time_tracking:
                 report["time_tracking"] = time_tracking
                 
             # Issue patterns
-            patterns = self.detect_issue_patterns(project_key)
+            patterns = results["issue_patterns"]
             if "error" not in patterns:
                 report["issue_patterns"] = patterns
                 
             # Trend analysis
-            trends = self.generate_trend_report(project_key, "3m")
+            trends = results["trends"]
             if "error" not in trends:
                 report["trends"] = trends
                 
         elif report_type == "velocity":
             # Focus on velocity and trends
-            metrics = self.get_project_metrics(project_key)
+            metrics = results["project_metrics"]
             if "error" not in metrics:
                 report["project_metrics"] = {
                     "total_issues": metrics["total_issues"],
@@ -1028,9 +891,9 @@ class AnalyticsManager:
                 }
                 
             # Detailed trend analysis
-            trends_1m = self.generate_trend_report(project_key, "1m")
-            trends_3m = self.generate_trend_report(project_key, "3m")
-            trends_6m = self.generate_trend_report(project_key, "6m")
+            trends_1m = results["trends_1m"]
+            trends_3m = results["trends_3m"]
+            trends_6m = results["trends_6m"]
             
             report["trends"] = {
                 "short_term": trends_1m if "error" not in trends_1m else {"error": trends_1m.get("error")},
@@ -1040,12 +903,12 @@ class AnalyticsManager:
             
         elif report_type == "efficiency":
             # Focus on time tracking and efficiency
-            time_tracking = self.analyze_time_tracking(project_key)
+            time_tracking = results["time_tracking"]
             if "error" not in time_tracking:
                 report["time_tracking"] = time_tracking
                 
             # Get resolution time metrics
-            metrics = self.get_project_metrics(project_key)
+            metrics = results["project_metrics"]
             if "error" not in metrics:
                 report["resolution_metrics"] = {
                     "resolution_time": metrics["resolution_time"],
@@ -1053,7 +916,7 @@ class AnalyticsManager:
                 }
                 
             # Get issue patterns related to efficiency
-            patterns = self.detect_issue_patterns(project_key)
+            patterns = results["issue_patterns"]
             if "error" not in patterns:
                 report["efficiency_patterns"] = {
                     "cycle_time_outliers": patterns.get("cycle_time_outliers", []),
@@ -1063,7 +926,7 @@ class AnalyticsManager:
                 
         elif report_type == "quality":
             # Focus on issue patterns and issue type distribution
-            metrics = self.get_project_metrics(project_key)
+            metrics = results["project_metrics"]
             if "error" not in metrics:
                 report["issue_distribution"] = {
                     "issue_types": metrics["issue_types"],
@@ -1071,7 +934,7 @@ class AnalyticsManager:
                 }
                 
             # Get trend data for bug reporting
-            trends = self.generate_trend_report(project_key, "3m")
+            trends = results["trends"]
             if "error" not in trends and "issue_type_trends" in trends:
                 bug_trends = {
                     period: count 
@@ -1159,6 +1022,7 @@ class AnalyticsManager:
         """
         # Create markdown content for the report
         content = f"# {title}\n\n"
+        chart_uploads = {}
         content += f"*Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}*\n\n"
         
         # Add executive summary
@@ -1243,34 +1107,15 @@ class AnalyticsManager:
                     content += f"| {period['period']} | {period['created']} | {period['resolved']} | {period['net_change']} | {period['backlog_size']} |\n"
                 content += "\n"
                 
-            # Add embedded charts if available
+            # Embed the charts; they are attached once the page exists
             if "chart_files" in trends:
                 content += "### Trend Charts\n\n"
                 
-                # Upload chart images and embed them
                 for chart_name, chart_path in trends["chart_files"].items():
-                    try:
-                        # Upload the chart as an attachment
-                        attachment_result = client.request(
-                            "POST",
-                            f"{os.environ.get('CONFLUENCE_URL')}/rest/api/content/{page_id}/child/attachment",
-                            headers={"X-Atlassian-Token": "no-check"},
-                            files={
-                                "file": (os.path.basename(chart_path), open(chart_path, "rb"), "image/png")
-                            }
-                        )
-                        
-                        if attachment_result.status_code in (200, 201):
-                            # Get the attachment ID
-                            attachment_id = attachment_result.json()["results"][0]["id"]
-                            
-                            # Add the chart to the content
-                            chart_title = chart_name.replace("_", " ").title()
-                            content += f"#### {chart_title}\n\n"
-                            content += f"![{chart_title}](/wiki/download/attachments/{page_id}/{os.path.basename(chart_path)})\n\n"
-                    except Exception as e:
-                        logger.error(f"Failed to upload chart {chart_name}: {str(e)}")
-                        content += f"*Chart {chart_name} could not be uploaded: {str(e)}*\n\n"
+                    chart_title = chart_name.replace("_", " ").title()
+                    content += f"#### {chart_title}\n\n"
+                    content += f"![{chart_title}]({os.path.basename(chart_path)})\n\n"
+                    chart_uploads[chart_name] = chart_path
                         
         # Issue patterns
         if "issue_patterns" in report:
@@ -1315,7 +1160,7 @@ class AnalyticsManager:
                     "space": {"key": space_key},
                     "body": {
                         "storage": {
-                            "value": self._markdown_to_storage_format(content),
+                            "value": markdown_to_storage(content),
                             "representation": "storage"
                         }
                     }
@@ -1327,12 +1172,16 @@ class AnalyticsManager:
                 page_id = page_data["id"]
                 page_url = page_data["_links"]["base"] + page_data["_links"]["webui"]
                 
-                return {
+                result = {
                     "success": True,
                     "page_id": page_id,
                     "page_url": page_url,
                     "message": f"Report published successfully to {title}"
                 }
+                failed_charts = self._upload_charts(client, page_id, chart_uploads)
+                if failed_charts:
+                    result["failed_charts"] = failed_charts
+                return result
             else:
                 logger.error(f"Failed to create page: {create_result.text}")
                 return {
@@ -1347,116 +1196,103 @@ class AnalyticsManager:
                 "error": f"Error publishing report: {str(e)}"
             }
             
-    def _get_all_project_issues(self, client: AuthenticatedClient, project_key: str, fields: Optional[List[str]] = None) -> List[Dict]:
-        """Helper method to get all issues for a project with pagination."""
-        if project_key in self._issue_cache:
-            return self._issue_cache[project_key]
-            
-        all_issues = []
-        start_at = 0
-        max_results = 100
-        fields_param = ",".join(fields) if fields else "*navigable"
+    def _upload_charts(self, client: AuthenticatedClient, page_id: str, chart_files: Dict[str, str]) -> Dict[str, str]:
+        """
+        Attach chart images to a page, uploading them concurrently.
         
-        while True:
+        Args:
+            client: Authenticated client
+            page_id: ID of the page embedding the charts
+            chart_files: Chart image paths by chart name
+            
+        Returns:
+            Error message by chart name for the charts that could not be uploaded
+        """
+        def upload(chart_path: str) -> None:
+            with open(chart_path, "rb") as f:
+                image = f.read()
             response = client.request(
-                "GET", 
-                f"{os.environ.get('JIRA_URL')}/rest/api/2/search",
-                params={
-                    "jql": f"project = {project_key}",
-                    "startAt": start_at,
-                    "maxResults": max_results,
-                    "fields": fields_param
-                }
+                "POST",
+                f"{os.environ.get('CONFLUENCE_URL')}/rest/api/content/{page_id}/child/attachment",
+                headers={"X-Atlassian-Token": "no-check"},
+                files={"file": (os.path.basename(chart_path), image, "image/png")}
             )
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch project issues: {response.text}")
-                return []
+            if response.status_code not in (200, 201):
+                raise ValueError(f"Attachment upload failed: {response.status_code}")
                 
-            data = response.json()
-            issues = data.get("issues", [])
-            all_issues.extend(issues)
+        failed = {}
+        if not chart_files:
+            return failed
+        with ThreadPoolExecutor(max_workers=min(len(chart_files), CHART_UPLOAD_CONCURRENCY)) as executor:
+            futures = {name: executor.submit(upload, path) for name, path in chart_files.items()}
+            for chart_name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Failed to upload chart {chart_name}: {str(e)}")
+                    failed[chart_name] = str(e)
+        return failed
+        
+    def _get_all_project_issues(self, client: AuthenticatedClient, project_key: str) -> List[Dict]:
+        """Helper method to get all issues for a project from the incremental issue mirror."""
+        return issue_mirror.get_project_issues(client, project_key)
+        
+    def _build_snapshot(self, client: AuthenticatedClient, project_key: str, parts: Set[str]) -> Dict:
+        """
+        Fetch the project data needed by a set of report sections, once.
+        
+        Args:
+            client: Authenticated client
+            project_key: Project key
+            parts: Union of the snapshot parts required by the sections (see REPORT_SECTIONS)
             
-            if len(issues) < max_results or start_at + len(issues) >= data.get("total", 0):
-                # No more issues to fetch
-                break
-                
-            start_at += len(issues)
+        Returns:
+            Picklable dict with the project key, the issue frame and, when
+            requested, the worklog totals (None if they could not be fetched)
             
-        # Cache the results to avoid repeated API calls
-        self._issue_cache[project_key] = all_issues
-        return all_issues
-        
-    def _markdown_to_storage_format(self, markdown: str) -> str:
-        """
-        Simple converter for markdown to Confluence storage format.
-        For a full implementation, a specialized library would be better.
+        Raises:
+            ValueError: If the project issues cannot be fetched
         """
-        # This is a very simplified conversion
-        html = markdown.replace("# ", "<h1>").replace("\n# ", "\n<h1>")
-        html = html.replace("## ", "<h2>").replace("\n## ", "\n<h2>")
-        html = html.replace("### ", "<h3>").replace("\n### ", "\n<h3>")
-        html = html.replace("#### ", "<h4>").replace("\n#### ", "\n<h4>")
-        
-        # Close heading tags
-        html = html.replace("<h1>", "<h1>").replace("\n", "</h1>\n", 1)
-        html = html.replace("<h2>", "<h2>").replace("\n", "</h2>\n", 1)
-        html = html.replace("<h3>", "<h3>").replace("\n", "</h3>\n", 1)
-        html = html.replace("<h4>", "<h4>").replace("\n", "</h4>\n", 1)
-        
-        # Convert lists
-        html = html.replace("\n- ", "\n<li>").replace("\n<li>", "</li>\n<li>", 1)
-        html = "<ul>" + html + "</ul>"
-        
-        # Convert tables
-        if "|" in html:
-            lines = html.split("\n")
-            in_table = False
-            table_html = ""
-            
-            for i, line in enumerate(lines):
-                if line.startswith("|") and line.endswith("|"):
-                    if not in_table:
-                        in_table = True
-                        table_html += "<table>"
-                        
-                    # Skip separator line
-                    if "-|-" in line:
-                        continue
-                        
-                    cells = line.strip("|").split("|")
-                    row_html = "<tr>"
-                    
-                    for cell in cells:
-                        if i == 0 or (i == 2 and "-|-" in lines[1]):  # Header row
-                            row_html += f"<th>{cell.strip()}</th>"
-                        else:
-                            row_html += f"<td>{cell.strip()}</td>"
-                            
-                    row_html += "</tr>"
-                    table_html += row_html
-                elif in_table:
-                    in_table = False
-                    table_html += "</table>"
-                    html = html.replace(table_html, table_html)
-                    
-            if in_table:
-                table_html += "</table>"
-                
-        # Convert bold, italic, code
-        html = html.replace("**", "<strong>").replace("**", "</strong>")
-        html = html.replace("*", "<em>").replace("*", "</em>")
-        html = html.replace("`", "<code>").replace("`", "</code>")
+        issues = self._get_all_project_issues(client, project_key)
+        snapshot = {
+            "project_key": project_key,
+            "frame": issues_to_frame(issues, text="text" in parts),
+        }
+        if "worklogs" in parts:
+            try:
+                snapshot["worklogs"] = worklog_store.get_project_time(client, project_key, issues)
+            except ValueError as e:
+                logger.error(f"Failed to fetch time tracking data: {e}")
+                snapshot["worklogs"] = None
+        return snapshot
         
-        # Convert links
-        import re
-        html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
+    @with_auth_client("jira")
+    def _get_report_snapshot(self, client: AuthenticatedClient, project_key: str, parts: Set[str]) -> Dict:
+        """Helper method to build a project snapshot with an authenticated client."""
+        return self._build_snapshot(client, project_key, parts)
         
-        # Convert images
-        html = re.sub(r'!\[([^\]]+)\]\(([^)]+)\)', r'<img src="\2" alt="\1"/>', html)
+    def _run_sections(self, snapshot: Dict, plan: List[Tuple[str, str, Dict]]) -> Dict[str, Dict]:
+        """
+        Run report sections on a shared snapshot in the process pool.
         
-        # Wrap in proper Confluence storage format
-        return html
+        Args:
+            snapshot: Project snapshot covering every section of the plan
+            plan: (result name, section, options) for each section to run
+            
+        Returns:
+            Dict mapping each result name to the section output
+        """
+        calls = {
+            name: (_run_report_section, (self.data_dir, section, snapshot, options), {})
+            for name, section, options in plan
+        }
+        results = {}
+        for name, result in process_pool.run_all(calls).items():
+            if isinstance(result, Exception):
+                logger.error(f"Report section {name} failed: {result}")
+                result = {"error": f"Report section failed: {result}"}
+            results[name] = result
+        return results
 
 
 # Create a global instance
@@ -5,11 +5,11 @@ import json
 import time
 from datetime import datetime
 
-import requests
 from dotenv import load_dotenv
 
 from .config import BitbucketConfig
 from .document_types import Document
+from .transport import http_transport, async_http_transport
 
 # Load environment variables
 load_dotenv()
@@ -61,28 +61,64 @@ class BitbucketIntegrationManager:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(api_url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(api_url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(api_url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(api_url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(api_url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(api_url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(api_url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(api_url, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
-            if response.status_code >= 400:
-                error_msg = f"API request failed: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-                
-            # Return JSON response or empty dict for 204 No Content
-            return response.json() if response.content else {}
+            return self._handle_response(response)
             
         except Exception as e:
             logger.error(f"Error making API request to {endpoint}: {str(e)}")
             raise
 
+    async def _make_api_request_async(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
+        """
+        Make a request to the Bitbucket REST API over the async transport.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path (without base URL)
+            data: Optional payload for POST/PUT requests
+            params: Optional query parameters
+            
+        Returns:
+            Dictionary containing the API response
+        """
+        # Ensure endpoint starts with / and doesn't include base URL
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+            
+        if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+            
+        api_url = f"{self.config.url.rstrip('/')}{endpoint}"
+        
+        try:
+            response = await async_http_transport.request(
+                method, api_url, json=data, auth=self.auth, headers=self.headers, params=params
+            )
+            return self._handle_response(response)
+            
+        except Exception as e:
+            logger.error(f"Error making API request to {endpoint}: {str(e)}")
+            raise
+
+    def _handle_response(self, response) -> Dict:
+        """Raise for Bitbucket API errors and decode the response body."""
+        if response.status_code >= 400:
+            error_msg = f"API request failed: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+            
+        # Return JSON response or empty dict for 204 No Content
+        return response.json() if response.content else {}
+
     def _paginate_results(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
         """
         Paginate through all results from a Bitbucket API endpoint.
@@ -97,29 +133,42 @@ class BitbucketIntegrationManager:
         if params is None:
             params = {}
             
-        results = []
-        has_next = True
-        url = endpoint
+        response = self._make_api_request("GET", endpoint, params=params)
+        results = list(response.get("values", []))
+        
+        # When the first page reports the total size, request the remaining
+        # pages concurrently instead of following "next" links one by one
+        size = response.get("size")
+        pagelen = response.get("pagelen")
+        if "next" in response and size and pagelen:
+            page_count = -(-size // pagelen)
+            pages = async_http_transport.run(async_http_transport.gather([
+                lambda page=page: self._make_api_request_async(
+                    "GET", endpoint, params={**params, "page": page, "pagelen": pagelen}
+                )
+                for page in range(2, page_count + 1)
+            ]))
+            for page in pages:
+                results.extend(page.get("values", []))
+            return results
+            
+        has_next = "next" in response
         
         while has_next:
-            response = self._make_api_request("GET", url, params=params)
+            # Extract the path from the full URL
+            url_parts = response["next"].split(self.config.url)
+            if len(url_parts) < 2:
+                break
+                
+            # The params are already in the "next" URL
+            response = self._make_api_request("GET", url_parts[1])
             
             # Add the values from this page to our results
             if "values" in response:
                 results.extend(response["values"])
                 
             # Check if there's a next page
-            if "next" in response:
-                # Extract the path from the full URL
-                url_parts = response["next"].split(self.config.url)
-                if len(url_parts) > 1:
-                    url = url_parts[1]
-                    # Clear the params since they're already in the URL
-                    params = {}
-                else:
-                    has_next = False
-            else:
-                has_next = False
+            has_next = "next" in response
                 
         return results
         
@@ -0,0 +1,291 @@
+"""
+Chart rendering for MCP Atlassian analytics reports.
+
+Charts are described by plain, picklable specs (title, axis labels, x labels
+and named value series) and rendered with matplotlib's object-oriented API
+on an Agg canvas, without the global pyplot state machine, so concurrent
+renders cannot draw into each other's figures. Rendering runs in the shared
+worker process pool (see process_pool), keeping the GIL-heavy drawing out of
+the server process.
+
+Rendered PNG and SVG output is cached in a SQLite database keyed by a hash
+of the spec and format, so an unchanged chart is never drawn twice. The
+cache has a byte budget and evicts the least recently read charts once it is
+exceeded.
+"""
+
+import io
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from .local_store import cache_path, connect_sqlite
+from .process_pool import process_pool
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.chart_renderer")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of rendered charts; 0 disables the cache
+CACHE_FILE_NAME = "chart_cache.sqlite3"
+CHART_FORMATS = ("png", "svg")
+CHART_STYLE_VERSION = 1  # bump when render_chart output changes, to invalidate cached charts
+FIGURE_SIZE = (12, 6)
+
+
+def chart_spec(kind: str, title: str, xlabel: str, ylabel: str, x: List[str],
+               series: List[Dict[str, Any]], legend_loc: str = "best") -> Dict[str, Any]:
+    """
+    Describe a chart.
+
+    Args:
+        kind: "bar", "stack" (stacked area) or "line"
+        title: Chart title
+        xlabel: X axis label
+        ylabel: Y axis label
+        x: Category labels along the X axis
+        series: Series as dicts with "label" and "values" (one per x label)
+            and optional "color"
+        legend_loc: matplotlib legend location
+
+    Returns:
+        Picklable chart spec for render_chart
+    """
+    return {
+        "kind": kind,
+        "title": title,
+        "xlabel": xlabel,
+        "ylabel": ylabel,
+        "x": [str(label) for label in x],
+        "series": [
+            {"label": str(s["label"]), "values": [float(v) for v in s["values"]], "color": s.get("color")}
+            for s in series
+        ],
+        "legend_loc": legend_loc,
+    }
+
+
+def render_chart(spec: Dict[str, Any], fmt: str = "png") -> bytes:
+    """
+    Render a chart spec to PNG or SVG bytes.
+
+    A module-level function, so it can run in a worker process.
+
+    Args:
+        spec: Chart spec from chart_spec
+        fmt: Output format, "png" or "svg"
+
+    Returns:
+        The encoded image
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure(figsize=FIGURE_SIZE)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+
+    x = spec["x"]
+    series = spec["series"]
+    if spec["kind"] == "bar":
+        for s in series:
+            ax.bar(x, s["values"], color=s["color"], alpha=0.6, label=s["label"])
+    elif spec["kind"] == "stack":
+        if series:
+            ax.stackplot(x, [s["values"] for s in series], labels=[s["label"] for s in series], alpha=0.7)
+    elif spec["kind"] == "line":
+        for s in series:
+            ax.plot(x, s["values"], marker="o", color=s["color"], label=s["label"])
+    else:
+        raise ValueError(f"Unknown chart kind: {spec['kind']}")
+
+    ax.set_title(spec["title"])
+    ax.set_xlabel(spec["xlabel"])
+    ax.set_ylabel(spec["ylabel"])
+    ax.tick_params(axis="x", labelrotation=45)
+    if series:
+        ax.legend(loc=spec["legend_loc"])
+    figure.tight_layout()
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+class ChartRenderer:
+    """
+    Renders chart specs in worker processes, with a hash-keyed on-disk cache.
+
+    Cache errors are logged and treated as misses, so a broken cache never
+    breaks a report.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the ChartRenderer.
+
+        The cache database is opened on first use.
+
+        Args:
+            path: Path of the SQLite cache file
+            max_bytes: Byte budget for cached charts (0 disables the cache)
+        """
+        self.path = path or cache_path(CACHE_FILE_NAME)
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv("ATLASSIAN_CHART_CACHE_BYTES", DEFAULT_MAX_BYTES)
+        )
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self.lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.max_bytes > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            connection = connect_sqlite(self.path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS charts ("
+                " key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS charts_last_access ON charts (last_access)")
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def chart_key(spec: Dict[str, Any], fmt: str) -> str:
+        """Hash of a chart spec and output format."""
+        payload = json.dumps([CHART_STYLE_VERSION, fmt, spec], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def render(self, spec: Dict[str, Any], fmt: str = "png") -> bytes:
+        """
+        Render one chart, or return its cached rendering.
+
+        Args:
+            spec: Chart spec from chart_spec
+            fmt: Output format, "png" or "svg"
+
+        Returns:
+            The encoded image
+
+        Raises:
+            ValueError: If the chart cannot be rendered
+        """
+        charts = self.render_many({"chart": spec}, fmt)
+        if "chart" not in charts:
+            raise ValueError("Chart rendering failed")
+        return charts["chart"]
+
+    def render_many(self, specs: Dict[str, Dict[str, Any]], fmt: str = "png") -> Dict[str, bytes]:
+        """
+        Render several charts concurrently, reusing cached renderings.
+
+        Args:
+            specs: Chart specs by name
+            fmt: Output format, "png" or "svg"
+
+        Returns:
+            Encoded images by name; charts that failed to render are logged and omitted
+        """
+        if fmt not in CHART_FORMATS:
+            raise ValueError(f"Unsupported chart format: {fmt}")
+
+        keys = {name: self.chart_key(spec, fmt) for name, spec in specs.items()}
+        charts = {}
+        for name, key in keys.items():
+            cached = self._get(key)
+            if cached is not None:
+                charts[name] = cached
+
+        # Identical specs within a batch are rendered once
+        missing = {}
+        for name, key in keys.items():
+            if name not in charts:
+                missing.setdefault(key, name)
+        results = process_pool.run_all({
+            key: (render_chart, (specs[name], fmt), {}) for key, name in missing.items()
+        })
+
+        for key, result in results.items():
+            if isinstance(result, Exception):
+                logger.error(f"Failed to render chart {missing[key]}: {result}")
+                continue
+            self._put(key, result)
+            for name, name_key in keys.items():
+                if name_key == key:
+                    charts[name] = result
+        return charts
+
+    def _get(self, key: str) -> Optional[bytes]:
+        """Read a cached chart."""
+        if not self.enabled:
+            return None
+        with self.lock:
+            try:
+                connection = self._connect()
+                row = connection.execute("SELECT data FROM charts WHERE key=?", (key,)).fetchone()
+                if row is None:
+                    return None
+                connection.execute("UPDATE charts SET last_access=? WHERE key=?", (time.time(), key))
+                connection.commit()
+                return bytes(row[0])
+            except sqlite3.Error as e:
+                logger.warning(f"Chart cache read failed: {e}")
+                return None
+
+    def _put(self, key: str, data: bytes) -> None:
+        """Store a rendered chart, evicting the least recently read charts over budget."""
+        if not self.enabled or len(data) > self.max_bytes:
+            return
+        with self.lock:
+            try:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO charts (key, data, size, last_access) VALUES (?, ?, ?, ?)",
+                    (key, sqlite3.Binary(data), len(data), time.time())
+                )
+
+                total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM charts").fetchone()[0]
+                if total > self.max_bytes:
+                    evicted = []
+                    for rowid, size in connection.execute("SELECT rowid, size FROM charts ORDER BY last_access"):
+                        if total <= self.max_bytes:
+                            break
+                        evicted.append((rowid,))
+                        total -= size
+                    connection.executemany("DELETE FROM charts WHERE rowid=?", evicted)
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Chart cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove every cached chart."""
+        with self.lock:
+            try:
+                connection = self._connect()
+                connection.execute("DELETE FROM charts")
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Chart cache clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Create a singleton instance
+chart_renderer = ChartRenderer()
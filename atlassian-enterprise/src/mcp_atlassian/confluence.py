@@ -1,13 +1,18 @@
 import logging
 import os
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
 
 from atlassian import Confluence
 from dotenv import load_dotenv
 
 from .config import ConfluenceConfig
 from .document_types import Document
+from .markdown_cache import markdown_cache
+from .markdown_storage import markdown_to_storage
 from .preprocessing import TextPreprocessor
+from .transport import http_transport, async_http_transport
+from .version_store import version_store
 
 # Load environment variables
 load_dotenv()
@@ -19,6 +24,13 @@ logger = logging.getLogger("mcp-atlassian")
 class ConfluenceFetcher:
     """Handles fetching and parsing content from Confluence."""
 
+    # Page size for paged collection endpoints such as /child/page
+    CHILD_PAGE_LIMIT = 100
+    # Pages per request when streaming a whole space
+    SPACE_EXPORT_BATCH_SIZE = 50
+    # Versions per request when listing page history
+    VERSION_PAGE_LIMIT = 100
+
     def __init__(self):
         url = os.getenv("CONFLUENCE_URL")
         username = os.getenv("CONFLUENCE_USERNAME")
@@ -34,7 +46,31 @@ class ConfluenceFetcher:
             password=self.config.api_token,  # API token is used as password
             cloud=True,
         )
-        self.preprocessor = TextPreprocessor(self.config.url, self.confluence)
+        self.preprocessor = TextPreprocessor(self.config.url, self.confluence, user_lookup=self._get_users_bulk)
+
+    def _get_users_bulk(self, account_ids: list[str]) -> dict[str, str]:
+        """
+        Look up the display names of several users with one request.
+
+        Args:
+            account_ids: Account IDs to look up (at most 100)
+
+        Returns:
+            Dictionary of account ID to display name for the users found
+        """
+        response = http_transport.get(
+            f"{self.config.url.rstrip('/')}/rest/api/user/bulk",
+            params={"accountId": ",".join(account_ids), "limit": len(account_ids)},
+            auth=(self.config.username, self.config.api_token),
+            headers={"Accept": "application/json"}
+        )
+
+        if response.status_code >= 400:
+            error_msg = f"Bulk user lookup failed: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        return {user["accountId"]: user.get("displayName") for user in response.json().get("results", [])}
 
     def _process_html_content(self, html_content: str, space_key: str) -> tuple[str, str]:
         return self.preprocessor.process_html_content(html_content, space_key)
@@ -47,6 +83,30 @@ class ConfluenceFetcher:
         _, markdown = self.preprocessor.process_html_content(html_content, "")
         return markdown
 
+    def _convert_page_body(self, page: dict, space_key: str, clean_html: bool = True) -> str:
+        """
+        Convert a page's storage body, reusing the cached output for its version.
+
+        Args:
+            page: Page as returned by the API, with body.storage and version expanded
+            space_key: The space key
+            clean_html: Whether to convert to markdown (True) or only process the HTML
+
+        Returns:
+            Markdown or processed HTML of the page body
+        """
+        page_id = page["id"]
+        version = page.get("version", {}).get("number")
+
+        content = markdown_cache.get(self.config.url, page_id, version, clean_html)
+        if content is not None:
+            return content
+
+        processed_html, processed_markdown = self._process_html_content(page["body"]["storage"]["value"], space_key)
+        content = processed_markdown if clean_html else processed_html
+        markdown_cache.put(self.config.url, page_id, version, clean_html, content)
+        return content
+
     def get_spaces(self, start: int = 0, limit: int = 10):
         """Get all available spaces."""
         return self.confluence.get_all_spaces(start=start, limit=limit)
@@ -56,8 +116,7 @@ class ConfluenceFetcher:
         page = self.confluence.get_page_by_id(page_id=page_id, expand="body.storage,version,space")
         space_key = page.get("space", {}).get("key", "")
 
-        content = page["body"]["storage"]["value"]
-        processed_html, processed_markdown = self._process_html_content(content, space_key)
+        content = self._convert_page_body(page, space_key, clean_html)
 
         # Get author information from version
         version = page.get("version", {})
@@ -74,7 +133,7 @@ class ConfluenceFetcher:
             "last_modified": version.get("when"),
         }
 
-        return Document(page_content=processed_markdown if clean_html else processed_html, metadata=metadata)
+        return Document(page_content=content, metadata=metadata)
 
     def get_page_by_title(self, space_key: str, title: str, clean_html: bool = True) -> Optional[Document]:
         """Get page content by space key and title."""
@@ -84,9 +143,10 @@ class ConfluenceFetcher:
             if not page:
                 return None
 
-            content = page["body"]["storage"]["value"]
             if clean_html:
-                content = self._clean_html_content(content)
+                content = self._convert_page_body(page, space_key)
+            else:
+                content = page["body"]["storage"]["value"]
 
             metadata = {
                 "page_id": page["id"],
@@ -105,28 +165,70 @@ class ConfluenceFetcher:
     def get_space_pages(
         self, space_key: str, start: int = 0, limit: int = 10, clean_html: bool = True
     ) -> list[Document]:
-        """Get all pages from a specific space."""
-        pages = self.confluence.get_all_pages_from_space(
-            space=space_key, start=start, limit=limit, expand="body.storage"
-        )
+        """Get pages from a specific space."""
+        return list(islice(
+            self.iter_space_pages(space_key, start=start, clean_html=clean_html, batch_size=limit),
+            limit
+        ))
+
+    def iter_space_pages(
+        self, space_key: str, start: int = 0, clean_html: bool = True, batch_size: Optional[int] = None
+    ) -> Iterator[Document]:
+        """
+        Stream every page of a space as Documents.
+
+        Pages are fetched in batches and converted as they arrive, so only one
+        batch of page bodies is held in memory at a time.
+
+        Args:
+            space_key: The space key
+            start: Offset of the first page
+            clean_html: Whether to convert page bodies to markdown
+            batch_size: Pages per request (defaults to SPACE_EXPORT_BATCH_SIZE)
+
+        Yields:
+            A Document per page
+        """
+        batch_size = batch_size or self.SPACE_EXPORT_BATCH_SIZE
+
+        while True:
+            pages = self.confluence.get_all_pages_from_space(
+                space=space_key, start=start, limit=batch_size, expand="body.storage,version"
+            )
+            # Cloud may cap the page size below the requested limit, so only
+            # an empty batch marks the end of the space
+            if not pages:
+                return
 
-        documents = []
-        for page in pages:
-            content = page["body"]["storage"]["value"]
             if clean_html:
-                content = self._clean_html_content(content)
+                cached = {
+                    page["id"]: markdown_cache.get(self.config.url, page["id"], page.get("version", {}).get("number"), True)
+                    for page in pages
+                }
+                # Resolve every user mentioned in the pages left to convert with one bulk lookup
+                self.preprocessor.prefetch_users(
+                    page["body"]["storage"]["value"] for page in pages if cached[page["id"]] is None
+                )
 
-            metadata = {
-                "page_id": page["id"],
-                "title": page["title"],
-                "space_key": space_key,
-                "version": page.get("version", {}).get("number"),
-                "url": f"{self.config.url}/wiki/spaces/{space_key}/pages/{page['id']}",
-            }
+            for page in pages:
+                if clean_html:
+                    content = cached[page["id"]]
+                    if content is None:
+                        content = self._convert_page_body(page, space_key)
+                else:
+                    content = page["body"]["storage"]["value"]
+
+                metadata = {
+                    "page_id": page["id"],
+                    "title": page["title"],
+                    "space_key": space_key,
+                    "version": page.get("version", {}).get("number"),
+                    "url": f"{self.config.url}/wiki/spaces/{space_key}/pages/{page['id']}",
+                }
 
-            documents.append(Document(page_content=content, metadata=metadata))
+                yield Document(page_content=content, metadata=metadata)
 
-        return documents
+            start += len(pages)
 
     def get_page_comments(self, page_id: str, clean_html: bool = True) -> list[Document]:
         """Get all comments for a specific page."""
@@ -188,6 +290,24 @@ class ConfluenceFetcher:
             logger.error(f"Search failed with error: {str(e)}")
             return []
             
+    def _to_storage_format(self, content: str, content_type: str) -> str:
+        """
+        Get page content in storage format.
+
+        Markdown is converted locally, so writing a page takes a single request.
+
+        Args:
+            content: The page content
+            content_type: The type of content ('markdown' or 'storage')
+
+        Returns:
+            The content in storage format
+        """
+        if content_type.lower() == "markdown":
+            return markdown_to_storage(content)
+        # Assume content is already in storage format
+        return content
+
     def create_page(self, space_key: str, title: str, content: str, parent_id: Optional[str] = None, 
                    content_type: str = "markdown") -> dict:
         """
@@ -204,37 +324,7 @@ class ConfluenceFetcher:
             Dictionary containing the created page details
         """
         try:
-            # Convert markdown to storage format if needed
-            if content_type.lower() == "markdown":
-                # Use the Confluence API to convert markdown to storage format
-                import requests
-                
-                auth = (self.config.username, self.config.api_token)
-                headers = {"Content-Type": "application/json"}
-                
-                # Use the Confluence REST API to convert markdown to storage format
-                api_url = f"{self.config.url}/rest/api/contentbody/convert/storage"
-                
-                response = requests.post(
-                    api_url,
-                    json={
-                        "value": content,
-                        "representation": "wiki"
-                    },
-                    auth=auth,
-                    headers=headers
-                )
-                
-                if response.status_code >= 400:
-                    error_msg = f"Failed to convert markdown: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-                
-                # Get the converted storage format
-                storage_format = response.json().get("value", content)
-            else:
-                # Assume content is already in storage format
-                storage_format = content
+            storage_format = self._to_storage_format(content, content_type)
             
             # Create the page
             page = self.confluence.create_page(
@@ -349,76 +439,141 @@ class ConfluenceFetcher:
             logger.error(f"Error attaching file {file_path} to page {page_id}: {str(e)}")
             raise
             
-    def get_page_history(self, page_id: str, limit: int = 10) -> list[dict]:
+    def _format_version(self, page_id: str, version: dict) -> dict:
+        """Format a version object from the Confluence API."""
+        by = version.get("by", {})
+        return {
+            "number": version.get("number"),
+            "when": version.get("when"),
+            "message": version.get("message", ""),
+            "author": {
+                "name": by.get("displayName", ""),
+                "email": by.get("email", ""),
+                "username": by.get("username", "")
+            },
+            "page_id": page_id,
+            "minor_edit": version.get("minorEdit", False)
+        }
+        
+    async def _get_versions_async(self, page_id: str, limit: int, from_version: Optional[int] = None,
+                                  to_version: Optional[int] = None) -> list:
+        """
+        List the versions of a page, newest first.
+        
+        Follows the listing's next links, which carry the cursor, so a long
+        history costs one request per VERSION_PAGE_LIMIT versions.
+        
+        Args:
+            page_id: The page ID
+            limit: Maximum number of versions to return
+            from_version: Optional oldest version number to include
+            to_version: Optional newest version number to include
+            
+        Returns:
+            List of version objects
+        """
+        versions = []
+        path = f"/rest/api/content/{page_id}/version"
+        params = {"limit": self.VERSION_PAGE_LIMIT}
+        
+        while path and len(versions) < limit:
+            page = await self._get_json_async(path, params=params)
+            for version in page.get("results", []):
+                number = version.get("number", 0)
+                if to_version is not None and number > to_version:
+                    continue
+                if from_version is not None and number < from_version:
+                    return versions
+                versions.append(version)
+                if len(versions) >= limit:
+                    break
+                    
+            path = page.get("_links", {}).get("next")
+            params = None
+            
+        return versions
+        
+    async def _get_version_body_async(self, page_id: str, version_number: int) -> str:
+        """Fetch the storage-format body of a page version."""
+        page = await self._get_json_async(
+            f"/rest/api/content/{page_id}",
+            params={"version": version_number, "expand": "body.storage"}
+        )
+        return page.get("body", {}).get("storage", {}).get("value", "")
+        
+    def get_version_bodies(self, page_id: str, version_numbers: list) -> dict:
+        """
+        Get the storage-format bodies of several versions of a page.
+        
+        Bodies already in the version store are reused; the rest are fetched
+        concurrently and stored.
+        
+        Args:
+            page_id: The page ID
+            version_numbers: Version numbers to get
+            
+        Returns:
+            Dictionary of version number to storage-format body
+        """
+        bodies = version_store.get_many(self.config.url, page_id, version_numbers)
+        missing = [number for number in version_numbers if number not in bodies]
+        
+        if missing:
+            fetched = async_http_transport.run(async_http_transport.gather([
+                lambda number=number: self._get_version_body_async(page_id, number)
+                for number in missing
+            ]))
+            for number, body in zip(missing, fetched):
+                version_store.put(self.config.url, page_id, number, body)
+                bodies[number] = body
+                
+        return bodies
+        
+    def get_version_body(self, page_id: str, version_number: int) -> str:
+        """
+        Get the storage-format body of a page version through the version store.
+        
+        Args:
+            page_id: The page ID
+            version_number: The version number
+            
+        Returns:
+            The storage-format body
+        """
+        def fetch():
+            page = self.confluence.get_page_by_id(page_id=page_id, version=version_number, expand="body.storage")
+            return page.get("body", {}).get("storage", {}).get("value", "")
+            
+        return version_store.get_or_fetch(self.config.url, page_id, version_number, fetch)
+        
+    def get_page_history(self, page_id: str, limit: int = 10, include_bodies: bool = False,
+                         from_version: Optional[int] = None, to_version: Optional[int] = None) -> list[dict]:
         """
         Get the version history of a Confluence page.
         
         Args:
             page_id: The ID of the page to get the history for
             limit: Maximum number of versions to return
+            include_bodies: Whether to add the storage-format body of each
+                version (fetched concurrently and kept in the version store)
+            from_version: Optional oldest version number to include
+            to_version: Optional newest version number to include
             
         Returns:
-            List of dictionaries containing version details
+            List of dictionaries containing version details, newest first
         """
         try:
-            # Get the current page
-            page = self.confluence.get_page_by_id(
-                page_id=page_id,
-                expand="version"
-            )
-            
-            # Format the response
-            versions = []
-            
-            # Add the current version to the list
-            current_version = page.get("version", {})
-            current_by = current_version.get("by", {})
-            versions.append({
-                "number": current_version.get("number"),
-                "when": current_version.get("when"),
-                "message": current_version.get("message", ""),
-                "author": {
-                    "name": current_by.get("displayName", ""),
-                    "email": current_by.get("email", ""),
-                    "username": current_by.get("username", "")
-                },
-                "page_id": page_id,
-                "minor_edit": current_version.get("minorEdit", False)
-            })
+            versions = [
+                self._format_version(page_id, version)
+                for version in async_http_transport.run(
+                    self._get_versions_async(page_id, limit, from_version, to_version)
+                )
+            ]
             
-            # Get previous versions
-            current_version_number = current_version.get("number", 1)
-            for version_number in range(current_version_number - 1, 0, -1):
-                if len(versions) >= limit:
-                    break
-                    
-                try:
-                    # Get the previous version
-                    version_page = self.confluence.get_page_by_id(
-                        page_id=page_id,
-                        version=version_number
-                    )
-                    
-                    # Get version information
-                    version = version_page.get("version", {})
-                    by = version.get("by", {})
-                    
-                    # Format the version details
-                    versions.append({
-                        "number": version.get("number"),
-                        "when": version.get("when"),
-                        "message": version.get("message", ""),
-                        "author": {
-                            "name": by.get("displayName", ""),
-                            "email": by.get("email", ""),
-                            "username": by.get("username", "")
-                        },
-                        "page_id": page_id,
-                        "minor_edit": version.get("minorEdit", False)
-                    })
-                except:
-                    # Skip versions that don't exist
-                    continue
+            if include_bodies and versions:
+                bodies = self.get_version_bodies(page_id, [version["number"] for version in versions])
+                for version in versions:
+                    version["body"] = bodies.get(version["number"], "")
             
             return versions
             
@@ -446,11 +601,7 @@ class ConfluenceFetcher:
             
             # Get the version to restore
             try:
-                version_content = self.confluence.get_page_by_id(
-                    page_id=page_id,
-                    version=version_number,
-                    expand="body.storage"
-                )
+                version_body = self.get_version_body(page_id, version_number)
             except Exception as e:
                 error_msg = f"Version {version_number} not found for page {page_id}: {str(e)}"
                 logger.error(error_msg)
@@ -460,7 +611,7 @@ class ConfluenceFetcher:
             updated_page = self.confluence.update_page(
                 page_id=page_id,
                 title=page.get("title"),
-                body=version_content.get("body", {}).get("storage", {}).get("value", ""),
+                body=version_body,
                 version=page.get("version", {}).get("number", 0) + 1,
                 representation="storage",
                 message=f"Restored to version {version_number}"
@@ -512,37 +663,7 @@ class ConfluenceFetcher:
                 content = page.get("body", {}).get("storage", {}).get("value", "")
                 content_type = "storage"  # Force storage type for existing content
             
-            # Convert markdown to storage format if needed
-            if content_type.lower() == "markdown":
-                # Use the Confluence API to convert markdown to storage format
-                import requests
-                
-                auth = (self.config.username, self.config.api_token)
-                headers = {"Content-Type": "application/json"}
-                
-                # Use the Confluence REST API to convert markdown to storage format
-                api_url = f"{self.config.url}/rest/api/contentbody/convert/storage"
-                
-                response = requests.post(
-                    api_url,
-                    json={
-                        "value": content,
-                        "representation": "wiki"
-                    },
-                    auth=auth,
-                    headers=headers
-                )
-                
-                if response.status_code >= 400:
-                    error_msg = f"Failed to convert markdown: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-                
-                # Get the converted storage format
-                storage_format = response.json().get("value", content)
-            else:
-                # Assume content is already in storage format
-                storage_format = content
+            storage_format = self._to_storage_format(content, content_type)
             
             # Get the current version number
             current_version = page.get("version", {}).get("number", 0)
@@ -653,8 +774,7 @@ class ConfluenceFetcher:
                 if position is not None:
                     update_data["position"] = position
                 
-                import requests
-                response = requests.put(
+                response = http_transport.put(
                     api_url,
                     json=update_data,
                     auth=auth,
@@ -694,8 +814,7 @@ class ConfluenceFetcher:
                     "position": position
                 }
                 
-                import requests
-                response = requests.put(
+                response = http_transport.put(
                     api_url,
                     json=update_data,
                     auth=auth,
@@ -734,6 +853,102 @@ class ConfluenceFetcher:
             logger.error(f"Error moving page {page_id}: {str(e)}")
             raise
             
+    async def _get_json_async(self, path: str, params: Optional[dict] = None) -> dict:
+        """
+        Make a GET request to the Confluence REST API over the async transport.
+        
+        Args:
+            path: API path relative to the Confluence base URL (e.g. '/rest/api/content/123')
+            params: Optional query parameters
+            
+        Returns:
+            The decoded JSON response
+        """
+        response = await async_http_transport.get(
+            f"{self.config.url.rstrip('/')}{path}",
+            params=params,
+            auth=(self.config.username, self.config.api_token),
+            headers={"Accept": "application/json"}
+        )
+        
+        if response.status_code >= 400:
+            error_msg = f"Confluence API request to {path} failed: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+            
+        return response.json()
+        
+    async def _get_all_results_async(self, path: str, params: Optional[dict] = None) -> list:
+        """
+        Get every result of a paged Confluence collection endpoint.
+        
+        Args:
+            path: API path of the collection
+            params: Optional query parameters
+            
+        Returns:
+            List of all results across pages
+        """
+        params = dict(params or {})
+        limit = self.CHILD_PAGE_LIMIT
+        start = 0
+        results = []
+        
+        while True:
+            page = await self._get_json_async(path, params={**params, "start": start, "limit": limit})
+            batch = page.get("results", [])
+            results.extend(batch)
+            
+            if not batch or "next" not in page.get("_links", {}):
+                return results
+                
+            start += len(batch)
+            
+    def _page_tree_node(self, page: dict, space_key: str) -> dict:
+        """Build a page tree node from a content object."""
+        return {
+            "id": page["id"],
+            "title": page["title"],
+            "url": f"{self.config.url}/wiki/spaces/{space_key}/pages/{page['id']}",
+            "children": []
+        }
+        
+    async def _build_page_tree_async(self, space_key: str, roots: list, depth: int) -> list:
+        """
+        Build page trees below the given pages, one level at a time.
+        
+        The children of every page on a level are requested concurrently, so
+        the number of round trips grows with the depth of the tree rather than
+        with the number of pages.
+        
+        Args:
+            space_key: The space key (used for page URLs)
+            roots: Content objects of the top-level pages
+            depth: Number of levels to fetch below the roots
+            
+        Returns:
+            List of tree nodes for the roots, with children filled in
+        """
+        nodes = [self._page_tree_node(page, space_key) for page in roots]
+        level = nodes
+        
+        for _ in range(depth):
+            if not level:
+                break
+                
+            children_per_node = await async_http_transport.gather([
+                lambda page_id=node["id"]: self._get_all_results_async(f"/rest/api/content/{page_id}/child/page")
+                for node in level
+            ])
+            
+            next_level = []
+            for node, children in zip(level, children_per_node):
+                node["children"] = [self._page_tree_node(child, space_key) for child in children]
+                next_level.extend(node["children"])
+            level = next_level
+            
+        return nodes
+        
     def get_page_tree(self, space_key: str, root_page_id: Optional[str] = None, 
                      depth: int = 3, expand: Optional[str] = None) -> dict:
         """
@@ -758,82 +973,30 @@ class ConfluenceFetcher:
                 if "homepage" in space and space["homepage"]:
                     root_page_id = space["homepage"]["id"]
                 else:
-                    # If no homepage, return all top-level pages
-                    top_pages = self.confluence.get_all_pages_from_space(
-                        space=space_key,
-                        start=0,
-                        limit=100,
-                        expand=expand,
-                        status=None,
-                        content_type="page"
-                    )
-                    
-                    # Filter to only include pages without ancestors (top-level)
-                    top_level_pages = []
-                    for page in top_pages:
-                        page_with_ancestors = self.confluence.get_page_by_id(
-                            page_id=page["id"],
-                            expand="ancestors"
+                    # If no homepage, build the tree from the top-level pages,
+                    # which the space content listing returns in one query
+                    async def build_space_tree():
+                        top_level_pages = await self._get_all_results_async(
+                            f"/rest/api/space/{space_key}/content/page",
+                            params={"depth": "root"}
                         )
-                        if not page_with_ancestors.get("ancestors"):
-                            top_level_pages.append(page)
-                    
-                    # Return the top-level pages
+                        return await self._build_page_tree_async(space_key, top_level_pages, depth - 1)
+                        
                     return {
                         "space_key": space_key,
-                        "pages": [
-                            {
-                                "id": page["id"],
-                                "title": page["title"],
-                                "url": f"{self.config.url}/wiki/spaces/{space_key}/pages/{page['id']}",
-                                "children": []
-                            }
-                            for page in top_level_pages
-                        ]
+                        "pages": async_http_transport.run(build_space_tree())
                     }
             
             # Get the root page
-            root_page = self.confluence.get_page_by_id(
-                page_id=root_page_id,
-                expand="children.page,ancestors"
-            )
+            root_page = self.confluence.get_page_by_id(page_id=root_page_id)
             
-            # Build the tree recursively
-            def build_tree(page_id, current_depth):
-                if current_depth > depth:
-                    return []
-                
-                # Get the page with its children
-                page = self.confluence.get_page_by_id(
-                    page_id=page_id,
-                    expand="children.page"
-                )
-                
-                # Get the children
-                children = []
-                if "children" in page and "page" in page["children"] and "results" in page["children"]["page"]:
-                    for child in page["children"]["page"]["results"]:
-                        children.append({
-                            "id": child["id"],
-                            "title": child["title"],
-                            "url": f"{self.config.url}/wiki/spaces/{space_key}/pages/{child['id']}",
-                            "children": build_tree(child["id"], current_depth + 1)
-                        })
-                
-                return children
-            
-            # Build the tree starting from the root page
-            children = build_tree(root_page_id, 1)
+            # Build the tree below the root page level by level
+            root_node = async_http_transport.run(self._build_page_tree_async(space_key, [root_page], depth))[0]
             
             # Return the tree
             return {
                 "space_key": space_key,
-                "root_page": {
-                    "id": root_page["id"],
-                    "title": root_page["title"],
-                    "url": f"{self.config.url}/wiki/spaces/{space_key}/pages/{root_page['id']}",
-                    "children": children
-                }
+                "root_page": root_node
             }
             
         except Exception as e:
@@ -6,10 +6,14 @@ This module provides advanced content management functionality for Confluence.
 
 import logging
 import json
+import difflib
 import requests
 from typing import Dict, List, Optional, Any, Union
 
 from .config import ConfluenceConfig
+from .storage_format import storage_to_markdown
+from .transport import http_transport
+from .version_store import version_store
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian")
@@ -51,7 +55,7 @@ class ConfluenceContentManager:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response = requests.request(
+            response = http_transport.request(
                 method=method,
                 url=url,
                 json=data,
@@ -492,10 +496,40 @@ class ConfluenceContentManager:
             f"/rest/api/content/{content_id}/version/{version_number}"
         )
     
+    def get_version_body(self, content_id: str, version_number: int) -> str:
+        """
+        Get the storage-format body of a content version.
+        
+        Saved versions never change, so bodies are kept in the shared version
+        store and fetched at most once.
+        
+        Args:
+            content_id: The content ID
+            version_number: The version number
+            
+        Returns:
+            The storage-format body of the version
+        """
+        def fetch():
+            version_content = self._make_api_request(
+                "GET", 
+                f"/rest/api/content/{content_id}", 
+                params={
+                    "version": version_number,
+                    "expand": "body.storage"
+                }
+            )
+            return version_content.get("body", {}).get("storage", {}).get("value", "")
+            
+        return version_store.get_or_fetch(self.base_url, content_id, version_number, fetch)
+    
     def compare_versions(self, content_id: str, source_version: int, target_version: int) -> Dict:
         """
         Compare two versions of a content.
         
+        The bodies of both versions are read through the version store and
+        compared as markdown, line by line.
+        
         Args:
             content_id: The content ID
             source_version: The source version number
@@ -504,14 +538,25 @@ class ConfluenceContentManager:
         Returns:
             Dictionary containing comparison details
         """
-        return self._make_api_request(
-            "GET", 
-            f"/rest/api/content/{content_id}/diff", 
-            params={
-                "source": source_version,
-                "target": target_version
-            }
-        )
+        source = storage_to_markdown(self.get_version_body(content_id, source_version)).splitlines()
+        target = storage_to_markdown(self.get_version_body(content_id, target_version)).splitlines()
+        
+        diff = list(difflib.unified_diff(
+            source, target,
+            fromfile=f"version {source_version}",
+            tofile=f"version {target_version}",
+            lineterm=""
+        ))
+        changed = [line for line in diff[2:] if line[:1] in ("+", "-")]
+        
+        return {
+            "content_id": content_id,
+            "source_version": source_version,
+            "target_version": target_version,
+            "lines_added": sum(1 for line in changed if line.startswith("+")),
+            "lines_removed": sum(1 for line in changed if line.startswith("-")),
+            "diff": "\n".join(diff)
+        }
     
     def restore_version(self, content_id: str, version_number: int) -> Dict:
         """
@@ -524,8 +569,8 @@ class ConfluenceContentManager:
         Returns:
             Dictionary containing restored content
         """
-        # Get the content version to restore
-        version = self.get_content_version(content_id, version_number)
+        # Get the content body for the version to restore
+        body = self.get_version_body(content_id, version_number)
         
         # Get the current content
         current = self._make_api_request(
@@ -536,18 +581,6 @@ class ConfluenceContentManager:
         
         current_version = current.get("version", {}).get("number", 0)
         
-        # Get the content body for the version to restore
-        version_content = self._make_api_request(
-            "GET", 
-            f"/rest/api/content/{content_id}", 
-            params={
-                "version": version_number,
-                "expand": "body.storage"
-            }
-        )
-        
-        body = version_content.get("body", {}).get("storage", {}).get("value", "")
-        
         # Update the content with the restored body
         update_data = {
             "version": {
@@ -593,7 +626,7 @@ class ConfluenceContentManager:
         url = f"{self.base_url}/rest/api/content/{content_id}/export"
         
         try:
-            response = requests.get(
+            response = http_transport.get(
                 url=url,
                 params=params,
                 auth=self.auth,
@@ -0,0 +1,117 @@
+"""
+Blocking handler execution for the MCP Atlassian servers.
+
+The service fetchers and managers are synchronous (requests-based), while the
+MCP server runs on a single asyncio event loop. This module runs blocking
+handlers on a bounded thread pool so that concurrent tool calls overlap instead
+of queueing behind each other, and caps the number of in-flight calls per
+Atlassian service so one busy product cannot starve the others.
+"""
+
+import os
+import asyncio
+import logging
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.executor")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_SERVICE_LIMITS = {
+    "jira": 8,
+    "confluence": 8,
+    "bitbucket": 4,
+    "jsm": 4,
+    "enterprise": 2,
+}
+DEFAULT_SERVICE_LIMIT = 4  # for services not listed above
+
+
+class BlockingExecutor:
+    """
+    Runs blocking handlers off the event loop with per-service concurrency limits.
+
+    All services share one thread pool; an asyncio semaphore per service bounds
+    how many of that service's handlers may occupy the pool at the same time.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, service_limits: Optional[Dict[str, int]] = None):
+        """
+        Initialize the BlockingExecutor.
+
+        Args:
+            max_workers: Size of the shared thread pool
+            service_limits: Maximum concurrent handlers per service name
+        """
+        self.max_workers = max_workers or int(os.getenv("ATLASSIAN_MAX_WORKERS", DEFAULT_MAX_WORKERS))
+
+        self.service_limits = {}
+        for service, limit in DEFAULT_SERVICE_LIMITS.items():
+            env_limit = os.getenv(f"ATLASSIAN_{service.upper()}_CONCURRENCY")
+            self.service_limits[service] = int(env_limit) if env_limit else limit
+        if service_limits:
+            self.service_limits.update(service_limits)
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Semaphores bind to an event loop, so keep one set per running loop
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.lock = threading.RLock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Create the shared thread pool on first use."""
+        with self.lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="mcp-atlassian"
+                )
+            return self._pool
+
+    def _get_semaphore(self, service: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a service."""
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(service)
+            if semaphore is None:
+                limit = self.service_limits.get(service, DEFAULT_SERVICE_LIMIT)
+                semaphore = asyncio.Semaphore(limit)
+                semaphores[service] = semaphore
+            return semaphore
+
+    async def run(self, service: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the thread pool.
+
+        Waits for a free slot in the service's concurrency limit first, so
+        excess calls queue on the event loop rather than in the pool.
+
+        Args:
+            service: Service name used for the concurrency limit (e.g. 'jira')
+            func: The blocking callable
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The callable's return value
+        """
+        async with self._get_semaphore(service):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the thread pool and forget per-service limiters."""
+        with self.lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
+            self._semaphores = weakref.WeakKeyDictionary()
+
+
+# Create a singleton instance
+blocking_executor = BlockingExecutor()
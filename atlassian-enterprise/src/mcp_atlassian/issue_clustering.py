@@ -0,0 +1,260 @@
+"""
+Scalable issue clustering for MCP Atlassian pattern detection.
+
+Exact KMeans with several restarts for every candidate cluster count costs
+time proportional to the number of issues times the restarts, so on large
+projects it dominates pattern detection. The scalable path here instead:
+
+- fits the feature scaler in one streaming pass over row batches
+- draws a fixed-size reservoir sample of the issues and selects the number
+  of clusters and fits the centroids with MiniBatchKMeans on that sample
+- assigns every issue to its nearest centroid in vectorized batches
+
+The fitted scaler and centroids are persisted per project together with
+the cluster of every issue and a hash of its features. A rerun reuses them
+and only scores issues that are new or whose features changed, refitting
+once the model is too old or too many issues changed.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.issue_clustering")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_SAMPLE_SIZE = 10000  # issues in the reservoir sample used for fitting
+DEFAULT_BATCH_SIZE = 8192  # issues scaled and scored per vectorized batch
+DEFAULT_REFIT_SECONDS = 7 * 24 * 3600  # maximum age of a persisted model
+DEFAULT_REFIT_FRACTION = 0.2  # refit once this share of the issues is new or changed
+MAX_CLUSTERS = 6
+MODEL_VERSION = 1
+RANDOM_STATE = 42
+
+
+def reservoir_sample(batches: Iterable[np.ndarray], size: int, seed: int = RANDOM_STATE) -> np.ndarray:
+    """
+    Uniform sample of rows from a stream of row batches (reservoir sampling).
+
+    Each batch is processed with vectorized draws: the t-th row seen replaces
+    a random reservoir slot with probability size / (t + 1), as in Algorithm R.
+
+    Args:
+        batches: Arrays of rows (same trailing shape)
+        size: Number of rows to keep
+        seed: Random seed
+
+    Returns:
+        Array of at most size rows
+    """
+    rng = np.random.default_rng(seed)
+    reservoir = None
+    seen = 0
+    for batch in batches:
+        batch = np.asarray(batch)
+        if reservoir is None:
+            reservoir = np.empty((size,) + batch.shape[1:], dtype=batch.dtype)
+
+        # Fill the reservoir first
+        fill = min(max(size - seen, 0), len(batch))
+        reservoir[seen:seen + fill] = batch[:fill]
+
+        rest = batch[fill:]
+        if len(rest):
+            positions = np.arange(seen + fill, seen + len(batch))
+            slots = rng.integers(0, positions + 1)
+            keep = slots < size
+            # Fancy assignment applies duplicates in order, like sequential replacement
+            reservoir[slots[keep]] = rest[keep]
+        seen += len(batch)
+
+    if reservoir is None:
+        return np.empty((0,))
+    return reservoir[:min(seen, size)]
+
+
+def assign_clusters(data: np.ndarray, scaler: StandardScaler, centroids: np.ndarray,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+    """
+    Nearest-centroid labels for raw feature rows, in vectorized batches.
+
+    Args:
+        data: Unscaled feature rows
+        scaler: Fitted feature scaler
+        centroids: Centroids in scaled feature space
+        batch_size: Rows scored per batch (bounds the distance matrix)
+
+    Returns:
+        Cluster index of each row
+    """
+    labels = np.empty(len(data), dtype="int64")
+    centroid_norms = (centroids ** 2).sum(axis=1)
+    for start in range(0, len(data), batch_size):
+        scaled = scaler.transform(data[start:start + batch_size])
+        # ||x - c||^2 without the per-row ||x||^2 term, which does not change the argmin
+        distances = centroid_norms - 2 * scaled @ centroids.T
+        labels[start:start + batch_size] = distances.argmin(axis=1)
+    return labels
+
+
+class ScalableClustering:
+    """
+    Sample-fitted MiniBatchKMeans clustering with persisted models per project.
+
+    Models are stored with joblib in the models directory, one file per
+    project. A missing or unreadable model is refitted.
+    """
+
+    def __init__(self, models_dir: str, sample_size: Optional[int] = None, batch_size: Optional[int] = None,
+                 refit_seconds: Optional[float] = None, refit_fraction: Optional[float] = None):
+        """
+        Initialize the ScalableClustering.
+
+        Args:
+            models_dir: Directory of the persisted models
+            sample_size: Issues in the reservoir sample used for fitting
+            batch_size: Issues scaled and scored per batch
+            refit_seconds: Maximum age of a persisted model
+            refit_fraction: Share of new or changed issues that triggers a refit
+        """
+        self.models_dir = models_dir
+        self.sample_size = sample_size or int(
+            os.getenv("ATLASSIAN_CLUSTERING_SAMPLE_SIZE", DEFAULT_SAMPLE_SIZE)
+        )
+        self.batch_size = batch_size or int(
+            os.getenv("ATLASSIAN_CLUSTERING_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+        )
+        self.refit_seconds = refit_seconds if refit_seconds is not None else float(
+            os.getenv("ATLASSIAN_CLUSTERING_REFIT_SECONDS", DEFAULT_REFIT_SECONDS)
+        )
+        self.refit_fraction = refit_fraction if refit_fraction is not None else float(
+            os.getenv("ATLASSIAN_CLUSTERING_REFIT_FRACTION", DEFAULT_REFIT_FRACTION)
+        )
+        self.lock = threading.RLock()
+
+    def _model_path(self, name: str) -> str:
+        """Path of the persisted model of a project."""
+        return os.path.join(self.models_dir, f"{name}_clusters.joblib")
+
+    def _load(self, name: str, features: List[str]) -> Optional[Dict[str, Any]]:
+        """Load a persisted model, or None if there is no usable one."""
+        path = self._model_path(name)
+        if not os.path.exists(path):
+            return None
+        try:
+            model = joblib.load(path)
+        except Exception as e:
+            logger.warning(f"Could not load clustering model {path}: {e}")
+            return None
+        if model.get("version") != MODEL_VERSION or model.get("features") != features:
+            return None
+        return model
+
+    def _save(self, name: str, model: Dict[str, Any]) -> None:
+        """Persist a model atomically."""
+        os.makedirs(self.models_dir, exist_ok=True)
+        path = self._model_path(name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            joblib.dump(model, temp_path)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save clustering model {path}: {e}")
+
+    def cluster(self, name: str, keys: pd.Series, features: pd.DataFrame) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Cluster issues, reusing the persisted model of the project when possible.
+
+        Args:
+            name: Model name (the project key)
+            keys: Issue key of each row
+            features: Numeric feature columns, one row per issue
+
+        Returns:
+            Tuple of the cluster index of each row and a dict describing the run
+            (num_clusters, refitted, scored_issues, sample_size)
+        """
+        columns = list(features.columns)
+        data = features.to_numpy(dtype="float64")
+        hashes = pd.util.hash_pandas_object(features, index=False).to_numpy()
+        # Fixed-width strings are stored as one raw buffer, unlike an array of Python objects
+        key_array = keys.to_numpy(dtype=str)
+        current = pd.DataFrame({"key": key_array, "hash": hashes})
+
+        with self.lock:
+            model = self._load(name, columns)
+            labels = None
+            if model is not None and time.time() - model["fitted_at"] < self.refit_seconds:
+                previous = pd.DataFrame({"key": model["keys"], "hash": model["hashes"], "label": model["labels"]})
+                known = current.merge(previous, on=["key", "hash"], how="left")["label"]
+                changed = known.isna().to_numpy()
+                if changed.mean() <= self.refit_fraction:
+                    labels = known.fillna(-1).to_numpy(dtype="int64")
+                    if changed.any():
+                        labels[changed] = assign_clusters(
+                            data[changed], model["scaler"], model["centroids"], self.batch_size
+                        )
+                    scored = int(changed.sum())
+
+            refitted = labels is None
+            if refitted:
+                model = self._fit(data, columns)
+                labels = assign_clusters(data, model["scaler"], model["centroids"], self.batch_size)
+                scored = len(data)
+
+            model.update(keys=key_array, hashes=hashes, labels=labels)
+            self._save(name, model)
+
+        return labels, {
+            "num_clusters": int(len(model["centroids"])),
+            "refitted": refitted,
+            "scored_issues": scored,
+            "sample_size": int(model["sample_size"]),
+        }
+
+    def _batches(self, data: np.ndarray) -> Iterable[np.ndarray]:
+        """Consecutive row batches of a matrix."""
+        for start in range(0, len(data), self.batch_size):
+            yield data[start:start + self.batch_size]
+
+    def _fit(self, data: np.ndarray, features: List[str]) -> Dict[str, Any]:
+        """Fit the scaler on every row and the centroids on a reservoir sample."""
+        scaler = StandardScaler()
+        for batch in self._batches(data):
+            scaler.partial_fit(batch)
+
+        sample = scaler.transform(reservoir_sample(self._batches(data), self.sample_size))
+
+        # Pick the number of clusters at the largest drop in inertia (elbow), as the exact path does
+        max_clusters = max(1, min(MAX_CLUSTERS, len(sample) // 5))
+        inertias = [
+            self._kmeans(k).fit(sample).inertia_
+            for k in range(1, max_clusters + 1)
+        ]
+        drops = [inertias[i] - inertias[i + 1] for i in range(len(inertias) - 1)]
+        num_clusters = drops.index(max(drops)) + 2 if drops else min(2, len(sample))
+
+        kmeans = self._kmeans(num_clusters).fit(sample)
+        return {
+            "version": MODEL_VERSION,
+            "features": features,
+            "scaler": scaler,
+            "centroids": kmeans.cluster_centers_,
+            "fitted_at": time.time(),
+            "sample_size": len(sample),
+        }
+
+    def _kmeans(self, num_clusters: int) -> MiniBatchKMeans:
+        """Mini-batch KMeans with the settings used for fitting."""
+        return MiniBatchKMeans(
+            n_clusters=num_clusters, batch_size=1024, n_init=3, random_state=RANDOM_STATE
+        )
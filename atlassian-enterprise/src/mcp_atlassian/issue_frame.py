@@ -0,0 +1,218 @@
+"""
+Columnar ingestion of Jira issues for MCP Atlassian analytics.
+
+Analytics reports aggregate the same handful of fields over every issue of a
+project. Raw issue payloads are flattened once into a DataFrame with one row
+per issue. Timestamps are parsed in a single vectorized pass, and every
+metric is then computed with grouped, vectorized pandas and numpy operations
+instead of Python loops over nested dicts.
+
+Timestamps are converted to naive local time, matching the
+``datetime.datetime.now()`` boundaries that reports bucket against.
+"""
+
+import re
+import logging
+import datetime
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .adf import field_text
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.issue_frame")
+
+# Constants
+JIRA_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+PRIORITY_LEVELS = {"Highest": 5, "High": 4, "Medium": 3, "Low": 2, "Lowest": 1}
+SECONDS_PER_DAY = 24 * 3600
+WORD_PATTERN = re.compile(r"\w+")
+
+ISSUE_COLUMNS = [
+    "key", "issue_type", "status", "status_category", "priority", "assignee", "reporter",
+    "created", "resolved", "original_estimate", "time_spent",
+    "comment_count", "label_count", "component_count",
+]
+CATEGORY_COLUMNS = ["issue_type", "status", "status_category", "priority", "assignee", "reporter"]
+
+
+def _name(value, key: str = "name"):
+    """Read a name from an optional nested object."""
+    return value.get(key) if value else None
+
+
+def parse_timestamps(values) -> pd.Series:
+    """
+    Parse Jira timestamps in one vectorized pass.
+
+    Args:
+        values: Sequence of Jira timestamp strings (or None)
+
+    Returns:
+        Series of naive local datetimes, NaT where a value is missing or invalid
+    """
+    parsed = pd.to_datetime(pd.Series(values, dtype=object), format=JIRA_TIMESTAMP_FORMAT,
+                            utc=True, errors="coerce")
+    local_zone = datetime.datetime.now().astimezone().tzinfo
+    return parsed.dt.tz_convert(local_zone).dt.tz_localize(None)
+
+
+def issues_to_frame(issues: Sequence[Dict], text: bool = False) -> pd.DataFrame:
+    """
+    Flatten raw issue payloads into one row per issue.
+
+    Args:
+        issues: Issues as returned by the Jira search endpoint
+        text: Also extract the description word count (slower, used for pattern analysis)
+
+    Returns:
+        DataFrame with the ISSUE_COLUMNS (plus word_count when text is set).
+        Times are in seconds; missing names are None.
+    """
+    rows = []
+    word_counts = []
+    for issue in issues:
+        fields = issue.get("fields") or {}
+        status = fields.get("status") or {}
+        time_tracking = fields.get("timetracking") or {}
+        rows.append((
+            issue.get("key"),
+            _name(fields.get("issuetype")),
+            status.get("name"),
+            _name(status.get("statusCategory"), "key"),
+            _name(fields.get("priority")),
+            _name(fields.get("assignee"), "displayName"),
+            _name(fields.get("reporter"), "displayName"),
+            fields.get("created"),
+            fields.get("resolutiondate"),
+            time_tracking.get("originalEstimateSeconds") or 0,
+            time_tracking.get("timeSpentSeconds") or 0,
+            len((fields.get("comment") or {}).get("comments") or []),
+            len(fields.get("labels") or []),
+            len(fields.get("components") or []),
+        ))
+        if text:
+            description = field_text(fields.get("description"))
+            word_counts.append(len(WORD_PATTERN.findall(description)) if description else 0)
+
+    frame = pd.DataFrame.from_records(rows, columns=ISSUE_COLUMNS)
+    frame["created"] = parse_timestamps(frame["created"])
+    frame["resolved"] = parse_timestamps(frame["resolved"])
+    frame[["original_estimate", "time_spent"]] = frame[["original_estimate", "time_spent"]].astype("float64")
+    for column in CATEGORY_COLUMNS:
+        frame[column] = frame[column].astype("category")
+    if text:
+        frame["word_count"] = np.asarray(word_counts, dtype="int64")
+    return frame
+
+
+def resolution_days(frame: pd.DataFrame) -> pd.Series:
+    """Days from creation to resolution, NaN for unresolved issues."""
+    return (frame["resolved"] - frame["created"]).dt.total_seconds() / SECONDS_PER_DAY
+
+
+def rank_percentiles(values: np.ndarray, quantiles: Sequence[float]) -> List[float]:
+    """
+    Nearest-rank percentiles (the value at index int(n * q) of the sorted values).
+
+    Uses a partial sort, so several percentiles cost one O(n) selection
+    rather than a full sort.
+
+    Args:
+        values: Non-empty array of values
+        quantiles: Quantiles between 0 and 1
+
+    Returns:
+        The percentile values, in the order of the quantiles
+    """
+    indexes = [min(int(len(values) * q), len(values) - 1) for q in quantiles]
+    partitioned = np.partition(values, sorted(set(indexes)))
+    return [float(partitioned[i]) for i in indexes]
+
+
+def value_counts(series: pd.Series, missing: str = "Unknown") -> Dict[str, int]:
+    """Count the values of a categorical column, most common first."""
+    counts = series.astype(object).fillna(missing).value_counts(sort=True)
+    return {str(name): int(count) for name, count in counts.items()}
+
+
+def format_dates(timestamps: pd.Series, date_format: str) -> pd.Series:
+    """
+    Format the date of each timestamp, formatting every distinct date only once.
+
+    Args:
+        timestamps: Datetimes (NaT gives None)
+        date_format: strftime format using date fields only (day, week, month, year)
+
+    Returns:
+        Series of formatted dates aligned with the timestamps
+    """
+    codes, dates = pd.factorize(timestamps.dt.normalize())
+    names = np.append(np.asarray(dates.strftime(date_format), dtype=object), None)
+    return pd.Series(names[codes], index=timestamps.index, dtype=object)
+
+
+def bucket_counts(bucket_names: pd.Series, bucket_keys: List[str]) -> Dict[str, int]:
+    """
+    Count rows per time bucket.
+
+    Args:
+        bucket_names: Bucket name of each row (see format_dates); None is ignored
+        bucket_keys: Buckets reported even when empty, in order
+
+    Returns:
+        Counts for every bucket key, followed by any other bucket that occurs
+    """
+    counts = dict.fromkeys(bucket_keys, 0)
+    for key, count in bucket_names.dropna().value_counts(sort=False).items():
+        counts[key] = counts.get(key, 0) + int(count)
+    return counts
+
+
+def status_timeline(frame: pd.DataFrame, boundaries: List[datetime.datetime],
+                    done_status: str = "Done") -> List[Dict[str, int]]:
+    """
+    Status distribution of the issues existing at each bucket boundary.
+
+    An issue counts from the first boundary at or after its creation, under
+    its current status, and as done_status from the first boundary at or
+    after its resolution. Each issue adds its entry and exit to a per-bucket
+    difference array, and a cumulative sum yields every distribution in
+    O(issues + buckets x statuses).
+
+    Args:
+        frame: Issue frame (created, resolved and status columns)
+        boundaries: Sorted bucket boundaries
+        done_status: Status reported for issues resolved by a boundary
+
+    Returns:
+        One dict of status to count per boundary, omitting zero counts
+    """
+    frame = frame[frame["created"].notna()]
+    statuses = list(pd.unique(frame["status"].astype(object).fillna("Unknown")))
+    if done_status not in statuses:
+        statuses.append(done_status)
+    status_index = {status: i for i, status in enumerate(statuses)}
+
+    edges = np.array(boundaries, dtype="datetime64[us]")
+    bucket_count = len(edges)
+    created_at = np.searchsorted(edges, frame["created"].to_numpy(dtype="datetime64[us]"), side="left")
+    resolved = frame["resolved"].to_numpy(dtype="datetime64[us]")
+    resolved_at = np.where(np.isnat(resolved), bucket_count,
+                           np.searchsorted(edges, resolved, side="left"))
+    resolved_at = np.maximum(resolved_at, created_at)
+    current = frame["status"].astype(object).fillna("Unknown").map(status_index).to_numpy(dtype="int64")
+
+    # One spare row absorbs entries and exits after the last boundary
+    deltas = np.zeros((bucket_count + 1, len(statuses)), dtype="int64")
+    np.add.at(deltas, (created_at, current), 1)
+    np.add.at(deltas, (resolved_at, current), -1)
+    np.add.at(deltas, (resolved_at, status_index[done_status]), 1)
+    totals = np.cumsum(deltas, axis=0)[:bucket_count]
+
+    return [
+        {statuses[j]: int(row[j]) for j in np.flatnonzero(row)}
+        for row in totals
+    ]
@@ -0,0 +1,299 @@
+"""
+Incremental local mirror of Jira projects for MCP Atlassian.
+
+Project analytics and model training read every issue of a project. Rather
+than downloading the whole project for each call, issues are kept in a local
+SQLite database and refreshed with `updated >= -Nm` delta queries covering
+the time since the previous sync. The delta window is relative, so it is
+computed on the Jira server and does not depend on time zones or clock skew
+between the server and this process.
+
+Deleted issues and issues moved to another project never show up in a delta.
+After each delta sync the local issue count is compared with the project
+total reported by Jira, and any mismatch (as well as a configurable maximum
+age) triggers a full resync of the project.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .local_store import cache_path, connect_sqlite, site_cache_key
+from .pagination import fetch_all_pages
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.issue_mirror")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_FIELDS = "*navigable,comment"  # superset of the fields read by analytics and training
+DEFAULT_REFRESH_SECONDS = 60  # reads within this interval of a sync are served locally
+DEFAULT_FULL_SYNC_SECONDS = 24 * 3600  # maximum age of a full project sync
+MIRROR_FILE_NAME = "issue_mirror.sqlite3"
+ISSUE_PAGE_SIZE = 100
+DELTA_OVERLAP_MINUTES = 2  # JQL dates have minute precision, so deltas overlap
+
+# Fetches one page of search results as (jql, start_at, max_results) -> response JSON,
+# raising ValueError if the search fails
+SearchFunction = Callable[[str, int, int], Dict]
+
+
+class IssueMirror:
+    """
+    SQLite mirror of Jira issues, synchronised per project with delta queries.
+
+    Issues are stored as their raw search payloads, keyed by site and issue ID,
+    together with the time of each project's last delta and full sync. Mirror
+    errors are logged and fall back to fetching the project directly, so a
+    broken mirror never breaks an analytics call. A failed sync serves the
+    mirrored issues; a project that was never synced and cannot be fetched
+    raises ValueError rather than looking empty.
+    """
+
+    def __init__(self, path: Optional[str] = None, fields: Optional[str] = None,
+                 refresh_seconds: Optional[float] = None, full_sync_seconds: Optional[float] = None):
+        """
+        Initialize the IssueMirror.
+
+        The database is opened on first use.
+
+        Args:
+            path: Path of the SQLite database file
+            fields: Comma-separated issue fields to mirror
+            refresh_seconds: Minimum time between two syncs of a project
+            full_sync_seconds: Maximum time between two full syncs of a project
+        """
+        self.path = path or cache_path(MIRROR_FILE_NAME)
+        self.fields = fields or os.getenv("ATLASSIAN_ISSUE_MIRROR_FIELDS", DEFAULT_FIELDS)
+        self.refresh_seconds = refresh_seconds if refresh_seconds is not None else float(
+            os.getenv("ATLASSIAN_ISSUE_MIRROR_REFRESH_SECONDS", DEFAULT_REFRESH_SECONDS)
+        )
+        self.full_sync_seconds = full_sync_seconds if full_sync_seconds is not None else float(
+            os.getenv("ATLASSIAN_ISSUE_MIRROR_FULL_SYNC_SECONDS", DEFAULT_FULL_SYNC_SECONDS)
+        )
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._project_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self.lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            connection = connect_sqlite(self.path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS issues ("
+                " site TEXT NOT NULL, issue_id INTEGER NOT NULL, project TEXT NOT NULL,"
+                " issue_key TEXT NOT NULL, updated TEXT, data TEXT NOT NULL,"
+                " PRIMARY KEY (site, issue_id))"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS issues_project ON issues (site, project)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                " site TEXT NOT NULL, project TEXT NOT NULL, fields TEXT NOT NULL,"
+                " last_sync REAL NOT NULL, last_full_sync REAL NOT NULL,"
+                " PRIMARY KEY (site, project))"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get_issues(self, site: str, project_key: str, search: SearchFunction) -> List[Dict]:
+        """
+        Get every issue of a project, syncing the mirror first if it is due.
+
+        Syncs of different projects run concurrently; only the database
+        reads and writes are serialised.
+
+        Args:
+            site: Base URL of the Jira site
+            project_key: Project key
+            search: Function fetching one page of search results
+
+        Returns:
+            List of raw issue payloads, newest first
+
+        Raises:
+            ValueError: If the project was never synced and cannot be fetched
+        """
+        site_key = site_cache_key(site)
+        with self._project_lock(site_key, project_key):
+            try:
+                self._sync(site_key, project_key, search)
+                with self.lock:
+                    rows = self._connect().execute(
+                        "SELECT data FROM issues WHERE site=? AND project=? ORDER BY issue_id DESC",
+                        (site_key, project_key)
+                    ).fetchall()
+                return [json.loads(row[0]) for row in rows]
+            except sqlite3.Error as e:
+                logger.warning(f"Issue mirror failed for project {project_key}: {e}")
+
+        issues = self._fetch(search, f'project = "{project_key}" ORDER BY key DESC')
+        if issues is None:
+            raise ValueError(f"Failed to fetch issues of project {project_key}")
+        return issues
+
+    def _project_lock(self, site_key: str, project_key: str) -> threading.Lock:
+        """Lock serialising the syncs of one project."""
+        with self.lock:
+            return self._project_locks.setdefault((site_key, project_key), threading.Lock())
+
+    def get_project_issues(self, client: Any, project_key: str) -> List[Dict]:
+        """
+        Get every issue of a project through an authenticated Jira client.
+
+        Args:
+            client: Authenticated Jira client
+            project_key: Project key
+
+        Returns:
+            List of raw issue payloads, newest first
+
+        Raises:
+            ValueError: If the project was never synced and cannot be fetched
+        """
+        site = os.environ.get("JIRA_URL", "")
+
+        def search(jql: str, start_at: int, max_results: int) -> Dict:
+            response = client.request(
+                "GET",
+                f"{site}/rest/api/2/search",
+                params={
+                    "jql": jql,
+                    "startAt": start_at,
+                    "maxResults": max_results,
+                    "fields": self.fields
+                }
+            )
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch project issues: {response.text}")
+                raise ValueError(f"Jira search failed: {response.status_code}")
+            return response.json()
+
+        return self.get_issues(site, project_key, search)
+
+    def _sync(self, site_key: str, project_key: str, search: SearchFunction) -> None:
+        """Bring the mirrored issues of a project up to date (network calls run without the database lock)."""
+        with self.lock:
+            state = self._connect().execute(
+                "SELECT fields, last_sync, last_full_sync FROM sync_state WHERE site=? AND project=?",
+                (site_key, project_key)
+            ).fetchone()
+
+        started = time.time()
+        if state is not None and started - state[1] < self.refresh_seconds:
+            return
+
+        if state is None or state[0] != self.fields or started - state[2] >= self.full_sync_seconds:
+            self._full_sync(site_key, project_key, search, started, synced=state is not None)
+            return
+
+        # Relative dates are evaluated by Jira, so only the elapsed time matters here
+        minutes = int((started - state[1]) // 60) + DELTA_OVERLAP_MINUTES
+        changed = self._fetch(
+            search, f'project = "{project_key}" AND updated >= "-{minutes}m" ORDER BY updated ASC'
+        )
+        if changed is None:
+            logger.warning(f"Delta sync of {project_key} failed, serving mirrored issues")
+            return
+
+        # Deleted and moved issues are missing from deltas, so check the project size
+        total = self._count(search, project_key)
+        with self.lock:
+            connection = self._connect()
+            self._store(connection, site_key, project_key, changed)
+            local = connection.execute(
+                "SELECT COUNT(*) FROM issues WHERE site=? AND project=?", (site_key, project_key)
+            ).fetchone()[0]
+            if total is None or total == local:
+                connection.execute(
+                    "UPDATE sync_state SET last_sync=? WHERE site=? AND project=?",
+                    (started, site_key, project_key)
+                )
+            connection.commit()
+
+        if total is not None and total != local:
+            logger.info(f"Issue mirror for {project_key} has {local} of {total} issues, resyncing")
+            self._full_sync(site_key, project_key, search, started, synced=True)
+            return
+        logger.debug(f"Synced {len(changed)} changed issues of {project_key}")
+
+    def _full_sync(self, site_key: str, project_key: str, search: SearchFunction, started: float,
+                   synced: bool) -> None:
+        """Replace the mirrored issues of a project with a complete download."""
+        issues = self._fetch(search, f'project = "{project_key}" ORDER BY key ASC')
+        if issues is None:
+            # Stale issues are better than none, but an empty mirror must not pass for an empty project
+            if not synced:
+                raise ValueError(f"Failed to fetch issues of project {project_key}")
+            logger.warning(f"Full sync of {project_key} failed, serving mirrored issues")
+            return
+
+        with self.lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM issues WHERE site=? AND project=?", (site_key, project_key))
+            self._store(connection, site_key, project_key, issues)
+            connection.execute(
+                "INSERT OR REPLACE INTO sync_state (site, project, fields, last_sync, last_full_sync)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (site_key, project_key, self.fields, started, started)
+            )
+            connection.commit()
+        logger.debug(f"Mirrored all {len(issues)} issues of {project_key}")
+
+    @staticmethod
+    def _store(connection: sqlite3.Connection, site_key: str, project_key: str, issues: List[Dict]) -> None:
+        """Insert or replace issue payloads."""
+        connection.executemany(
+            "INSERT OR REPLACE INTO issues (site, issue_id, project, issue_key, updated, data)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (site_key, int(issue["id"]), project_key, issue.get("key", ""),
+                 issue.get("fields", {}).get("updated"), json.dumps(issue))
+                for issue in issues
+            ]
+        )
+
+    @staticmethod
+    def _fetch(search: SearchFunction, jql: str) -> Optional[List[Dict]]:
+        """Fetch every page of a search concurrently, or None if any page fails."""
+        try:
+            return fetch_all_pages(
+                lambda start_at, max_results: search(jql, start_at, max_results),
+                page_size=ISSUE_PAGE_SIZE, items_key="issues", total_key="total"
+            )
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _count(search: SearchFunction, project_key: str) -> Optional[int]:
+        """Get the number of issues in a project as reported by Jira."""
+        try:
+            return search(f'project = "{project_key}"', 0, 0).get("total")
+        except ValueError:
+            return None
+
+    def clear(self) -> None:
+        """Remove every mirrored issue and sync state."""
+        with self.lock:
+            try:
+                connection = self._connect()
+                connection.execute("DELETE FROM issues")
+                connection.execute("DELETE FROM sync_state")
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Issue mirror clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Create a singleton instance
+issue_mirror = IssueMirror()
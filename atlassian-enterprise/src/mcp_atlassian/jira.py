@@ -3,6 +3,7 @@ import os
 import json
 from datetime import datetime
 from typing import Dict, List, Optional, Union, Any, Tuple
+from urllib.parse import urlencode
 
 from atlassian import Jira
 from dotenv import load_dotenv
@@ -10,6 +11,7 @@ from dotenv import load_dotenv
 from .config import JiraConfig
 from .document_types import Document
 from .preprocessing import TextPreprocessor
+from .transport import http_transport, async_http_transport
 
 # Load environment variables
 load_dotenv()
@@ -25,6 +27,25 @@ class JiraFetcher:
     NAME_FIELD_ID = "customfield_10057"
     DEPT_FIELD_ID = "customfield_10058"
 
+    # Fields consumed by _issue_to_document, requested up front by search_issues
+    # so that search results can be turned into Documents without a refetch
+    ISSUE_DOCUMENT_FIELDS = [
+        "summary",
+        "issuetype",
+        "status",
+        "created",
+        "priority",
+        "description",
+        "comment",
+        "issuelinks",
+        NAME_FIELD_ID,
+        DEPT_FIELD_ID,
+    ]
+
+    # Page size for paginated JQL searches and parent keys per subtask query
+    SEARCH_PAGE_SIZE = 100
+    SUBTASK_BATCH_SIZE = 50
+
     def __init__(self):
         url = os.getenv("JIRA_URL")
         username = os.getenv("JIRA_USERNAME")
@@ -40,16 +61,16 @@ class JiraFetcher:
             password=self.config.api_token,  # API token is used as password
             cloud=True,
         )
-        self.preprocessor = TextPreprocessor(self.config.url)
+        self.preprocessor = TextPreprocessor(self.config.url, user_lookup=self._get_users_bulk)
         
         # Initialize a cache to store which projects have custom fields available
         self._custom_fields_cache = {}
 
-    def _clean_text(self, text: str) -> str:
+    def _clean_text(self, text: Union[str, Dict]) -> str:
         """
         Clean text content by:
         1. Processing user mentions and links
-        2. Converting HTML/wiki markup to markdown
+        2. Converting HTML/wiki markup (or ADF documents) to markdown
         """
         if not text:
             return ""
@@ -90,8 +111,6 @@ class JiraFetcher:
         Returns:
             Dictionary containing the API response
         """
-        import requests
-        
         # Ensure endpoint starts with / and doesn't include base URL
         if not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
@@ -106,27 +125,84 @@ class JiraFetcher:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(api_url, auth=auth, headers=headers)
+                response = http_transport.get(api_url, auth=auth, headers=headers)
             elif method.upper() == "POST":
-                response = requests.post(api_url, json=data, auth=auth, headers=headers)
+                response = http_transport.post(api_url, json=data, auth=auth, headers=headers)
             elif method.upper() == "PUT":
-                response = requests.put(api_url, json=data, auth=auth, headers=headers)
+                response = http_transport.put(api_url, json=data, auth=auth, headers=headers)
             elif method.upper() == "DELETE":
-                response = requests.delete(api_url, auth=auth, headers=headers)
+                response = http_transport.delete(api_url, auth=auth, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
-            if response.status_code >= 400:
-                error_msg = f"API request failed: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-                
-            # Return JSON response or empty dict for 204 No Content
-            return response.json() if response.content else {}
+            return self._handle_response(response)
             
         except Exception as e:
             logger.error(f"Error making API request to {endpoint}: {str(e)}")
             raise
+
+    async def _make_api_request_async(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                                      params: Optional[Dict] = None) -> Dict:
+        """
+        Make a direct request to the Jira REST API over the async transport.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path (without base URL)
+            data: Optional payload for POST/PUT requests
+            params: Optional query parameters
+            
+        Returns:
+            Dictionary containing the API response
+        """
+        # Ensure endpoint starts with / and doesn't include base URL
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+            
+        # Add REST API path if not already included
+        if not endpoint.startswith("/rest/api/"):
+            endpoint = f"/rest/api/3{endpoint}"
+            
+        if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+            
+        api_url = f"{self.config.url.rstrip('/')}{endpoint}"
+        
+        try:
+            response = await async_http_transport.request(
+                method, api_url, json=data, params=params,
+                auth=(self.config.username, self.config.api_token),
+                headers={"Content-Type": "application/json"}
+            )
+            return self._handle_response(response)
+            
+        except Exception as e:
+            logger.error(f"Error making API request to {endpoint}: {str(e)}")
+            raise
+
+    def _handle_response(self, response) -> Dict:
+        """Raise for Jira API errors and decode the response body."""
+        if response.status_code >= 400:
+            error_msg = f"API request failed: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+            
+        # Return JSON response or empty dict for 204 No Content
+        return response.json() if response.content else {}
+    
+    def _get_users_bulk(self, account_ids: List[str]) -> Dict[str, str]:
+        """
+        Look up the display names of several users with one request.
+        
+        Args:
+            account_ids: Account IDs to look up (at most 100)
+            
+        Returns:
+            Dictionary of account ID to display name for the users found
+        """
+        query = urlencode([("accountId", account_id) for account_id in account_ids] + [("maxResults", len(account_ids))])
+        response = self._make_api_request("GET", f"/user/bulk?{query}")
+        return {user["accountId"]: user.get("displayName") for user in response.get("values", [])}
     
     def _has_custom_fields_for_project(self, project_key: str) -> Tuple[bool, bool]:
         """
@@ -348,60 +424,80 @@ class JiraFetcher:
         """
         try:
             issue = self.jira.issue(issue_key, expand=expand)
+            return self._issue_to_document(issue, issue_key)
 
-            # Process description and comments
-            description = self._clean_text(issue["fields"].get("description", ""))
-
-            # Get comments
-            comments = []
-            if "comment" in issue["fields"]:
-                for comment in issue["fields"]["comment"]["comments"]:
-                    processed_comment = self._clean_text(comment["body"])
-                    created = self._parse_date(comment["created"])
-                    author = comment["author"].get("displayName", "Unknown")
-                    comments.append({"body": processed_comment, "created": created, "author": author})
-
-            # Format created date using new parser
-            created_date = self._parse_date(issue["fields"]["created"])
-
-            # Get custom fields (handle objects with value property)
-            name_field = issue["fields"].get(self.NAME_FIELD_ID, {})
-            dept_field = issue["fields"].get(self.DEPT_FIELD_ID, {})
-            
-            # Extract values from fields
-            name = name_field.get("value", "") if isinstance(name_field, dict) else str(name_field)
-            dept = dept_field.get("value", "") if isinstance(dept_field, dict) else str(dept_field)
-            
-            # Get issue links
-            issue_links = []
-            if "issuelinks" in issue["fields"]:
-                for link in issue["fields"]["issuelinks"]:
-                    link_type = link["type"]["name"]
-                    inward = link["type"]["inward"]
-                    outward = link["type"]["outward"]
-                    
-                    if "inwardIssue" in link:
-                        linked_issue = link["inwardIssue"]
-                        direction = "inward"
-                        relationship = inward
-                    elif "outwardIssue" in link:
-                        linked_issue = link["outwardIssue"]
-                        direction = "outward"
-                        relationship = outward
-                    else:
-                        continue
-                    
-                    issue_links.append({
-                        "type": link_type,
-                        "relationship": relationship,
-                        "direction": direction,
-                        "issue_key": linked_issue["key"],
-                        "issue_summary": linked_issue["fields"]["summary"],
-                        "issue_type": linked_issue["fields"]["issuetype"]["name"]
-                    })
-            
-            # Combine content in a more structured way
-            content = f"""Issue: {issue_key}
+        except Exception as e:
+            logger.error(f"Error fetching issue {issue_key}: {str(e)}")
+            raise
+
+    def _issue_to_document(self, issue: Dict, issue_key: Optional[str] = None) -> Document:
+        """
+        Build a Document from a raw issue payload.
+
+        The payload can come from the single-issue endpoint or from a JQL search
+        response, as long as it carries the fields listed in ISSUE_DOCUMENT_FIELDS.
+
+        Args:
+            issue: Raw issue dictionary as returned by the Jira REST API
+            issue_key: Optional issue key (defaults to the key in the payload)
+
+        Returns:
+            Document containing issue content and metadata
+        """
+        issue_key = issue_key or issue.get("key")
+        # Process description and comments
+        description = self._clean_text(issue["fields"].get("description", ""))
+
+        # Get comments
+        comments = []
+        if "comment" in issue["fields"]:
+            for comment in issue["fields"]["comment"]["comments"]:
+                processed_comment = self._clean_text(comment["body"])
+                created = self._parse_date(comment["created"])
+                author = comment["author"].get("displayName", "Unknown")
+                comments.append({"body": processed_comment, "created": created, "author": author})
+
+        # Format created date using new parser
+        created_date = self._parse_date(issue["fields"]["created"])
+
+        # Get custom fields (handle objects with value property)
+        name_field = issue["fields"].get(self.NAME_FIELD_ID, {})
+        dept_field = issue["fields"].get(self.DEPT_FIELD_ID, {})
+        
+        # Extract values from fields
+        name = name_field.get("value", "") if isinstance(name_field, dict) else str(name_field)
+        dept = dept_field.get("value", "") if isinstance(dept_field, dict) else str(dept_field)
+        
+        # Get issue links
+        issue_links = []
+        if "issuelinks" in issue["fields"]:
+            for link in issue["fields"]["issuelinks"]:
+                link_type = link["type"]["name"]
+                inward = link["type"]["inward"]
+                outward = link["type"]["outward"]
+                
+                if "inwardIssue" in link:
+                    linked_issue = link["inwardIssue"]
+                    direction = "inward"
+                    relationship = inward
+                elif "outwardIssue" in link:
+                    linked_issue = link["outwardIssue"]
+                    direction = "outward"
+                    relationship = outward
+                else:
+                    continue
+                
+                issue_links.append({
+                    "type": link_type,
+                    "relationship": relationship,
+                    "direction": direction,
+                    "issue_key": linked_issue["key"],
+                    "issue_summary": linked_issue["fields"]["summary"],
+                    "issue_type": linked_issue["fields"]["issuetype"]["name"]
+                })
+        
+        # Combine content in a more structured way
+        content = f"""Issue: {issue_key}
 Title: {issue['fields'].get('summary', '')}
 Type: {issue['fields']['issuetype']['name']}
 Status: {issue['fields']['status']['name']}
@@ -413,35 +509,31 @@ Description:
 {description}
 """
 
-            # Add issue links if any
-            if issue_links:
-                content += "\nLinks:\n"
-                for link in issue_links:
-                    content += f"- {link['relationship']} {link['issue_key']} ({link['issue_type']}): {link['issue_summary']}\n"
-
-            # Add comments
-            content += "\nComments:\n" + "\n".join(
-                [f"{c['created']} - {c['author']}: {c['body']}" for c in comments]
-            )
+        # Add issue links if any
+        if issue_links:
+            content += "\nLinks:\n"
+            for link in issue_links:
+                content += f"- {link['relationship']} {link['issue_key']} ({link['issue_type']}): {link['issue_summary']}\n"
 
-            # Streamlined metadata with only essential information
-            metadata = {
-                "key": issue_key,
-                "title": issue["fields"].get("summary", ""),
-                "type": issue["fields"]["issuetype"]["name"],
-                "status": issue["fields"]["status"]["name"],
-                "created_date": created_date,
-                "priority": issue["fields"].get("priority", {}).get("name", "None"),
-                "link": f"{self.config.url.rstrip('/')}/browse/{issue_key}",
-                "name": name,
-                "dept": dept
-            }
+        # Add comments
+        content += "\nComments:\n" + "\n".join(
+            [f"{c['created']} - {c['author']}: {c['body']}" for c in comments]
+        )
 
-            return Document(page_content=content, metadata=metadata)
+        # Streamlined metadata with only essential information
+        metadata = {
+            "key": issue_key,
+            "title": issue["fields"].get("summary", ""),
+            "type": issue["fields"]["issuetype"]["name"],
+            "status": issue["fields"]["status"]["name"],
+            "created_date": created_date,
+            "priority": issue["fields"].get("priority", {}).get("name", "None"),
+            "link": f"{self.config.url.rstrip('/')}/browse/{issue_key}",
+            "name": name,
+            "dept": dept
+        }
 
-        except Exception as e:
-            logger.error(f"Error fetching issue {issue_key}: {str(e)}")
-            raise
+        return Document(page_content=content, metadata=metadata)
 
     def search_issues(
         self, jql: str, fields: str = "*all", start: int = 0, limit: int = 50, expand: Optional[str] = None
@@ -449,6 +541,11 @@ Description:
         """
         Search for issues using JQL.
 
+        Documents are built directly from the search response, so a page of
+        results costs a single round trip. An issue is only refetched on its own
+        when the search payload is missing something the Document needs (for
+        example when Jira truncated its comment list).
+
         Args:
             jql: JQL query string
             fields: Comma-separated string of fields to return
@@ -460,20 +557,103 @@ Description:
             List of Documents containing matching issues
         """
         try:
-            results = self.jira.jql(jql, fields=fields, start=start, limit=limit, expand=expand)
+            results = self.jira.jql(
+                jql, fields=self._with_document_fields(fields), start=start, limit=limit, expand=expand
+            )
+            return self._issues_to_documents(results["issues"], expand)
+
+        except Exception as e:
+            logger.error(f"Error searching issues with JQL {jql}: {str(e)}")
+            raise
 
+    def search_all_issues(self, jql: str, fields: str = "*all", expand: Optional[str] = None) -> List[Document]:
+        """
+        Search for every issue matching a JQL query, page by page.
+
+        Args:
+            jql: JQL query string
+            fields: Comma-separated string of fields to return
+            expand: Fields to expand
+
+        Returns:
+            List of Documents containing every matching issue
+        """
+        try:
             documents = []
-            for issue in results["issues"]:
-                # Get full issue details
-                doc = self.get_issue(issue["key"], expand=expand)
-                documents.append(doc)
+            start = 0
+            while True:
+                results = self.jira.jql(
+                    jql, fields=self._with_document_fields(fields), start=start,
+                    limit=self.SEARCH_PAGE_SIZE, expand=expand
+                )
+                issues = results.get("issues", [])
+                documents.extend(self._issues_to_documents(issues, expand))
 
-            return documents
+                start += len(issues)
+                if not issues or start >= results.get("total", 0):
+                    return documents
 
         except Exception as e:
             logger.error(f"Error searching issues with JQL {jql}: {str(e)}")
             raise
 
+    def _issues_to_documents(self, issues: List[Dict], expand: Optional[str] = None) -> List[Document]:
+        """Build Documents from search result issues, refetching issues whose payload is partial."""
+        documents = []
+        for issue in issues:
+            if self._is_complete_issue_payload(issue):
+                doc = self._issue_to_document(issue)
+            else:
+                # Fall back to the single-issue endpoint for partial payloads
+                doc = self.get_issue(issue["key"], expand=expand)
+            documents.append(doc)
+        return documents
+
+    def _with_document_fields(self, fields: Optional[str]) -> str:
+        """
+        Extend a search field list with the fields required to build Documents.
+
+        Args:
+            fields: Comma-separated string of fields requested by the caller
+
+        Returns:
+            Comma-separated string of fields to request from the search endpoint
+        """
+        if not fields or "*all" in fields:
+            return "*all"
+
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        for field in self.ISSUE_DOCUMENT_FIELDS:
+            if field not in requested:
+                requested.append(field)
+
+        return ",".join(requested)
+
+    def _is_complete_issue_payload(self, issue: Dict) -> bool:
+        """
+        Check whether a search result carries everything _issue_to_document needs.
+
+        Args:
+            issue: Raw issue dictionary from a JQL search response
+
+        Returns:
+            True if the issue can be converted without fetching it again
+        """
+        fields = issue.get("fields") or {}
+
+        for field in ("issuetype", "status", "created"):
+            if not fields.get(field):
+                return False
+
+        # Search responses may only embed the first page of comments
+        comment = fields.get("comment")
+        if comment:
+            comments = comment.get("comments", [])
+            if comment.get("total", len(comments)) > len(comments):
+                return False
+
+        return True
+
     def get_project_issues(self, project_key: str, start: int = 0, limit: int = 50) -> List[Document]:
         """
         Get all issues for a project.
@@ -1126,13 +1306,15 @@ Description:
             logger.error(f"Error creating Epic in project {project_key}: {str(e)}")
             raise
             
-    def get_epic_issues(self, epic_key: str, include_subtasks: bool = True) -> dict:
+    def get_epic_issues(self, epic_key: str, include_subtasks: bool = True, batch_subtasks: bool = True) -> dict:
         """
         Get all issues linked to an Epic in a structured format.
         
         Args:
             epic_key: The Epic issue key (e.g., 'PROJ-123')
             include_subtasks: Whether to include subtasks of issues linked to the Epic
+            batch_subtasks: Whether to resolve subtasks with a few chunked
+                `parent in (...)` queries instead of one search per linked issue
             
         Returns:
             Dictionary containing the Epic details and linked issues
@@ -1147,14 +1329,22 @@ Description:
             
             # Get all issues linked to the Epic
             jql = f"'Epic Link' = {epic_key} ORDER BY created DESC"
-            linked_issues = self.search_issues(jql)
+            linked_issues = self.search_all_issues(jql)
             
             # Get subtasks if requested
-            if include_subtasks:
+            if include_subtasks and batch_subtasks:
+                subtasks_by_parent = self.get_subtasks_for_issues(
+                    [issue.metadata.get("key") for issue in linked_issues]
+                )
+                for issue in linked_issues:
+                    subtasks = subtasks_by_parent.get(issue.metadata.get("key"))
+                    if subtasks:
+                        issue.metadata["subtasks"] = subtasks
+            elif include_subtasks:
                 for issue in linked_issues:
                     issue_key = issue.metadata.get("key")
                     subtask_jql = f"parent = {issue_key} ORDER BY created DESC"
-                    subtasks = self.search_issues(subtask_jql)
+                    subtasks = self.search_all_issues(subtask_jql)
                     if subtasks:
                         # Add subtasks to the issue metadata
                         issue.metadata["subtasks"] = [
@@ -1196,24 +1386,83 @@ Description:
             logger.error(f"Error getting issues for Epic {epic_key}: {str(e)}")
             raise
             
-    def update_epic_progress(self, epic_key: str) -> dict:
+    def get_subtasks_for_issues(self, issue_keys: List[str], batch_size: int = SUBTASK_BATCH_SIZE) -> Dict[str, List[dict]]:
+        """
+        Get the subtasks of many issues with chunked `parent in (...)` queries.
+        
+        Args:
+            issue_keys: The parent issue keys (e.g., ['PROJ-1', 'PROJ-2'])
+            batch_size: Number of parent keys per JQL query
+            
+        Returns:
+            Dictionary mapping each parent key to its list of subtask summaries
+        """
+        subtasks_by_parent = {issue_key: [] for issue_key in issue_keys}
+        
+        try:
+            for i in range(0, len(issue_keys), batch_size):
+                chunk = issue_keys[i:i + batch_size]
+                jql = f"parent in ({', '.join(chunk)}) ORDER BY created DESC"
+                
+                start = 0
+                while True:
+                    results = self.jira.jql(
+                        jql, fields="summary,status,issuetype,parent", start=start, limit=self.SEARCH_PAGE_SIZE
+                    )
+                    issues = results.get("issues", [])
+                    
+                    # Group the subtasks client-side by their parent
+                    for issue in issues:
+                        fields = issue.get("fields", {})
+                        parent_key = (fields.get("parent") or {}).get("key")
+                        if parent_key not in subtasks_by_parent:
+                            continue
+                        subtasks_by_parent[parent_key].append({
+                            "key": issue.get("key"),
+                            "summary": fields.get("summary", ""),
+                            "status": (fields.get("status") or {}).get("name"),
+                            "type": (fields.get("issuetype") or {}).get("name")
+                        })
+                    
+                    start += len(issues)
+                    if not issues or start >= results.get("total", 0):
+                        break
+            
+            return subtasks_by_parent
+            
+        except Exception as e:
+            logger.error(f"Error getting subtasks for {len(issue_keys)} issues: {str(e)}")
+            raise
+            
+    def update_epic_progress(self, epic_key: str, epic_issues: Optional[dict] = None) -> dict:
         """
         Update Epic progress tracking based on linked issues.
         
         Args:
             epic_key: The Epic issue key (e.g., 'PROJ-123')
+            epic_issues: Optional result of get_epic_issues for this Epic, to
+                reuse an already fetched rollup instead of searching again
             
         Returns:
             Dictionary containing the updated Epic progress
         """
         try:
             # Get all issues linked to the Epic
-            epic_issues = self.get_epic_issues(epic_key)
+            if epic_issues is None:
+                epic_issues = self.get_epic_issues(epic_key)
             
             # Calculate progress
             total_issues = epic_issues.get("total_issues", 0)
             completed_issues = epic_issues.get("completed_issues", 0)
             
+            subtasks = [
+                subtask
+                for issue in epic_issues.get("issues", [])
+                for subtask in issue.get("subtasks", [])
+            ]
+            total_subtasks = len(subtasks)
+            completed_subtasks = len([subtask for subtask in subtasks if subtask.get("status") == "Done"])
+            
             progress_percentage = 0
             if total_issues > 0:
                 progress_percentage = int((completed_issues / total_issues) * 100)
@@ -1233,6 +1482,8 @@ Description:
                 "epic_key": epic_key,
                 "total_issues": total_issues,
                 "completed_issues": completed_issues,
+                "total_subtasks": total_subtasks,
+                "completed_subtasks": completed_subtasks,
                 "progress_percentage": progress_percentage,
                 "updated": True
             }
@@ -0,0 +1,299 @@
+"""
+Single-pass conversion of Jira wiki markup to markdown.
+
+Issue descriptions and comments from Jira REST API v2 are written in Jira
+wiki markup. All markup handled here (mentions, smart links, links, headings,
+lists, tables, code and noformat blocks, quotes, panels and inline
+formatting) is matched by one compiled pattern and rewritten in a single
+left-to-right scan, so the cost grows linearly with the length of the text
+rather than with the number of links times the length of the text.
+"""
+
+import re
+import logging
+from typing import Callable, List, Optional
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.jira_markup")
+
+# User mentions, resolved before the scan so they can be fetched in bulk
+MENTION_PATTERN = re.compile(r"\[~accountid:([^\]\s]+)\]")
+
+# Every construct the converter rewrites. Each alternative starts with a
+# literal character so the regex engine can skip ahead to candidate positions
+# instead of trying every alternative at every character. Line-level markup
+# matches the newline before the line (text is scanned with a newline
+# prepended). Block constructs come first so that their content (code in
+# particular) is not scanned for inline markup.
+BLOCK_PATTERNS = [
+    r"\{code(?::(?P<code_params>[^}\n]*))?\}(?P<code>.*?)\{code\}",
+    r"\{noformat(?::[^}\n]*)?\}(?P<noformat>.*?)\{noformat\}",
+    r"\{quote\}(?P<quote>.*?)\{quote\}",
+    r"\{panel(?::(?P<panel_params>[^}\n]*))?\}(?P<panel>.*?)\{panel\}",
+    r"\n[ \t]*h(?P<heading>[1-6])\.[ \t]+",
+    r"\n[ \t]*(?P<quote_line>bq)\.[ \t]+",
+    r"\n[ \t]*(?P<table_row>\|[^\n]*\|)[ \t]*(?=\n|\Z)",
+    r"\n[ \t]*(?P<rule>-{4,})[ \t]*(?=\n|\Z)",
+    r"\n[ \t]*(?P<list>[*#]+|-)[ \t]+",
+]
+LINK_PATTERN = r"\[(?P<link>[^\[\]\n]+)\]"
+INLINE_PATTERNS = [
+    LINK_PATTERN,
+    r"\{\{(?P<monospace>[^\n]+?)\}\}",
+    r"\{(?P<color>color)(?::[^}\n]*)?\}",
+    r"\*(?<![\w*]\*)(?P<strong>[^*\s](?:[^*\n]*?[^*\s])?)\*(?![\w*])",
+    r"_(?<![\w_]_)(?P<emphasis>[^_\s](?:[^_\n]*?[^_\s])?)_(?![\w_])",
+    r"-(?<![\w-]-)(?P<strike>[^-\s](?:[^-\n]*?[^-\s])?)-(?![\w-])",
+    r"!(?P<image>[^!\s|][^!|\n]*?\.(?:png|jpe?g|gif|svg|bmp|webp))(?:\|[^!\n]*)?!",
+    r"\\(?P<line_break>\\)",
+]
+
+TOKEN_PATTERN = re.compile("|".join(BLOCK_PATTERNS + INLINE_PATTERNS), re.DOTALL | re.IGNORECASE)
+INLINE_TOKEN_PATTERN = re.compile("|".join(INLINE_PATTERNS), re.IGNORECASE)
+LINK_TOKEN_PATTERN = re.compile(LINK_PATTERN)
+
+# Table cell separators (| and ||), skipping links and monospace spans
+TABLE_CELL_PATTERN = re.compile(r"\[[^\[\]\n]*\]|\{\{.*?\}\}|\|\|?")
+
+ISSUE_URL_PATTERN = re.compile(r"browse/([A-Z][A-Z0-9_]*-\d+)")
+CONFLUENCE_URL_PATTERN = re.compile(r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)")
+ISSUE_KEY_PREFIX_PATTERN = re.compile(r"^[A-Z]+-\d+\s+")
+URL_PREFIXES = ("http://", "https://", "mailto:", "file:", "ftp://")
+
+
+class JiraMarkupConverter:
+    """
+    Converter from Jira wiki markup to markdown.
+
+    ``convert`` rewrites a text in one scan with a compiled pattern; the only
+    other pass is a quick search for account IDs so that mentioned users can
+    be resolved with one bulk lookup before the scan.
+    """
+
+    def __init__(self, base_url: str = "", user_name: Optional[Callable[[str], Optional[str]]] = None,
+                 wiki: bool = True):
+        """
+        Initialize the JiraMarkupConverter.
+
+        Args:
+            base_url: Base URL of the Jira site, used for issue links
+            user_name: Function returning the display name of an account ID
+                (unresolved mentions render as User:<account ID>)
+            wiki: Whether to convert wiki formatting; when False only
+                mentions and links are rewritten (for text that is already
+                markdown or HTML)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.user_name = user_name
+        self.wiki = wiki
+
+    def convert(self, text: str) -> str:
+        """
+        Convert Jira wiki markup to markdown.
+
+        Args:
+            text: Wiki markup
+
+        Returns:
+            The converted markdown
+        """
+        if not text:
+            return ""
+        if not self.wiki:
+            return LINK_TOKEN_PATTERN.sub(self._rewrite, text)
+
+        # Per-call state: where the previous table row ended, to know when a
+        # row starts a new table and needs a separator line after it
+        self._table_end = -1
+        return TOKEN_PATTERN.sub(self._rewrite, "\n" + text)[1:]
+
+    def _convert_inline(self, text: str) -> str:
+        """Convert inline markup only (for table cells and formatted spans)."""
+        return INLINE_TOKEN_PATTERN.sub(self._rewrite, text)
+
+    def _rewrite(self, match: re.Match) -> str:
+        return self._handlers[match.lastgroup](self, match)
+
+    # Blocks
+
+    def _code(self, match: re.Match) -> str:
+        return self._code_block(match.group("code"), self._code_language(match.group("code_params")))
+
+    def _noformat(self, match: re.Match) -> str:
+        return self._code_block(match.group("noformat"))
+
+    def _quote_block(self, match: re.Match) -> str:
+        return self._quote(self._convert_nested(match.group("quote")))
+
+    def _panel(self, match: re.Match) -> str:
+        return self._quote(self._convert_nested(match.group("panel")),
+                           self._macro_param(match.group("panel_params"), "title"))
+
+    def _heading(self, match: re.Match) -> str:
+        return "\n" + "#" * int(match.group("heading")) + " "
+
+    def _quote_line(self, match: re.Match) -> str:
+        return "\n> "
+
+    def _rule(self, match: re.Match) -> str:
+        return "\n---"
+
+    def _list(self, match: re.Match) -> str:
+        bullets = match.group("list")
+        marker = "1." if bullets[-1] == "#" else "-"
+        return "\n" + "   " * (len(bullets) - 1) + marker + " "
+
+    def _convert_nested(self, text: str) -> str:
+        # Quotes and panels contain wiki markup of their own; a separate
+        # converter keeps their tables apart from the outer ones
+        return JiraMarkupConverter(self.base_url, self.user_name).convert(text.strip("\n"))
+
+
+    @staticmethod
+    def _code_block(code: str, language: str = "") -> str:
+        code = code.strip("\n")
+        fence = "````" if "```" in code else "```"
+        return f"{fence}{language}\n{code}\n{fence}"
+
+    @classmethod
+    def _code_language(cls, params: Optional[str]) -> str:
+        if not params:
+            return ""
+        if "=" not in params.split("|")[0]:
+            return params.split("|")[0].strip()
+        return cls._macro_param(params, "language")
+
+    @staticmethod
+    def _macro_param(params: Optional[str], name: str) -> str:
+        for param in (params or "").split("|"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == name:
+                return value.strip()
+        return ""
+
+    @staticmethod
+    def _quote(text: str, title: str = "") -> str:
+        if title:
+            text = f"**{title}**\n\n{text}" if text else f"**{title}**"
+        return "\n".join(f"> {line}" if line else ">" for line in text.split("\n"))
+
+    def _table_row(self, match: re.Match) -> str:
+        cells = self._split_cells(match.group("table_row"))
+        line = "\n| " + " | ".join(self._convert_inline(cell.strip()).replace("|", "\\|") for cell in cells) + " |"
+
+        # A row that does not directly follow another row starts a table, and
+        # markdown needs a separator line after a table's first row
+        if self._table_end != match.start():
+            line += "\n| " + " | ".join("---" for _ in cells) + " |"
+        self._table_end = match.end()
+        return line
+
+    @staticmethod
+    def _split_cells(row: str) -> List[str]:
+        cells = []
+        start = 0
+        for separator in TABLE_CELL_PATTERN.finditer(row):
+            if separator.group(0)[0] != "|":
+                continue
+            cells.append(row[start:separator.start()])
+            start = separator.end()
+        cells.append(row[start:])
+        # Drop the empty strings outside the leading and trailing separators
+        return cells[1:-1]
+
+    # Inline markup
+
+    def _link(self, match: re.Match) -> str:
+        link = match.group("link")
+        if link.startswith("~accountid:"):
+            account_id = link[len("~accountid:"):]
+            display_name = self.user_name(account_id) if self.user_name else None
+            return f"@{display_name}" if display_name else f"User:{account_id}"
+        if link.startswith("~"):
+            return f"@{link[1:]}"
+
+        parts = link.split("|")
+        if len(parts) >= 3 and parts[-1].strip() == "smart-link":
+            return self._smart_link(parts[0], parts[1])
+        if len(parts) >= 2:
+            text, url = parts[0].strip(), parts[1].strip()
+            if url.startswith(URL_PREFIXES) or url.startswith(("#", "^")) or ISSUE_URL_PATTERN.search(url):
+                return f"[{text or url}]({url})"
+            return match.group(0)
+        if link.startswith(URL_PREFIXES):
+            return f"[{link}]({link})"
+        # Anything else in brackets ([WIP], [^attachment], ...) is left as is
+        return match.group(0)
+
+    def _smart_link(self, text: str, url: str) -> str:
+        issue_key = ISSUE_URL_PATTERN.search(url)
+        if issue_key:
+            return f"[{issue_key.group(1)}]({self.base_url}/browse/{issue_key.group(1)})"
+
+        confluence_page = CONFLUENCE_URL_PATTERN.search(url)
+        if confluence_page:
+            title = ISSUE_KEY_PREFIX_PATTERN.sub("", confluence_page.group(1).replace("+", " "))
+            return f"[{title}]({url})"
+
+        return f"[{text}]({url.split('?')[0]})"
+
+    def _monospace(self, match: re.Match) -> str:
+        return f"`{match.group('monospace')}`"
+
+    def _color(self, match: re.Match) -> str:
+        # {color} tags are dropped, keeping the coloured text
+        return ""
+
+    def _strong(self, match: re.Match) -> str:
+        return f"**{self._convert_inline(match.group('strong'))}**"
+
+    def _emphasis(self, match: re.Match) -> str:
+        return f"*{self._convert_inline(match.group('emphasis'))}*"
+
+    def _strike(self, match: re.Match) -> str:
+        return f"~~{self._convert_inline(match.group('strike'))}~~"
+
+    def _image(self, match: re.Match) -> str:
+        return f"![{match.group('image')}]({match.group('image')})"
+
+    def _line_break(self, match: re.Match) -> str:
+        return "  \n"
+
+    # Handler for each token, keyed by the name of its last group
+    _handlers = {
+        "code": _code,
+        "noformat": _noformat,
+        "quote": _quote_block,
+        "panel": _panel,
+        "heading": _heading,
+        "quote_line": _quote_line,
+        "table_row": _table_row,
+        "rule": _rule,
+        "list": _list,
+        "link": _link,
+        "monospace": _monospace,
+        "color": _color,
+        "strong": _strong,
+        "emphasis": _emphasis,
+        "strike": _strike,
+        "image": _image,
+        "line_break": _line_break,
+    }
+
+
+def jira_markup_to_markdown(text: str, base_url: str = "",
+                            user_name: Optional[Callable[[str], Optional[str]]] = None,
+                            wiki: bool = True) -> str:
+    """
+    Convert Jira wiki markup to markdown in one pass.
+
+    Args:
+        text: Wiki markup
+        base_url: Base URL of the Jira site, used for issue links
+        user_name: Function returning the display name of an account ID
+        wiki: Whether to convert wiki formatting or only mentions and links
+
+    Returns:
+        The converted markdown
+    """
+    return JiraMarkupConverter(base_url=base_url, user_name=user_name, wiki=wiki).convert(text)
@@ -10,9 +10,12 @@ Date: May 7, 2025
 
 import logging
 import os
+import httpx
 import requests
 from typing import Dict, List, Optional, Union, Any, Tuple
 
+from .transport import http_transport, async_http_transport
+
 # Configure logging
 logger = logging.getLogger("mcp-jsm")
 
@@ -79,38 +82,73 @@ class JiraServiceManager:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
-            # Handle response and raise appropriate exceptions
-            if response.status_code >= 400:
-                error_msg = f"JSM API Error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                
-                # Handle specific error codes
-                if response.status_code == 404:
-                    raise ValueError("Service desk resource not found")
-                elif response.status_code == 403:
-                    raise ValueError("Permission denied - check JSM scopes")
-                elif response.status_code == 400:
-                    raise ValueError(f"Bad request: {response.text}")
-                else:
-                    raise ValueError(error_msg)
-            
-            # Return JSON response or empty dict for 204 No Content
-            return response.json() if response.content else {}
+            return self._handle_response(response)
             
         except requests.RequestException as e:
             logger.error(f"Error making JSM API request to {endpoint}: {str(e)}")
             raise ValueError(f"JSM API request failed: {str(e)}")
 
+    async def _make_api_request_async(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
+        """
+        Make a request to the JSM API over the async transport.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path (without base URL)
+            data: Optional payload for POST/PUT requests
+            params: Optional query parameters
+            
+        Returns:
+            Dictionary containing the API response
+        """
+        # Ensure endpoint starts with /
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+            
+        if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+            
+        url = f"{self.api_base}{endpoint}"
+        
+        try:
+            response = await async_http_transport.request(
+                method, url, json=data, auth=self.auth, headers=self.headers, params=params
+            )
+            return self._handle_response(response)
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Error making JSM API request to {endpoint}: {str(e)}")
+            raise ValueError(f"JSM API request failed: {str(e)}")
+            
+    def _handle_response(self, response) -> Dict:
+        """Raise for JSM API errors and decode the response body."""
+        if response.status_code >= 400:
+            error_msg = f"JSM API Error: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+
+            # Handle specific error codes
+            if response.status_code == 404:
+                raise ValueError("Service desk resource not found")
+            elif response.status_code == 403:
+                raise ValueError("Permission denied - check JSM scopes")
+            elif response.status_code == 400:
+                raise ValueError(f"Bad request: {response.text}")
+            else:
+                raise ValueError(error_msg)
+
+        # Return JSON response or empty dict for 204 No Content
+        return response.json() if response.content else {}
+
     # ======= SERVICE DESK OPERATIONS =======
     
     def get_service_desks(self, start: int = 0, limit: int = 50) -> Dict:
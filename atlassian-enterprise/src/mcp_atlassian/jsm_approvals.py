@@ -11,9 +11,13 @@ Date: May 7, 2025
 import logging
 from typing import Dict, List, Optional, Union, Any
 import os
+import httpx
 import requests
 import time
 
+from .pagination import fetch_all_pages_async
+from .transport import http_transport, async_http_transport
+
 # Configure logging
 logger = logging.getLogger("mcp-jsm-approvals")
 
@@ -41,6 +45,7 @@ class JSMApprovalManager:
             self.headers = jsm_client.headers
             self.api_base = jsm_client.api_base
             self._make_api_request = jsm_client._make_api_request
+            self._make_api_request_async = jsm_client._make_api_request_async
         else:
             self.url = url or os.getenv("JSM_URL") or os.getenv("JIRA_URL")
             self.username = username or os.getenv("JSM_USERNAME") or os.getenv("JIRA_USERNAME")
@@ -90,37 +95,72 @@ class JSMApprovalManager:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
-            # Handle response and raise appropriate exceptions
-            if response.status_code >= 400:
-                error_msg = f"JSM API Error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                
-                # Handle specific error codes
-                if response.status_code == 404:
-                    raise ValueError("Approval resource not found")
-                elif response.status_code == 403:
-                    raise ValueError("Permission denied - check JSM scopes")
-                elif response.status_code == 400:
-                    raise ValueError(f"Bad request: {response.text}")
-                else:
-                    raise ValueError(error_msg)
-            
-            # Return JSON response or empty dict for 204 No Content
-            return response.json() if response.content else {}
+            return self._handle_response(response)
             
         except requests.RequestException as e:
             logger.error(f"Error making JSM API request to {endpoint}: {str(e)}")
             raise ValueError(f"JSM API request failed: {str(e)}")
+
+    async def _make_api_request_async(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
+        """
+        Make a request to the JSM API over the async transport.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path (without base URL)
+            data: Optional payload for POST/PUT requests
+            params: Optional query parameters
+            
+        Returns:
+            Dictionary containing the API response
+        """
+        # Ensure endpoint starts with /
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+            
+        if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+            
+        url = f"{self.api_base}{endpoint}"
+        
+        try:
+            response = await async_http_transport.request(
+                method, url, json=data, auth=self.auth, headers=self.headers, params=params
+            )
+            return self._handle_response(response)
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Error making JSM API request to {endpoint}: {str(e)}")
+            raise ValueError(f"JSM API request failed: {str(e)}")
+            
+    def _handle_response(self, response) -> Dict:
+        """Raise for JSM API errors and decode the response body."""
+        if response.status_code >= 400:
+            error_msg = f"JSM API Error: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+
+            # Handle specific error codes
+            if response.status_code == 404:
+                raise ValueError("Approval resource not found")
+            elif response.status_code == 403:
+                raise ValueError("Permission denied - check JSM scopes")
+            elif response.status_code == 400:
+                raise ValueError(f"Bad request: {response.text}")
+            else:
+                raise ValueError(error_msg)
+
+        # Return JSON response or empty dict for 204 No Content
+        return response.json() if response.content else {}
             
     def _make_jira_api_request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
         """
@@ -143,13 +183,13 @@ class JSMApprovalManager:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
@@ -348,17 +388,9 @@ class JSMApprovalManager:
         # Filter by time period
         requests = self._filter_requests_by_time_period(requests, time_period)
         
-        # Get approval history for each request
-        approvals = []
-        for request in requests:
-            issue_key = request.get("issueKey")
-            if issue_key:
-                try:
-                    request_approvals = self._make_api_request("GET", f"/request/{issue_key}/approval")
-                    if "values" in request_approvals:
-                        approvals.extend(request_approvals["values"])
-                except Exception as e:
-                    logger.error(f"Error getting approvals for {issue_key}: {str(e)}")
+        # Get approval history for all requests concurrently
+        issue_keys = [request.get("issueKey") for request in requests if request.get("issueKey")]
+        approvals = async_http_transport.run(self._get_request_approvals_async(issue_keys))
         
         # Calculate metrics
         metrics = {
@@ -372,32 +404,37 @@ class JSMApprovalManager:
         
         return metrics
     
-    def _get_all_service_desk_requests(self, service_desk_id: str) -> List[Dict]:
-        """Get all requests for a service desk (handles pagination)."""
-        all_requests = []
-        start = 0
-        limit = 100
-        
-        while True:
-            params = {
-                "serviceDeskId": service_desk_id,
-                "start": start,
-                "limit": limit
-            }
-            
-            result = self._make_api_request("GET", "/request", params=params)
-            
-            if "values" not in result or not result["values"]:
-                break
-                
-            all_requests.extend(result["values"])
+    async def _get_request_approvals_async(self, issue_keys: List[str]) -> List[Dict]:
+        """
+        Get the approvals of many requests concurrently.
+        
+        Args:
+            issue_keys: Keys of the requests
             
-            if len(result["values"]) < limit:
-                break
+        Returns:
+            List of approvals, in request order
+        """
+        results = await async_http_transport.gather(
+            [lambda key=key: self._make_api_request_async("GET", f"/request/{key}/approval") for key in issue_keys],
+            return_exceptions=True
+        )
+        
+        approvals = []
+        for issue_key, result in zip(issue_keys, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error getting approvals for {issue_key}: {str(result)}")
+            elif "values" in result:
+                approvals.extend(result["values"])
                 
-            start += limit
-            
-        return all_requests
+        return approvals
+    
+    def _get_all_service_desk_requests(self, service_desk_id: str) -> List[Dict]:
+        """Get all requests for a service desk (pages after the first are fetched concurrently)."""
+        return async_http_transport.run(fetch_all_pages_async(
+            lambda start, limit: self._make_api_request_async(
+                "GET", "/request", params={"serviceDeskId": service_desk_id, "start": start, "limit": limit}
+            )
+        ))
     
     def _filter_requests_by_time_period(self, requests: List[Dict], time_period: str) -> List[Dict]:
         """Filter requests by creation time period."""
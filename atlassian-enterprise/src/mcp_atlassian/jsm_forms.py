@@ -14,6 +14,8 @@ import os
 import requests
 import json
 
+from .transport import http_transport
+
 # Configure logging
 logger = logging.getLogger("mcp-jsm-forms")
 
@@ -89,13 +91,13 @@ class JSMFormManager:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
@@ -142,13 +144,13 @@ class JSMFormManager:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
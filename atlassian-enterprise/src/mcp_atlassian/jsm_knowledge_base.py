@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Union, Any
 import os
 import requests
 
+from .transport import http_transport
+
 # Configure logging
 logger = logging.getLogger("mcp-jsm-kb")
 
@@ -86,13 +88,13 @@ class JSMKnowledgeBase:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
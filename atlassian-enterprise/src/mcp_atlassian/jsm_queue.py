@@ -11,9 +11,13 @@ Date: May 7, 2025
 import logging
 from typing import Dict, List, Optional, Union, Any
 import os
+import httpx
 import requests
 import json
 
+from .pagination import fetch_all_pages_async
+from .transport import http_transport, async_http_transport
+
 # Configure logging
 logger = logging.getLogger("mcp-jsm-queue")
 
@@ -42,6 +46,7 @@ class JSMQueueManager:
             self.headers = jsm_client.headers
             self.api_base = jsm_client.api_base
             self._make_api_request = jsm_client._make_api_request
+            self._make_api_request_async = jsm_client._make_api_request_async
         else:
             self.url = url or os.getenv("JSM_URL") or os.getenv("JIRA_URL")
             self.username = username or os.getenv("JSM_USERNAME") or os.getenv("JIRA_USERNAME")
@@ -89,37 +94,72 @@ class JSMQueueManager:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
-            # Handle response and raise appropriate exceptions
-            if response.status_code >= 400:
-                error_msg = f"JSM API Error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                
-                # Handle specific error codes
-                if response.status_code == 404:
-                    raise ValueError("Queue resource not found")
-                elif response.status_code == 403:
-                    raise ValueError("Permission denied - check JSM scopes")
-                elif response.status_code == 400:
-                    raise ValueError(f"Bad request: {response.text}")
-                else:
-                    raise ValueError(error_msg)
-            
-            # Return JSON response or empty dict for 204 No Content
-            return response.json() if response.content else {}
+            return self._handle_response(response)
             
         except requests.RequestException as e:
             logger.error(f"Error making JSM API request to {endpoint}: {str(e)}")
             raise ValueError(f"JSM API request failed: {str(e)}")
+
+    async def _make_api_request_async(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
+        """
+        Make a request to the JSM API over the async transport.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path (without base URL)
+            data: Optional payload for POST/PUT requests
+            params: Optional query parameters
+            
+        Returns:
+            Dictionary containing the API response
+        """
+        # Ensure endpoint starts with /
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+            
+        if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+            
+        url = f"{self.api_base}{endpoint}"
+        
+        try:
+            response = await async_http_transport.request(
+                method, url, json=data, auth=self.auth, headers=self.headers, params=params
+            )
+            return self._handle_response(response)
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Error making JSM API request to {endpoint}: {str(e)}")
+            raise ValueError(f"JSM API request failed: {str(e)}")
+            
+    def _handle_response(self, response) -> Dict:
+        """Raise for JSM API errors and decode the response body."""
+        if response.status_code >= 400:
+            error_msg = f"JSM API Error: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+
+            # Handle specific error codes
+            if response.status_code == 404:
+                raise ValueError("Queue resource not found")
+            elif response.status_code == 403:
+                raise ValueError("Permission denied - check JSM scopes")
+            elif response.status_code == 400:
+                raise ValueError(f"Bad request: {response.text}")
+            else:
+                raise ValueError(error_msg)
+
+        # Return JSON response or empty dict for 204 No Content
+        return response.json() if response.content else {}
             
     def _make_jira_api_request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
         """
@@ -142,13 +182,13 @@ class JSMQueueManager:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.get(url, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.post(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.put(url, json=data, auth=self.auth, headers=self.headers, params=params)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
+                response = http_transport.delete(url, json=data, auth=self.auth, headers=self.headers, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
@@ -410,29 +450,20 @@ class JSMQueueManager:
         return metrics
     
     def _get_all_queue_issues(self, service_desk_id: str, queue_id: str) -> List[Dict]:
-        """Get all issues in a queue (handles pagination)."""
-        all_issues = []
-        start = 0
-        limit = 100
-        
-        while True:
-            result = self._make_api_request(
-                "GET", 
-                f"/servicedesk/{service_desk_id}/queue/{queue_id}/issue", 
-                params={"start": start, "limit": limit, "expand": "fields"}
+        """
+        Get all issues in a queue (handles pagination).
+        
+        The queue endpoint does not report a total, so after a full first page
+        the following pages are requested concurrently until a short or empty
+        page marks the end of the queue.
+        """
+        endpoint = f"/servicedesk/{service_desk_id}/queue/{queue_id}/issue"
+        
+        return async_http_transport.run(fetch_all_pages_async(
+            lambda start, limit: self._make_api_request_async(
+                "GET", endpoint, params={"start": start, "limit": limit, "expand": "fields"}
             )
-            
-            if "values" not in result or not result["values"]:
-                break
-                
-            all_issues.extend(result["values"])
-            
-            if len(result["values"]) < limit:
-                break
-                
-            start += limit
-            
-        return all_issues
+        ))
     
     def _calculate_avg_resolution_time(self, issues: List[Dict]) -> Dict:
         """Calculate average resolution time for issues."""
@@ -0,0 +1,94 @@
+"""
+Lazy loading helpers for MCP Atlassian.
+
+The servers expose service clients and managers as module-level singletons.
+Creating them eagerly means every import pays for the service constructors and
+for heavy dependencies (pandas, scikit-learn, matplotlib, nltk) that most
+sessions never use. This module provides a proxy that stands in for such a
+singleton and only creates the real object on first attribute access.
+"""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.lazy")
+
+
+class LazyObject:
+    """
+    Proxy that creates the wrapped object on first attribute access.
+
+    Attribute reads, writes and deletes are forwarded to the wrapped object, so
+    existing code can keep using the proxy as if it were the object itself.
+    Creation is guarded by a lock, so concurrent tool calls on the executor
+    threads build the object only once.
+    """
+
+    def __init__(self, factory: Callable[[], Any], name: Optional[str] = None):
+        """
+        Initialize the LazyObject.
+
+        Args:
+            factory: Zero-argument callable that creates the wrapped object
+            name: Name used in log messages (defaults to the factory name)
+        """
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_name", name or getattr(factory, "__name__", "object"))
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_loaded", False)
+        object.__setattr__(self, "_lock", threading.RLock())
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the wrapped object has been created."""
+        return self._loaded
+
+    def _resolve(self) -> Any:
+        """Create the wrapped object if needed and return it."""
+        if self._loaded:
+            return self._instance
+
+        with self._lock:
+            if not self._loaded:
+                start = time.perf_counter()
+                instance = self._factory()
+                object.__setattr__(self, "_instance", instance)
+                object.__setattr__(self, "_loaded", True)
+                logger.debug(f"Loaded {self._name} in {time.perf_counter() - start:.3f}s")
+            return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        if self._loaded:
+            return repr(self._instance)
+        return f"<LazyObject {self._name} (not loaded)>"
+
+
+def lazy_import(module: str, attribute: str, package: Optional[str] = None) -> LazyObject:
+    """
+    Create a proxy for a module attribute that imports the module on first use.
+
+    Args:
+        module: Module name (may be relative when package is given)
+        attribute: Name of the attribute to load from the module
+        package: Package used to resolve a relative module name
+
+    Returns:
+        A LazyObject wrapping the attribute
+    """
+    def load():
+        return getattr(importlib.import_module(module, package), attribute)
+
+    return LazyObject(load, name=f"{module.lstrip('.')}.{attribute}")
@@ -0,0 +1,57 @@
+"""
+Shared helpers for the on-disk caches and stores of MCP Atlassian.
+
+Converted pages (markdown_cache), mirrored issues (issue_mirror), worklogs
+(worklog_store), rendered charts (chart_renderer) and training job progress
+(training_jobs) all live under one cache directory. This module defines that
+directory, the key under which per-site data is stored, and the SQLite
+connection setup the databases share.
+"""
+
+import os
+import sqlite3
+import hashlib
+
+# Constants (each can be overridden through the environment)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mcp-atlassian")
+SQLITE_TIMEOUT = 10  # seconds to wait for a database locked by another process
+
+
+def cache_path(name: str) -> str:
+    """
+    Path of a file or directory in the cache directory.
+
+    Args:
+        name: File or directory name
+
+    Returns:
+        The path under ATLASSIAN_CACHE_DIR (or the default cache directory)
+    """
+    return os.path.join(os.getenv("ATLASSIAN_CACHE_DIR", DEFAULT_CACHE_DIR), name)
+
+
+def site_cache_key(site: str) -> str:
+    """Short stable key for a site URL."""
+    return hashlib.sha1(site.rstrip("/").encode("utf-8")).hexdigest()[:16]
+
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    """
+    Open a SQLite database shared by the server threads and processes.
+
+    The parent directory is created if needed, and the database uses a
+    write-ahead log so readers in other processes never block on a writer.
+
+    Args:
+        path: Path of the database file
+
+    Returns:
+        The open connection, usable from any thread
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    connection = sqlite3.connect(path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    return connection
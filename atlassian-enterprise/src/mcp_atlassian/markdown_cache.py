@@ -0,0 +1,211 @@
+"""
+Persistent cache of converted Confluence page content.
+
+Converting a page's storage format to markdown (parsing, mention resolution
+and rendering) dominates the cost of reading a page, yet a page
+only changes when its version number does. Converted output is therefore
+stored on disk keyed by (site, page ID, version number, clean_html) and reused
+for as long as the page stays at that version. The database records the
+version of the conversion code that produced its entries, and a cache written
+by another converter version is emptied on open. The cache has a byte budget
+and evicts the least recently read entries once it is exceeded.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Optional
+
+from .local_store import cache_path, connect_sqlite, site_cache_key
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.markdown_cache")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB of converted content; 0 disables the cache
+CACHE_FILE_NAME = "markdown_cache.sqlite3"
+CONVERTER_VERSION = 2  # bump when the page conversion output changes, to invalidate cached pages
+
+
+class MarkdownCache:
+    """
+    Version-keyed on-disk cache of converted page content with LRU eviction.
+
+    Entries live in a SQLite database so that several server processes can
+    share the cache safely. Storing a new version of a page drops the cached
+    output of its older versions. Cache errors are logged and treated as
+    misses, so a broken cache never breaks a page read.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the MarkdownCache.
+
+        The database is opened on first use.
+
+        Args:
+            path: Path of the SQLite database file
+            max_bytes: Byte budget for cached content (0 disables the cache)
+        """
+        self.path = path or cache_path(CACHE_FILE_NAME)
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv("ATLASSIAN_MARKDOWN_CACHE_BYTES", DEFAULT_MAX_BYTES)
+        )
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self.lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.max_bytes > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            connection = connect_sqlite(self.path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                " site TEXT NOT NULL, page_id TEXT NOT NULL, version INTEGER NOT NULL,"
+                " clean_html INTEGER NOT NULL, content TEXT NOT NULL, size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL,"
+                " PRIMARY KEY (site, page_id, clean_html, version))"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access)")
+            # Content converted by another version of the conversion code is stale
+            if connection.execute("PRAGMA user_version").fetchone()[0] != CONVERTER_VERSION:
+                connection.execute("DELETE FROM pages")
+                connection.execute(f"PRAGMA user_version = {CONVERTER_VERSION}")
+            connection.commit()
+
+            self._total_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+            self._connection = connection
+        return self._connection
+
+    def get(self, site: str, page_id: str, version: Optional[int], clean_html: bool) -> Optional[str]:
+        """
+        Get the cached conversion of a page version.
+
+        Args:
+            site: Base URL of the Confluence site
+            page_id: Page ID
+            version: Page version number
+            clean_html: Whether the cached content is markdown (True) or processed HTML
+
+        Returns:
+            The cached content, or None on a miss
+        """
+        if not self.enabled or version is None:
+            return None
+
+        key = (site_cache_key(site), str(page_id), int(version), int(clean_html))
+        with self.lock:
+            try:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT content FROM pages WHERE site=? AND page_id=? AND version=? AND clean_html=?", key
+                ).fetchone()
+                if row is None:
+                    return None
+
+                connection.execute(
+                    "UPDATE pages SET last_access=? WHERE site=? AND page_id=? AND version=? AND clean_html=?",
+                    (time.time(),) + key
+                )
+                connection.commit()
+                return row[0]
+            except sqlite3.Error as e:
+                logger.warning(f"Markdown cache read failed for page {page_id}: {e}")
+                return None
+
+    def put(self, site: str, page_id: str, version: Optional[int], clean_html: bool, content: str) -> None:
+        """
+        Store the conversion of a page version, evicting old entries over budget.
+
+        Args:
+            site: Base URL of the Confluence site
+            page_id: Page ID
+            version: Page version number
+            clean_html: Whether the content is markdown (True) or processed HTML
+            content: Converted content
+        """
+        if not self.enabled or version is None:
+            return
+
+        size = len(content.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        site_key = site_cache_key(site)
+        with self.lock:
+            try:
+                connection = self._connect()
+
+                # Older versions of the page will not be requested again
+                replaced = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM pages WHERE site=? AND page_id=? AND clean_html=? AND version<=?",
+                    (site_key, str(page_id), int(clean_html), int(version))
+                ).fetchone()[0]
+                connection.execute(
+                    "DELETE FROM pages WHERE site=? AND page_id=? AND clean_html=? AND version<=?",
+                    (site_key, str(page_id), int(clean_html), int(version))
+                )
+                connection.execute(
+                    "INSERT INTO pages (site, page_id, version, clean_html, content, size, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (site_key, str(page_id), int(version), int(clean_html), content, size, time.time())
+                )
+                self._total_bytes += size - replaced
+
+                if self._total_bytes > self.max_bytes:
+                    self._evict(connection)
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Markdown cache write failed for page {page_id}: {e}")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete the least recently read entries until the cache fits its budget."""
+        # Other processes may have written to the cache, so start from the real total
+        self._total_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+
+        rows = connection.execute("SELECT rowid, size FROM pages ORDER BY last_access").fetchall()
+        evicted = []
+        for rowid, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            evicted.append((rowid,))
+            self._total_bytes -= size
+
+        connection.executemany("DELETE FROM pages WHERE rowid=?", evicted)
+        logger.debug(f"Evicted {len(evicted)} entries from the markdown cache")
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self.lock:
+            try:
+                connection = self._connect()
+                connection.execute("DELETE FROM pages")
+                connection.commit()
+                self._total_bytes = 0
+            except sqlite3.Error as e:
+                logger.warning(f"Markdown cache clear failed: {e}")
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes of content currently cached."""
+        with self.lock:
+            return self._total_bytes
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Create a singleton instance
+markdown_cache = MarkdownCache()
@@ -0,0 +1,402 @@
+"""
+Local conversion of markdown to Confluence storage format.
+
+Pages written as markdown used to be sent to Confluence's
+``contentbody/convert`` endpoint (as wiki markup, which mis-renders markdown)
+before the actual create or update request. This module converts them
+locally instead: block structure (headings, paragraphs, lists, task lists,
+block quotes, admonitions, fenced code, tables, rules) is read in one scan
+over the lines, and inline markup (code spans, emphasis, links, images) is
+rewritten with a single compiled pattern per text run.
+"""
+
+import re
+import logging
+from html import escape
+from typing import List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.markdown_storage")
+
+FENCE_PATTERN = re.compile(r"^[ ]{0,3}(`{3,}|~{3,})[ \t]*([^`\s]*)[^`]*$")
+HEADING_PATTERN = re.compile(r"^[ ]{0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+RULE_PATTERN = re.compile(r"^[ ]{0,3}(?:(?:\*[ \t]*){3,}|(?:-[ \t]*){3,}|(?:_[ \t]*){3,})$")
+QUOTE_PATTERN = re.compile(r"^[ ]{0,3}>[ ]?")
+LIST_ITEM_PATTERN = re.compile(r"^([ ]{0,3})([-*+]|\d{1,9}[.)])([ \t]+|$)")
+TASK_PATTERN = re.compile(r"^\[([ xX])\][ \t]+")
+TABLE_SEPARATOR_PATTERN = re.compile(r"^[ ]{0,3}\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$")
+ADMONITION_PATTERN = re.compile(r"^\[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\][ \t]*$", re.IGNORECASE)
+
+# Inline markup, matched in one scan: code spans first so that their content
+# is literal, then escapes, images, links, autolinks, emphasis and the
+# characters that must be escaped in XHTML
+INLINE_PATTERN = re.compile(
+    r"(?P<code>(?P<ticks>`+)(?P<code_text>.+?)(?P=ticks))"
+    r"|\\(?P<escaped>[\\`*_{}\[\]()#+\-.!|~<>])"
+    r"|!\[(?P<image_alt>[^\]]*)\]\((?P<image_url>[^)\s]+)(?:[ \t]+\"[^\"]*\")?\)"
+    r"|\[(?P<link_text>(?:[^\[\]]|\[[^\]]*\])+)\]\((?P<link_url>[^)\s]+)(?:[ \t]+\"[^\"]*\")?\)"
+    r"|<(?P<autolink>(?:https?|mailto|ftp):[^>\s]+)>"
+    r"|\*\*(?P<strong>(?!\s).+?(?<!\s))\*\*"
+    r"|(?<!\w)__(?P<strong_u>(?!\s).+?(?<!\s))__(?!\w)"
+    r"|~~(?P<strike>(?!\s).+?(?<!\s))~~"
+    r"|\*(?P<em>(?!\s)[^*]+?(?<!\s))\*"
+    r"|(?<!\w)_(?P<em_u>(?!\s)[^_]+?(?<!\s))_(?!\w)"
+    r"|(?P<entity>[&<>])"
+)
+
+# Confluence macros used for GitHub-style admonitions (> [!NOTE])
+ADMONITION_MACROS = {
+    "note": "info",
+    "tip": "tip",
+    "important": "note",
+    "warning": "warning",
+    "caution": "warning",
+}
+
+ENTITIES = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+
+
+def _cdata(text: str) -> str:
+    """Wrap text in a CDATA section, splitting any ']]>' it contains."""
+    return "<![CDATA[" + text.replace("]]>", "]]]]><![CDATA[>") + "]]>"
+
+
+def _attr(value: str) -> str:
+    return escape(value, quote=True)
+
+
+def _split_row(line: str) -> List[str]:
+    """Split a table row on unescaped pipes outside code spans."""
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+
+    cells = []
+    current = []
+    in_code = False
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if char == "\\" and i + 1 < len(line) and line[i + 1] == "|":
+            current.append("|")
+            i += 2
+            continue
+        if char == "`":
+            in_code = not in_code
+        elif char == "|" and not in_code:
+            cells.append("".join(current).strip())
+            current = []
+            i += 1
+            continue
+        current.append(char)
+        i += 1
+    cells.append("".join(current).strip())
+    return cells
+
+
+class MarkdownStorageConverter:
+    """Converter from markdown to Confluence storage format."""
+
+    def __init__(self):
+        """Initialize the MarkdownStorageConverter."""
+        # Task IDs must be unique within a page
+        self._task_id = 0
+
+    def convert(self, markdown: str) -> str:
+        """
+        Convert markdown to storage format.
+
+        Args:
+            markdown: Markdown text
+
+        Returns:
+            The storage-format XHTML
+        """
+        if not markdown:
+            return ""
+        lines = markdown.replace("\r\n", "\n").replace("\r", "\n").expandtabs(4).split("\n")
+        return self._convert_blocks(lines)
+
+    # Blocks
+
+    def _convert_blocks(self, lines: List[str]) -> str:
+        output = []
+        paragraph: List[str] = []
+        i = 0
+
+        def flush_paragraph():
+            if paragraph:
+                output.append(f"<p>{self._convert_paragraph(paragraph)}</p>")
+                paragraph.clear()
+
+        while i < len(lines):
+            line = lines[i]
+            stripped = line.strip()
+
+            if not stripped:
+                flush_paragraph()
+                i += 1
+                continue
+
+            fence = FENCE_PATTERN.match(line)
+            if fence:
+                flush_paragraph()
+                block, i = self._fenced_code(lines, i, fence)
+                output.append(block)
+                continue
+
+            heading = HEADING_PATTERN.match(line)
+            if heading:
+                flush_paragraph()
+                level = len(heading.group(1))
+                output.append(f"<h{level}>{self.convert_inline(heading.group(2) or '')}</h{level}>")
+                i += 1
+                continue
+
+            if RULE_PATTERN.match(line):
+                flush_paragraph()
+                output.append("<hr />")
+                i += 1
+                continue
+
+            if QUOTE_PATTERN.match(line):
+                flush_paragraph()
+                block, i = self._quote(lines, i)
+                output.append(block)
+                continue
+
+            if LIST_ITEM_PATTERN.match(line) and not (paragraph and self._interrupts_paragraph(line)):
+                flush_paragraph()
+                block, i = self._list(lines, i)
+                output.append(block)
+                continue
+
+            if "|" in line and i + 1 < len(lines) and TABLE_SEPARATOR_PATTERN.match(lines[i + 1]) \
+                    and "|" in lines[i + 1]:
+                flush_paragraph()
+                block, i = self._table(lines, i)
+                output.append(block)
+                continue
+
+            paragraph.append(line)
+            i += 1
+
+        flush_paragraph()
+        return "".join(output)
+
+    @staticmethod
+    def _interrupts_paragraph(line: str) -> bool:
+        # Like CommonMark, only bullets and lists starting at 1 interrupt a paragraph
+        marker = LIST_ITEM_PATTERN.match(line).group(2)
+        return not (marker in "-*+" or marker[:-1] == "1")
+
+    def _convert_paragraph(self, lines: List[str]) -> str:
+        parts = []
+        for index, line in enumerate(lines):
+            text = line.strip()
+            hard_break = line.endswith("  ") or (text.endswith("\\") and not text.endswith("\\\\"))
+            if text.endswith("\\") and hard_break:
+                text = text[:-1].rstrip()
+            parts.append(self.convert_inline(text))
+            if index < len(lines) - 1:
+                parts.append("<br />" if hard_break else " ")
+        return "".join(parts)
+
+    def _fenced_code(self, lines: List[str], start: int, fence: re.Match) -> Tuple[str, int]:
+        marker = fence.group(1)
+        language = fence.group(2).lower()
+        code = []
+        i = start + 1
+        while i < len(lines):
+            closing = lines[i].strip()
+            if closing.startswith(marker[0] * len(marker)) and not closing.strip(marker[0]):
+                i += 1
+                break
+            code.append(lines[i])
+            i += 1
+
+        parameters = f'<ac:parameter ac:name="language">{_attr(language)}</ac:parameter>' if language else ""
+        return (
+            f'<ac:structured-macro ac:name="code">{parameters}'
+            f'<ac:plain-text-body>{_cdata(chr(10).join(code))}</ac:plain-text-body></ac:structured-macro>',
+            i,
+        )
+
+    def _quote(self, lines: List[str], start: int) -> Tuple[str, int]:
+        content = []
+        i = start
+        while i < len(lines) and lines[i].strip():
+            quote = QUOTE_PATTERN.match(lines[i])
+            # Lines without '>' continue the quote (lazy continuation)
+            content.append(lines[i][quote.end():] if quote else lines[i])
+            i += 1
+
+        admonition = ADMONITION_PATTERN.match(content[0].strip())
+        if admonition:
+            macro = ADMONITION_MACROS[admonition.group(1).lower()]
+            body = self._convert_blocks(content[1:])
+            return (
+                f'<ac:structured-macro ac:name="{macro}"><ac:rich-text-body>{body}'
+                f'</ac:rich-text-body></ac:structured-macro>',
+                i,
+            )
+        return f"<blockquote>{self._convert_blocks(content)}</blockquote>", i
+
+    def _list(self, lines: List[str], start: int) -> Tuple[str, int]:
+        first = LIST_ITEM_PATTERN.match(lines[start])
+        ordered = first.group(2)[0].isdigit()
+        items = []
+        i = start
+
+        while i < len(lines):
+            item = LIST_ITEM_PATTERN.match(lines[i])
+            if not item or item.group(2)[0].isdigit() != ordered:
+                break
+
+            # Content lines are indented past the marker
+            indent = len(item.group(0)) if item.group(3) else len(item.group(1)) + len(item.group(2)) + 1
+            body = [lines[i][len(item.group(0)):]]
+            i += 1
+            while i < len(lines):
+                line = lines[i]
+                if not line.strip():
+                    # A blank line continues the item only if indented content follows
+                    if i + 1 < len(lines) and lines[i + 1].strip() and \
+                            len(lines[i + 1]) - len(lines[i + 1].lstrip()) >= indent:
+                        body.append("")
+                        i += 1
+                        continue
+                    break
+                leading = len(line) - len(line.lstrip())
+                if leading >= indent:
+                    body.append(line[indent:])
+                elif LIST_ITEM_PATTERN.match(line) or FENCE_PATTERN.match(line) or HEADING_PATTERN.match(line) \
+                        or QUOTE_PATTERN.match(line) or RULE_PATTERN.match(line):
+                    break
+                else:
+                    # Lazy continuation of the item's paragraph
+                    body.append(line.strip())
+                i += 1
+            items.append(body)
+
+            # Items separated by one blank line belong to the same list
+            if i + 1 < len(lines) and not lines[i].strip():
+                following = LIST_ITEM_PATTERN.match(lines[i + 1])
+                if following and following.group(2)[0].isdigit() == ordered:
+                    i += 1
+
+        if not ordered and all(TASK_PATTERN.match(body[0]) for body in items):
+            return self._task_list(items), i
+
+        tag = "ol" if ordered else "ul"
+        start_number = int(first.group(2)[:-1]) if ordered else 1
+        opening = f'<ol start="{start_number}">' if ordered and start_number != 1 else f"<{tag}>"
+        return opening + "".join(f"<li>{self._list_item(body)}</li>" for body in items) + f"</{tag}>", i
+
+    def _list_item(self, body: List[str]) -> str:
+        content = self._convert_blocks(body)
+        # Tight items: a lone leading paragraph is unwrapped
+        if content.startswith("<p>") and content.count("<p>") == 1:
+            end = content.index("</p>")
+            content = content[3:end] + content[end + 4:]
+        return content
+
+    def _task_list(self, items: List[List[str]]) -> str:
+        tasks = []
+        for body in items:
+            task = TASK_PATTERN.match(body[0])
+            status = "incomplete" if task.group(1) == " " else "complete"
+            self._task_id += 1
+            content = self._list_item([body[0][task.end():]] + body[1:])
+            tasks.append(
+                f"<ac:task><ac:task-id>{self._task_id}</ac:task-id><ac:task-status>{status}</ac:task-status>"
+                f"<ac:task-body>{content}</ac:task-body></ac:task>"
+            )
+        return "<ac:task-list>" + "".join(tasks) + "</ac:task-list>"
+
+    def _table(self, lines: List[str], start: int) -> Tuple[str, int]:
+        header = _split_row(lines[start])
+        alignments = []
+        for cell in _split_row(lines[start + 1]):
+            if cell.startswith(":") and cell.endswith(":"):
+                alignments.append("center")
+            elif cell.endswith(":"):
+                alignments.append("right")
+            else:
+                alignments.append("")
+
+        def row(cells: List[str], tag: str) -> str:
+            # Pad or truncate ragged rows to the header width
+            cells = (cells + [""] * len(header))[:len(header)]
+            rendered = []
+            for index, cell in enumerate(cells):
+                align = alignments[index] if index < len(alignments) else ""
+                style = f' style="text-align: {align};"' if align else ""
+                rendered.append(f"<{tag}{style}>{self.convert_inline(cell)}</{tag}>")
+            return "<tr>" + "".join(rendered) + "</tr>"
+
+        rows = [row(header, "th")]
+        i = start + 2
+        while i < len(lines) and lines[i].strip() and "|" in lines[i]:
+            rows.append(row(_split_row(lines[i]), "td"))
+            i += 1
+        return "<table><tbody>" + "".join(rows) + "</tbody></table>", i
+
+    # Inline markup
+
+    def convert_inline(self, text: str) -> str:
+        """
+        Convert inline markdown (code, emphasis, links, images) to storage format.
+
+        Args:
+            text: Markdown text without block structure
+
+        Returns:
+            The storage-format XHTML
+        """
+        return INLINE_PATTERN.sub(self._inline, text)
+
+    def _inline(self, match: re.Match) -> str:
+        kind = match.lastgroup
+        if kind == "code" or kind == "code_text":
+            return f"<code>{escape(match.group('code_text').strip(), quote=False)}</code>"
+        if kind == "escaped":
+            return ENTITIES.get(match.group("escaped"), match.group("escaped"))
+        if kind == "image_url":
+            return self._image(match.group("image_alt"), match.group("image_url"))
+        if kind == "link_url":
+            return f'<a href="{_attr(match.group("link_url"))}">{self.convert_inline(match.group("link_text"))}</a>'
+        if kind == "autolink":
+            url = match.group("autolink")
+            return f'<a href="{_attr(url)}">{escape(url, quote=False)}</a>'
+        if kind in ("strong", "strong_u"):
+            return f"<strong>{self.convert_inline(match.group(kind))}</strong>"
+        if kind in ("em", "em_u"):
+            return f"<em>{self.convert_inline(match.group(kind))}</em>"
+        if kind == "strike":
+            return f"<del>{self.convert_inline(match.group('strike'))}</del>"
+        return ENTITIES[match.group(0)]
+
+    @staticmethod
+    def _image(alt: str, url: str) -> str:
+        alt_attr = f' ac:alt="{_attr(alt)}"' if alt else ""
+        if re.match(r"^(?:https?:)?//", url):
+            return f'<ac:image{alt_attr}><ri:url ri:value="{_attr(url)}" /></ac:image>'
+        # Relative paths refer to attachments of the page
+        filename = url.rsplit("/", 1)[-1]
+        return f'<ac:image{alt_attr}><ri:attachment ri:filename="{_attr(filename)}" /></ac:image>'
+
+
+def markdown_to_storage(markdown: Optional[str]) -> str:
+    """
+    Convert markdown to Confluence storage format.
+
+    Args:
+        markdown: Markdown text
+
+    Returns:
+        The storage-format XHTML
+    """
+    return MarkdownStorageConverter().convert(markdown or "")
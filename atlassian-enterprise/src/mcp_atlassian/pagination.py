@@ -0,0 +1,135 @@
+"""
+Concurrent offset pagination for MCP Atlassian.
+
+Jira search, JSM queues and JSM request listings page through results with a
+start offset and a page limit. Rather than requesting those pages one after
+another, the first page is fetched to learn the page size (and the total,
+where the endpoint reports one) and the remaining offsets are then fetched by
+a bounded set of concurrent workers. Pages are reassembled in offset order.
+
+When the total is unknown, workers keep claiming the next offset until a
+short page, an empty page or ``isLastPage`` marks the end of the results, at
+which point no further offsets are scheduled. A short page before the
+reported total ends the results as well, so a shrinking result set never
+leaves gaps.
+"""
+
+import os
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .transport import async_http_transport
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.pagination")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PAGE_CONCURRENCY = 8  # pages in flight per paginated listing
+
+# Fetches one page as (start, limit) -> response JSON
+AsyncPageFunction = Callable[[int, int], Awaitable[Dict]]
+PageFunction = Callable[[int, int], Dict]
+
+
+def _page_concurrency(concurrency: Optional[int]) -> int:
+    """Resolve the in-flight page limit."""
+    return max(1, concurrency or int(os.getenv("ATLASSIAN_PAGINATION_CONCURRENCY", DEFAULT_PAGE_CONCURRENCY)))
+
+
+def _is_last_page(page: Dict, values: List[Any], page_size: int) -> bool:
+    """Whether a page ends the results."""
+    return len(values) < page_size or bool(page.get("isLastPage"))
+
+
+async def fetch_all_pages_async(fetch_page: AsyncPageFunction, page_size: int = DEFAULT_PAGE_SIZE,
+                                items_key: str = "values", total_key: Optional[str] = None,
+                                concurrency: Optional[int] = None) -> List[Any]:
+    """
+    Fetch every page of an offset-paginated listing concurrently.
+
+    Args:
+        fetch_page: Coroutine function fetching the page at (start, limit)
+        page_size: Requested page limit
+        items_key: Key of the items in each page ("values", "issues", ...)
+        total_key: Key of the total item count, if the endpoint reports one
+        concurrency: Maximum pages in flight (defaults to ATLASSIAN_PAGINATION_CONCURRENCY)
+
+    Returns:
+        All items in offset order
+    """
+    first = await fetch_page(0, page_size)
+    items = list(first.get(items_key) or [])
+    if not items or first.get("isLastPage"):
+        return items
+
+    # Servers may cap the limit, so the first page sets the stride
+    stride = len(items)
+    total = first.get(total_key) if total_key else None
+    end = total if isinstance(total, int) else None
+    if end is not None and end <= stride:
+        return items
+
+    pages: Dict[int, List[Any]] = {}
+    next_offset = stride
+
+    async def worker():
+        nonlocal end, next_offset
+        while end is None or next_offset < end:
+            offset = next_offset
+            next_offset += stride
+            page = await fetch_page(offset, stride)
+            values = list(page.get(items_key) or [])
+            pages[offset] = values
+            if _is_last_page(page, values, stride):
+                last = offset + len(values)
+                end = last if end is None else min(end, last)
+
+    worker_count = _page_concurrency(concurrency)
+    if end is not None:
+        worker_count = min(worker_count, -(-(end - stride) // stride))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(worker_count)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        raise
+
+    for offset in sorted(pages):
+        if offset < end:
+            items.extend(pages[offset])
+    logger.debug(f"Fetched {len(items)} items in {len(pages) + 1} pages")
+    return items
+
+
+def fetch_all_pages(fetch_page: PageFunction, page_size: int = DEFAULT_PAGE_SIZE,
+                    items_key: str = "values", total_key: Optional[str] = None,
+                    concurrency: Optional[int] = None) -> List[Any]:
+    """
+    Fetch every page of an offset-paginated listing with a blocking page function.
+
+    Pages are fetched on a thread pool sized to the in-flight limit, for
+    clients (such as the authenticated enterprise client) without an async API.
+
+    Args:
+        fetch_page: Function fetching the page at (start, limit)
+        page_size: Requested page limit
+        items_key: Key of the items in each page ("values", "issues", ...)
+        total_key: Key of the total item count, if the endpoint reports one
+        concurrency: Maximum pages in flight (defaults to ATLASSIAN_PAGINATION_CONCURRENCY)
+
+    Returns:
+        All items in offset order
+    """
+    concurrency = _page_concurrency(concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mcp-atlassian-pages") as pool:
+        async def fetch_page_async(start: int, limit: int) -> Dict:
+            return await asyncio.get_running_loop().run_in_executor(pool, fetch_page, start, limit)
+
+        return async_http_transport.run(
+            fetch_all_pages_async(fetch_page_async, page_size, items_key, total_key, concurrency)
+        )
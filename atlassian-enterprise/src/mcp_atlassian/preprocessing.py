@@ -1,49 +1,101 @@
 import logging
 import re
-import warnings
-from typing import Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from .adf import adf_to_markdown, collect_mention_ids, is_adf
+from .jira_markup import MENTION_PATTERN, jira_markup_to_markdown
+from .storage_format import storage_to_markdown
+from .user_cache import UserCache, user_cache
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Account IDs of user mentions in Confluence storage format
+ACCOUNT_ID_PATTERN = re.compile(r'ri:account-id="([^"]+)"')
+
+# Links that mention a user, replaced by @mentions in processed HTML
+MENTION_LINK_PATTERN = re.compile(
+    r'<ac:link\b[^>]*>\s*<ri:user\b[^>]*?ri:account-id="([^"]+)"[^>]*>.*?</ac:link>', re.DOTALL
+)
+
+# Tags marking Jira text as rendered HTML rather than wiki markup
+HTML_TAG_PATTERN = re.compile(r"<[a-zA-Z/][^>]*>")
+
 
 class TextPreprocessor:
     """Handles text preprocessing for Confluence and Jira content."""
 
-    def __init__(self, base_url: str, confluence_client=None):
+    def __init__(self, base_url: str, confluence_client=None,
+                 user_lookup: Optional[Callable[[List[str]], Dict[str, str]]] = None,
+                 cache: Optional[UserCache] = None):
+        """
+        Initialize the TextPreprocessor.
+
+        Args:
+            base_url: Base URL of the Atlassian site
+            confluence_client: Optional Confluence client for single-user lookups
+            user_lookup: Optional bulk lookup mapping account IDs to display names
+            cache: User cache (defaults to the cache shared by all preprocessors)
+        """
         self.base_url = base_url.rstrip("/")
         self.confluence_client = confluence_client
+        self.user_lookup = user_lookup
+        self.user_cache = cache if cache is not None else user_cache
+
+    def _get_user_display_name(self, account_id: str) -> Optional[str]:
+        """Fetch a single user's display name from the Confluence API."""
+        user_info = self.confluence_client.get_user_details_by_accountid(account_id)
+        return user_info.get("displayName", account_id)
+
+    def resolve_users(self, account_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Resolve account IDs to display names through the shared user cache.
+
+        Uncached IDs are fetched with one bulk request per batch; IDs the bulk
+        lookup does not return fall back to single-user lookups.
+
+        Args:
+            account_ids: Account IDs to resolve
+
+        Returns:
+            Dictionary of account ID to display name for every resolved ID
+        """
+        return self.user_cache.resolve(
+            account_ids,
+            bulk_lookup=self.user_lookup,
+            single_lookup=self._get_user_display_name if self.confluence_client else None,
+        )
+
+    def prefetch_users(self, html_contents: Iterable[str]) -> None:
+        """
+        Warm the user cache with every user mentioned in some storage-format content.
+
+        Args:
+            html_contents: Storage-format bodies, e.g. all comments of a page
+        """
+        if self.user_lookup or self.confluence_client:
+            self.resolve_users(
+                account_id for html in html_contents for account_id in ACCOUNT_ID_PATTERN.findall(html or "")
+            )
 
     def process_html_content(self, html_content: str, space_key: str = "") -> Tuple[str, str]:
         """Process HTML content to replace user refs and page links."""
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Process user mentions
-            user_mentions = soup.find_all("ri:user")
-            for user in user_mentions:
-                account_id = user.get("ri:account-id")
-                if account_id and self.confluence_client:
-                    try:
-                        # Fetch user info using the Confluence API
-                        user_info = self.confluence_client.get_user_details_by_accountid(account_id)
-                        display_name = user_info.get("displayName", account_id)
-
-                        # Replace the entire ac:link structure with @mention
-                        link_tag = user.find_parent("ac:link")
-                        if link_tag:
-                            link_tag.replace_with(f"@{display_name}")
-                    except Exception as e:
-                        logger.warning(f"Could not fetch user info for {account_id}: {e}")
-                        # Fallback: just use the account ID
-                        link_tag = user.find_parent("ac:link")
-                        if link_tag:
-                            link_tag.replace_with(f"@user_{account_id}")
-
-            processed_html = str(soup)
-            processed_markdown = md(processed_html)
+            # Resolve all mentioned users up front
+            account_ids = ACCOUNT_ID_PATTERN.findall(html_content)
+            display_names = {}
+            processed_html = html_content
+            if account_ids and (self.user_lookup or self.confluence_client):
+                display_names = self.resolve_users(account_ids)
+
+                # Replace the entire ac:link structure with @mention,
+                # falling back to the account ID for unresolved users
+                processed_html = MENTION_LINK_PATTERN.sub(
+                    lambda m: f"@{display_names.get(m.group(1)) or f'user_{m.group(1)}'}", html_content
+                )
+
+            processed_markdown = storage_to_markdown(
+                html_content, user_name=display_names.get, base_url=self.base_url, space_key=space_key
+            )
 
             return processed_html, processed_markdown
 
@@ -51,79 +103,57 @@ class TextPreprocessor:
             logger.error(f"Error in process_html_content: {str(e)}")
             raise
 
-    def clean_jira_text(self, text: str) -> str:
+    def clean_jira_text(self, text: Union[str, Dict[str, Any]]) -> str:
         """
-        Clean Jira text content by:
-        1. Processing user mentions and links
-        2. Converting HTML/wiki markup to markdown
+        Clean Jira text content by converting wiki markup (or rendered HTML),
+        user mentions and smart links to markdown in a single pass.
+
+        ADF documents (REST API v3 rich text fields) are rendered to markdown
+        directly.
         """
         if not text:
             return ""
 
-        # Process user mentions
-        mention_pattern = r"\[~accountid:(.*?)\]"
-        text = self._process_mentions(text, mention_pattern)
+        if is_adf(text):
+            return self.render_adf(text)
 
-        # Process Jira smart links
-        text = self._process_smart_links(text)
+        # Resolve all mentioned users up front with one bulk lookup
+        account_ids = MENTION_PATTERN.findall(text)
+        display_names = {}
+        if account_ids and (self.user_lookup or self.confluence_client):
+            display_names = self.resolve_users(account_ids)
 
-        # Convert HTML to markdown if needed
-        text = self._convert_html_to_markdown(text)
+        # Rendered HTML only needs its mentions and links rewritten before
+        # it is converted; anything else is wiki markup
+        is_html = HTML_TAG_PATTERN.search(text) is not None
+        text = jira_markup_to_markdown(
+            text, base_url=self.base_url, user_name=display_names.get, wiki=not is_html
+        )
+        if is_html:
+            text = self._convert_html_to_markdown(text)
 
         return text.strip()
 
-    def _process_mentions(self, text: str, pattern: str) -> str:
-        """Process user mentions in text."""
-        mentions = re.findall(pattern, text)
-        for account_id in mentions:
-            try:
-                # Note: This is a placeholder - actual user fetching should be injected
-                display_name = f"User:{account_id}"
-                text = text.replace(f"[~accountid:{account_id}]", display_name)
-            except Exception as e:
-                logger.error(f"Error getting user info for {account_id}: {str(e)}")
-        return text
-
-    def _process_smart_links(self, text: str) -> str:
-        """Process Jira/Confluence smart links."""
-        # Pattern matches: [text|url|smart-link]
-        link_pattern = r"\[(.*?)\|(.*?)\|smart-link\]"
-        matches = re.finditer(link_pattern, text)
-
-        for match in matches:
-            full_match = match.group(0)
-            link_text = match.group(1)
-            link_url = match.group(2)
-
-            # Extract issue key if it's a Jira issue link
-            issue_key_match = re.search(r"browse/([A-Z]+-\d+)", link_url)
-            # Check if it's a Confluence wiki link
-            confluence_match = re.search(r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)", link_url)
-
-            if issue_key_match:
-                issue_key = issue_key_match.group(1)
-                clean_url = f"{self.base_url}/browse/{issue_key}"
-                text = text.replace(full_match, f"[{issue_key}]({clean_url})")
-            elif confluence_match:
-                url_title = confluence_match.group(1)
-                readable_title = url_title.replace("+", " ")
-                readable_title = re.sub(r"^[A-Z]+-\d+\s+", "", readable_title)
-                text = text.replace(full_match, f"[{readable_title}]({link_url})")
-            else:
-                clean_url = link_url.split("?")[0]
-                text = text.replace(full_match, f"[{link_text}]({clean_url})")
-
-        return text
+    def render_adf(self, document: Dict[str, Any]) -> str:
+        """
+        Render an ADF document to markdown, resolving mentions through the user cache.
+
+        Args:
+            document: ADF document
+
+        Returns:
+            The rendered markdown
+        """
+        account_ids = collect_mention_ids(document)
+        display_names = {}
+        if account_ids and (self.user_lookup or self.confluence_client):
+            display_names = self.resolve_users(account_ids)
+        return adf_to_markdown(document, user_name=display_names.get)
 
     def _convert_html_to_markdown(self, text: str) -> str:
         """Convert HTML content to markdown if needed."""
-        if re.search(r"<[^>]+>", text):
-            try:
-                with warnings.catch_warnings():
-                    warnings.filterwarnings("ignore", category=UserWarning)
-                    soup = BeautifulSoup(f"<div>{text}</div>", "html.parser")
-                    html = str(soup.div.decode_contents()) if soup.div else text
-                    text = md(html)
-            except Exception as e:
-                logger.warning(f"Error converting HTML to markdown: {e}")
-        return text
+        try:
+            return storage_to_markdown(text)
+        except Exception as e:
+            logger.warning(f"Error converting HTML to markdown: {e}")
+            return text
@@ -0,0 +1,156 @@
+"""
+CPU-bound work in worker processes for the MCP Atlassian servers.
+
+Analytics sections (pandas aggregations, clustering, chart rendering) are
+CPU-bound and hold the GIL, so on the blocking thread pool they only take
+turns. This module keeps one lazily created pool of worker processes shared
+by the CPU-heavy features. Workers are started with the spawn method by
+default, so they never inherit locks held by server threads, and the pool
+lives as long as the server, so each worker imports pandas and scikit-learn
+only once.
+
+Functions and arguments sent to the pool must be picklable (module-level
+functions, plain data, DataFrames). Setting ATLASSIAN_PROCESS_WORKERS to 0
+runs the work in the calling process instead, as does work submitted from
+inside a worker process.
+"""
+
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.process_pool")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_PROCESS_WORKERS = min(4, os.cpu_count() or 1) if (os.cpu_count() or 1) > 1 else 0  # in-process on one core
+DEFAULT_START_METHOD = "spawn"
+
+# A function call as (function, positional arguments, keyword arguments)
+Call = Tuple[Callable, Tuple, Dict[str, Any]]
+
+
+class ProcessPool:
+    """
+    Shared pool of worker processes with an in-process fallback.
+
+    A pool whose worker died (for example killed for memory) is replaced,
+    and the calls it lost are run again in the calling process.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, start_method: Optional[str] = None):
+        """
+        Initialize the ProcessPool.
+
+        The worker processes are started on first use.
+
+        Args:
+            max_workers: Number of worker processes (0 runs calls in-process)
+            start_method: multiprocessing start method ("spawn", "forkserver" or "fork")
+        """
+        env_workers = os.getenv("ATLASSIAN_PROCESS_WORKERS")
+        if max_workers is None:
+            max_workers = int(env_workers) if env_workers else DEFAULT_PROCESS_WORKERS
+        self.max_workers = max(0, max_workers)
+        self.start_method = start_method or os.getenv("ATLASSIAN_PROCESS_START_METHOD", DEFAULT_START_METHOD)
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.lock = threading.RLock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use."""
+        with self.lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method)
+                )
+            return self._pool
+
+    def _reset(self, broken: ProcessPoolExecutor) -> None:
+        """Forget a broken pool so the next call starts a new one."""
+        with self.lock:
+            if self._pool is broken:
+                self._pool = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _run_inline(func: Callable, *args, **kwargs) -> Future:
+        """Run a call in the calling process, returning its outcome as a Future."""
+        future = Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Run a picklable callable in a worker process.
+
+        Args:
+            func: Module-level function to run
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Future of the function's return value
+        """
+        # Work submitted from inside a worker (a report section rendering its
+        # charts, say) runs in that worker rather than starting a nested pool
+        if self.max_workers == 0 or multiprocessing.parent_process() is not None:
+            return self._run_inline(func, *args, **kwargs)
+
+        pool = self._get_pool()
+        try:
+            return pool.submit(func, *args, **kwargs)
+        except BrokenProcessPool:
+            logger.warning("Process pool is broken, starting a new one")
+            self._reset(pool)
+            return self._get_pool().submit(func, *args, **kwargs)
+
+    def run_all(self, calls: Dict[str, Call]) -> Dict[str, Any]:
+        """
+        Run several calls concurrently and wait for all of them.
+
+        Args:
+            calls: Calls to run, by name
+
+        Returns:
+            Dict mapping each name to the call's return value, or to the
+            exception it raised
+        """
+        futures = {name: self.submit(func, *args, **kwargs) for name, (func, args, kwargs) in calls.items()}
+
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except BrokenProcessPool:
+                logger.warning(f"Worker process died while running {name}, running it in-process")
+                with self.lock:
+                    if self._pool is not None:
+                        self._reset(self._pool)
+                func, args, kwargs = calls[name]
+                try:
+                    results[name] = func(*args, **kwargs)
+                except Exception as e:
+                    results[name] = e
+            except Exception as e:
+                results[name] = e
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        with self.lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait, cancel_futures=True)
+                self._pool = None
+
+
+# Create a singleton instance
+process_pool = ProcessPool()
@@ -710,7 +710,7 @@ def get_enhanced_confluence_tools() -> List[Tool]:
         ),
         Tool(
             name="confluence_content_compare_versions",
-            description="Compare two versions of a content",
+            description="Compare two versions of a content as a unified diff of their markdown",
             inputSchema={
                 "type": "object",
                 "properties": {
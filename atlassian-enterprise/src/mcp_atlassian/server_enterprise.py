@@ -8,18 +8,35 @@ including authentication, analytics, AI capabilities, and app integrations.
 import os
 import json
 import logging
+import importlib.util
 from typing import Dict, List, Optional, Any
 
 from mcp.types import Tool
 
-from .auth import auth_manager
-from .analytics import analytics_manager
-from .ai_capabilities import ai_capabilities_manager
-from .marketplace_integration import app_integration_manager
+from .lazy import lazy_import
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian.server_enterprise")
 
+# The managers pull in pandas, scikit-learn, matplotlib and nltk, so each one
+# is only imported when a tool in its family is first called
+auth_manager = lazy_import(".auth", "auth_manager", __package__)
+analytics_manager = lazy_import(".analytics", "analytics_manager", __package__)
+ai_capabilities_manager = lazy_import(".ai_capabilities", "ai_capabilities_manager", __package__)
+app_integration_manager = lazy_import(".marketplace_integration", "app_integration_manager", __package__)
+
+# Third-party packages the enterprise managers need
+ENTERPRISE_DEPENDENCIES = ("pandas", "numpy", "matplotlib", "sklearn", "nltk", "joblib", "jwt")
+
+
+def get_enterprise_available() -> bool:
+    """Check that the enterprise dependencies are installed without importing them."""
+    missing = [dep for dep in ENTERPRISE_DEPENDENCIES if importlib.util.find_spec(dep) is None]
+    if missing:
+        logger.warning(f"Enterprise features disabled, missing packages: {', '.join(missing)}")
+        return False
+    return True
+
 
 def get_enterprise_tools() -> List[Tool]:
     """Get the enterprise tools for MCP Atlassian."""
@@ -227,7 +244,7 @@ def get_enterprise_tools() -> List[Tool]:
     tools.extend([
         Tool(
             name="ai_train_issue_classifier",
-            description="Train an AI model to classify issues",
+            description="Start training an AI model to classify issues in the background; returns a job ID to poll with ai_get_training_job",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -312,7 +329,7 @@ def get_enterprise_tools() -> List[Tool]:
         ),
         Tool(
             name="ai_train_sla_predictor",
-            description="Train an AI model to predict SLA breaches",
+            description="Start training an AI model to predict SLA breaches in the background; returns a job ID to poll with ai_get_training_job",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -337,6 +354,33 @@ def get_enterprise_tools() -> List[Tool]:
                 },
                 "required": ["issue_key"]
             }
+        ),
+        Tool(
+            name="ai_get_training_job",
+            description="Get the status, progress and results of a model training job",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "Job ID returned when training was started"
+                    }
+                },
+                "required": ["job_id"]
+            }
+        ),
+        Tool(
+            name="ai_list_training_jobs",
+            description="List recent model training jobs",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_key": {
+                        "type": "string",
+                        "description": "Only list training jobs of this project"
+                    }
+                }
+            }
         )
     ])
     
@@ -671,6 +715,20 @@ def handle_enterprise_tool_call(name: str, arguments: Any) -> Any:
         )
         return result
     
+    elif name == "ai_get_training_job":
+        job_id = arguments["job_id"]
+        result = ai_capabilities_manager.get_training_job(
+            job_id=job_id
+        )
+        return result
+    
+    elif name == "ai_list_training_jobs":
+        project_key = arguments.get("project_key")
+        result = ai_capabilities_manager.list_training_jobs(
+            project_key=project_key
+        )
+        return result
+    
     # Marketplace App Integration tools
     elif name == "app_get_available":
         apps = app_integration_manager.get_available_apps()
@@ -16,9 +16,11 @@ from typing import Dict, List, Optional, Any
 from mcp.server import Server
 from mcp.types import Resource, Tool, TextContent
 
+from .executor import blocking_executor
+
 # Import Enterprise modules
 try:
-    from .server_enterprise import get_enterprise_tools, handle_enterprise_tool_call
+    from .server_enterprise import get_enterprise_tools, handle_enterprise_tool_call, get_enterprise_available
     ENTERPRISE_AVAILABLE = True
 except ImportError:
     ENTERPRISE_AVAILABLE = False
@@ -27,6 +29,7 @@ except ImportError:
     # Define dummy functions
     def get_enterprise_tools(): return []
     def handle_enterprise_tool_call(name, arguments): return {}
+    def get_enterprise_available(): return False
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING)
@@ -37,7 +40,7 @@ logging.getLogger("mcp.server.lowlevel.server").setLevel(logging.WARNING)
 def get_available_services():
     """Determine which ENTERPRISE services are available based on environment variables."""
     # Enterprise features are always available if the module loads
-    enterprise_vars = ENTERPRISE_AVAILABLE
+    enterprise_vars = ENTERPRISE_AVAILABLE and get_enterprise_available()
     
     # Check for required Atlassian credentials for enterprise features
     atlassian_configured = any([
@@ -80,7 +83,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     try:
         # Handle Enterprise tools
         if services.get("enterprise", False):
-            result = await handle_enterprise_tool_call(name, arguments)
+            result = await blocking_executor.run("enterprise", handle_enterprise_tool_call, name, arguments)
             return [TextContent(type="text", text=json.dumps(result, indent=2))]
         
         # Tool not found
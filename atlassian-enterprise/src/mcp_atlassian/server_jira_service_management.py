@@ -17,6 +17,7 @@ from .jsm_knowledge_base import JSMKnowledgeBase
 from .jsm_queue import JSMQueueManager
 from .jsm_approvals import JSMApprovalManager
 from .jsm_forms import JSMFormManager
+from .lazy import LazyObject
 
 # Configure logging
 logger = logging.getLogger("mcp-jsm")
@@ -31,9 +32,9 @@ def get_jsm_available():
     return jsm_vars
 
 def initialize_jsm_service():
-    """Initialize JSM service if credentials are available."""
+    """Initialize JSM service if credentials are available (created on first use)."""
     if get_jsm_available():
-        return JiraServiceManager()
+        return LazyObject(JiraServiceManager)
     return None
 
 # Initialize JSM service and advanced modules
@@ -44,10 +45,10 @@ jsm_approval_service = None
 jsm_form_service = None
 
 if jsm_service:
-    jsm_kb_service = JSMKnowledgeBase(jsm_client=jsm_service)
-    jsm_queue_service = JSMQueueManager(jsm_client=jsm_service)
-    jsm_approval_service = JSMApprovalManager(jsm_client=jsm_service)
-    jsm_form_service = JSMFormManager(jsm_client=jsm_service)
+    jsm_kb_service = LazyObject(lambda: JSMKnowledgeBase(jsm_client=jsm_service), name="JSMKnowledgeBase")
+    jsm_queue_service = LazyObject(lambda: JSMQueueManager(jsm_client=jsm_service), name="JSMQueueManager")
+    jsm_approval_service = LazyObject(lambda: JSMApprovalManager(jsm_client=jsm_service), name="JSMApprovalManager")
+    jsm_form_service = LazyObject(lambda: JSMFormManager(jsm_client=jsm_service), name="JSMFormManager")
 
 def get_jsm_tools():
     """Get JSM tools to register with the MCP server."""
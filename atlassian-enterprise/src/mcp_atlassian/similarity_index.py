@@ -0,0 +1,261 @@
+"""
+Persistent text similarity index for MCP Atlassian content suggestions.
+
+Each project's issues are indexed once and then kept up to date: a sync
+compares every issue's `updated` timestamp with the indexed one and only
+vectorizes issues that are new or changed, dropping deleted ones. Texts are
+vectorized with a HashingVectorizer, which needs no vocabulary, so adding an
+issue never changes the vectors of the others. Term counts are kept in a
+sparse matrix together with per-term document frequencies, and TF-IDF cosine
+similarity is computed at query time with one sparse matrix-vector product,
+so the IDF weights always reflect the current corpus.
+
+Each document also carries a set of tags (for example which kinds of
+suggestion content the issue has), so one index serves every search filter.
+Indexes are saved per project with joblib and written atomically.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.similarity_index")
+
+# Constants
+HASH_FEATURES = 2 ** 20  # hashed term space; collisions are negligible for issue summaries
+INDEX_VERSION = 1
+
+# Describes an issue for the index as (text to index, tags of the document)
+DescribeFunction = Callable[[Dict], Tuple[str, List[str]]]
+
+
+def _issue_stamp(issue: Dict) -> str:
+    """Version of an issue payload: its updated timestamp, or a hash of the payload."""
+    updated = issue.get("fields", {}).get("updated")
+    if updated:
+        return str(updated)
+    return hashlib.sha1(json.dumps(issue, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class SimilarityIndex:
+    """
+    Incrementally updated TF-IDF similarity indexes, one per project.
+
+    Loaded indexes are kept in memory and saved after every sync that
+    changed them. A missing or unreadable index file is rebuilt.
+    """
+
+    def __init__(self, index_dir: str):
+        """
+        Initialize the SimilarityIndex.
+
+        Args:
+            index_dir: Directory of the persisted indexes
+        """
+        self.index_dir = index_dir
+        self.vectorizer = HashingVectorizer(
+            n_features=HASH_FEATURES, ngram_range=(1, 2), alternate_sign=False, norm=None
+        )
+        self._indexes: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.RLock()
+
+    def _index_path(self, name: str) -> str:
+        """Path of the persisted index of a project."""
+        return os.path.join(self.index_dir, f"{name}_similarity.joblib")
+
+    @staticmethod
+    def _empty_index() -> Dict[str, Any]:
+        """An index without documents."""
+        return {
+            "version": INDEX_VERSION,
+            "keys": np.empty(0, dtype=str),
+            "stamps": np.empty(0, dtype=str),
+            "counts": sp.csr_matrix((0, HASH_FEATURES), dtype="float64"),
+            "tag_names": [],
+            "tags": np.zeros((0, 0), dtype=bool),
+        }
+
+    def _load(self, name: str) -> Dict[str, Any]:
+        """Get the index of a project from memory or disk."""
+        index = self._indexes.get(name)
+        if index is not None:
+            return index
+
+        path = self._index_path(name)
+        if os.path.exists(path):
+            try:
+                index = joblib.load(path)
+                if index.get("version") != INDEX_VERSION:
+                    index = None
+            except Exception as e:
+                logger.warning(f"Could not load similarity index {path}: {e}")
+                index = None
+        if index is None:
+            index = self._empty_index()
+        self._prepare(index)
+        self._indexes[name] = index
+        return index
+
+    def _save(self, name: str, index: Dict[str, Any]) -> None:
+        """Persist an index atomically (without the derived weights)."""
+        os.makedirs(self.index_dir, exist_ok=True)
+        path = self._index_path(name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        stored = {k: v for k, v in index.items() if k not in ("frequencies", "idf_squared", "norms", "postings")}
+        try:
+            joblib.dump(stored, temp_path)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save similarity index {path}: {e}")
+
+    @staticmethod
+    def _prepare(index: Dict[str, Any]) -> None:
+        """Compute the document frequencies, IDF weights, TF-IDF norms and term postings."""
+        counts = index["counts"]
+        documents = counts.shape[0]
+        frequencies = np.bincount(counts.indices, minlength=HASH_FEATURES)
+        index["frequencies"] = frequencies
+        # Smoothed IDF, as computed by TfidfVectorizer
+        idf = np.log((1 + documents) / (1 + frequencies)) + 1
+        index["idf_squared"] = idf ** 2
+        index["norms"] = np.sqrt(counts.multiply(counts) @ index["idf_squared"])
+        # Column-major copy, so a query only reads the postings of its own terms
+        index["postings"] = counts.tocsc()
+
+    def update(self, name: str, issues: List[Dict], describe: DescribeFunction) -> int:
+        """
+        Bring the index of a project up to date with its current issues.
+
+        Args:
+            name: Index name (the project key)
+            issues: Every issue payload of the project
+            describe: Function giving the text and tags of an issue
+
+        Returns:
+            Number of issues that were (re)indexed
+        """
+        keys = np.array([issue.get("key", "") for issue in issues], dtype=str)
+        stamps = np.array([_issue_stamp(issue) for issue in issues], dtype=str)
+
+        with self.lock:
+            index = self._load(name)
+            positions = {key: position for position, key in enumerate(index["keys"])}
+            previous = np.array([positions.get(key, -1) for key in keys], dtype="int64")
+            known = previous >= 0
+            unchanged = known.copy()
+            unchanged[known] = index["stamps"][previous[known]] == stamps[known]
+
+            changed = np.flatnonzero(~unchanged)
+            if len(changed) == 0 and len(keys) == len(index["keys"]):
+                return 0
+
+            descriptions = [describe(issues[i]) for i in changed]
+            tag_names = list(index["tag_names"])
+            for _, tags in descriptions:
+                for tag in tags:
+                    if tag not in tag_names:
+                        tag_names.append(tag)
+
+            # Keep the rows of unchanged issues and append the changed ones
+            kept = previous[unchanged]
+            new_counts = self.vectorizer.transform([text for text, _ in descriptions]).astype("float64")
+            new_tags = np.zeros((len(changed), len(tag_names)), dtype=bool)
+            for row, (_, tags) in enumerate(descriptions):
+                new_tags[row, [tag_names.index(tag) for tag in tags]] = True
+            old_tags = np.zeros((len(kept), len(tag_names)), dtype=bool)
+            old_tags[:, :len(index["tag_names"])] = index["tags"][kept]
+
+            index = {
+                "version": INDEX_VERSION,
+                "keys": np.concatenate([keys[unchanged], keys[changed]]),
+                "stamps": np.concatenate([stamps[unchanged], stamps[changed]]),
+                "counts": sp.vstack([index["counts"][kept], new_counts], format="csr"),
+                "tag_names": tag_names,
+                "tags": np.vstack([old_tags, new_tags]),
+            }
+            self._prepare(index)
+            self._indexes[name] = index
+            self._save(name, index)
+
+        logger.debug(f"Indexed {len(changed)} changed issues of {name}")
+        return len(changed)
+
+    def count(self, name: str, tag: Optional[str] = None) -> int:
+        """
+        Number of indexed issues of a project.
+
+        Args:
+            name: Index name (the project key)
+            tag: Only count documents with this tag
+
+        Returns:
+            Number of documents
+        """
+        with self.lock:
+            index = self._load(name)
+        if tag is None:
+            return len(index["keys"])
+        if tag not in index["tag_names"]:
+            return 0
+        return int(index["tags"][:, index["tag_names"].index(tag)].sum())
+
+    def search(self, name: str, query: str, tag: Optional[str] = None, limit: int = 3,
+               min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Find the indexed issues most similar to a query text.
+
+        Args:
+            name: Index name (the project key)
+            query: Query text
+            tag: Only consider documents with this tag
+            limit: Maximum number of results
+            min_score: Minimum cosine similarity of a result
+
+        Returns:
+            List of (issue key, cosine similarity), most similar first
+        """
+        with self.lock:
+            index = self._load(name)
+
+        if tag is not None and tag not in index["tag_names"]:
+            return []
+
+        # Terms no document contains are ignored, like words outside a TfidfVectorizer vocabulary
+        query_counts = self.vectorizer.transform([query])
+        present = index["frequencies"][query_counts.indices] > 0
+        columns = query_counts.indices[present]
+        weights = query_counts.data[present] * index["idf_squared"][columns]
+        query_norm = np.sqrt((query_counts.data[present] * weights).sum())
+        if query_norm == 0 or len(index["keys"]) == 0:
+            return []
+
+        # Cosine similarity of TF-IDF vectors: (q * idf) . (d * idf) / (|q * idf| |d * idf|)
+        dots = index["postings"][:, columns] @ weights
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(index["norms"] > 0, dots / (index["norms"] * query_norm), 0.0)
+        if tag is not None:
+            scores[~index["tags"][:, index["tag_names"].index(tag)]] = 0.0
+
+        candidates = np.flatnonzero(scores > min_score)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(str(index["keys"][i]), float(scores[i])) for i in candidates]
+
+    def clear(self) -> None:
+        """Forget every loaded index and remove the persisted ones."""
+        with self.lock:
+            self._indexes = {}
+            if os.path.isdir(self.index_dir):
+                for file_name in os.listdir(self.index_dir):
+                    if file_name.endswith("_similarity.joblib"):
+                        os.remove(os.path.join(self.index_dir, file_name))
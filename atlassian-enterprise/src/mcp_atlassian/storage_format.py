@@ -0,0 +1,495 @@
+"""
+Single-pass conversion of Confluence storage format to markdown.
+
+Storage format is XHTML extended with ``ac:`` (macros, links, images, tasks,
+layouts) and ``ri:`` (resource identifiers such as users, pages and
+attachments) elements. The converter is built on the incremental
+``html.parser`` tokenizer and writes markdown as elements close, keeping only
+the stack of open elements instead of building a document tree, serializing
+it and parsing it a second time.
+"""
+
+import re
+import logging
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional
+from urllib.parse import quote
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.storage_format")
+
+# Elements that never have content or an end tag
+VOID_ELEMENTS = frozenset([
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param",
+    "source", "track", "wbr",
+])
+
+# Elements rendered as blocks separated by blank lines
+BLOCK_ELEMENTS = frozenset([
+    "p", "div", "section", "article", "header", "footer", "main", "nav", "aside", "figure",
+    "figcaption", "address", "dl", "dt", "dd", "center", "details", "summary",
+    "ac:layout", "ac:layout-section", "ac:layout-cell", "ac:rich-text-body", "ac:task-body",
+])
+
+# Elements whose content is dropped
+SKIPPED_ELEMENTS = frozenset(["script", "style", "head", "title", "template", "ac:placeholder", "ac:task-id"])
+
+# Elements whose whitespace-only text is layout, not content
+STRUCTURAL_ELEMENTS = frozenset([
+    "ul", "ol", "table", "thead", "tbody", "tfoot", "tr", "colgroup", "ac:task-list", "ac:task",
+    "ac:structured-macro", "ac:macro", "ac:layout", "ac:layout-section", "ac:link", "ac:image",
+])
+
+# Elements whose text is kept verbatim (whitespace included)
+PREFORMATTED_ELEMENTS = frozenset(["pre", "xmp", "ac:plain-text-body", "ac:plain-text-link-body"])
+
+# Elements whose text is not markdown-escaped
+LITERAL_ELEMENTS = PREFORMATTED_ELEMENTS | frozenset(["code", "tt", "kbd", "samp", "ac:parameter"])
+
+# Inline formatting elements and their markdown markers
+INLINE_MARKERS = {
+    "strong": "**", "b": "**",
+    "em": "*", "i": "*", "cite": "*",
+    "s": "~~", "del": "~~", "strike": "~~",
+}
+
+# Panel-style macros rendered as block quotes
+PANEL_MACROS = frozenset(["info", "note", "warning", "tip", "panel", "success", "error"])
+
+# Macros rendered as fenced code blocks
+CODE_MACROS = frozenset(["code", "noformat"])
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+BLANK_LINES_PATTERN = re.compile(r"[ \t]*\n(?:[ \t]*\n)+")
+ESCAPE_PATTERN = re.compile(r"([*_])")
+CODE_PLACEHOLDER_PATTERN = re.compile(r"\x00(\d+)\x00")
+
+
+def _collapse_whitespace(match: re.Match) -> str:
+    """Collapse a run of whitespace, keeping line and paragraph breaks."""
+    newlines = match.group(0).count("\n")
+    if newlines == 0:
+        return " "
+    return "\n\n" if newlines > 1 else "\n"
+
+
+class _Frame:
+    """An open element and the markdown rendered for its content so far."""
+
+    __slots__ = ("tag", "attrs", "parts", "data", "preformatted", "literal", "skip")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["_Frame"]):
+        self.tag = tag
+        self.attrs = attrs
+        self.parts: List[str] = []
+        self.data: Dict = {}
+        self.preformatted = tag in PREFORMATTED_ELEMENTS or (parent is not None and parent.preformatted)
+        self.literal = tag in LITERAL_ELEMENTS or (parent is not None and parent.literal)
+        self.skip = tag in SKIPPED_ELEMENTS or (parent is not None and parent.skip)
+
+
+class StorageFormatConverter(HTMLParser):
+    """
+    Streaming converter from Confluence storage format to markdown.
+
+    Feed content with ``feed`` (in as many chunks as needed) and call
+    ``close`` to get the markdown. Code blocks are kept out of the output
+    until the end so that blank-line normalization never touches them.
+    """
+
+    def __init__(self, user_name: Optional[Callable[[str], Optional[str]]] = None,
+                 base_url: str = "", space_key: str = ""):
+        """
+        Initialize the StorageFormatConverter.
+
+        Args:
+            user_name: Function returning the display name of an account ID
+                (mentions of unresolved users render as @user_<account ID>)
+            base_url: Base URL of the Confluence site, used for page links
+            space_key: Space of the page, used for links without a space key
+        """
+        super().__init__(convert_charrefs=True)
+        self.user_name = user_name
+        self.base_url = base_url.rstrip("/")
+        self.space_key = space_key
+
+        self._stack: List[_Frame] = [_Frame("[document]", {}, None)]
+        self._code_blocks: List[str] = []
+
+    def feed(self, data: str) -> None:
+        """
+        Parse a chunk of content.
+
+        NUL characters (never valid in storage format) are dropped, since
+        they delimit the code block placeholders in the rendered output.
+
+        Args:
+            data: Next chunk of storage-format or HTML content
+        """
+        super().feed(data.replace("\x00", ""))
+
+    # Parser callbacks
+
+    def handle_starttag(self, tag: str, attrs: List) -> None:
+        attrs = {name: value or "" for name, value in attrs}
+
+        if tag in VOID_ELEMENTS:
+            if not self._top.skip:
+                self._top.parts.append(self._render_void(tag, attrs))
+            return
+
+        if tag.startswith("ri:"):
+            # Resource identifiers describe the enclosing link or image
+            owner = self._find("ac:link", "ac:image")
+            if owner is not None:
+                owner.data.setdefault("resource", (tag, attrs))
+            self._stack.append(_Frame(tag, attrs, self._top))
+            self._top.skip = True
+            return
+
+        # Close an open list item, row or cell that the new one implicitly ends
+        if tag in ("li", "tr", "td", "th", "p") and self._top.tag == tag:
+            self.handle_endtag(tag)
+
+        self._stack.append(_Frame(tag, attrs, self._top))
+
+    def handle_startendtag(self, tag: str, attrs: List) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in VOID_ELEMENTS:
+            return
+
+        # Ignore end tags without a matching open element; close any
+        # elements left open inside the one being closed
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                break
+        else:
+            return
+
+        while len(self._stack) > depth:
+            frame = self._stack.pop()
+            rendered = "" if frame.skip else self._render(frame)
+            if rendered and not self._top.skip:
+                self._top.parts.append(rendered)
+
+    def handle_data(self, data: str) -> None:
+        frame = self._top
+        if frame.skip:
+            return
+        if frame.preformatted:
+            frame.parts.append(data)
+            return
+
+        text = WHITESPACE_PATTERN.sub(_collapse_whitespace, data)
+        # Whitespace at the start of a line, or between structural tags, is layout
+        if text[:1] == " " and (not frame.parts or frame.parts[-1].endswith("\n")):
+            text = text[1:]
+        if not text or (frame.tag in STRUCTURAL_ELEMENTS and text.isspace()):
+            return
+        frame.parts.append(text if frame.literal else ESCAPE_PATTERN.sub(r"\\\1", text))
+
+    def unknown_decl(self, data: str) -> None:
+        # CDATA sections hold the bodies of code macros and plain-text links
+        if data.startswith("CDATA["):
+            self._append_raw(data[len("CDATA["):])
+
+    def handle_comment(self, data: str) -> None:
+        # Parsers that treat CDATA as a bogus comment report it here
+        if data.startswith("[CDATA[") and data.endswith("]]"):
+            self._append_raw(data[len("[CDATA["):-2])
+
+    def close(self) -> str:
+        """
+        Finish parsing and return the markdown.
+
+        Returns:
+            The converted markdown
+        """
+        super().close()
+        while len(self._stack) > 1:
+            self.handle_endtag(self._top.tag)
+
+        markdown = BLANK_LINES_PATTERN.sub("\n\n", "".join(self._stack[0].parts)).strip()
+        return CODE_PLACEHOLDER_PATTERN.sub(lambda m: self._code_blocks[int(m.group(1))], markdown)
+
+    # Helpers
+
+    @property
+    def _top(self) -> _Frame:
+        return self._stack[-1]
+
+    def _find(self, *tags: str) -> Optional[_Frame]:
+        """Get the innermost open element with one of the given tags."""
+        for frame in reversed(self._stack):
+            if frame.tag in tags:
+                return frame
+        return None
+
+    def _append_raw(self, text: str) -> None:
+        """Append text that is neither whitespace-collapsed nor escaped."""
+        if not self._top.skip:
+            self._top.parts.append(text)
+
+    def _code_block(self, code: str, language: str = "") -> str:
+        """Store a fenced code block and return its placeholder."""
+        code = code.strip("\n")
+        fence = "````" if "```" in code else "```"
+        self._code_blocks.append(f"{fence}{language}\n{code}\n{fence}")
+        return f"\n\n\x00{len(self._code_blocks) - 1}\x00\n\n"
+
+    @staticmethod
+    def _block(text: str) -> str:
+        """Render content as a block separated from its neighbours by blank lines."""
+        text = BLANK_LINES_PATTERN.sub("\n\n", text).strip()
+        return f"\n\n{text}\n\n" if text else ""
+
+    @staticmethod
+    def _wrap(text: str, marker: str) -> str:
+        """Wrap inline content in a marker, keeping surrounding spaces outside it."""
+        stripped = text.strip()
+        if not stripped:
+            return text
+        leading = text[:len(text) - len(text.lstrip())]
+        trailing = text[len(text.rstrip()):]
+        return f"{leading}{marker}{stripped}{marker}{trailing}"
+
+    def _escape(self, text: str) -> str:
+        return ESCAPE_PATTERN.sub(r"\\\1", text)
+
+    def _page_url(self, title: str, space_key: str) -> str:
+        """URL of a page addressed by space and title."""
+        if not self.base_url or not space_key:
+            return ""
+        return f"{self.base_url}/display/{quote(space_key)}/{quote(title.replace(' ', '+'), safe='+')}"
+
+    # Rendering
+
+    def _render_void(self, tag: str, attrs: Dict[str, str]) -> str:
+        if tag == "br":
+            return "  \n"
+        if tag == "hr":
+            return "\n\n---\n\n"
+        if tag == "img":
+            return f"![{self._escape(attrs.get('alt', ''))}]({attrs.get('src', '')})"
+        return ""
+
+    def _render(self, frame: _Frame) -> str:
+        tag = frame.tag
+        inner = "".join(frame.parts)
+
+        if tag in INLINE_MARKERS:
+            return self._wrap(inner, INLINE_MARKERS[tag])
+        if tag in BLOCK_ELEMENTS:
+            return self._block(inner)
+        if len(tag) == 2 and tag[0] == "h" and tag[1] in "123456":
+            heading = WHITESPACE_PATTERN.sub(" ", inner).strip()
+            return f"\n\n{'#' * int(tag[1])} {heading}\n\n" if heading else ""
+
+        render = self._RENDERERS.get(tag)
+        if render is not None:
+            return render(self, frame, inner)
+        return inner
+
+    def _render_code(self, frame: _Frame, inner: str) -> str:
+        if frame.preformatted or self._find("pre") is not None:
+            return inner
+        ticks = "``" if "`" in inner else "`"
+        return self._wrap(inner, ticks) if inner.strip() else ""
+
+    def _render_pre(self, frame: _Frame, inner: str) -> str:
+        language = ""
+        for name in frame.attrs.get("class", "").split():
+            if name.startswith("language-"):
+                language = name[len("language-"):]
+        return self._code_block(inner, language)
+
+    def _render_blockquote(self, frame: _Frame, inner: str) -> str:
+        return self._quote(inner)
+
+    def _quote(self, text: str, label: str = "") -> str:
+        text = BLANK_LINES_PATTERN.sub("\n\n", text).strip()
+        if label:
+            text = f"**{label}**\n\n{text}" if text else f"**{label}**"
+        if not text:
+            return ""
+        quoted = "\n".join(f"> {line}" if line else ">" for line in text.split("\n"))
+        return f"\n\n{quoted}\n\n"
+
+    def _render_list(self, frame: _Frame, inner: str) -> str:
+        text = BLANK_LINES_PATTERN.sub("\n", inner).strip("\n")
+        return f"\n\n{text}\n\n" if text.strip() else ""
+
+    def _render_list_item(self, frame: _Frame, inner: str) -> str:
+        parent = self._find("ul", "ol", "ac:task-list")
+        if parent is not None and parent.tag == "ol":
+            parent.data["count"] = parent.data.get("count", 0) + 1
+            marker = f"{int(parent.attrs.get('start') or 1) + parent.data['count'] - 1}. "
+        elif frame.tag == "ac:task":
+            marker = "- [x] " if frame.data.get("status") == "complete" else "- [ ] "
+        else:
+            marker = "- "
+
+        text = BLANK_LINES_PATTERN.sub("\n", inner).strip()
+        indent = " " * len(marker)
+        lines = text.split("\n")
+        body = "\n".join([lines[0]] + [f"{indent}{line}" if line else "" for line in lines[1:]])
+        return f"\n{marker}{body}\n"
+
+    def _render_task_status(self, frame: _Frame, inner: str) -> str:
+        task = self._find("ac:task")
+        if task is not None:
+            task.data["status"] = inner.strip()
+        return ""
+
+    def _render_table_cell(self, frame: _Frame, inner: str) -> str:
+        text = CODE_PLACEHOLDER_PATTERN.sub(
+            lambda m: "`" + " ".join(self._code_blocks[int(m.group(1))].split("\n")[1:-1]) + "`", inner
+        )
+        text = re.sub(r"\s*\n\s*", "<br>", text.strip()).replace("|", "\\|")
+        row = self._find("tr")
+        if row is not None:
+            row.data.setdefault("cells", []).append(text)
+            if frame.tag == "th":
+                row.data["header"] = True
+        return ""
+
+    def _render_table_row(self, frame: _Frame, inner: str) -> str:
+        table = self._find("table")
+        if table is not None and frame.data.get("cells"):
+            table.data.setdefault("rows", []).append(frame.data["cells"])
+            if frame.data.get("header") and len(table.data["rows"]) == 1:
+                table.data["header"] = True
+        return ""
+
+    def _render_table(self, frame: _Frame, inner: str) -> str:
+        rows = frame.data.get("rows", [])
+        if not rows:
+            return ""
+
+        width = max(len(row) for row in rows)
+        rows = [row + [""] * (width - len(row)) for row in rows]
+        lines = [f"| {' | '.join(rows[0])} |", f"| {' | '.join(['---'] * width)} |"]
+        lines.extend(f"| {' | '.join(row)} |" for row in rows[1:])
+        return "\n\n" + "\n".join(lines) + "\n\n"
+
+    def _render_link(self, frame: _Frame, inner: str) -> str:
+        href = frame.attrs.get("href", "")
+        text = inner.strip()
+        if not href:
+            return inner
+        return f"[{text or href}]({href})"
+
+    def _render_time(self, frame: _Frame, inner: str) -> str:
+        return inner or frame.attrs.get("datetime", "")
+
+    def _render_ac_link(self, frame: _Frame, inner: str) -> str:
+        kind, attrs = frame.data.get("resource", ("", {}))
+        text = inner.strip()
+
+        if kind == "ri:user":
+            account_id = attrs.get("ri:account-id") or attrs.get("ri:userkey", "")
+            display_name = self.user_name(account_id) if self.user_name and account_id else None
+            return f"@{self._escape(display_name)}" if display_name else f"@{self._escape(f'user_{account_id}')}"
+
+        anchor = frame.attrs.get("ac:anchor", "")
+        if kind in ("ri:page", "ri:blog-post"):
+            title = attrs.get("ri:content-title", "")
+            url = self._page_url(title, attrs.get("ri:space-key") or self.space_key)
+            text = text or self._escape(title)
+            if url:
+                return f"[{text}]({url}{'#' + anchor if anchor else ''})"
+            return text
+        if kind == "ri:attachment":
+            return text or self._escape(attrs.get("ri:filename", ""))
+        if kind == "ri:url":
+            url = attrs.get("ri:value", "")
+            return f"[{text or url}]({url})"
+        if anchor:
+            return f"[{text or self._escape(anchor)}](#{anchor})"
+        return text
+
+    def _render_ac_image(self, frame: _Frame, inner: str) -> str:
+        kind, attrs = frame.data.get("resource", ("", {}))
+        if kind == "ri:url":
+            src = attrs.get("ri:value", "")
+        else:
+            src = attrs.get("ri:filename", "")
+        alt = frame.attrs.get("ac:alt") or frame.attrs.get("ac:title") or src
+        return f"![{self._escape(alt)}]({src})" if src else ""
+
+    def _render_emoticon(self, frame: _Frame, inner: str) -> str:
+        return frame.attrs.get("ac:emoji-fallback") or f":{frame.attrs.get('ac:name', '')}:"
+
+    def _render_parameter(self, frame: _Frame, inner: str) -> str:
+        macro = self._find("ac:structured-macro", "ac:macro")
+        if macro is not None:
+            macro.data.setdefault("params", {})[frame.attrs.get("ac:name", "")] = inner.strip()
+        return ""
+
+    def _render_macro(self, frame: _Frame, inner: str) -> str:
+        name = frame.attrs.get("ac:name", "")
+        params = frame.data.get("params", {})
+
+        if name in CODE_MACROS:
+            return self._code_block(inner, params.get("language", ""))
+        if name in PANEL_MACROS:
+            label = params.get("title") or ("" if name == "panel" else name.capitalize())
+            return self._quote(inner, self._escape(label))
+        if name == "expand":
+            return self._block(f"**{self._escape(params.get('title') or 'Details')}**\n\n{inner}")
+        if name == "status":
+            return f"**[{self._escape(params.get('title', ''))}]**"
+        if name == "jira":
+            return params.get("key", "")
+        return inner
+
+    _RENDERERS = {
+        "code": _render_code,
+        "pre": _render_pre,
+        "xmp": _render_pre,
+        "blockquote": _render_blockquote,
+        "ul": _render_list,
+        "ol": _render_list,
+        "ac:task-list": _render_list,
+        "li": _render_list_item,
+        "ac:task": _render_list_item,
+        "ac:task-status": _render_task_status,
+        "td": _render_table_cell,
+        "th": _render_table_cell,
+        "tr": _render_table_row,
+        "table": _render_table,
+        "a": _render_link,
+        "time": _render_time,
+        "ac:link": _render_ac_link,
+        "ac:image": _render_ac_image,
+        "ac:emoticon": _render_emoticon,
+        "ac:parameter": _render_parameter,
+        "ac:structured-macro": _render_macro,
+        "ac:macro": _render_macro,
+    }
+
+
+def storage_to_markdown(content: str, user_name: Optional[Callable[[str], Optional[str]]] = None,
+                        base_url: str = "", space_key: str = "") -> str:
+    """
+    Convert Confluence storage format (or plain HTML) to markdown in one pass.
+
+    Args:
+        content: Storage-format or HTML content
+        user_name: Function returning the display name of an account ID
+        base_url: Base URL of the Confluence site, used for page links
+        space_key: Space of the page, used for links without a space key
+
+    Returns:
+        The converted markdown
+    """
+    if not content:
+        return ""
+
+    converter = StorageFormatConverter(user_name=user_name, base_url=base_url, space_key=space_key)
+    converter.feed(content)
+    return converter.close()
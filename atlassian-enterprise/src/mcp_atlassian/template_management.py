@@ -10,6 +10,7 @@ import requests
 from typing import Dict, List, Optional, Any, Union
 
 from .config import ConfluenceConfig
+from .transport import http_transport
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian")
@@ -51,7 +52,7 @@ class ConfluenceTemplateManager:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response = requests.request(
+            response = http_transport.request(
                 method=method,
                 url=url,
                 json=data,
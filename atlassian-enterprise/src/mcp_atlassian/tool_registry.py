@@ -0,0 +1,251 @@
+"""
+Tool registry for the MCP Atlassian server.
+
+Tool definitions are built once per family (Jira, Confluence, Bitbucket, JSM,
+enterprise, ...) and cached, so listing tools does not rebuild hundreds of
+Tool objects and JSON schemas on every request. Tool calls are dispatched
+through a dictionary from tool name to handler, and their arguments are
+checked against the cached input schema before the handler runs.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from mcp.types import ListToolsResult, ServerResult, Tool
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.tool_registry")
+
+# Python types accepted for each JSON schema type
+JSON_SCHEMA_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+
+@dataclass
+class ToolEntry:
+    """A registered tool and the handler that serves it."""
+
+    tool: Tool  # Tool definition, including its input schema
+    family: str  # Tool family (e.g. 'jira', 'jsm', 'enterprise')
+    service: str  # Service used for concurrency limits (e.g. 'confluence')
+    handler: Callable[[Dict[str, Any]], Any]  # Called with the validated arguments
+
+
+class ToolRegistry:
+    """
+    Registry of tool families, tool definitions and tool handlers.
+
+    A family provides its tool definitions and either one handler for all of
+    its tools (called with the tool name and arguments) or relies on per-tool
+    handlers registered with the ``handler`` decorator (called with the
+    arguments only).
+    """
+
+    def __init__(self):
+        """Initialize the ToolRegistry."""
+        self._families = []
+        self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._entries: Optional[Dict[str, ToolEntry]] = None
+        self._tools: Optional[List[Tool]] = None
+        self._list_tools_result: Optional[ServerResult] = None
+        self.lock = threading.RLock()
+
+    def register_family(self, family: str, tools: Callable[[], List[Tool]],
+                        enabled: Callable[[], bool], service: Optional[str] = None,
+                        handler: Optional[Callable[[str, Dict[str, Any]], Any]] = None) -> None:
+        """
+        Register a family of tools.
+
+        Args:
+            family: Family name
+            tools: Callable that builds the family's tool definitions
+            enabled: Callable that tells whether the family is configured
+            service: Service name for concurrency limits (defaults to the family name)
+            handler: Optional handler for every tool in the family, called
+                with (name, arguments); otherwise per-tool handlers are used
+        """
+        with self.lock:
+            self._families.append({
+                "family": family,
+                "tools": tools,
+                "enabled": enabled,
+                "service": service or family,
+                "handler": handler,
+            })
+            self.invalidate()
+
+    def handler(self, name: str) -> Callable:
+        """
+        Decorator that registers the handler for a single tool.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Decorator that registers and returns the function unchanged
+        """
+        def decorator(func):
+            self._tool_handlers[name] = func
+            return func
+
+        return decorator
+
+    def invalidate(self) -> None:
+        """Drop the cached tool definitions so they are rebuilt on next use."""
+        with self.lock:
+            self._entries = None
+            self._tools = None
+            self._list_tools_result = None
+
+    def _build(self) -> Dict[str, ToolEntry]:
+        """Build the tool definitions and dispatch table once."""
+        with self.lock:
+            if self._entries is not None:
+                return self._entries
+
+            entries = {}
+            for family in self._families:
+                if not family["enabled"]():
+                    continue
+
+                try:
+                    tools = family["tools"]()
+                except Exception as e:
+                    logger.error(f"Error adding {family['family']} tools: {str(e)}")
+                    continue
+
+                for tool in tools:
+                    if family["handler"] is not None:
+                        handler = partial(family["handler"], tool.name)
+                    else:
+                        handler = self._tool_handlers.get(tool.name)
+                    if handler is None:
+                        logger.error(f"No handler registered for tool {tool.name}")
+                        continue
+                    entries[tool.name] = ToolEntry(
+                        tool=tool,
+                        family=family["family"],
+                        service=family["service"],
+                        handler=handler,
+                    )
+
+                logger.info(f"Added {len(tools)} {family['family']} tools")
+
+            self._entries = entries
+            self._tools = [entry.tool for entry in entries.values()]
+            self._list_tools_result = ServerResult(ListToolsResult(tools=self._tools))
+            return entries
+
+    def list_tools(self) -> List[Tool]:
+        """Get the tool definitions of all enabled families."""
+        self._build()
+        return self._tools
+
+    def list_tools_result(self) -> ServerResult:
+        """Get the cached list_tools response."""
+        self._build()
+        return self._list_tools_result
+
+    def get(self, name: str) -> ToolEntry:
+        """
+        Look up a tool.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            The registered tool entry
+
+        Raises:
+            ValueError: If the tool is unknown or its family is not configured
+        """
+        entry = self._build().get(name)
+        if entry is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return entry
+
+    def validate_arguments(self, name: str, arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Check tool arguments against the tool's input schema.
+
+        Required properties must be present, enum values must match, and
+        values must have the declared JSON type. Numeric strings are accepted
+        for integer and number properties, since handlers convert them.
+
+        Args:
+            name: Tool name
+            arguments: Arguments supplied by the client
+
+        Returns:
+            The arguments (an empty dict when none were supplied)
+
+        Raises:
+            ValueError: If the arguments do not match the schema
+        """
+        arguments = arguments or {}
+        if not isinstance(arguments, dict):
+            raise ValueError(f"Invalid arguments for {name}: expected an object")
+
+        schema = self.get(name).tool.inputSchema or {}
+        properties = schema.get("properties", {})
+
+        missing = [key for key in schema.get("required", []) if arguments.get(key) is None]
+        if missing:
+            raise ValueError(f"Missing required arguments for {name}: {', '.join(missing)}")
+
+        for key, value in arguments.items():
+            spec = properties.get(key)
+            if spec is None or value is None:
+                continue
+
+            if "enum" in spec and value not in spec["enum"]:
+                raise ValueError(f"Invalid value for {name}.{key}: {value!r} (expected one of {spec['enum']})")
+
+            expected = spec.get("type")
+            if expected and not self._matches_type(value, expected):
+                raise ValueError(f"Invalid value for {name}.{key}: expected {expected}, got {type(value).__name__}")
+
+        return arguments
+
+    @staticmethod
+    def _matches_type(value: Any, expected: Any) -> bool:
+        """Check a value against a JSON schema type (or list of types)."""
+        for schema_type in expected if isinstance(expected, list) else [expected]:
+            if schema_type in ("integer", "number") and isinstance(value, str):
+                try:
+                    float(value) if schema_type == "number" else int(value)
+                    return True
+                except ValueError:
+                    continue
+            python_types = JSON_SCHEMA_TYPES.get(schema_type)
+            if python_types is None:
+                return True
+            # bool is a subclass of int, but not a JSON integer or number
+            if isinstance(value, bool) and schema_type != "boolean":
+                continue
+            if isinstance(value, python_types):
+                return True
+        return False
+
+    def dispatch(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Call the handler for a tool.
+
+        Args:
+            name: Tool name
+            arguments: Validated tool arguments
+
+        Returns:
+            The handler's result
+        """
+        return self.get(name).handler(arguments)
@@ -0,0 +1,232 @@
+"""
+Background model training jobs for MCP Atlassian.
+
+Training a model reads a whole project and fits a forest, which takes far
+longer than an MCP client waits for a tool call. Training tools therefore
+submit a job and return its ID at once. The job runs on a small pool of
+job threads, which fetch and prepare the data and hand the CPU-bound fitting
+to the shared worker process pool (see process_pool).
+
+Jobs report their progress by writing a small JSON file, so the fitting
+code can report progress from a worker process just as the job thread does.
+Job records are kept in memory for the lifetime of the server; the trained
+models themselves are persisted by the code that trains them.
+"""
+
+import os
+import json
+import uuid
+import logging
+import datetime
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .local_store import cache_path
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.training_jobs")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_CONCURRENCY = 2  # training jobs run at a time
+DEFAULT_HISTORY = 100  # finished jobs kept for status queries
+PROGRESS_DIR_NAME = "training_jobs"
+
+# Runs a job given the path of its progress file, returning the job result
+JobFunction = Callable[[str], Dict[str, Any]]
+
+
+def write_progress(progress_path: str, progress: float, stage: str) -> None:
+    """
+    Record the progress of a job.
+
+    A module-level function, so fitting code running in a worker process
+    can report progress too.
+
+    Args:
+        progress_path: Progress file of the job
+        progress: Completed fraction of the job, between 0 and 1
+        stage: Short description of the current step
+    """
+    temp_path = f"{progress_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w") as f:
+            json.dump({"progress": round(min(max(progress, 0.0), 1.0), 3), "stage": stage}, f)
+        os.replace(temp_path, progress_path)
+    except OSError as e:
+        logger.debug(f"Could not record job progress in {progress_path}: {e}")
+
+
+class TrainingJobs:
+    """
+    Registry and runner of background training jobs.
+
+    A job that is submitted while an identical one (same name) is still
+    queued or running is not started again; the running job is returned.
+    """
+
+    def __init__(self, progress_dir: Optional[str] = None, concurrency: Optional[int] = None,
+                 history: Optional[int] = None):
+        """
+        Initialize the TrainingJobs.
+
+        The job threads are started on first use.
+
+        Args:
+            progress_dir: Directory of the job progress files
+            concurrency: Number of jobs run at a time
+            history: Number of finished jobs kept
+        """
+        self.progress_dir = progress_dir or cache_path(PROGRESS_DIR_NAME)
+        self.concurrency = concurrency or int(
+            os.getenv("ATLASSIAN_TRAINING_CONCURRENCY", DEFAULT_CONCURRENCY)
+        )
+        self.history = history or int(os.getenv("ATLASSIAN_TRAINING_JOB_HISTORY", DEFAULT_HISTORY))
+
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.lock = threading.RLock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the job threads on first use."""
+        with self.lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency, thread_name_prefix="training-job"
+                )
+            return self._executor
+
+    @staticmethod
+    def _now() -> str:
+        """Current time as an ISO 8601 string."""
+        return datetime.datetime.now().isoformat()
+
+    def submit(self, kind: str, project_key: str, name: str, func: JobFunction) -> Dict[str, Any]:
+        """
+        Start a training job in the background.
+
+        Args:
+            kind: Kind of job (for example "issue_classifier")
+            project_key: Project the model is trained for
+            name: Name of the trained model; only one job per name runs at a time
+            func: Function running the job; it receives the path of the job's
+                progress file and returns the job result (a dict with an
+                "error" key marks the job as failed)
+
+        Returns:
+            Status of the submitted job, or of the identical job already running
+        """
+        with self.lock:
+            for job in self._jobs.values():
+                if job["name"] == name and job["status"] in ("queued", "running"):
+                    return self._snapshot(job)
+
+            job_id = uuid.uuid4().hex
+            job = {
+                "job_id": job_id,
+                "kind": kind,
+                "project_key": project_key,
+                "name": name,
+                "status": "queued",
+                "progress": 0.0,
+                "stage": "queued",
+                "submitted_at": self._now(),
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+                "error": None,
+            }
+            self._jobs[job_id] = job
+            self._trim()
+            snapshot = self._snapshot(job)
+
+        self._get_executor().submit(self._run, job_id, func)
+        logger.info(f"Submitted training job {job_id} for {name}")
+        return snapshot
+
+    def _run(self, job_id: str, func: JobFunction) -> None:
+        """Run a job on a job thread and record its outcome."""
+        progress_path = os.path.join(self.progress_dir, f"{job_id}.json")
+        with self.lock:
+            job = self._jobs[job_id]
+            job.update(status="running", stage="starting", started_at=self._now())
+
+        try:
+            os.makedirs(self.progress_dir, exist_ok=True)
+            result = func(progress_path)
+            error = result.get("error") if isinstance(result, dict) else None
+        except Exception as e:
+            logger.exception(f"Training job {job_id} failed")
+            result, error = None, str(e)
+
+        with self.lock:
+            job.update(
+                status="failed" if error else "succeeded",
+                progress=job["progress"] if error else 1.0,
+                stage="failed" if error else "done",
+                finished_at=self._now(),
+                result=None if error else result,
+                error=error,
+            )
+        try:
+            os.remove(progress_path)
+        except OSError:
+            pass
+
+    def _snapshot(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Public status of a job, with the latest progress of a running job."""
+        if job["status"] == "running":
+            try:
+                with open(os.path.join(self.progress_dir, f"{job['job_id']}.json")) as f:
+                    job.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+        return {key: value for key, value in job.items() if key != "name"}
+
+    def _trim(self) -> None:
+        """Forget the oldest finished jobs beyond the history size."""
+        finished = [job_id for job_id, job in self._jobs.items() if job["status"] in ("succeeded", "failed")]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a job.
+
+        Args:
+            job_id: Job ID returned on submission
+
+        Returns:
+            Job status, or None if the job is unknown
+        """
+        with self.lock:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job is not None else None
+
+    def list(self, project_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List jobs, most recently submitted first.
+
+        Args:
+            project_key: Only list the jobs of this project
+
+        Returns:
+            Job statuses
+        """
+        with self.lock:
+            return [
+                self._snapshot(job) for job in reversed(self._jobs.values())
+                if project_key is None or job["project_key"] == project_key
+            ]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the job threads, letting running jobs finish."""
+        with self.lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Create a singleton instance
+training_jobs = TrainingJobs()
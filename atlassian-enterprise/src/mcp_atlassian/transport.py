@@ -0,0 +1,395 @@
+"""
+Shared HTTP transport for MCP Atlassian.
+
+This module provides a single pooled HTTP transport used by every manager that
+talks to the Atlassian REST APIs directly. Connections are kept alive in one
+pool per host, so TCP and TLS setup is paid once per connection rather than
+once per request, and every request gets a default timeout.
+
+It also provides an asyncio transport built on httpx, used by operations that
+fan out into many independent requests and want to keep them in flight
+together rather than one after another.
+"""
+
+import os
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.transport")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_POOL_SIZE = 20  # connections kept alive per host
+DEFAULT_CONNECT_TIMEOUT = 10.0  # seconds
+DEFAULT_READ_TIMEOUT = 60.0  # seconds
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+RETRY_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+DEFAULT_MAX_CONCURRENCY = 32  # in-flight requests per gather / async connections
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HttpTransport:
+    """
+    Pooled HTTP transport shared by all Atlassian API managers.
+
+    Keeps one keep-alive session per host, each with a bounded connection pool,
+    default connect/read timeouts, gzip-encoded responses and retries with
+    backoff for idempotent requests.
+    """
+
+    def __init__(self, pool_size: Optional[int] = None,
+                 connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None):
+        """
+        Initialize the HttpTransport.
+
+        Args:
+            pool_size: Maximum number of pooled connections per host
+            connect_timeout: Connect timeout in seconds
+            read_timeout: Read timeout in seconds
+            max_retries: Retries for idempotent requests on connection errors
+                and throttling/gateway status codes
+        """
+        self.pool_size = pool_size or int(os.getenv("ATLASSIAN_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE))
+        self.connect_timeout = connect_timeout or float(
+            os.getenv("ATLASSIAN_HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)
+        )
+        self.read_timeout = read_timeout or float(os.getenv("ATLASSIAN_HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT))
+        self.max_retries = max_retries if max_retries is not None else int(
+            os.getenv("ATLASSIAN_HTTP_MAX_RETRIES", DEFAULT_MAX_RETRIES)
+        )
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self.lock = threading.RLock()
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """Default (connect, read) timeout applied to every request."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def configure(self, pool_size: Optional[int] = None,
+                  connect_timeout: Optional[float] = None,
+                  read_timeout: Optional[float] = None,
+                  max_retries: Optional[int] = None) -> None:
+        """
+        Change the transport settings.
+
+        Existing sessions are closed so that new pools pick up the settings.
+
+        Args:
+            pool_size: Maximum number of pooled connections per host
+            connect_timeout: Connect timeout in seconds
+            read_timeout: Read timeout in seconds
+            max_retries: Retries for idempotent requests
+        """
+        with self.lock:
+            if pool_size is not None:
+                self.pool_size = pool_size
+            if connect_timeout is not None:
+                self.connect_timeout = connect_timeout
+            if read_timeout is not None:
+                self.read_timeout = read_timeout
+            if max_retries is not None:
+                self.max_retries = max_retries
+            self.close()
+
+    def _create_session(self) -> requests.Session:
+        """Create a keep-alive session with a bounded connection pool."""
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        return session
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Get the pooled session for the host of a URL.
+
+        Args:
+            url: Any URL on the target host
+
+        Returns:
+            The shared session for that host
+        """
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+
+        with self.lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+                logger.debug(f"Opened HTTP connection pool for {host} (size {self.pool_size})")
+            return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the pooled session for the URL's host.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, ...)
+            url: Full request URL
+            **kwargs: Any keyword arguments accepted by requests
+
+        Returns:
+            The response object
+        """
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return self.get_session(url).request(method.upper(), url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        """Send a PUT request."""
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        """Send a DELETE request."""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled sessions."""
+        with self.lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+
+class AsyncHttpTransport:
+    """
+    Asyncio HTTP transport shared by all Atlassian API managers.
+
+    Uses one pooled httpx client per event loop, with HTTP/2 when available,
+    the same timeouts and retry policy as HttpTransport, and a bounded
+    ``gather`` for fanning out independent requests. Synchronous code can
+    drive coroutines through ``run``, which executes them on a long-lived
+    background loop so its connection pool survives between calls.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None,
+                 connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None,
+                 http2: Optional[bool] = None):
+        """
+        Initialize the AsyncHttpTransport.
+
+        Args:
+            max_concurrency: Maximum open connections per client and default
+                in-flight limit for gather
+            connect_timeout: Connect timeout in seconds
+            read_timeout: Read timeout in seconds
+            max_retries: Retries for idempotent requests on connection errors
+                and throttling/gateway status codes
+            http2: Whether to negotiate HTTP/2 (requires the h2 package)
+        """
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("ATLASSIAN_HTTP_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+        )
+        self.connect_timeout = connect_timeout or float(
+            os.getenv("ATLASSIAN_HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)
+        )
+        self.read_timeout = read_timeout or float(os.getenv("ATLASSIAN_HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT))
+        self.max_retries = max_retries if max_retries is not None else int(
+            os.getenv("ATLASSIAN_HTTP_MAX_RETRIES", DEFAULT_MAX_RETRIES)
+        )
+        if http2 is None:
+            http2 = os.getenv("ATLASSIAN_HTTP2", "true").lower() in ("true", "1", "yes")
+        if http2 and not HTTP2_AVAILABLE:
+            logger.debug("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+        self.http2 = http2 and HTTP2_AVAILABLE
+
+        # httpx clients bind to the loop they were first used on
+        self._clients = weakref.WeakKeyDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self.lock = threading.RLock()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a pooled async client."""
+        transport = httpx.AsyncHTTPTransport(
+            http2=self.http2,
+            retries=self.max_retries,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled client for the running event loop.
+
+        Returns:
+            The shared async client for the current loop
+        """
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            client = self._clients.get(loop)
+            if client is None:
+                client = self._create_client()
+                self._clients[loop] = client
+                logger.debug(f"Opened async HTTP client (http2={self.http2}, max {self.max_concurrency} connections)")
+            return client
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the pooled client for the running loop.
+
+        Idempotent requests are retried with backoff on throttling and gateway
+        errors, honouring Retry-After.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, ...)
+            url: Full request URL
+            **kwargs: Keyword arguments accepted by httpx (auth, params, json, headers, ...)
+
+        Returns:
+            The response object
+        """
+        method = method.upper()
+        if kwargs.get("timeout") is None:
+            kwargs.pop("timeout", None)
+        client = self.get_client()
+
+        attempt = 0
+        while True:
+            response = await client.request(method, url, **kwargs)
+            if (method not in RETRY_METHODS or response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= self.max_retries):
+                return response
+
+            retry_after = response.headers.get("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else RETRY_BACKOFF_FACTOR * (2 ** attempt)
+            attempt += 1
+            logger.debug(f"Retrying {method} {url} after {response.status_code} (attempt {attempt})")
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> httpx.Response:
+        """Send a PUT request."""
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        """Send a DELETE request."""
+        return await self.request("DELETE", url, **kwargs)
+
+    async def gather(self, calls: Iterable[Callable[[], Awaitable[Any]]],
+                     limit: Optional[int] = None, return_exceptions: bool = False) -> List[Any]:
+        """
+        Run coroutine factories concurrently with a bound on in-flight calls.
+
+        Args:
+            calls: Zero-argument callables that each return an awaitable
+            limit: Maximum concurrent calls (defaults to max_concurrency)
+            return_exceptions: Return exceptions in place of results instead of raising
+
+        Returns:
+            Results in the same order as the calls
+        """
+        semaphore = asyncio.Semaphore(limit or self.max_concurrency)
+
+        async def bounded(call):
+            async with semaphore:
+                return await call()
+
+        return await asyncio.gather(*[bounded(call) for call in calls], return_exceptions=return_exceptions)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use."""
+        with self.lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="mcp-atlassian-async",
+                    daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """
+        Run a coroutine from synchronous code and wait for its result.
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        loop = self._get_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncHttpTransport.run cannot be called from its own event loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def aclose(self) -> None:
+        """Close the client for the running loop."""
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        """Close the background loop and its client."""
+        with self.lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+# Create singleton instances
+http_transport = HttpTransport()
+async_http_transport = AsyncHttpTransport()
@@ -0,0 +1,155 @@
+"""
+Shared user directory cache for MCP Atlassian.
+
+Maps Atlassian account IDs to display names. Account IDs are the same across
+Jira and Confluence, so one cache is shared by both preprocessors: a user
+resolved while rendering a Confluence page is not fetched again for a Jira
+comment. Entries expire after a TTL and the least recently used entries are
+evicted once the cache is full.
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.user_cache")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_USER_CACHE_SIZE = 5000  # cached account IDs
+DEFAULT_USER_CACHE_TTL = 3600  # seconds
+USER_BULK_BATCH_SIZE = 100  # account IDs per bulk user request
+
+
+class UserCache:
+    """
+    Thread-safe LRU cache of account ID to display name with a TTL.
+
+    Lookups that miss are resolved in bulk: every uncached account ID is sent
+    to a bulk lookup function in batches, and only IDs the bulk endpoint did
+    not return fall back to a single-user lookup.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the UserCache.
+
+        Args:
+            max_size: Maximum number of cached users
+            ttl: Seconds before a cached display name expires
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.max_size = max_size or int(os.getenv("ATLASSIAN_USER_CACHE_SIZE", DEFAULT_USER_CACHE_SIZE))
+        self.ttl = ttl if ttl is not None else float(os.getenv("ATLASSIAN_USER_CACHE_TTL", DEFAULT_USER_CACHE_TTL))
+        self.clock = clock
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.lock = threading.RLock()
+
+    def get(self, account_id: str) -> Optional[str]:
+        """
+        Get a cached display name.
+
+        Args:
+            account_id: Atlassian account ID
+
+        Returns:
+            The display name, or None if it is not cached or has expired
+        """
+        with self.lock:
+            entry = self._entries.get(account_id)
+            if entry is None:
+                return None
+
+            display_name, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[account_id]
+                return None
+
+            self._entries.move_to_end(account_id)
+            return display_name
+
+    def put(self, account_id: str, display_name: str) -> None:
+        """
+        Cache a display name.
+
+        Args:
+            account_id: Atlassian account ID
+            display_name: Display name of the user
+        """
+        with self.lock:
+            self._entries[account_id] = (display_name, self.clock() + self.ttl)
+            self._entries.move_to_end(account_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def resolve(self, account_ids: Iterable[str],
+                bulk_lookup: Optional[Callable[[List[str]], Dict[str, str]]] = None,
+                single_lookup: Optional[Callable[[str], Optional[str]]] = None) -> Dict[str, str]:
+        """
+        Resolve display names, fetching every uncached account ID in bulk.
+
+        Args:
+            account_ids: Account IDs to resolve (duplicates are ignored)
+            bulk_lookup: Function mapping a batch of account IDs to display names
+            single_lookup: Fallback for IDs the bulk lookup did not return
+
+        Returns:
+            Dictionary of account ID to display name for every resolved ID
+        """
+        unique_ids = list(dict.fromkeys(account_id for account_id in account_ids if account_id))
+        resolved = {}
+        missing = []
+        for account_id in unique_ids:
+            display_name = self.get(account_id)
+            if display_name is None:
+                missing.append(account_id)
+            else:
+                resolved[account_id] = display_name
+
+        if missing and bulk_lookup is not None:
+            for i in range(0, len(missing), USER_BULK_BATCH_SIZE):
+                batch = missing[i:i + USER_BULK_BATCH_SIZE]
+                try:
+                    found = bulk_lookup(batch)
+                except Exception as e:
+                    logger.warning(f"Bulk user lookup failed for {len(batch)} users: {e}")
+                    continue
+
+                for account_id, display_name in found.items():
+                    if display_name:
+                        self.put(account_id, display_name)
+                        resolved[account_id] = display_name
+
+        if single_lookup is not None:
+            for account_id in missing:
+                if account_id in resolved:
+                    continue
+                try:
+                    display_name = single_lookup(account_id)
+                except Exception as e:
+                    logger.warning(f"Could not fetch user info for {account_id}: {e}")
+                    continue
+
+                if display_name:
+                    self.put(account_id, display_name)
+                    resolved[account_id] = display_name
+
+        return resolved
+
+    def clear(self) -> None:
+        """Remove every cached user."""
+        with self.lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._entries)
+
+
+# Create a singleton instance
+user_cache = UserCache()
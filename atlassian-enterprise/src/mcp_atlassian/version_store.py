@@ -0,0 +1,149 @@
+"""
+Store of historic Confluence page bodies for MCP Atlassian.
+
+A saved version of a page never changes, so its storage-format body can be
+cached without expiry under (site, page ID, version number). Version history
+audits, version comparisons and restores all read bodies through this store,
+so each historic body is downloaded at most once per process. The least
+recently used bodies are evicted once the store exceeds its byte budget.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.version_store")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_VERSION_STORE_BYTES = 64 * 1024 * 1024  # budget for cached bodies
+
+VersionKey = Tuple[str, str, int]
+
+
+class VersionBodyStore:
+    """Thread-safe LRU store of immutable page bodies keyed by page version."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialize the VersionBodyStore.
+
+        Args:
+            max_bytes: Budget for the stored bodies in bytes (0 disables the store)
+        """
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv("ATLASSIAN_VERSION_STORE_BYTES", DEFAULT_VERSION_STORE_BYTES)
+        )
+
+        # Each entry holds the body and its size in bytes
+        self._bodies: "OrderedDict[VersionKey, Tuple[str, int]]" = OrderedDict()
+        self._size = 0
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def _key(site: str, page_id: str, version: int) -> VersionKey:
+        return site.rstrip("/"), str(page_id), int(version)
+
+    def get(self, site: str, page_id: str, version: int) -> Optional[str]:
+        """
+        Get a stored body.
+
+        Args:
+            site: Base URL of the Confluence site
+            page_id: Page ID
+            version: Version number
+
+        Returns:
+            The storage-format body, or None if it is not stored
+        """
+        key = self._key(site, page_id, version)
+        with self.lock:
+            entry = self._bodies.get(key)
+            if entry is None:
+                return None
+            self._bodies.move_to_end(key)
+            return entry[0]
+
+    def put(self, site: str, page_id: str, version: int, body: str) -> None:
+        """
+        Store the body of a page version.
+
+        Args:
+            site: Base URL of the Confluence site
+            page_id: Page ID
+            version: Version number
+            body: Storage-format body of that version
+        """
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        key = self._key(site, page_id, version)
+        with self.lock:
+            previous = self._bodies.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._bodies[key] = (body, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._bodies.popitem(last=False)
+                self._size -= evicted_size
+
+    def get_or_fetch(self, site: str, page_id: str, version: int, fetch: Callable[[], str]) -> str:
+        """
+        Get a stored body, fetching and storing it on a miss.
+
+        Args:
+            site: Base URL of the Confluence site
+            page_id: Page ID
+            version: Version number
+            fetch: Function returning the body of the version from Confluence
+
+        Returns:
+            The storage-format body
+        """
+        body = self.get(site, page_id, version)
+        if body is None:
+            body = fetch()
+            self.put(site, page_id, version, body)
+        return body
+
+    def get_many(self, site: str, page_id: str, versions: Iterable[int]) -> Dict[int, str]:
+        """
+        Get the stored bodies of several versions of a page.
+
+        Args:
+            site: Base URL of the Confluence site
+            page_id: Page ID
+            versions: Version numbers
+
+        Returns:
+            Dictionary of version number to body for every stored version
+        """
+        bodies = {}
+        for version in versions:
+            body = self.get(site, page_id, version)
+            if body is not None:
+                bodies[version] = body
+        return bodies
+
+    def clear(self) -> None:
+        """Remove all stored bodies."""
+        with self.lock:
+            self._bodies.clear()
+            self._size = 0
+
+    def total_bytes(self) -> int:
+        """Get the size of all stored bodies in bytes."""
+        with self.lock:
+            return self._size
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._bodies)
+
+
+# Create a singleton instance
+version_store = VersionBodyStore()
@@ -0,0 +1,416 @@
+"""
+Incremental worklog ingestion for MCP Atlassian time tracking.
+
+Issue search responses embed at most the first 20 worklogs of each issue, so
+totals computed from them are silently wrong on busy issues. Instead, every
+worklog of the site is ingested through the bulk worklog endpoints: the
+"updated since" and "deleted since" feeds list changed worklog IDs page by
+page, and the worklogs of each page are fetched by ID, with several list
+requests in flight at a time. The first sync of a site starts
+ATLASSIAN_WORKLOG_SINCE_DAYS back (a year by default) rather than walking
+the whole history of a large site.
+
+Worklogs are stored in a local SQLite database together with running totals
+per project by user, day, week and issue type. Each batch of changed
+worklogs subtracts the previous contribution of those worklogs and adds the
+new one, so memory stays flat while the site history is ingested and every
+later sync only processes the worklogs changed since the previous one.
+
+The project and issue type of a worklog come from the issues of the project
+(see issue_mirror). When an issue enters, leaves or changes type within a
+project, the contributions of its stored worklogs are moved accordingly.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .issue_frame import format_dates, parse_timestamps
+from .local_store import cache_path, connect_sqlite, site_cache_key
+from .pagination import DEFAULT_PAGE_CONCURRENCY
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian.worklog_store")
+
+# Constants (each can be overridden through the environment)
+DEFAULT_REFRESH_SECONDS = 60  # reads within this interval of a sync are served locally
+DEFAULT_SINCE_DAYS = 365  # history ingested by the first sync of a site; 0 ingests every worklog
+STORE_FILE_NAME = "worklogs.sqlite3"
+LIST_BATCH_SIZE = 1000  # maximum worklog IDs per list request
+SQL_BATCH_SIZE = 900  # stays below SQLite's host parameter limit
+DELETED_OVERLAP_MS = 60 * 1000
+DIMENSIONS = ("user", "type", "day", "week")
+DAY_FORMAT = "%Y-%m-%d"
+WEEK_FORMAT = "%Y-W%U"
+
+# Fetches one page of a worklog feed as (kind, since) -> response JSON, where kind
+# is "updated" or "deleted"; raises ValueError if the request fails
+FeedFunction = Callable[[str, int], Dict]
+# Fetches worklogs by ID as ids -> list of worklog JSON; raises ValueError if the request fails
+ListFunction = Callable[[List[int]], List[Dict]]
+
+
+def _chunks(values: Sequence, size: int) -> Iterator[Sequence]:
+    """Split a sequence into consecutive chunks."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class WorklogStore:
+    """
+    SQLite store of Jira worklogs with incrementally maintained project totals.
+
+    Totals are kept in seconds per (project, dimension, bucket) and always
+    equal the sum over stored worklogs of the issues currently mapped to the
+    project, so they never need to be recomputed from scratch.
+    """
+
+    def __init__(self, path: Optional[str] = None, refresh_seconds: Optional[float] = None,
+                 concurrency: Optional[int] = None, since_days: Optional[float] = None):
+        """
+        Initialize the WorklogStore.
+
+        The database is opened on first use.
+
+        Args:
+            path: Path of the SQLite database file
+            refresh_seconds: Minimum time between two syncs of a site
+            concurrency: Maximum worklog list requests in flight
+            since_days: Days of worklog updates ingested by the first sync of a site (0 for all)
+        """
+        self.path = path or cache_path(STORE_FILE_NAME)
+        self.refresh_seconds = refresh_seconds if refresh_seconds is not None else float(
+            os.getenv("ATLASSIAN_WORKLOG_REFRESH_SECONDS", DEFAULT_REFRESH_SECONDS)
+        )
+        self.concurrency = max(1, concurrency or int(
+            os.getenv("ATLASSIAN_PAGINATION_CONCURRENCY", DEFAULT_PAGE_CONCURRENCY)
+        ))
+        self.since_days = since_days if since_days is not None else float(
+            os.getenv("ATLASSIAN_WORKLOG_SINCE_DAYS", DEFAULT_SINCE_DAYS)
+        )
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._site_locks: Dict[str, threading.Lock] = {}
+        self.lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            connection = connect_sqlite(self.path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS worklogs ("
+                " site TEXT NOT NULL, worklog_id INTEGER NOT NULL, issue_id INTEGER NOT NULL,"
+                " author TEXT NOT NULL, day TEXT, week TEXT, seconds INTEGER NOT NULL,"
+                " PRIMARY KEY (site, worklog_id))"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS worklogs_issue ON worklogs (site, issue_id)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS worklog_issues ("
+                " site TEXT NOT NULL, issue_id INTEGER NOT NULL, project TEXT NOT NULL,"
+                " issue_type TEXT NOT NULL, PRIMARY KEY (site, issue_id))"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS worklog_issues_project ON worklog_issues (site, project)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS worklog_totals ("
+                " site TEXT NOT NULL, project TEXT NOT NULL, dimension TEXT NOT NULL,"
+                " bucket TEXT NOT NULL, seconds INTEGER NOT NULL,"
+                " PRIMARY KEY (site, project, dimension, bucket))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS worklog_sync ("
+                " site TEXT PRIMARY KEY, updated_since INTEGER NOT NULL,"
+                " deleted_since INTEGER NOT NULL, last_sync REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get_project_totals(self, site: str, project_key: str, issue_types: Dict[int, str],
+                           fetch_feed: FeedFunction, fetch_worklogs: ListFunction) -> Dict[str, Dict[str, int]]:
+        """
+        Get the logged time of a project, syncing the store first if it is due.
+
+        Only one sync of a site runs at a time, without holding the database
+        lock during requests. While a site is syncing, other reads serve the
+        stored totals instead of waiting, unless the site was never synced.
+
+        Args:
+            site: Base URL of the Jira site
+            project_key: Project key
+            issue_types: Issue type name of every issue of the project, by issue ID
+            fetch_feed: Function fetching one page of a worklog feed
+            fetch_worklogs: Function fetching worklogs by ID
+
+        Returns:
+            Seconds logged per bucket for each of the DIMENSIONS, buckets in sorted order
+
+        Raises:
+            ValueError: If the worklogs cannot be fetched and were never synced before
+        """
+        site_key = site_cache_key(site)
+        try:
+            with self.lock:
+                connection = self._connect()
+                self._set_project_issues(connection, site_key, project_key, issue_types)
+                synced = self._sync_state(connection, site_key) is not None
+
+            site_lock = self._site_lock(site_key)
+            if site_lock.acquire(blocking=not synced):
+                try:
+                    self._sync(site_key, fetch_feed, fetch_worklogs)
+                except ValueError as e:
+                    with self.lock:
+                        connection.rollback()
+                        if self._sync_state(connection, site_key) is None:
+                            raise
+                    logger.warning(f"Worklog sync failed, serving stored totals: {e}")
+                finally:
+                    site_lock.release()
+
+            totals = {dimension: {} for dimension in DIMENSIONS}
+            with self.lock:
+                for dimension, bucket, seconds in connection.execute(
+                    "SELECT dimension, bucket, seconds FROM worklog_totals"
+                    " WHERE site=? AND project=? AND seconds != 0 ORDER BY dimension, bucket",
+                    (site_key, project_key)
+                ):
+                    totals[dimension][bucket] = seconds
+            return totals
+        except sqlite3.Error as e:
+            logger.error(f"Worklog store failed for project {project_key}: {e}")
+            raise ValueError(f"Worklog store failed: {e}")
+
+    def _site_lock(self, site_key: str) -> threading.Lock:
+        """Lock serialising the syncs of one site."""
+        with self.lock:
+            return self._site_locks.setdefault(site_key, threading.Lock())
+
+    def get_project_time(self, client: Any, project_key: str, issues: List[Dict]) -> Dict[str, Dict[str, int]]:
+        """
+        Get the logged time of a project through an authenticated Jira client.
+
+        Args:
+            client: Authenticated Jira client
+            project_key: Project key
+            issues: Every issue of the project (only id and issuetype are read)
+
+        Returns:
+            Seconds logged per bucket for each of the DIMENSIONS
+        """
+        site = os.environ.get("JIRA_URL", "")
+
+        def fetch_feed(kind: str, since: int) -> Dict:
+            response = client.request("GET", f"{site}/rest/api/2/worklog/{kind}", params={"since": since})
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch {kind} worklogs: {response.text}")
+                raise ValueError(f"Jira worklog feed failed: {response.status_code}")
+            return response.json()
+
+        def fetch_worklogs(ids: List[int]) -> List[Dict]:
+            response = client.request("POST", f"{site}/rest/api/2/worklog/list", json={"ids": ids})
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch worklogs: {response.text}")
+                raise ValueError(f"Jira worklog list failed: {response.status_code}")
+            return response.json()
+
+        issue_types = {
+            int(issue["id"]): (issue.get("fields", {}).get("issuetype") or {}).get("name") or "Unknown"
+            for issue in issues
+        }
+        return self.get_project_totals(site, project_key, issue_types, fetch_feed, fetch_worklogs)
+
+    @staticmethod
+    def _sync_state(connection: sqlite3.Connection, site_key: str) -> Optional[Tuple[int, int, float]]:
+        """Feed cursors and time of the last sync of a site."""
+        return connection.execute(
+            "SELECT updated_since, deleted_since, last_sync FROM worklog_sync WHERE site=?", (site_key,)
+        ).fetchone()
+
+    def _sync(self, site_key: str, fetch_feed: FeedFunction, fetch_worklogs: ListFunction) -> None:
+        """
+        Ingest the worklogs updated and deleted since the previous sync of the site.
+
+        Requests run without the database lock; each batch of worklogs is
+        applied under it, so reads see consistent totals throughout a sync.
+        """
+        with self.lock:
+            connection = self._connect()
+            state = self._sync_state(connection, site_key)
+        started = time.time()
+        if state is not None and started - state[2] < self.refresh_seconds:
+            return
+
+        applied = 0
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            # Keep a bounded number of list requests in flight while walking the feed
+            pending = set()
+            if state is not None:
+                updated_since = state[0]
+            else:
+                updated_since = int((started - self.since_days * 86400) * 1000) if self.since_days > 0 else 0
+            for ids, updated_since in self._feed(fetch_feed, "updated", updated_since):
+                for chunk in _chunks(ids, LIST_BATCH_SIZE):
+                    pending.add(executor.submit(fetch_worklogs, list(chunk)))
+                    while len(pending) >= self.concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            applied += self._apply_updated(connection, site_key, future.result())
+            for future in pending:
+                applied += self._apply_updated(connection, site_key, future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if state is None:
+            # Nothing deleted before the first sync is stored; only deletions
+            # that raced with it (within the sync time plus an overlap) matter
+            deleted_since = updated_since - int((time.time() - started) * 1000) - DELETED_OVERLAP_MS
+        else:
+            deleted_since = state[1]
+        for ids, deleted_since in self._feed(fetch_feed, "deleted", max(deleted_since, 0)):
+            applied += self._apply_deleted(connection, site_key, ids)
+
+        with self.lock:
+            connection.execute(
+                "INSERT OR REPLACE INTO worklog_sync (site, updated_since, deleted_since, last_sync)"
+                " VALUES (?, ?, ?, ?)",
+                (site_key, updated_since, deleted_since, started)
+            )
+            connection.commit()
+        logger.debug(f"Synced {applied} changed worklogs")
+
+    @staticmethod
+    def _feed(fetch_feed: FeedFunction, kind: str, since: int) -> Iterator[Tuple[List[int], int]]:
+        """Walk a worklog feed, yielding the worklog IDs of each page and the cursor after it."""
+        while True:
+            page = fetch_feed(kind, since)
+            until = int(page.get("until", since))
+            yield [int(value["worklogId"]) for value in page.get("values", [])], until
+            if page.get("lastPage", True) or until == since:
+                return
+            since = until
+
+    def _apply_updated(self, connection: sqlite3.Connection, site_key: str, worklogs: List[Dict]) -> int:
+        """Store a batch of created or updated worklogs and update the totals."""
+        if not worklogs:
+            return 0
+        started = parse_timestamps([worklog.get("started") for worklog in worklogs])
+        days = format_dates(started, DAY_FORMAT)
+        weeks = format_dates(started, WEEK_FORMAT)
+        rows = [
+            (site_key, int(worklog["id"]), int(worklog["issueId"]),
+             (worklog.get("author") or {}).get("displayName") or "Unknown",
+             day, week, int(worklog.get("timeSpentSeconds") or 0))
+            for worklog, day, week in zip(worklogs, days, weeks)
+        ]
+        ids = [row[1] for row in rows]
+
+        with self.lock:
+            self._add_totals(connection, site_key, self._contributions(connection, site_key, "worklog_id", ids), -1)
+            connection.executemany(
+                "INSERT OR REPLACE INTO worklogs (site, worklog_id, issue_id, author, day, week, seconds)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._add_totals(connection, site_key, self._contributions(connection, site_key, "worklog_id", ids), 1)
+            connection.commit()
+        return len(rows)
+
+    def _apply_deleted(self, connection: sqlite3.Connection, site_key: str, ids: List[int]) -> int:
+        """Remove a batch of deleted worklogs and update the totals."""
+        if not ids:
+            return 0
+        with self.lock:
+            self._add_totals(connection, site_key, self._contributions(connection, site_key, "worklog_id", ids), -1)
+            connection.executemany(
+                "DELETE FROM worklogs WHERE site=? AND worklog_id=?", [(site_key, i) for i in ids]
+            )
+            connection.commit()
+        return len(ids)
+
+    def _set_project_issues(self, connection: sqlite3.Connection, site_key: str, project_key: str,
+                            issue_types: Dict[int, str]) -> None:
+        """Map the issues of a project, moving the totals of issues that entered, left or changed type."""
+        current = dict(connection.execute(
+            "SELECT issue_id, issue_type FROM worklog_issues WHERE site=? AND project=?",
+            (site_key, project_key)
+        ).fetchall())
+        changed = [i for i, issue_type in issue_types.items() if current.get(i) != issue_type]
+        removed = [i for i in current if i not in issue_types]
+        if not changed and not removed:
+            return
+
+        moved = changed + removed
+        self._add_totals(connection, site_key, self._contributions(connection, site_key, "issue_id", moved), -1)
+        connection.executemany(
+            "INSERT OR REPLACE INTO worklog_issues (site, issue_id, project, issue_type) VALUES (?, ?, ?, ?)",
+            [(site_key, i, project_key, issue_types[i]) for i in changed]
+        )
+        connection.executemany(
+            "DELETE FROM worklog_issues WHERE site=? AND issue_id=?", [(site_key, i) for i in removed]
+        )
+        self._add_totals(connection, site_key, self._contributions(connection, site_key, "issue_id", moved), 1)
+        connection.commit()
+
+    @staticmethod
+    def _contributions(connection: sqlite3.Connection, site_key: str, column: str,
+                       ids: Sequence[int]) -> Counter:
+        """Seconds contributed to each (project, dimension, bucket) by the mapped worklogs with the given IDs."""
+        contributions = Counter()
+        for chunk in _chunks(list(ids), SQL_BATCH_SIZE):
+            rows = connection.execute(
+                "SELECT i.project, i.issue_type, w.author, w.day, w.week, w.seconds"
+                " FROM worklogs w JOIN worklog_issues i ON i.site = w.site AND i.issue_id = w.issue_id"
+                f" WHERE w.site=? AND w.{column} IN ({','.join('?' * len(chunk))})",
+                (site_key, *chunk)
+            )
+            for project, issue_type, author, day, week, seconds in rows:
+                contributions[(project, "user", author)] += seconds
+                contributions[(project, "type", issue_type)] += seconds
+                if day is not None:
+                    contributions[(project, "day", day)] += seconds
+                    contributions[(project, "week", week)] += seconds
+        return contributions
+
+    @staticmethod
+    def _add_totals(connection: sqlite3.Connection, site_key: str, contributions: Counter, sign: int) -> None:
+        """Add (sign 1) or subtract (sign -1) contributions from the running totals."""
+        if not contributions:
+            return
+        connection.executemany(
+            "INSERT INTO worklog_totals (site, project, dimension, bucket, seconds) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (site, project, dimension, bucket) DO UPDATE SET seconds = seconds + excluded.seconds",
+            [(site_key, *key, sign * seconds) for key, seconds in contributions.items()]
+        )
+        if sign < 0:
+            connection.executemany(
+                "DELETE FROM worklog_totals WHERE site=? AND project=? AND dimension=? AND bucket=? AND seconds = 0",
+                [(site_key, *key) for key in contributions]
+            )
+
+    def clear(self) -> None:
+        """Remove every stored worklog, issue mapping, total and sync state."""
+        with self.lock:
+            try:
+                connection = self._connect()
+                for table in ("worklogs", "worklog_issues", "worklog_totals", "worklog_sync"):
+                    connection.execute(f"DELETE FROM {table}")
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Worklog store clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Create a singleton instance
+worklog_store = WorklogStore()
@@ -0,0 +1,179 @@
+"""
+Tests for the Atlassian Document Format (ADF) renderer.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.adf import adf_to_markdown, collect_mention_ids, field_text
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.user_cache import UserCache
+
+
+def doc(*content):
+    return {"type": "doc", "version": 1, "content": list(content)}
+
+
+def paragraph(*content):
+    return {"type": "paragraph", "content": list(content)}
+
+
+def text(value, *marks):
+    node = {"type": "text", "text": value}
+    if marks:
+        node["marks"] = list(marks)
+    return node
+
+
+def cell(node_type, value):
+    return {"type": node_type, "content": [paragraph(text(value))]}
+
+
+class TestAdfRenderer(unittest.TestCase):
+    """Test cases for adf_to_markdown."""
+
+    def test_inline_content(self):
+        """Test marks, mentions, cards, dates, emoji and status."""
+        markdown = adf_to_markdown(doc(
+            {"type": "heading", "attrs": {"level": 2}, "content": [text("Outage review")]},
+            paragraph(
+                text("Fix "), text("config_file", {"type": "code"}), text(" in "),
+                text("prod", {"type": "strong"}, {"type": "link", "attrs": {"href": "https://status.example.com"}}),
+                text(", ask "), {"type": "mention", "attrs": {"id": "abc", "text": "@Alice"}},
+                text(" or "), {"type": "mention", "attrs": {"id": "xyz"}},
+                text(", see "), {"type": "inlineCard", "attrs": {"url": "https://example.atlassian.net/browse/OPS-12"}},
+                {"type": "hardBreak"},
+                text("due "), {"type": "date", "attrs": {"timestamp": "1735689600000"}},
+                text(" "), {"type": "emoji", "attrs": {"shortName": ":fire:", "text": "🔥"}},
+                text(" "), {"type": "status", "attrs": {"text": "BLOCKED"}},
+            ),
+        ), user_name={"xyz": "Bob Jones"}.get)
+
+        self.assertEqual(markdown, (
+            "## Outage review\n\n"
+            "Fix `config_file` in [**prod**](https://status.example.com), ask @Alice or @Bob Jones, "
+            "see [OPS-12](https://example.atlassian.net/browse/OPS-12)  \n"
+            "due 2025-01-01 🔥 **[BLOCKED]**"
+        ))
+
+        print("✅ ADF inline content is rendered")
+
+    def test_block_content(self):
+        """Test lists, code blocks, panels, tables and task lists."""
+        markdown = adf_to_markdown(doc(
+            {"type": "bulletList", "content": [
+                {"type": "listItem", "content": [paragraph(text("one"))]},
+                {"type": "listItem", "content": [
+                    paragraph(text("two")),
+                    {"type": "orderedList", "attrs": {"order": 3}, "content": [
+                        {"type": "listItem", "content": [paragraph(text("three"))]},
+                    ]},
+                ]},
+            ]},
+            {"type": "codeBlock", "attrs": {"language": "python"}, "content": [text("def f(a_b):\n\n    return *a_b")]},
+            {"type": "panel", "attrs": {"panelType": "warning"}, "content": [paragraph(text("Drain first."))]},
+            {"type": "table", "content": [
+                {"type": "tableRow", "content": [cell("tableHeader", "Host"), cell("tableHeader", "State")]},
+                {"type": "tableRow", "content": [cell("tableCell", "a|b")]},
+            ]},
+            {"type": "taskList", "content": [
+                {"type": "taskItem", "attrs": {"state": "DONE"}, "content": [text("done")]},
+                {"type": "taskItem", "attrs": {"state": "TODO"}, "content": [text("todo")]},
+            ]},
+            {"type": "rule"},
+            {"type": "paragraph"},
+        ))
+
+        self.assertEqual(markdown, (
+            "- one\n- two\n  3. three\n\n"
+            "```python\ndef f(a_b):\n\n    return *a_b\n```\n\n"
+            "> **Warning**\n>\n> Drain first.\n\n"
+            "| Host | State |\n| --- | --- |\n| a\\|b |  |\n\n"
+            "- [x] done\n- [ ] todo\n\n"
+            "---"
+        ))
+
+        print("✅ ADF block content is rendered")
+
+    def test_deep_nesting(self):
+        """Test that deeply nested documents do not hit the recursion limit."""
+        node = paragraph(text("deep"))
+        for _ in range(5000):
+            node = {"type": "blockquote", "content": [node]}
+
+        markdown = adf_to_markdown(doc(node))
+
+        self.assertTrue(markdown.endswith("deep"))
+        self.assertEqual(collect_mention_ids(doc(node)), [])
+
+        print("✅ Deeply nested ADF is rendered without recursion")
+
+    def test_field_text(self):
+        """Test that v2 strings and v3 ADF documents are both returned as text."""
+        self.assertEqual(field_text("wiki *text*"), "wiki *text*")
+        self.assertEqual(field_text(None), "")
+        self.assertEqual(field_text(doc(paragraph(text("adf text")))), "adf text")
+
+        print("✅ field_text handles both API versions")
+
+
+class TestJiraAdfFields(unittest.TestCase):
+    """Test that JiraFetcher renders ADF descriptions and comments."""
+
+    def setUp(self):
+        """Set up a JiraFetcher backed by a mocked Jira client."""
+        self.env_patcher = patch.dict('os.environ', {
+            'JIRA_URL': 'https://example.atlassian.net',
+            'JIRA_USERNAME': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+        self.jira_patcher = patch('mcp_atlassian.jira.Jira')
+        self.jira_patcher.start()
+
+        self.jira_fetcher = JiraFetcher()
+        self.jira_fetcher.preprocessor.user_cache = UserCache(max_size=10, ttl=60)
+        self.jira_fetcher.preprocessor.user_lookup = MagicMock(return_value={"xyz": "Bob Jones"})
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.jira_patcher.stop()
+        self.env_patcher.stop()
+
+    def test_issue_document_from_adf(self):
+        """Test that v3 issue payloads produce markdown content."""
+        issue = {
+            "key": "OPS-1",
+            "fields": {
+                "summary": "Outage",
+                "issuetype": {"name": "Bug"},
+                "status": {"name": "Open"},
+                "created": "2025-04-01T10:00:00.000+0000",
+                "priority": {"name": "High"},
+                "description": doc(paragraph(text("Service "), text("down", {"type": "strong"}))),
+                "comment": {"comments": [{
+                    "body": doc(paragraph({"type": "mention", "attrs": {"id": "xyz"}}, text(" please check"))),
+                    "created": "2025-04-01T11:00:00.000+0000",
+                    "author": {"displayName": "Alice"},
+                }]},
+                "issuelinks": [],
+            },
+        }
+
+        document = self.jira_fetcher._issue_to_document(issue)
+
+        self.assertIn("Service **down**", document.page_content)
+        self.assertIn("@Bob Jones please check", document.page_content)
+        self.jira_fetcher.preprocessor.user_lookup.assert_called_once_with(["xyz"])
+
+        print("✅ JiraFetcher renders ADF descriptions and comments")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Tests for the asyncio HTTP transport and the operations that fan out over it.
+"""
+
+import unittest
+import sys
+import os
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.transport import AsyncHttpTransport
+from mcp_atlassian.bitbucket import BitbucketManager
+from mcp_atlassian.jsm_approvals import JSMApprovalManager
+
+
+class TestAsyncHttpTransport(unittest.TestCase):
+    """Test cases for the AsyncHttpTransport class."""
+
+    def setUp(self):
+        """Set up a transport whose clients answer from a mock handler."""
+        self.transport = AsyncHttpTransport(max_concurrency=3, max_retries=2, http2=False)
+        self.calls = []
+
+        def handler(request):
+            self.calls.append(request)
+            if request.url.path == "/flaky" and len(self.calls) == 1:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"path": request.url.path})
+
+        self.mock_transport = httpx.MockTransport(handler)
+        self.client_patcher = patch.object(
+            self.transport, "_create_client",
+            side_effect=lambda: httpx.AsyncClient(transport=self.mock_transport)
+        )
+        self.client_patcher.start()
+
+    def tearDown(self):
+        """Close the background loop."""
+        self.transport.close()
+        self.client_patcher.stop()
+
+    def test_gather_preserves_order_and_bounds_concurrency(self):
+        """Test that gather keeps call order and never exceeds its limit."""
+        state = {"running": 0, "peak": 0}
+
+        async def call(i):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01 * (5 - i))
+            state["running"] -= 1
+            return i
+
+        results = asyncio.run(self.transport.gather([lambda i=i: call(i) for i in range(5)], limit=2))
+
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+        self.assertEqual(state["peak"], 2)
+
+        print("✅ AsyncHttpTransport.gather is ordered and bounded")
+
+    def test_run_reuses_client_and_retries(self):
+        """Test that sync callers share one client and idempotent requests are retried."""
+        first = self.transport.run(self.transport.get("https://example.atlassian.net/flaky"))
+        second = self.transport.run(self.transport.get("https://example.atlassian.net/other"))
+
+        self.assertEqual(first.json(), {"path": "/flaky"})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(len(self.calls), 3)
+        self.transport._create_client.assert_called_once()
+
+        print("✅ AsyncHttpTransport.run reuses its pooled client")
+
+
+class TestAsyncFanOut(unittest.TestCase):
+    """Test operations that fan out their sub-requests concurrently."""
+
+    def setUp(self):
+        """Set up credentials for the managers."""
+        self.env_patcher = patch.dict('os.environ', {
+            'BITBUCKET_WORKSPACE': 'test-workspace',
+            'BITBUCKET_USERNAME': 'test-user',
+            'BITBUCKET_APP_PASSWORD': 'test-password',
+            'JSM_URL': 'https://example.atlassian.net',
+            'JSM_USERNAME': 'test@example.com',
+            'JSM_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.env_patcher.stop()
+
+    def test_bitbucket_pages_fetched_concurrently(self):
+        """Test that pages after the first are requested by number when the size is known."""
+        manager = BitbucketManager()
+        first_page = {"size": 25, "pagelen": 10, "page": 1, "values": list(range(10)),
+                      "next": "https://api.bitbucket.org/2.0/repositories/test-workspace?page=2"}
+
+        async def fetch_page(method, endpoint, params=None):
+            start = (params["page"] - 1) * 10
+            return {"values": list(range(start, min(start + 10, 25)))}
+
+        with patch.object(manager, "_make_api_request", return_value=first_page) as mock_request, \
+                patch.object(manager, "_make_api_request_async", side_effect=fetch_page) as mock_async:
+            results = manager._paginate_results("/repositories/test-workspace", params={"q": "x"})
+
+        self.assertEqual(results, list(range(25)))
+        mock_request.assert_called_once()
+        self.assertEqual(sorted(c[1]["params"]["page"] for c in mock_async.call_args_list), [2, 3])
+        self.assertEqual(mock_async.call_args_list[0][1]["params"]["q"], "x")
+
+        print("✅ _paginate_results fetches remaining pages concurrently")
+
+    def test_approval_lookups_gathered(self):
+        """Test that approval metrics look up every request concurrently and skip failures."""
+        manager = JSMApprovalManager()
+        service_requests = [{"issueKey": f"SD-{i}"} for i in range(3)]
+
+        async def fetch_approvals(method, endpoint, data=None, params=None):
+            if "SD-1" in endpoint:
+                raise ValueError("Approval resource not found")
+            return {"values": [{"approvalStatus": "APPROVED", "approvalType": "LEVEL_1"}]}
+
+        with patch.object(manager, "_get_all_service_desk_requests", return_value=service_requests), \
+                patch.object(manager, "_filter_requests_by_time_period", side_effect=lambda r, p: r), \
+                patch.object(manager, "_make_api_request_async", side_effect=fetch_approvals) as mock_async:
+            metrics = manager.get_approval_metrics("1")
+
+        self.assertEqual(mock_async.call_count, 3)
+        self.assertEqual(metrics["totalApprovals"], 2)
+        self.assertEqual(metrics["approved"], 2)
+
+        print("✅ get_approval_metrics gathers approval lookups")
+
+
+if __name__ == '__main__':
+    unittest.main()
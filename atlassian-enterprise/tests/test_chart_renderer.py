@@ -0,0 +1,134 @@
+"""
+Tests for cached chart rendering and concurrent chart uploads.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian import chart_renderer as chart_module
+from mcp_atlassian.chart_renderer import ChartRenderer, chart_spec, render_chart
+from mcp_atlassian.process_pool import ProcessPool
+
+
+def velocity_spec(created=(3, 5, 2)):
+    """Build a small bar chart spec."""
+    return chart_spec("bar", "Issue Velocity for OPS (1m)", "Time Period", "Number of Issues",
+                      ["01-01", "01-02", "01-03"],
+                      [{"label": "Created", "values": list(created), "color": "blue"},
+                       {"label": "Resolved", "values": [1, 2, 3], "color": "green"}])
+
+
+class TestRenderChart(unittest.TestCase):
+    """Test cases for render_chart."""
+
+    def test_formats_and_kinds(self):
+        """Test PNG and SVG output for every chart kind."""
+        self.assertTrue(render_chart(velocity_spec()).startswith(b"\x89PNG"))
+        self.assertIn(b"<svg", render_chart(velocity_spec(), "svg"))
+
+        stack = chart_spec("stack", "Status", "Time Period", "Issues", ["a", "b"],
+                           [{"label": "Open", "values": [1, 2]}, {"label": "Done", "values": [0, 3]}],
+                           legend_loc="upper left")
+        line = chart_spec("line", "Types", "Time Period", "Issues", ["a", "b"], [])
+        self.assertTrue(render_chart(stack).startswith(b"\x89PNG"))
+        self.assertTrue(render_chart(line).startswith(b"\x89PNG"))
+        with self.assertRaises(ValueError):
+            render_chart(dict(line, kind="pie"))
+
+        print("✅ Charts render to PNG and SVG without pyplot")
+
+
+class TestChartRenderer(unittest.TestCase):
+    """Test cases for the ChartRenderer cache."""
+
+    def setUp(self):
+        """Set up a renderer with an in-process pool and a temporary cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.renderer = ChartRenderer(path=os.path.join(self.temp_dir.name, "charts.sqlite3"))
+        self.pool_patcher = patch.object(chart_module, "process_pool", ProcessPool(max_workers=0))
+        self.pool_patcher.start()
+
+    def tearDown(self):
+        """Clean up patches and the cache."""
+        self.pool_patcher.stop()
+        self.renderer.close()
+        self.temp_dir.cleanup()
+
+    def test_cache_by_series(self):
+        """Test that charts are rendered once per distinct spec and format."""
+        with patch.object(chart_module, "render_chart", wraps=render_chart) as mock_render:
+            first = self.renderer.render_many({"a": velocity_spec(), "b": velocity_spec()})
+            again = self.renderer.render_many({"c": velocity_spec()})
+            self.renderer.render(velocity_spec(), "svg")
+            changed = self.renderer.render(velocity_spec(created=(3, 5, 9)))
+
+        self.assertEqual(mock_render.call_count, 3)
+        self.assertEqual(first["a"], first["b"])
+        self.assertEqual(again["c"], first["a"])
+        self.assertNotEqual(changed, first["a"])
+
+        print("✅ Rendered charts are cached by spec hash")
+
+    def test_eviction_and_failures(self):
+        """Test the byte budget and that failed charts are left out."""
+        self.renderer.max_bytes = len(render_chart(velocity_spec())) + 10
+
+        self.renderer.render(velocity_spec())
+        self.renderer.render(velocity_spec(created=(1, 1, 1)))
+        count = self.renderer._connect().execute("SELECT COUNT(*) FROM charts").fetchone()[0]
+        self.assertEqual(count, 1)
+
+        charts = self.renderer.render_many({"ok": velocity_spec(), "bad": dict(velocity_spec(), kind="pie")})
+        self.assertEqual(list(charts), ["ok"])
+
+        print("✅ Chart cache evicts over budget and skips failed charts")
+
+
+class TestChartUpload(unittest.TestCase):
+    """Test the concurrent chart uploads of published reports."""
+
+    def test_upload_charts(self):
+        """Test that charts are attached concurrently and failures are reported."""
+        from mcp_atlassian.analytics import AnalyticsManager
+
+        running = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def request(method, url, headers=None, files=None):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            time.sleep(0.05)
+            with lock:
+                running["now"] -= 1
+            return MagicMock(status_code=500 if "bad" in files["file"][0] else 200)
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            paths = {}
+            for name in ("velocity_chart", "status_chart", "bad_chart"):
+                paths[name] = os.path.join(data_dir, f"OPS_{name}.png")
+                with open(paths[name], "wb") as f:
+                    f.write(b"\x89PNG")
+            client = MagicMock()
+            client.request.side_effect = request
+
+            failed = AnalyticsManager(data_dir=data_dir)._upload_charts(client, "123", paths)
+
+        self.assertEqual(list(failed), ["bad_chart"])
+        self.assertEqual(client.request.call_count, 3)
+        self.assertIn("/content/123/child/attachment", client.request.call_args.args[1])
+        self.assertGreater(running["peak"], 1)
+
+        print("✅ Charts are uploaded concurrently")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Mock test suite for streaming Confluence space exports.
+"""
+
+import unittest
+import sys
+import os
+import types
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.confluence import ConfluenceFetcher
+from mcp_atlassian.markdown_cache import MarkdownCache
+
+
+def make_pages(count):
+    """Build raw page payloads as returned by get_all_pages_from_space."""
+    return [
+        {
+            "id": str(i),
+            "title": f"Page {i}",
+            "body": {"storage": {"value": f"<p>Body {i}</p>"}},
+            "version": {"number": i + 1},
+        }
+        for i in range(count)
+    ]
+
+
+class TestConfluenceSpaceExport(unittest.TestCase):
+    """Test streaming space exports with mocks."""
+
+    def setUp(self):
+        """Set up a ConfluenceFetcher backed by a mocked Confluence client."""
+        self.env_patcher = patch.dict('os.environ', {
+            'CONFLUENCE_URL': 'https://example.atlassian.net/wiki',
+            'CONFLUENCE_USERNAME': 'test@example.com',
+            'CONFLUENCE_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+        # Keep conversions out of the on-disk cache
+        self.cache_patcher = patch('mcp_atlassian.confluence.markdown_cache', MarkdownCache(max_bytes=0))
+        self.cache_patcher.start()
+
+        self.confluence_patcher = patch('mcp_atlassian.confluence.Confluence')
+        self.mock_confluence_class = self.confluence_patcher.start()
+        self.mock_confluence = MagicMock()
+        self.mock_confluence_class.return_value = self.mock_confluence
+
+        self.fetcher = ConfluenceFetcher()
+        self.pages = make_pages(5)
+        self.mock_confluence.get_all_pages_from_space.side_effect = \
+            lambda space, start, limit, expand: self.pages[start:start + limit]
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.confluence_patcher.stop()
+        self.cache_patcher.stop()
+        self.env_patcher.stop()
+
+    def test_iter_space_pages_streams_whole_space(self):
+        """Test that the generator pages through the space lazily."""
+        pages = self.fetcher.iter_space_pages("TEST", batch_size=2)
+
+        self.assertIsInstance(pages, types.GeneratorType)
+        self.mock_confluence.get_all_pages_from_space.assert_not_called()
+
+        first = next(pages)
+        self.assertEqual(first.metadata["page_id"], "0")
+        self.assertIn("Body 0", first.page_content)
+        self.assertEqual(self.mock_confluence.get_all_pages_from_space.call_count, 1)
+
+        rest = list(pages)
+        self.assertEqual([doc.metadata["page_id"] for doc in rest], ["1", "2", "3", "4"])
+        # Three full or partial batches plus the empty batch that ends the space
+        self.assertEqual(self.mock_confluence.get_all_pages_from_space.call_count, 4)
+
+        print("✅ iter_space_pages streams every page of a space")
+
+    def test_get_space_pages_respects_limit(self):
+        """Test that get_space_pages still returns a single window of pages."""
+        documents = self.fetcher.get_space_pages("TEST", start=1, limit=3)
+
+        self.assertEqual([doc.metadata["page_id"] for doc in documents], ["1", "2", "3"])
+        self.assertEqual(documents[0].metadata["version"], 2)
+        self.mock_confluence.get_all_pages_from_space.assert_called_once_with(
+            space="TEST", start=1, limit=3, expand="body.storage,version"
+        )
+
+        print("✅ get_space_pages returns one window of pages")
+
+    def test_space_resource_is_capped(self):
+        """Test that the space resource stops at its byte budget and links to the rest."""
+        from pydantic import AnyUrl
+        from mcp_atlassian import server
+
+        self.mock_confluence.get_all_pages_from_space.side_effect = \
+            lambda space, start, limit, expand: self.pages[start:start + 2]
+        with patch.dict(server.services, {"confluence": True}), \
+                patch.object(server, "confluence_fetcher", self.fetcher), \
+                patch.object(server, "SPACE_EXPORT_MAX_BYTES", 45):
+            first = server._read_resource(AnyUrl("confluence://TEST"))
+            # Fetching stops at the batch holding the first page over budget
+            self.assertEqual(self.mock_confluence.get_all_pages_from_space.call_count, 2)
+            rest = server._read_resource(AnyUrl("confluence://TEST?start=2"))
+
+        self.assertEqual(len(first), 3)
+        self.assertIn("# Page 1", first[1])
+        self.assertIn("confluence://TEST?start=2", first[-1])
+        self.assertIn("# Page 2", rest[0])
+        self.assertIn("confluence://TEST?start=4", rest[-1])
+
+        print("✅ Space exports are capped and can be continued")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Mock test suite for the Confluence page tree builder.
+
+These tests verify that the tree is built level by level from paged
+/child/page listings, and that space roots come from a single listing.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.confluence import ConfluenceFetcher
+
+
+# Child pages by parent ID; page "1" has more children than fit in one page
+TREE = {
+    "1": ["2", "3", "4"],
+    "2": ["5"],
+    "3": [],
+    "4": [],
+    "5": ["6"],
+    "6": [],
+    "7": ["8"],
+    "8": [],
+}
+
+
+class TestConfluencePageTree(unittest.TestCase):
+    """Test level-by-level page tree building with mocks."""
+
+    def setUp(self):
+        """Set up a ConfluenceFetcher with mocked clients."""
+        self.env_patcher = patch.dict('os.environ', {
+            'CONFLUENCE_URL': 'https://example.atlassian.net/wiki',
+            'CONFLUENCE_USERNAME': 'test@example.com',
+            'CONFLUENCE_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+        self.confluence_patcher = patch('mcp_atlassian.confluence.Confluence')
+        self.mock_confluence_class = self.confluence_patcher.start()
+        self.mock_confluence = MagicMock()
+        self.mock_confluence_class.return_value = self.mock_confluence
+
+        self.fetcher = ConfluenceFetcher()
+        self.fetcher.CHILD_PAGE_LIMIT = 2
+        self.requests = []
+
+        async def fake_get_json(path, params=None):
+            self.requests.append((path, params))
+            if path.startswith("/rest/api/space/"):
+                ids = ["1", "7"]
+            else:
+                ids = TREE[path.split("/")[4]]
+            batch = ids[params["start"]:params["start"] + params["limit"]]
+            links = {"next": "/more"} if params["start"] + params["limit"] < len(ids) else {}
+            return {"results": [{"id": i, "title": f"Page {i}"} for i in batch], "_links": links}
+
+        self.json_patcher = patch.object(self.fetcher, "_get_json_async", side_effect=fake_get_json)
+        self.json_patcher.start()
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.json_patcher.stop()
+        self.confluence_patcher.stop()
+        self.env_patcher.stop()
+
+    def test_tree_from_root_page(self):
+        """Test that children are paged through and the depth is respected."""
+        self.mock_confluence.get_page_by_id.return_value = {"id": "1", "title": "Page 1"}
+
+        tree = self.fetcher.get_page_tree("TEST", root_page_id="1", depth=2)
+
+        root = tree["root_page"]
+        self.assertEqual([child["id"] for child in root["children"]], ["2", "3", "4"])
+        self.assertEqual(root["children"][0]["children"][0]["id"], "5")
+        # Depth 2 stops before the grandchildren's children are requested
+        self.assertEqual(root["children"][0]["children"][0]["children"], [])
+        self.assertNotIn("/rest/api/content/5/child/page", [path for path, _ in self.requests])
+        # Page "1" needed two requests to list all three children
+        self.assertEqual([path for path, _ in self.requests].count("/rest/api/content/1/child/page"), 2)
+
+        print("✅ get_page_tree pages through children level by level")
+
+    def test_tree_without_homepage(self):
+        """Test that space roots come from the root listing instead of per-page ancestor lookups."""
+        self.mock_confluence.get_space.return_value = {"key": "TEST"}
+
+        tree = self.fetcher.get_page_tree("TEST", depth=2)
+
+        self.assertEqual([page["id"] for page in tree["pages"]], ["1", "7"])
+        self.assertEqual(tree["pages"][1]["children"][0]["id"], "8")
+        self.assertEqual(self.requests[0], ("/rest/api/space/TEST/content/page",
+                                            {"depth": "root", "start": 0, "limit": 2}))
+        self.mock_confluence.get_page_by_id.assert_not_called()
+        self.mock_confluence.get_all_pages_from_space.assert_not_called()
+
+        print("✅ get_page_tree finds space roots in a single listing")
+
+
+if __name__ == '__main__':
+    unittest.main()
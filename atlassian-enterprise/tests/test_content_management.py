@@ -27,7 +27,7 @@ class TestConfluenceContentManager(unittest.TestCase):
         self.assertEqual(result["results"][0]["key"], "test-property")
         self.assertEqual(result["results"][0]["value"]["data"], "test-value")
         
-    @patch('requests.request')
+    @patch('mcp_atlassian.transport.http_transport.request')
     def test_set_content_property(self, mock_request):
         """Test setting a content property."""
         # Setup mock response
@@ -66,7 +66,7 @@ class TestConfluenceContentManager(unittest.TestCase):
         self.assertEqual(result[0]["name"], "test-label")
         self.assertEqual(result[0]["prefix"], "global")
         
-    @patch('requests.request')
+    @patch('mcp_atlassian.transport.http_transport.request')
     def test_add_label(self, mock_request):
         """Test adding a label to content."""
         # Setup mock response
@@ -109,7 +109,7 @@ class TestConfluenceContentManager(unittest.TestCase):
         self.assertEqual(result["results"][0]["title"], "Content with Label")
         self.assertEqual(result["results"][0]["space"]["key"], "TEST")
         
-    @patch('requests.request')
+    @patch('mcp_atlassian.transport.http_transport.request')
     def test_get_content_restrictions(self, mock_request):
         """Test getting content restrictions."""
         # Setup mock response
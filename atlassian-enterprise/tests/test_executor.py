@@ -0,0 +1,89 @@
+"""
+Tests for running blocking tool handlers off the event loop.
+"""
+
+import unittest
+import sys
+import os
+import time
+import asyncio
+import threading
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.executor import BlockingExecutor
+
+
+class TestBlockingExecutor(unittest.TestCase):
+    """Test cases for the BlockingExecutor class."""
+
+    def setUp(self):
+        """Set up an executor with small limits."""
+        self.executor = BlockingExecutor(max_workers=4, service_limits={"jira": 2, "confluence": 2})
+        self.lock = threading.Lock()
+        self.running = {"jira": 0, "confluence": 0}
+        self.peak = {"jira": 0, "confluence": 0}
+
+    def tearDown(self):
+        """Shut down the thread pool."""
+        self.executor.shutdown()
+
+    def blocking_handler(self, service, value):
+        """Simulate a slow, synchronous API call and track concurrency."""
+        with self.lock:
+            self.running[service] += 1
+            self.peak[service] = max(self.peak[service], self.running[service])
+        time.sleep(0.05)
+        with self.lock:
+            self.running[service] -= 1
+        return value * 2
+
+    def test_handlers_overlap(self):
+        """Test that concurrent blocking calls overlap instead of serializing."""
+        async def run_all():
+            return await asyncio.gather(
+                self.executor.run("jira", self.blocking_handler, "jira", 1),
+                self.executor.run("confluence", self.blocking_handler, "confluence", 2),
+            )
+
+        start = time.monotonic()
+        results = asyncio.run(run_all())
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(results, [2, 4])
+        self.assertLess(elapsed, 0.095)
+
+        print("✅ Blocking handlers for different services run concurrently")
+
+    def test_per_service_limit(self):
+        """Test that a service never exceeds its concurrency limit."""
+        async def run_all():
+            return await asyncio.gather(*[
+                self.executor.run("jira", self.blocking_handler, "jira", i)
+                for i in range(6)
+            ])
+
+        results = asyncio.run(run_all())
+
+        self.assertEqual(results, [0, 2, 4, 6, 8, 10])
+        self.assertEqual(self.peak["jira"], 2)
+
+        print("✅ Per-service concurrency limits are enforced")
+
+    def test_exceptions_propagate(self):
+        """Test that handler exceptions reach the awaiting coroutine."""
+        def failing_handler():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(self.executor.run("jsm", failing_handler))
+
+        # The executor stays usable across event loops
+        self.assertEqual(asyncio.run(self.executor.run("jsm", lambda: "ok")), "ok")
+
+        print("✅ Handler exceptions propagate through the executor")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for the scalable issue clustering path.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.issue_clustering import ScalableClustering, reservoir_sample
+
+
+def make_features(count, seed=3):
+    """Build two well-separated groups of issue features."""
+    rng = np.random.default_rng(seed)
+    group = np.arange(count) % 2
+    features = pd.DataFrame({
+        "comment_count": group * 20 + rng.random(count),
+        "cycle_time": group * 30 + rng.random(count),
+        "word_count": group * 500 + rng.random(count) * 10,
+    })
+    return pd.Series([f"OPS-{n}" for n in range(count)]), features, group
+
+
+class TestReservoirSample(unittest.TestCase):
+    """Test cases for reservoir_sample."""
+
+    def test_sample_size_and_uniformity(self):
+        """Test that the sample has the requested size and covers the whole stream."""
+        rows = np.arange(10000).reshape(-1, 1)
+        batches = [rows[i:i + 700] for i in range(0, len(rows), 700)]
+
+        sample = reservoir_sample(batches, 1000)
+        self.assertEqual(sample.shape, (1000, 1))
+        self.assertEqual(len(np.unique(sample)), 1000)
+        # Every tenth of the stream is represented about equally
+        counts = np.bincount(sample[:, 0] // 1000, minlength=10)
+        self.assertTrue(np.all(counts > 60), counts)
+
+        self.assertEqual(len(reservoir_sample([rows[:5]], 1000)), 5)
+
+        print("✅ Reservoir samples are uniform over the stream")
+
+
+class TestScalableClustering(unittest.TestCase):
+    """Test cases for the ScalableClustering class."""
+
+    def setUp(self):
+        """Set up clustering with models in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clustering = ScalableClustering(self.temp_dir.name, sample_size=500, batch_size=256)
+
+    def tearDown(self):
+        """Remove the models."""
+        self.temp_dir.cleanup()
+
+    def test_clusters_match_groups(self):
+        """Test that the sample-fitted centroids separate the groups of every issue."""
+        keys, features, group = make_features(3000)
+
+        labels, run = self.clustering.cluster("OPS", keys, features)
+
+        self.assertEqual(run["num_clusters"], 2)
+        self.assertTrue(run["refitted"])
+        self.assertEqual(run["scored_issues"], 3000)
+        self.assertEqual(run["sample_size"], 500)
+        self.assertEqual(len(set(zip(labels, group))), 2)
+
+        print("✅ Scalable clustering separates the issue groups")
+
+    def test_rerun_scores_only_changed_issues(self):
+        """Test that reruns reuse the persisted model and refit once too much changed."""
+        keys, features, group = make_features(1000)
+        labels, _ = self.clustering.cluster("OPS", keys, features)
+
+        # Move one issue to the other group and add a new one
+        features.loc[0] = features.loc[1]
+        keys = pd.concat([keys, pd.Series(["OPS-1000"])], ignore_index=True)
+        features = pd.concat([features, features.iloc[[2]]], ignore_index=True)
+        rerun_labels, run = ScalableClustering(self.temp_dir.name).cluster("OPS", keys, features)
+
+        self.assertFalse(run["refitted"])
+        self.assertEqual(run["scored_issues"], 2)
+        self.assertEqual(rerun_labels[0], labels[1])
+        self.assertEqual(rerun_labels[1000], labels[2])
+        np.testing.assert_array_equal(rerun_labels[1:1000], labels[1:])
+
+        features["comment_count"] += 1
+        _, run = self.clustering.cluster("OPS", keys, features)
+        self.assertTrue(run["refitted"])
+
+        print("✅ Reruns only score new or changed issues")
+
+    def test_issue_patterns_use_scalable_path(self):
+        """Test that pattern detection switches to the scalable path for large projects."""
+        from mcp_atlassian import analytics
+        from mcp_atlassian.issue_frame import issues_to_frame
+
+        issues = [{"id": str(n), "key": f"OPS-{n}", "fields": {
+            "issuetype": {"name": "Bug" if n % 2 else "Task"},
+            "status": {"name": "Done", "statusCategory": {"key": "done"}},
+            "priority": {"name": "High"},
+            "created": "2025-01-01T10:00:00.000+0000",
+            "resolutiondate": f"2025-01-{2 + (n % 2) * 20:02d}T10:00:00.000+0000",
+            "comment": {"comments": [{}] * (n % 2 * 10)},
+        }} for n in range(60)]
+        snapshot = {"project_key": "OPS", "frame": issues_to_frame(issues, text=True)}
+
+        manager = analytics.AnalyticsManager(data_dir=self.temp_dir.name)
+        with patch.object(analytics, "SCALABLE_CLUSTERING_MIN_ISSUES", 50):
+            result = manager._issue_patterns_section(snapshot)["clustering_analysis"]
+
+        self.assertEqual(result["method"], "MiniBatchKMeans")
+        self.assertEqual(sorted(i["size"] for i in result["insights"]), [30, 30])
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, "models", "OPS_clusters.joblib")))
+
+        print("✅ Large projects are clustered on the scalable path")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests for the columnar issue ingestion used by analytics.
+"""
+
+import unittest
+import sys
+import os
+import datetime
+
+import numpy as np
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.issue_frame import (
+    bucket_counts, format_dates, issues_to_frame, rank_percentiles, resolution_days,
+    status_timeline, value_counts
+)
+
+
+def make_issue(n, created, resolved=None, status="Open", category="new", **fields):
+    """Build a raw issue payload as returned by the search endpoint."""
+    payload = {
+        "issuetype": {"name": "Bug" if n % 2 else "Task"},
+        "status": {"name": status, "statusCategory": {"key": category}},
+        "priority": {"name": "High"},
+        "assignee": None,
+        "created": created,
+        "resolutiondate": resolved,
+    }
+    payload.update(fields)
+    return {"id": str(n), "key": f"OPS-{n}", "fields": payload}
+
+
+class TestIssueFrame(unittest.TestCase):
+    """Test cases for issues_to_frame."""
+
+    def test_flatten_issues(self):
+        """Test typed columns, missing values and description word counts."""
+        frame = issues_to_frame([
+            make_issue(1, "2025-01-01T10:00:00.000+0000", "2025-01-03T22:00:00.000+0000", "Done", "done",
+                       timetracking={"originalEstimateSeconds": 3600, "timeSpentSeconds": 7200},
+                       comment={"comments": [{}, {}]}, labels=["a"], description="Restart the app_server now"),
+            make_issue(2, "2025-01-02T10:00:00.000+0200", priority=None, timetracking={}),
+        ], text=True)
+
+        self.assertEqual(list(frame["key"]), ["OPS-1", "OPS-2"])
+        self.assertEqual(list(resolution_days(frame).fillna(-1)), [2.5, -1])
+        self.assertEqual(frame["created"].iloc[1] - frame["created"].iloc[0], datetime.timedelta(hours=22))
+        self.assertEqual(list(frame["time_spent"]), [7200.0, 0.0])
+        self.assertEqual(list(frame["comment_count"]), [2, 0])
+        self.assertEqual(list(frame["word_count"]), [4, 0])
+        self.assertEqual(value_counts(frame["priority"]), {"High": 1, "Unknown": 1})
+        self.assertTrue(frame["assignee"].isna().all())
+
+        print("✅ Issues are flattened into typed columns")
+
+    def test_dates(self):
+        """Test per-date formatting and bucketing."""
+        frame = issues_to_frame([
+            make_issue(1, "2025-01-06T09:00:00.000+0000"),
+            make_issue(2, "2025-01-06T18:00:00.000+0000"),
+            make_issue(3, None),
+        ])
+
+        days = format_dates(frame["created"], "%Y-%m-%d")
+        self.assertIsNone(days.iloc[2])
+        self.assertEqual(bucket_counts(days, ["2025-01-05", "2025-01-06"]), {"2025-01-05": 0, "2025-01-06": 2})
+        self.assertEqual(bucket_counts(days, ["2025-01-05"]), {"2025-01-05": 0, "2025-01-06": 2})
+
+        print("✅ Dates are formatted and bucketed")
+
+
+class TestAggregations(unittest.TestCase):
+    """Test the vectorized aggregations against the straightforward definitions."""
+
+    def test_rank_percentiles(self):
+        """Test nearest-rank percentiles without a full sort."""
+        for size in (1, 2, 5, 10, 11, 101):
+            values = np.random.default_rng(size).random(size)
+            expected = [sorted(values)[len(values) // 2], sorted(values)[int(len(values) * 0.9)]]
+            self.assertEqual(rank_percentiles(values, [0.5, 0.9]), expected)
+
+        print("✅ Percentiles match the sorted nearest rank")
+
+    def test_status_timeline(self):
+        """Test the difference-array timeline against rescanning every issue per bucket."""
+        rng = np.random.default_rng(3)
+        start = datetime.datetime(2025, 1, 1)
+        issues = []
+        for n in range(300):
+            created = start + datetime.timedelta(hours=float(rng.integers(0, 24 * 40)))
+            resolved = created + datetime.timedelta(hours=float(rng.integers(0, 24 * 20))) if n % 3 else None
+            status = ["Open", "In Progress", "Done"][n % 3]
+            issues.append(make_issue(n, created.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                                     resolved and resolved.strftime("%Y-%m-%dT%H:%M:%S.000+0000"), status))
+        frame = issues_to_frame(issues)
+        buckets = [start + datetime.timedelta(days=day) for day in range(0, 70, 3)]
+
+        expected = []
+        for bucket in buckets:
+            counts = {}
+            for created, resolved, status in zip(frame["created"], frame["resolved"], frame["status"]):
+                if created <= bucket:
+                    current = "Done" if resolved is not None and resolved <= bucket else status
+                    counts[current] = counts.get(current, 0) + 1
+            expected.append(counts)
+
+        self.assertEqual(status_timeline(frame, buckets), expected)
+
+        print("✅ Status timeline matches a per-bucket rescan")
+
+
+if __name__ == '__main__':
+    unittest.main()
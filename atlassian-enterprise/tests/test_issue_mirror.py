@@ -0,0 +1,159 @@
+"""
+Tests for the incremental local mirror of Jira projects.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.issue_mirror import IssueMirror
+
+SITE = "https://example.atlassian.net"
+
+
+def make_issue(issue_id, summary="Issue", updated="2025-01-01T10:00:00.000+0000"):
+    """Build a raw issue payload as returned by the search endpoint."""
+    return {
+        "id": str(issue_id),
+        "key": f"OPS-{issue_id}",
+        "fields": {"summary": summary, "updated": updated},
+    }
+
+
+class FakeJira:
+    """Search endpoint serving a mutable list of issues."""
+
+    def __init__(self, issues):
+        self.issues = issues
+        self.queries = []
+        self.fail = False
+
+    def search(self, jql, start_at, max_results):
+        self.queries.append((jql, start_at, max_results))
+        if self.fail:
+            raise ValueError("Jira search failed: 503")
+        matches = [issue for issue in self.issues if "updated >=" not in jql or issue.get("changed")]
+        return {"issues": matches[start_at:start_at + max_results], "total": len(matches)}
+
+
+class TestIssueMirror(unittest.TestCase):
+    """Test cases for the IssueMirror class."""
+
+    def setUp(self):
+        """Set up a mirror in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.mirror = IssueMirror(path=os.path.join(self.temp_dir.name, "mirror.sqlite3"),
+                                  fields="*navigable", refresh_seconds=0)
+        self.jira = FakeJira([make_issue(n) for n in range(1, 251)])
+
+    def tearDown(self):
+        """Close and remove the mirror."""
+        self.mirror.close()
+        self.temp_dir.cleanup()
+
+    def test_full_then_delta_sync(self):
+        """Test that only changed issues are downloaded after the first sync."""
+        issues = self.mirror.get_issues(SITE, "OPS", self.jira.search)
+
+        self.assertEqual(len(issues), 250)
+        self.assertEqual(issues[0]["key"], "OPS-250")
+        self.assertEqual(len(self.jira.queries), 3)
+
+        self.jira.issues[4] = dict(make_issue(5, summary="Renamed"), changed=True)
+        self.jira.queries = []
+        issues = self.mirror.get_issues(SITE + "/", "OPS", self.jira.search)
+
+        self.assertEqual(len(issues), 250)
+        self.assertEqual(issues[-5]["fields"]["summary"], "Renamed")
+        delta_query, count_query = self.jira.queries
+        self.assertIn('project = "OPS" AND updated >= "-2m"', delta_query[0])
+        self.assertEqual(count_query[2], 0)
+
+        print("✅ Issue mirror pulls only changed issues")
+
+    def test_deleted_issues_trigger_resync(self):
+        """Test that a count mismatch after a delta resyncs the whole project."""
+        self.mirror.get_issues(SITE, "OPS", self.jira.search)
+
+        del self.jira.issues[:10]
+        issues = self.mirror.get_issues(SITE, "OPS", self.jira.search)
+
+        self.assertEqual(len(issues), 240)
+        self.assertNotIn("OPS-1", [issue["key"] for issue in issues])
+
+        print("✅ Deleted issues are dropped by a resync")
+
+    def test_refresh_interval_and_failures(self):
+        """Test that recent syncs are served locally and failed syncs keep the mirror."""
+        mirror = IssueMirror(path=self.mirror.path, fields="*navigable", refresh_seconds=3600)
+        self.assertEqual(len(mirror.get_issues(SITE, "OPS", self.jira.search)), 250)
+        self.jira.queries = []
+
+        self.assertEqual(len(mirror.get_issues(SITE, "OPS", self.jira.search)), 250)
+        self.assertEqual(self.jira.queries, [])
+        mirror.close()
+
+        self.jira.fail = True
+        self.assertEqual(len(self.mirror.get_issues(SITE, "OPS", self.jira.search)), 250)
+        # A project that was never synced must not look empty
+        with self.assertRaises(ValueError):
+            self.mirror.get_issues(SITE, "DEV", self.jira.search)
+
+        print("✅ Issue mirror serves recent and stale data locally")
+
+    def test_projects_sync_concurrently(self):
+        """Test that a slow sync of one project does not block reads of another."""
+        self.mirror.get_issues(SITE, "DEV", self.jira.search)
+        self.mirror.refresh_seconds = 3600
+        started, release = threading.Event(), threading.Event()
+
+        def slow_search(jql, start_at, max_results):
+            started.set()
+            release.wait(10)
+            return self.jira.search(jql, start_at, max_results)
+
+        results = []
+        worker = threading.Thread(target=self.mirror.get_issues, args=(SITE, "OPS", slow_search))
+        reader = threading.Thread(target=lambda: results.append(self.mirror.get_issues(SITE, "DEV", self.jira.search)))
+        worker.start()
+        try:
+            started.wait(10)
+            reader.start()
+            reader.join(5)
+            # The read finished while the other project was still downloading
+            self.assertFalse(release.is_set())
+            self.assertEqual([len(issues) for issues in results], [250])
+        finally:
+            release.set()
+            worker.join(10)
+            reader.join(10)
+
+        print("✅ Projects sync without blocking each other")
+
+    def test_get_project_issues(self):
+        """Test syncing through an authenticated client and a change of mirrored fields."""
+        client = MagicMock()
+        client.request.return_value.status_code = 200
+        client.request.return_value.json.return_value = {"issues": [make_issue(1)], "total": 1}
+
+        with patch.dict('os.environ', {'JIRA_URL': SITE}):
+            self.assertEqual(len(self.mirror.get_project_issues(client, "OPS")), 1)
+            self.mirror.fields = "*navigable,comment"
+            self.mirror.get_project_issues(client, "OPS")
+
+        method, url = client.request.call_args.args
+        self.assertEqual((method, url), ("GET", f"{SITE}/rest/api/2/search"))
+        self.assertEqual(client.request.call_args.kwargs["params"]["fields"], "*navigable,comment")
+        self.assertEqual(client.request.call_args.kwargs["params"]["jql"], 'project = "OPS" ORDER BY key ASC')
+
+        print("✅ Changing the mirrored fields resyncs the project")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Tests for the single-pass Jira wiki markup to markdown converter.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.jira_markup import jira_markup_to_markdown
+from mcp_atlassian.preprocessing import TextPreprocessor
+from mcp_atlassian.user_cache import UserCache
+
+BASE_URL = "https://example.atlassian.net"
+
+
+class TestJiraMarkupToMarkdown(unittest.TestCase):
+    """Test cases for jira_markup_to_markdown."""
+
+    def convert(self, text):
+        return jira_markup_to_markdown(text, base_url=BASE_URL, user_name={"abc": "Alice Smith"}.get)
+
+    def test_headings_lists_and_formatting(self):
+        """Test headings, nested lists, rules and inline formatting."""
+        markdown = self.convert(
+            "h2. Steps\n"
+            "# Open the *admin* page\n"
+            "## Click _Save_ on {{config_file}}\n"
+            "* -old- well-known snake_case_name on 2024-01-02\n"
+            "----\n"
+            "line\\\\break {color:red}red{color} !screen.png|thumbnail!"
+        )
+
+        self.assertEqual(markdown, (
+            "## Steps\n"
+            "1. Open the **admin** page\n"
+            "   1. Click *Save* on `config_file`\n"
+            "- ~~old~~ well-known snake_case_name on 2024-01-02\n"
+            "---\n"
+            "line  \nbreak red ![screen.png](screen.png)"
+        ))
+
+        print("✅ Headings, lists and inline formatting are converted")
+
+    def test_links_and_mentions(self):
+        """Test mentions, smart links, plain links and bracketed text."""
+        markdown = self.convert(
+            "Ping [~accountid:abc], [~accountid:zzz] and [~jdoe]. "
+            "See [OPS-1 title|https://other.atlassian.net/browse/OPS-1?focus=1|smart-link], "
+            "[page|https://example.atlassian.net/wiki/spaces/X/pages/123/OPS-2+Runbook+Page?x=1|smart-link], "
+            "[docs|https://docs.example.com/a_b], [https://status.example.com] and [WIP]"
+        )
+
+        self.assertEqual(markdown, (
+            "Ping @Alice Smith, User:zzz and @jdoe. "
+            f"See [OPS-1]({BASE_URL}/browse/OPS-1), "
+            "[Runbook Page](https://example.atlassian.net/wiki/spaces/X/pages/123/OPS-2+Runbook+Page?x=1), "
+            "[docs](https://docs.example.com/a_b), [https://status.example.com](https://status.example.com) and [WIP]"
+        ))
+
+        print("✅ Links and mentions are converted")
+
+    def test_code_and_quotes(self):
+        """Test code and noformat blocks, panels and quotes."""
+        markdown = self.convert(
+            "{code:python}\ndef f(a_b):\n    return *a_b  # [~accountid:abc]\n{code}\n"
+            "{noformat}\nraw *text*\n{noformat}\n"
+            "{panel:title=Heads up|borderStyle=dashed}\nDrain *first*.\n{panel}\n"
+            "{quote}quoted{quote}\n"
+            "bq. one liner"
+        )
+
+        self.assertEqual(markdown, (
+            "```python\ndef f(a_b):\n    return *a_b  # [~accountid:abc]\n```\n"
+            "```\nraw *text*\n```\n"
+            "> **Heads up**\n>\n> Drain **first**.\n"
+            "> quoted\n"
+            "> one liner"
+        ))
+
+        print("✅ Code blocks, panels and quotes are converted")
+
+    def test_tables(self):
+        """Test header rows, links and pipes in cells, and separate tables."""
+        markdown = self.convert(
+            "||Host||State||\n"
+            "|a|[link|http://h/x]|\n"
+            "|b|*up* {{a|b}}|\n"
+            "\n"
+            "|solo|"
+        )
+
+        self.assertEqual(markdown, (
+            "| Host | State |\n"
+            "| --- | --- |\n"
+            "| a | [link](http://h/x) |\n"
+            "| b | **up** `a\\|b` |\n"
+            "\n"
+            "| solo |\n"
+            "| --- |"
+        ))
+
+        print("✅ Tables are converted")
+
+    def test_links_only(self):
+        """Test that wiki=False rewrites mentions and links but not formatting."""
+        markdown = jira_markup_to_markdown(
+            "<p>*kept* [~accountid:abc]</p>", user_name={"abc": "Alice Smith"}.get, wiki=False
+        )
+
+        self.assertEqual(markdown, "<p>*kept* @Alice Smith</p>")
+
+        print("✅ Links-only conversion leaves formatting alone")
+
+
+class TestCleanJiraText(unittest.TestCase):
+    """Test TextPreprocessor.clean_jira_text with the tokenizer."""
+
+    def setUp(self):
+        """Set up a preprocessor with a mocked bulk user lookup."""
+        self.user_lookup = MagicMock(return_value={"abc": "Alice Smith"})
+        self.preprocessor = TextPreprocessor(
+            BASE_URL, user_lookup=self.user_lookup, cache=UserCache(max_size=10, ttl=60)
+        )
+
+    def test_wiki_markup(self):
+        """Test that wiki markup is converted and mentions resolved in one lookup."""
+        markdown = self.preprocessor.clean_jira_text(
+            "h3. Impact\n* [~accountid:abc] and [~accountid:abc] on [OPS-1|https://x/browse/OPS-1|smart-link]\n"
+        )
+
+        self.assertEqual(markdown, f"### Impact\n- @Alice Smith and @Alice Smith on [OPS-1]({BASE_URL}/browse/OPS-1)")
+        self.user_lookup.assert_called_once_with(["abc"])
+
+        print("✅ clean_jira_text converts wiki markup")
+
+    def test_rendered_html(self):
+        """Test that rendered HTML still goes through the HTML converter."""
+        markdown = self.preprocessor.clean_jira_text("<p>Ask [~accountid:abc] about <b>this</b></p>")
+
+        self.assertEqual(markdown, "Ask @Alice Smith about **this**")
+
+        print("✅ clean_jira_text converts rendered HTML")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+"""
+Mock test suite for JQL search and Epic rollups in JiraFetcher.
+
+These tests verify that search results are turned into Documents straight
+from the search payload, and that issues are only refetched individually
+when the payload is incomplete.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.jira import JiraFetcher
+
+
+def make_issue(key, summary="Test issue", status="To Do", comments=None, comment_total=None):
+    """Build a raw issue payload as returned by the Jira search endpoint."""
+    comments = comments or []
+    return {
+        "key": key,
+        "fields": {
+            "summary": summary,
+            "issuetype": {"name": "Task"},
+            "status": {"name": status},
+            "created": "2025-04-01T10:00:00.000+0000",
+            "priority": {"name": "Medium"},
+            "description": "Plain description",
+            "comment": {
+                "comments": comments,
+                "total": len(comments) if comment_total is None else comment_total,
+            },
+            "issuelinks": [],
+        },
+    }
+
+
+class JiraFetcherTestCase(unittest.TestCase):
+    """Base test case providing a JiraFetcher with a mocked Jira client."""
+
+    def setUp(self):
+        """Set up a JiraFetcher backed by a mocked Jira client."""
+        self.env_patcher = patch.dict('os.environ', {
+            'JIRA_URL': 'https://example.atlassian.net',
+            'JIRA_USERNAME': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+        self.jira_patcher = patch('mcp_atlassian.jira.Jira')
+        self.mock_jira_class = self.jira_patcher.start()
+        self.mock_jira = MagicMock()
+        self.mock_jira_class.return_value = self.mock_jira
+
+        self.jira_fetcher = JiraFetcher()
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.jira_patcher.stop()
+        self.env_patcher.stop()
+
+
+class TestJiraSearch(JiraFetcherTestCase):
+    """Test single-round-trip JQL search with mocks."""
+
+    def test_search_builds_documents_from_payload(self):
+        """Test that a search costs a single request when the payload is complete."""
+        self.mock_jira.jql.return_value = {
+            "issues": [make_issue("TEST-1"), make_issue("TEST-2", status="Done")]
+        }
+
+        documents = self.jira_fetcher.search_issues("project = TEST")
+
+        self.assertEqual([doc.metadata["key"] for doc in documents], ["TEST-1", "TEST-2"])
+        self.assertEqual(documents[1].metadata["status"], "Done")
+        self.assertIn("Issue: TEST-1", documents[0].page_content)
+        self.mock_jira.jql.assert_called_once()
+        self.mock_jira.issue.assert_not_called()
+
+        print("✅ search_issues builds Documents without per-issue requests")
+
+    def test_search_matches_get_issue(self):
+        """Test that search Documents are identical to get_issue Documents."""
+        raw_issue = make_issue("TEST-3", comments=[{
+            "body": "Looks good",
+            "created": "2025-04-02T10:00:00.000+0000",
+            "author": {"displayName": "Jane"},
+        }])
+        self.mock_jira.jql.return_value = {"issues": [raw_issue]}
+        self.mock_jira.issue.return_value = raw_issue
+
+        from_search = self.jira_fetcher.search_issues("key = TEST-3")[0]
+        from_issue = self.jira_fetcher.get_issue("TEST-3")
+
+        self.assertEqual(from_search.page_content, from_issue.page_content)
+        self.assertEqual(from_search.metadata, from_issue.metadata)
+
+        print("✅ search_issues Documents match get_issue Documents")
+
+    def test_search_falls_back_for_truncated_comments(self):
+        """Test that issues with truncated comments are refetched individually."""
+        truncated = make_issue("TEST-4", comment_total=25)
+        self.mock_jira.jql.return_value = {"issues": [make_issue("TEST-5"), truncated]}
+        self.mock_jira.issue.return_value = make_issue("TEST-4")
+
+        documents = self.jira_fetcher.search_issues("project = TEST")
+
+        self.assertEqual(len(documents), 2)
+        self.mock_jira.issue.assert_called_once_with("TEST-4", expand=None)
+
+        print("✅ search_issues falls back to get_issue for partial payloads")
+
+    def test_search_requests_document_fields(self):
+        """Test that a narrowed field list is extended with the Document fields."""
+        self.mock_jira.jql.return_value = {"issues": []}
+
+        self.jira_fetcher.search_issues("project = TEST", fields="summary,labels")
+
+        requested = self.mock_jira.jql.call_args[1]["fields"].split(",")
+        self.assertEqual(requested[:2], ["summary", "labels"])
+        for field in JiraFetcher.ISSUE_DOCUMENT_FIELDS:
+            self.assertIn(field, requested)
+
+        print("✅ search_issues requests the fields needed to build Documents")
+
+
+class TestEpicSubtasks(JiraFetcherTestCase):
+    """Test batched subtask resolution for Epic rollups with mocks."""
+
+    def test_subtasks_resolved_in_chunks(self):
+        """Test that subtasks for many parents are fetched in chunked queries."""
+        parent_keys = [f"TEST-{i}" for i in range(1, 6)]
+
+        def fake_jql(jql, fields=None, start=0, limit=None, expand=None):
+            if "TEST-1" in jql:
+                return {"total": 2, "issues": [
+                    {"key": "TEST-101", "fields": {"summary": "Sub A", "status": {"name": "Done"},
+                                                   "issuetype": {"name": "Sub-task"}, "parent": {"key": "TEST-1"}}},
+                    {"key": "TEST-102", "fields": {"summary": "Sub B", "status": {"name": "To Do"},
+                                                   "issuetype": {"name": "Sub-task"}, "parent": {"key": "TEST-2"}}},
+                ]}
+            return {"total": 1, "issues": [
+                {"key": "TEST-105", "fields": {"summary": "Sub C", "status": {"name": "Done"},
+                                               "issuetype": {"name": "Sub-task"}, "parent": {"key": "TEST-5"}}},
+            ]}
+
+        self.mock_jira.jql.side_effect = fake_jql
+
+        subtasks = self.jira_fetcher.get_subtasks_for_issues(parent_keys, batch_size=3)
+
+        self.assertEqual(self.mock_jira.jql.call_count, 2)
+        self.assertIn("parent in (TEST-1, TEST-2, TEST-3)", self.mock_jira.jql.call_args_list[0][0][0])
+        self.assertEqual([s["key"] for s in subtasks["TEST-1"]], ["TEST-101"])
+        self.assertEqual([s["key"] for s in subtasks["TEST-2"]], ["TEST-102"])
+        self.assertEqual(subtasks["TEST-3"], [])
+        self.assertEqual(subtasks["TEST-5"][0]["status"], "Done")
+
+        print("✅ get_subtasks_for_issues groups chunked results by parent")
+
+    def test_epic_issues_paged(self):
+        """Test that every issue linked to a large Epic is returned, page by page."""
+        stories = [make_issue(f"TEST-{i}") for i in range(1, 81)]
+        epic = make_issue("TEST-100")
+        epic["fields"]["issuetype"] = {"name": "Epic"}
+        self.mock_jira.issue.return_value = epic
+
+        def fake_jql(jql, fields=None, start=0, limit=None, expand=None):
+            if jql.startswith("'Epic Link'"):
+                return {"total": len(stories), "issues": stories[start:start + 30]}
+            return {"total": 0, "issues": []}
+
+        self.mock_jira.jql.side_effect = fake_jql
+
+        result = self.jira_fetcher.get_epic_issues("TEST-100")
+
+        self.assertEqual(result["total_issues"], 80)
+        self.assertEqual([issue["key"] for issue in result["issues"]][-1], "TEST-80")
+        parent_queries = [c[0][0] for c in self.mock_jira.jql.call_args_list if c[0][0].startswith("parent in")]
+        self.assertIn("TEST-80", parent_queries[-1])
+
+        print("✅ get_epic_issues pages through every linked issue")
+
+    def test_update_epic_progress_reuses_rollup(self):
+        """Test that update_epic_progress reuses a get_epic_issues result."""
+        epic_issues = {
+            "total_issues": 2,
+            "completed_issues": 1,
+            "issues": [
+                {"key": "TEST-1", "status": "Done", "subtasks": [{"key": "TEST-101", "status": "Done"}]},
+                {"key": "TEST-2", "status": "To Do", "subtasks": [{"key": "TEST-102", "status": "To Do"}]},
+            ],
+        }
+
+        with patch.object(self.jira_fetcher, "get_epic_issues") as mock_get_epic_issues, \
+                patch.object(self.jira_fetcher, "update_issue") as mock_update_issue:
+            result = self.jira_fetcher.update_epic_progress("TEST-100", epic_issues=epic_issues)
+
+        mock_get_epic_issues.assert_not_called()
+        mock_update_issue.assert_called_once_with("TEST-100", fields={"customfield_10014": 50})
+        self.assertEqual(result["progress_percentage"], 50)
+        self.assertEqual(result["total_subtasks"], 2)
+        self.assertEqual(result["completed_subtasks"], 1)
+
+        print("✅ update_epic_progress reuses the Epic rollup")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -231,11 +231,16 @@ class TestMockJSMAdvanced(unittest.TestCase):
                 return approvals_response2
             return {}
             
+        # Approval lookups are fetched concurrently over the async transport
+        async def async_side_effect_func(*args, **kwargs):
+            return side_effect_func(*args, **kwargs)
+            
         self.mock_api_request.side_effect = side_effect_func
         
         # Call the method
         service_desk_id = "sd-1001"
-        metrics = self.approval_service.get_approval_metrics(service_desk_id=service_desk_id)
+        with patch.object(self.approval_service, "_make_api_request_async", side_effect=async_side_effect_func):
+            metrics = self.approval_service.get_approval_metrics(service_desk_id=service_desk_id)
         
         # Verify results
         self.assertEqual(metrics["totalApprovals"], 3)
@@ -0,0 +1,117 @@
+"""
+Tests for lazy service initialization and lazy imports.
+"""
+
+import unittest
+import sys
+import os
+import json
+import subprocess
+import threading
+import time
+
+# Add the src directory to the path
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../src')
+sys.path.insert(0, SRC_DIR)
+
+from mcp_atlassian.lazy import LazyObject
+
+
+class Service:
+    """Simple service used to observe construction."""
+
+    instances = 0
+
+    def __init__(self):
+        time.sleep(0.01)
+        Service.instances += 1
+        self.value = 1
+
+    def double(self):
+        return self.value * 2
+
+
+class TestLazyObject(unittest.TestCase):
+    """Test cases for the LazyObject proxy."""
+
+    def setUp(self):
+        """Reset the construction counter."""
+        Service.instances = 0
+
+    def test_created_once_on_first_use(self):
+        """Test that the object is created on first access, once, even under concurrency."""
+        service = LazyObject(Service)
+        self.assertFalse(service.loaded)
+        self.assertEqual(Service.instances, 0)
+
+        threads = [threading.Thread(target=service.double) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(service.loaded)
+        self.assertEqual(Service.instances, 1)
+        self.assertEqual(service.double(), 2)
+
+        print("✅ LazyObject creates the wrapped object once, on first use")
+
+    def test_attribute_writes_forwarded(self):
+        """Test that setting attributes on the proxy updates the wrapped object."""
+        service = LazyObject(Service)
+
+        service.value = 5
+
+        self.assertEqual(service.double(), 10)
+        self.assertEqual(service._instance.value, 5)
+
+        print("✅ LazyObject forwards attribute writes")
+
+
+class TestLazyServerStartup(unittest.TestCase):
+    """Test that importing the servers does not construct services or load heavy stacks."""
+
+    def run_child(self, code):
+        """Run code in a fresh interpreter with credentials for every service."""
+        env = dict(os.environ)
+        env.update({
+            'CONFLUENCE_URL': 'https://example.atlassian.net/wiki',
+            'CONFLUENCE_USERNAME': 'test@example.com',
+            'CONFLUENCE_API_TOKEN': 'test-token',
+            'JIRA_URL': 'https://example.atlassian.net',
+            'JIRA_USERNAME': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'PYTHONPATH': SRC_DIR,
+        })
+        result = subprocess.run([sys.executable, "-c", code], env=env, cwd=SRC_DIR,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_server_import_is_lazy(self):
+        """Test that the fetchers and enterprise stacks load only when used."""
+        result = self.run_child(
+            "import sys, json, asyncio\n"
+            "import mcp_atlassian.server as server\n"
+            "tools = asyncio.run(server.list_tools())\n"
+            "print(json.dumps({\n"
+            "    'jira_loaded': server.jira_fetcher.loaded,\n"
+            "    'confluence_loaded': server.confluence_fetcher.loaded,\n"
+            "    'heavy_modules': [m for m in ('pandas', 'sklearn', 'matplotlib', 'nltk', 'atlassian',\n"
+            "                                  'mcp_atlassian.analytics', 'mcp_atlassian.ai_capabilities')\n"
+            "                     if m in sys.modules],\n"
+            "    'tools': [tool.name for tool in tools],\n"
+            "}))\n"
+        )
+
+        self.assertFalse(result["jira_loaded"])
+        self.assertFalse(result["confluence_loaded"])
+        self.assertEqual(result["heavy_modules"], [])
+        self.assertIn("jira_get_issue", result["tools"])
+        self.assertIn("confluence_search", result["tools"])
+
+        print("✅ Server import and list_tools do not construct services")
+
+
+if __name__ == '__main__':
+    unittest.main()
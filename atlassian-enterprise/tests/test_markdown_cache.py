@@ -0,0 +1,157 @@
+"""
+Tests for the version-keyed markdown cache used for Confluence page reads.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.confluence import ConfluenceFetcher
+from mcp_atlassian.markdown_cache import MarkdownCache
+
+SITE = "https://example.atlassian.net/wiki"
+
+
+def make_page(page_id="123", version=1, body="<h1>Runbook</h1><p>Restart the service.</p>"):
+    """Build a raw page payload as returned by get_page_by_id."""
+    return {
+        "id": page_id,
+        "title": "Runbook",
+        "body": {"storage": {"value": body}},
+        "version": {"number": version, "by": {"displayName": "Test User"}, "when": "2025-01-01T00:00:00Z"},
+        "space": {"key": "OPS", "name": "Operations"},
+    }
+
+
+class TestMarkdownCache(unittest.TestCase):
+    """Test cases for the MarkdownCache class."""
+
+    def setUp(self):
+        """Set up a cache in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = MarkdownCache(path=os.path.join(self.temp_dir.name, "cache.sqlite3"), max_bytes=100)
+
+    def tearDown(self):
+        """Close and remove the cache."""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_version_keyed(self):
+        """Test that entries are keyed by version and persist across instances."""
+        self.cache.put(SITE, "1", 1, True, "v1")
+        self.assertEqual(self.cache.get(SITE, "1", 1, True), "v1")
+        self.assertIsNone(self.cache.get(SITE, "1", 1, False))
+        self.assertIsNone(self.cache.get("https://other.atlassian.net/wiki", "1", 1, True))
+
+        # A new version replaces the old one
+        self.cache.put(SITE, "1", 2, True, "v2")
+        self.assertIsNone(self.cache.get(SITE, "1", 1, True))
+        self.assertEqual(self.cache.total_bytes, 2)
+
+        reopened = MarkdownCache(path=self.cache.path, max_bytes=100)
+        self.assertEqual(reopened.get(SITE, "1", 2, True), "v2")
+        reopened.close()
+
+        print("✅ MarkdownCache is keyed by page version")
+
+    def test_converter_version(self):
+        """Test that entries written by another converter version are dropped."""
+        self.cache.put(SITE, "1", 1, True, "old")
+        self.cache.close()
+
+        with patch('mcp_atlassian.markdown_cache.CONVERTER_VERSION', 99):
+            upgraded = MarkdownCache(path=self.cache.path, max_bytes=100)
+            self.assertIsNone(upgraded.get(SITE, "1", 1, True))
+            self.assertEqual(upgraded.total_bytes, 0)
+            upgraded.put(SITE, "1", 1, True, "new")
+            upgraded.close()
+
+            reopened = MarkdownCache(path=self.cache.path, max_bytes=100)
+            self.assertEqual(reopened.get(SITE, "1", 1, True), "new")
+            reopened.close()
+
+        print("✅ MarkdownCache drops entries of other converter versions")
+
+    def test_lru_eviction(self):
+        """Test that the least recently read entries are evicted over budget."""
+        self.cache.put(SITE, "1", 1, True, "a" * 40)
+        self.cache.put(SITE, "2", 1, True, "b" * 40)
+        self.assertIsNotNone(self.cache.get(SITE, "1", 1, True))
+
+        self.cache.put(SITE, "3", 1, True, "c" * 40)
+
+        self.assertIsNotNone(self.cache.get(SITE, "1", 1, True))
+        self.assertIsNone(self.cache.get(SITE, "2", 1, True))
+        self.assertIsNotNone(self.cache.get(SITE, "3", 1, True))
+        self.assertLessEqual(self.cache.total_bytes, 100)
+
+        print("✅ MarkdownCache evicts least recently read entries")
+
+
+class TestConfluencePageCache(unittest.TestCase):
+    """Test that Confluence page reads reuse cached conversions."""
+
+    def setUp(self):
+        """Set up a ConfluenceFetcher backed by a mocked client and a temporary cache."""
+        self.env_patcher = patch.dict('os.environ', {
+            'CONFLUENCE_URL': SITE,
+            'CONFLUENCE_USERNAME': 'test@example.com',
+            'CONFLUENCE_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = MarkdownCache(path=os.path.join(self.temp_dir.name, "cache.sqlite3"), max_bytes=1024 * 1024)
+        self.cache_patcher = patch('mcp_atlassian.confluence.markdown_cache', self.cache)
+        self.cache_patcher.start()
+
+        self.confluence_patcher = patch('mcp_atlassian.confluence.Confluence')
+        self.mock_confluence = MagicMock()
+        self.confluence_patcher.start().return_value = self.mock_confluence
+
+        self.fetcher = ConfluenceFetcher()
+
+    def tearDown(self):
+        """Clean up patches and the cache."""
+        self.confluence_patcher.stop()
+        self.cache_patcher.stop()
+        self.env_patcher.stop()
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_page_reads_reuse_conversion(self):
+        """Test that unchanged versions skip conversion and new versions are converted."""
+        self.mock_confluence.get_page_by_id.return_value = make_page(version=3)
+        self.mock_confluence.get_page_by_title.return_value = make_page(version=3)
+
+        with patch.object(self.fetcher, '_process_html_content',
+                          wraps=self.fetcher._process_html_content) as convert:
+            first = self.fetcher.get_page_content("123")
+            second = self.fetcher.get_page_content("123")
+            by_title = self.fetcher.get_page_by_title("OPS", "Runbook")
+            self.assertEqual(convert.call_count, 1)
+
+            # Raw HTML output is cached separately
+            self.fetcher.get_page_content("123", clean_html=False)
+            self.assertEqual(convert.call_count, 2)
+
+            self.mock_confluence.get_page_by_id.return_value = make_page(version=4, body="<p>Updated</p>")
+            updated = self.fetcher.get_page_content("123")
+            self.assertEqual(convert.call_count, 3)
+
+        self.assertIn("Runbook", first.page_content)
+        self.assertEqual(first.page_content, second.page_content)
+        self.assertEqual(first.page_content, by_title.page_content)
+        self.assertEqual(second.metadata["version"], 3)
+        self.assertIn("Updated", updated.page_content)
+
+        print("✅ Confluence page reads reuse cached conversions")
+
+
+if __name__ == '__main__':
+    unittest.main()
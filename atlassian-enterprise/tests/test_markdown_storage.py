@@ -0,0 +1,178 @@
+"""
+Tests for the local markdown to Confluence storage format converter.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.confluence import ConfluenceFetcher
+from mcp_atlassian.markdown_storage import markdown_to_storage
+from mcp_atlassian.storage_format import storage_to_markdown
+
+
+class TestMarkdownToStorage(unittest.TestCase):
+    """Test cases for markdown_to_storage."""
+
+    def test_text_formatting(self):
+        """Test headings, inline formatting, links, escaping and line breaks."""
+        storage = markdown_to_storage(
+            "# Release *1.2*\n\n"
+            "Use **bold**, _em_, ~~old~~ and `a<b>` with [docs](https://x.com/?a=1&b=2 \"Docs\").\n"
+            "Same paragraph  \n"
+            "after a break & <tag> \\*literal\\* snake_case"
+        )
+
+        self.assertEqual(storage, (
+            "<h1>Release <em>1.2</em></h1>"
+            "<p>Use <strong>bold</strong>, <em>em</em>, <del>old</del> and <code>a&lt;b&gt;</code> with "
+            "<a href=\"https://x.com/?a=1&amp;b=2\">docs</a>. Same paragraph<br />"
+            "after a break &amp; &lt;tag&gt; *literal* snake_case</p>"
+        ))
+
+        print("✅ Text formatting is converted")
+
+    def test_lists_and_tasks(self):
+        """Test nested lists, ordered lists and task lists."""
+        storage = markdown_to_storage(
+            "- one\n- two\n  - nested\n\n"
+            "3. three\n4. four\n\n"
+            "- [ ] todo\n- [x] **done**"
+        )
+
+        self.assertEqual(storage, (
+            "<ul><li>one</li><li>two<ul><li>nested</li></ul></li></ul>"
+            "<ol start=\"3\"><li>three</li><li>four</li></ol>"
+            "<ac:task-list>"
+            "<ac:task><ac:task-id>1</ac:task-id><ac:task-status>incomplete</ac:task-status>"
+            "<ac:task-body>todo</ac:task-body></ac:task>"
+            "<ac:task><ac:task-id>2</ac:task-id><ac:task-status>complete</ac:task-status>"
+            "<ac:task-body><strong>done</strong></ac:task-body></ac:task>"
+            "</ac:task-list>"
+        ))
+
+        print("✅ Lists and task lists are converted")
+
+    def test_code_quotes_and_images(self):
+        """Test code macros, quotes, admonitions, rules and images."""
+        storage = markdown_to_storage(
+            "```python\nif a < b:\n    return \"]]>\"\n```\n"
+            "> quoted\n\n"
+            "> [!WARNING]\n> Drain first.\n\n"
+            "---\n"
+            "![Diagram](diagram.png) ![Logo](https://img.example.com/logo.png)"
+        )
+
+        self.assertEqual(storage, (
+            "<ac:structured-macro ac:name=\"code\"><ac:parameter ac:name=\"language\">python</ac:parameter>"
+            "<ac:plain-text-body><![CDATA[if a < b:\n    return \"]]]]><![CDATA[>\"]]></ac:plain-text-body>"
+            "</ac:structured-macro>"
+            "<blockquote><p>quoted</p></blockquote>"
+            "<ac:structured-macro ac:name=\"warning\"><ac:rich-text-body><p>Drain first.</p>"
+            "</ac:rich-text-body></ac:structured-macro>"
+            "<hr />"
+            "<p><ac:image ac:alt=\"Diagram\"><ri:attachment ri:filename=\"diagram.png\" /></ac:image> "
+            "<ac:image ac:alt=\"Logo\"><ri:url ri:value=\"https://img.example.com/logo.png\" /></ac:image></p>"
+        ))
+
+        print("✅ Code macros, quotes and images are converted")
+
+    def test_tables(self):
+        """Test header rows, alignment, escaped pipes and ragged rows."""
+        storage = markdown_to_storage(
+            "| Host | CPU |\n"
+            "|------|----:|\n"
+            "| a \\| b | `x|y` |\n"
+            "| only |\n"
+        )
+
+        self.assertEqual(storage, (
+            "<table><tbody>"
+            "<tr><th>Host</th><th style=\"text-align: right;\">CPU</th></tr>"
+            "<tr><td>a | b</td><td style=\"text-align: right;\"><code>x|y</code></td></tr>"
+            "<tr><td>only</td><td style=\"text-align: right;\"></td></tr>"
+            "</tbody></table>"
+        ))
+
+        print("✅ Tables are converted")
+
+    def test_round_trip(self):
+        """Test that storage_to_markdown reads back what markdown_to_storage writes."""
+        markdown = (
+            "## Runbook\n\n"
+            "Restart **service** with `kubectl`.\n\n"
+            "- [x] drained\n- [ ] restarted\n\n"
+            "| Step | Owner |\n| --- | --- |\n| drain | ops |\n\n"
+            "```bash\nkubectl rollout restart deploy/app\n```"
+        )
+
+        self.assertEqual(storage_to_markdown(markdown_to_storage(markdown)), markdown)
+
+        print("✅ Markdown survives a round trip through storage format")
+
+
+class TestConfluenceWrites(unittest.TestCase):
+    """Test that page writes convert markdown without an extra request."""
+
+    def setUp(self):
+        """Set up a ConfluenceFetcher backed by a mocked Confluence client."""
+        self.env_patcher = patch.dict('os.environ', {
+            'CONFLUENCE_URL': 'https://example.atlassian.net/wiki',
+            'CONFLUENCE_USERNAME': 'test@example.com',
+            'CONFLUENCE_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+        self.confluence_patcher = patch('mcp_atlassian.confluence.Confluence')
+        self.mock_confluence = self.confluence_patcher.start().return_value
+
+        self.transport_patcher = patch('mcp_atlassian.confluence.http_transport')
+        self.mock_transport = self.transport_patcher.start()
+
+        self.fetcher = ConfluenceFetcher()
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.transport_patcher.stop()
+        self.confluence_patcher.stop()
+        self.env_patcher.stop()
+
+    def test_create_page(self):
+        """Test that create_page sends converted storage format in one request."""
+        self.mock_confluence.create_page.return_value = {"id": "42"}
+
+        result = self.fetcher.create_page("OPS", "Runbook", "# Steps\n\n- drain")
+
+        self.assertEqual(result["page_id"], "42")
+        self.mock_confluence.create_page.assert_called_once_with(
+            space="OPS", title="Runbook", body="<h1>Steps</h1><ul><li>drain</li></ul>",
+            parent_id=None, representation="storage"
+        )
+        self.mock_transport.post.assert_not_called()
+
+        print("✅ create_page converts markdown locally")
+
+    def test_update_page(self):
+        """Test that update_page converts markdown and keeps storage content as is."""
+        self.mock_confluence.get_page_by_id.return_value = {
+            "title": "Runbook", "version": {"number": 3}, "space": {"key": "OPS"},
+            "body": {"storage": {"value": "<p>old</p>"}},
+        }
+        self.mock_confluence.update_page.return_value = {"title": "Runbook", "version": {"number": 4}}
+
+        self.fetcher.update_page("42", content="**new**")
+        self.fetcher.update_page("42", content="<p>raw</p>", content_type="storage")
+
+        bodies = [call.kwargs["body"] for call in self.mock_confluence.update_page.call_args_list]
+        self.assertEqual(bodies, ["<p><strong>new</strong></p>", "<p>raw</p>"])
+        self.mock_transport.post.assert_not_called()
+
+        print("✅ update_page converts markdown locally")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Tests for concurrent offset pagination and the listings built on it.
+"""
+
+import unittest
+import sys
+import os
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.pagination import fetch_all_pages, fetch_all_pages_async
+from mcp_atlassian.jsm_approvals import JSMApprovalManager
+from mcp_atlassian.jsm_queue import JSMQueueManager
+
+
+class FakeListing:
+    """Offset-paginated listing with optional total, server page cap and latency."""
+
+    def __init__(self, size, report_total=True, max_limit=None, delay=0.01):
+        self.size = size
+        self.report_total = report_total
+        self.max_limit = max_limit
+        self.delay = delay
+        self.starts = []
+        self.running = 0
+        self.peak = 0
+
+    def page(self, start, limit):
+        self.starts.append(start)
+        limit = min(limit, self.max_limit or limit)
+        values = list(range(start, min(start + limit, self.size)))
+        page = {"values": values, "start": start, "limit": limit, "isLastPage": start + limit >= self.size}
+        if self.report_total:
+            page["total"] = self.size
+        return page
+
+    async def fetch(self, start, limit):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        # Later pages answer first, so results arrive out of order
+        await asyncio.sleep(self.delay / (1 + start // 100))
+        self.running -= 1
+        return self.page(start, limit)
+
+
+class TestFetchAllPages(unittest.TestCase):
+    """Test cases for fetch_all_pages_async and fetch_all_pages."""
+
+    def test_known_total(self):
+        """Test that every remaining offset is fetched once, in order and bounded."""
+        listing = FakeListing(2050)
+
+        items = asyncio.run(fetch_all_pages_async(listing.fetch, total_key="total", concurrency=4))
+
+        self.assertEqual(items, list(range(2050)))
+        self.assertEqual(sorted(listing.starts), list(range(0, 2100, 100)))
+        self.assertEqual(listing.peak, 4)
+
+        print("✅ Known-total listings are fetched concurrently in order")
+
+    def test_unknown_total_and_capped_limit(self):
+        """Test stopping at the last page and using the server's page size as stride."""
+        listing = FakeListing(730, report_total=False, max_limit=50)
+
+        items = asyncio.run(fetch_all_pages_async(listing.fetch, page_size=100, concurrency=3))
+
+        self.assertEqual(items, list(range(730)))
+        self.assertEqual(len(set(listing.starts)), len(listing.starts))
+        self.assertLessEqual(len(listing.starts), 15 + 2)
+        self.assertTrue(all(start % 50 == 0 for start in listing.starts))
+
+        print("✅ Unknown-total listings stop after the last page")
+
+    def test_short_page_before_total(self):
+        """Test that a listing shrinking during pagination ends at the short page."""
+        listing = FakeListing(500)
+        listing.page = lambda start, limit, page=listing.page: dict(
+            page(start, limit), values=[] if start >= 300 else list(range(start, min(start + limit, 250)))
+        )
+
+        items = asyncio.run(fetch_all_pages_async(listing.fetch, total_key="total", concurrency=8))
+
+        self.assertEqual(items, list(range(250)))
+
+        print("✅ Short pages end the results early")
+
+    def test_blocking_page_function(self):
+        """Test the thread-pool wrapper for blocking clients."""
+        listing = FakeListing(1000)
+        threads = set()
+
+        def fetch(start, limit):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            page = listing.page(start, limit)
+            return {"issues": page.pop("values"), **page}
+
+        items = fetch_all_pages(fetch, items_key="issues", total_key="total", concurrency=5)
+
+        self.assertEqual(items, list(range(1000)))
+        self.assertGreater(len(threads), 1)
+
+        print("✅ Blocking page functions are fetched on a thread pool")
+
+    def test_errors_propagate(self):
+        """Test that a failing page fails the whole listing."""
+        listing = FakeListing(1000)
+
+        async def fetch(start, limit):
+            if start == 300:
+                raise ValueError("JSM API request failed: 500")
+            return await listing.fetch(start, limit)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(fetch_all_pages_async(fetch, total_key="total"))
+
+        print("✅ Page errors propagate")
+
+
+class TestJSMListings(unittest.TestCase):
+    """Test the JSM listings that page through the shared paginator."""
+
+    def setUp(self):
+        """Set up credentials for the managers."""
+        self.env_patcher = patch.dict('os.environ', {
+            'JSM_URL': 'https://example.atlassian.net',
+            'JSM_USERNAME': 'test@example.com',
+            'JSM_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.env_patcher.stop()
+
+    def test_queue_and_request_listings(self):
+        """Test that queue issues and service desk requests are fetched concurrently."""
+        listing = FakeListing(420, report_total=False)
+
+        async def fetch(method, endpoint, data=None, params=None):
+            return await listing.fetch(params["start"], params["limit"])
+
+        queue_manager = JSMQueueManager()
+        with patch.object(queue_manager, "_make_api_request_async", side_effect=fetch) as mock_async:
+            self.assertEqual(queue_manager._get_all_queue_issues("1", "2"), list(range(420)))
+        self.assertEqual(mock_async.call_args.kwargs["params"]["expand"], "fields")
+
+        approval_manager = JSMApprovalManager()
+        with patch.object(approval_manager, "_make_api_request_async", side_effect=fetch) as mock_async:
+            self.assertEqual(approval_manager._get_all_service_desk_requests("1"), list(range(420)))
+        self.assertEqual(mock_async.call_args.kwargs["params"]["serviceDeskId"], "1")
+        self.assertGreater(listing.peak, 1)
+
+        print("✅ JSM listings page through the shared paginator")
+
+
+if __name__ == '__main__':
+    unittest.main()
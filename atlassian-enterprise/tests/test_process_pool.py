@@ -0,0 +1,100 @@
+"""
+Tests for the shared process pool and the custom report sections run on it.
+"""
+
+import unittest
+import sys
+import os
+import math
+import tempfile
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.process_pool import ProcessPool
+
+
+def make_issue(n):
+    """Build a raw issue payload as returned by the search endpoint."""
+    return {"id": str(n), "key": f"OPS-{n}", "fields": {
+        "issuetype": {"name": "Bug" if n % 2 else "Task"},
+        "status": {"name": "Done", "statusCategory": {"key": "done"}},
+        "priority": {"name": "High"},
+        "assignee": {"displayName": f"User {n % 3}"},
+        "created": "2025-01-01T10:00:00.000+0000",
+        "resolutiondate": "2025-01-03T10:00:00.000+0000",
+        "timetracking": {"originalEstimateSeconds": 3600, "timeSpentSeconds": 600 * (n % 7 + 1)},
+        "comment": {"comments": [{}] * (n % 4)},
+        "description": "Restart the service " * (n % 5),
+    }}
+
+
+class TestProcessPool(unittest.TestCase):
+    """Test cases for the ProcessPool class."""
+
+    def test_run_all_in_workers(self):
+        """Test that calls run in worker processes and errors are returned per call."""
+        pool = ProcessPool(max_workers=2)
+        try:
+            results = pool.run_all({
+                "pid": (os.getpid, (), {}),
+                "factorial": (math.factorial, (20,), {}),
+                "error": (math.sqrt, (-1,), {}),
+            })
+        finally:
+            pool.shutdown()
+
+        self.assertNotEqual(results["pid"], os.getpid())
+        self.assertEqual(results["factorial"], math.factorial(20))
+        self.assertIsInstance(results["error"], ValueError)
+
+        print("✅ Calls run in worker processes")
+
+    def test_inline(self):
+        """Test that a pool without workers runs calls in the calling process."""
+        pool = ProcessPool(max_workers=0)
+
+        results = pool.run_all({"pid": (os.getpid, (), {}), "value": (lambda x: x * 2, (21,), {})})
+
+        self.assertEqual(results, {"pid": os.getpid(), "value": 42})
+
+        print("✅ Calls run in-process when workers are disabled")
+
+
+class TestCustomReport(unittest.TestCase):
+    """Test that custom reports fetch the project once for all sections."""
+
+    def test_comprehensive_report_uses_one_snapshot(self):
+        """Test the report planner's shared snapshot."""
+        from mcp_atlassian import analytics
+
+        issues = [make_issue(n) for n in range(1, 41)]
+        worklogs = {"user": {"User 1": 7200}, "type": {"Bug": 7200}, "day": {}, "week": {}}
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            manager = analytics.AnalyticsManager(data_dir=data_dir)
+            snapshot_parts = []
+
+            def get_report_snapshot(project_key, parts):
+                snapshot_parts.append(parts)
+                return manager._build_snapshot(None, project_key, parts)
+
+            with patch.object(analytics.issue_mirror, "get_project_issues", return_value=issues) as mock_issues, \
+                    patch.object(analytics.worklog_store, "get_project_time", return_value=worklogs) as mock_worklogs, \
+                    patch.object(analytics, "process_pool", ProcessPool(max_workers=0)), \
+                    patch.object(manager, "_get_report_snapshot", side_effect=get_report_snapshot):
+                report = manager.generate_custom_report(project_key="OPS", report_type="comprehensive")
+
+        self.assertEqual(mock_issues.call_count, 1)
+        self.assertEqual(mock_worklogs.call_count, 1)
+        self.assertEqual(snapshot_parts, [{"frame", "text", "worklogs"}])
+        self.assertEqual(report["project_metrics"]["total_issues"], 40)
+        self.assertEqual(report["time_tracking"]["time_by_user"], {"User 1": 2.0})
+        self.assertIn("issue_patterns", report)
+
+        print("✅ Comprehensive reports share one project snapshot")
+
+
+if __name__ == '__main__':
+    unittest.main()
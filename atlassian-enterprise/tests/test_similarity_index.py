@@ -0,0 +1,134 @@
+"""
+Tests for the persistent content suggestion index.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.similarity_index import SimilarityIndex
+
+SUMMARIES = [
+    "Login page times out behind the proxy",
+    "Proxy returns 502 for the login page",
+    "Export to CSV drops unicode characters",
+    "Dark mode colours in the settings page",
+    "CSV export is slow for large projects",
+    "Session expires too early after login",
+]
+
+
+def make_issue(n, summary, updated="2025-01-01T10:00:00.000+0000", description=""):
+    """Build a raw issue payload as stored by the issue mirror."""
+    return {"id": str(n), "key": f"OPS-{n}", "fields": {
+        "summary": summary,
+        "updated": updated,
+        "description": description,
+        "issuetype": {"name": "Bug"},
+    }}
+
+
+def describe(issue):
+    """Index issues by summary, tagged when they have a description."""
+    fields = issue["fields"]
+    return fields["summary"], ["description"] if fields["description"] else []
+
+
+class TestSimilarityIndex(unittest.TestCase):
+    """Test cases for the SimilarityIndex class."""
+
+    def setUp(self):
+        """Set up an index in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index = SimilarityIndex(self.temp_dir.name)
+        self.issues = [make_issue(n, summary) for n, summary in enumerate(SUMMARIES)]
+
+    def tearDown(self):
+        """Remove the index."""
+        self.temp_dir.cleanup()
+
+    def test_scores_match_tfidf_cosine(self):
+        """Test that search scores equal TfidfVectorizer cosine similarities over the whole corpus."""
+        self.assertEqual(self.index.update("OPS", self.issues, describe), len(SUMMARIES))
+        query = "login page proxy timeout"
+
+        results = self.index.search("OPS", query, limit=len(SUMMARIES))
+
+        vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+        expected = cosine_similarity(vectorizer.fit(SUMMARIES).transform([query]),
+                                     vectorizer.transform(SUMMARIES)).flatten()
+        self.assertEqual({key for key, _ in results[:2]}, {"OPS-0", "OPS-1"})
+        for key, score in results:
+            self.assertAlmostEqual(score, expected[int(key.split("-")[1])])
+        self.assertEqual(len(results), int(np.count_nonzero(expected)))
+        self.assertEqual(len(self.index.search("OPS", query, limit=1)), 1)
+
+        print("✅ Similarity scores match TF-IDF cosine similarity")
+
+    def test_incremental_update_and_persistence(self):
+        """Test that only changed issues are reindexed and the index survives a restart."""
+        self.index.update("OPS", self.issues, describe)
+        self.assertEqual(self.index.update("OPS", self.issues, describe), 0)
+
+        self.issues[2] = make_issue(2, "Login fails with SSO", updated="2025-02-01T10:00:00.000+0000",
+                                    description="Configure the identity provider certificate")
+        del self.issues[3]
+        self.issues.append(make_issue(9, "CSV import ignores the header row"))
+
+        reloaded = SimilarityIndex(self.temp_dir.name)
+        self.assertEqual(reloaded.update("OPS", self.issues, describe), 2)
+        self.assertEqual(reloaded.count("OPS"), len(SUMMARIES))
+        self.assertEqual(reloaded.count("OPS", tag="description"), 1)
+
+        self.assertEqual([key for key, _ in reloaded.search("OPS", "dark mode")], [])
+        self.assertEqual([key for key, _ in reloaded.search("OPS", "SSO login", tag="description")], ["OPS-2"])
+        self.assertIn("OPS-9", [key for key, _ in SimilarityIndex(self.temp_dir.name).search("OPS", "CSV import")])
+
+        print("✅ Index updates are incremental and persisted")
+
+    def test_suggest_content_searches_every_issue(self):
+        """Test that suggestions come from the whole project, not the latest issues only."""
+        from mcp_atlassian import ai_capabilities
+
+        issues = [make_issue(n, f"Routine maintenance task number {n}") for n in range(300)]
+        issues.append(make_issue(1000, "Payment gateway rejects expired cards",
+                                 description="Retry the charge after refreshing the card token from the vault."))
+        issues.reverse()
+
+        manager = ai_capabilities.AICapabilitiesManager(models_dir=self.temp_dir.name)
+        with patch.object(ai_capabilities.issue_mirror, "get_project_issues", return_value=issues):
+            result = manager.suggest_content(client=None, project_key="OPS", query="payment gateway card error")
+            missing = manager.suggest_content(client=None, project_key="OPS", query="payment", content_type="comment")
+
+        self.assertEqual([s["issue_key"] for s in result["suggestions"]], ["OPS-1000"])
+        self.assertIn("card token", result["suggestions"][0]["content"])
+        self.assertIn("error", missing)
+
+        print("✅ Content suggestions search every issue of the project")
+
+    def test_suggest_content_skips_unknown_matches(self):
+        """Test that matches indexed by a concurrent call with a newer mirror read are skipped."""
+        from mcp_atlassian import ai_capabilities
+
+        issues = [make_issue(1, "Payment gateway rejects expired cards", description="Refresh the card token.")]
+        manager = ai_capabilities.AICapabilitiesManager(models_dir=self.temp_dir.name)
+        with patch.object(ai_capabilities.issue_mirror, "get_project_issues", return_value=issues), \
+                patch.object(manager.similarity_index, "search", return_value=[("OPS-2", 0.9), ("OPS-1", 0.5)]):
+            result = manager.suggest_content(client=None, project_key="OPS", query="payment gateway")
+
+        self.assertEqual([s["issue_key"] for s in result["suggestions"]], ["OPS-1"])
+
+        print("✅ Content suggestions skip issues missing from the mirror read")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,7 +27,7 @@ class TestConfluenceSpaceManager(unittest.TestCase):
         self.assertEqual(result["results"][0]["key"], "TEST")
         self.assertEqual(result["results"][0]["name"], "Test Space")
         
-    @patch('requests.request')
+    @patch('mcp_atlassian.transport.http_transport.request')
     def test_create_space(self, mock_request):
         """Test creating a space."""
         # Setup mock response
@@ -63,7 +63,7 @@ class TestConfluenceSpaceManager(unittest.TestCase):
         self.assertEqual(result["key"], "TEST")
         self.assertEqual(result["status"], "archived")
         
-    @patch('requests.request')
+    @patch('mcp_atlassian.transport.http_transport.request')
     def test_add_space_permission(self, mock_request):
         """Test adding a space permission."""
         # Setup mock response
@@ -0,0 +1,141 @@
+"""
+Tests for the single-pass storage format to markdown converter.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.storage_format import StorageFormatConverter, storage_to_markdown
+
+BASE_URL = "https://example.atlassian.net/wiki"
+
+
+class TestStorageToMarkdown(unittest.TestCase):
+    """Test cases for storage_to_markdown."""
+
+    def convert(self, content):
+        return storage_to_markdown(content, user_name={"abc": "Alice Smith"}.get, base_url=BASE_URL, space_key="OPS")
+
+    def test_text_formatting(self):
+        """Test headings, inline formatting, escaping and line breaks."""
+        markdown = self.convert(
+            "<h1>Runbook &amp; notes</h1>"
+            "<p>Use <strong>bold </strong>and <em>care</em> with snake_case and <code>a_b</code>.<br/>Next</p>"
+            "<p>See <a href=\"https://status.example.com\">status</a></p>"
+        )
+
+        self.assertEqual(markdown, (
+            "# Runbook & notes\n\n"
+            "Use **bold** and *care* with snake\\_case and `a_b`.  \nNext\n\n"
+            "See [status](https://status.example.com)"
+        ))
+
+        print("✅ Text formatting is converted")
+
+    def test_confluence_links_and_mentions(self):
+        """Test user mentions, page links and attachment images."""
+        markdown = self.convert(
+            "<p>Ask <ac:link><ri:user ri:account-id=\"abc\" /></ac:link> or "
+            "<ac:link><ri:user ri:account-id=\"zzz\" /></ac:link>, then read "
+            "<ac:link><ri:page ri:content-title=\"Escalation Policy\" /></ac:link> and "
+            "<ac:link><ri:page ri:space-key=\"DEV\" ri:content-title=\"Setup\" />"
+            "<ac:plain-text-link-body><![CDATA[the setup guide]]></ac:plain-text-link-body></ac:link>.</p>"
+            "<ac:image ac:alt=\"Diagram\"><ri:attachment ri:filename=\"diagram.png\" /></ac:image>"
+        )
+
+        self.assertEqual(markdown, (
+            "Ask @Alice Smith or @user\\_zzz, then read "
+            f"[Escalation Policy]({BASE_URL}/display/OPS/Escalation+Policy) and "
+            f"[the setup guide]({BASE_URL}/display/DEV/Setup).\n\n"
+            "![Diagram](diagram.png)"
+        ))
+
+        print("✅ Confluence links and mentions are converted")
+
+    def test_macros(self):
+        """Test code, panel, status and unknown macros."""
+        markdown = self.convert(
+            "<ac:structured-macro ac:name=\"toc\" />"
+            "<ac:structured-macro ac:name=\"note\"><ac:rich-text-body><p>Drain first.</p>"
+            "</ac:rich-text-body></ac:structured-macro>"
+            "<ac:structured-macro ac:name=\"code\"><ac:parameter ac:name=\"language\">python</ac:parameter>"
+            "<ac:plain-text-body><![CDATA[def f(a):\n\n    return a < 2 and a_b]]></ac:plain-text-body>"
+            "</ac:structured-macro>"
+            "<p>State: <ac:structured-macro ac:name=\"status\"><ac:parameter ac:name=\"title\">DONE</ac:parameter>"
+            "</ac:structured-macro></p>"
+        )
+
+        self.assertEqual(markdown, (
+            "> **Note**\n>\n> Drain first.\n\n"
+            "```python\ndef f(a):\n\n    return a < 2 and a_b\n```\n\n"
+            "State: **[DONE]**"
+        ))
+
+        print("✅ Confluence macros are converted")
+
+    def test_lists_and_tasks(self):
+        """Test nested lists, ordered lists and task lists."""
+        markdown = self.convert(
+            "<ul><li>one</li><li>two<ul><li>nested</li></ul></li></ul>"
+            "<ol start=\"3\"><li>three</li><li>four</li></ol>"
+            "<ac:task-list><ac:task><ac:task-id>1</ac:task-id><ac:task-status>complete</ac:task-status>"
+            "<ac:task-body>done</ac:task-body></ac:task><ac:task><ac:task-id>2</ac:task-id>"
+            "<ac:task-status>incomplete</ac:task-status><ac:task-body>todo</ac:task-body></ac:task></ac:task-list>"
+        )
+
+        self.assertEqual(markdown, (
+            "- one\n- two\n  - nested\n\n"
+            "3. three\n4. four\n\n"
+            "- [x] done\n- [ ] todo"
+        ))
+
+        print("✅ Lists and task lists are converted")
+
+    def test_tables(self):
+        """Test tables with header rows, ragged rows and multi-line cells."""
+        markdown = self.convert(
+            "<table><tbody><tr><th>Name</th><th>Value</th></tr>"
+            "<tr><td><p>a|b</p></td><td>1<br/>2</td></tr><tr><td>only</td></tr></tbody></table>"
+        )
+
+        self.assertEqual(markdown, (
+            "| Name | Value |\n"
+            "| --- | --- |\n"
+            "| a\\|b | 1<br>2 |\n"
+            "| only |  |"
+        ))
+
+        print("✅ Tables are converted")
+
+    def test_streaming_and_fragments(self):
+        """Test chunked input and HTML fragments mixed with plain text."""
+        converter = StorageFormatConverter()
+        for chunk in ("<p>Hel", "lo <str", "ong>wor", "ld</strong></p>"):
+            converter.feed(chunk)
+        self.assertEqual(converter.close(), "Hello **world**")
+
+        self.assertEqual(storage_to_markdown("line one\nline <b>two</b>\n\nnext"),
+                         "line one\nline **two**\n\nnext")
+        self.assertEqual(storage_to_markdown("<p>unclosed <em>tags"), "unclosed *tags*")
+
+        print("✅ Chunked input and fragments are converted")
+
+    def test_nul_characters(self):
+        """Test that NUL characters in page text are not read as code block placeholders."""
+        self.assertEqual(storage_to_markdown("<p>text \x001\x00 nul</p>"), "text 1 nul")
+        self.assertEqual(
+            storage_to_markdown("<table><tr><td>\x000\x00</td></tr></table>"
+                                "<ac:structured-macro ac:name=\"code\"><ac:plain-text-body>"
+                                "<![CDATA[x = \"\x000\x00\"]]></ac:plain-text-body></ac:structured-macro>"),
+            "| 0 |\n| --- |\n\n```\nx = \"0\"\n```"
+        )
+
+        print("✅ NUL characters in page text are dropped")
+
+
+if __name__ == '__main__':
+    unittest.main()
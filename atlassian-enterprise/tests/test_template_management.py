@@ -27,7 +27,7 @@ class TestConfluenceTemplateManager(unittest.TestCase):
         self.assertEqual(result["results"][0]["name"], "Meeting Notes")
         self.assertEqual(result["results"][0]["templateType"], "page")
         
-    @patch('requests.request')
+    @patch('mcp_atlassian.transport.http_transport.request')
     def test_get_blueprint_templates(self, mock_request):
         """Test getting blueprint templates."""
         # Setup mock response
@@ -84,7 +84,7 @@ class TestConfluenceTemplateManager(unittest.TestCase):
         self.assertEqual(result["title"], "New Page")
         self.assertEqual(result["space"]["key"], "TEST")
         
-    @patch('requests.request')
+    @patch('mcp_atlassian.transport.http_transport.request')
     def test_create_page_from_blueprint(self, mock_request):
         """Test creating a page from blueprint."""
         # Setup mock response
@@ -0,0 +1,119 @@
+"""
+Tests for the tool registry used by the MCP server.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock
+
+from mcp.types import Tool
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.tool_registry import ToolRegistry
+
+
+def make_tool(name, properties=None, required=None):
+    """Build a Tool definition with a simple object schema."""
+    return Tool(
+        name=name,
+        description=f"Test tool {name}",
+        inputSchema={
+            "type": "object",
+            "properties": properties or {},
+            "required": required or [],
+        },
+    )
+
+
+class TestToolRegistry(unittest.TestCase):
+    """Test cases for the ToolRegistry class."""
+
+    def setUp(self):
+        """Set up a registry with a per-tool family and a family-level handler."""
+        self.registry = ToolRegistry()
+
+        self.jira_tools = MagicMock(return_value=[
+            make_tool("jira_get_issue",
+                      {"issue_key": {"type": "string"}, "limit": {"type": "integer"}},
+                      ["issue_key"]),
+            make_tool("jira_transition_issue",
+                      {"state": {"type": "string", "enum": ["OPEN", "DONE"]}}),
+        ])
+        self.registry.register_family("jira", tools=self.jira_tools, enabled=lambda: True)
+
+        @self.registry.handler("jira_get_issue")
+        def get_issue(arguments):
+            return {"key": arguments["issue_key"]}
+
+        @self.registry.handler("jira_transition_issue")
+        def transition_issue(arguments):
+            return {"state": arguments.get("state")}
+
+        self.jsm_handler = MagicMock(return_value={"ok": True})
+        self.registry.register_family(
+            "jsm",
+            tools=lambda: [make_tool("jsm_get_service_desks")],
+            handler=self.jsm_handler,
+            enabled=lambda: True,
+        )
+        self.registry.register_family(
+            "bitbucket",
+            tools=lambda: [make_tool("bitbucket_list_repositories")],
+            enabled=lambda: False,
+        )
+
+    def test_tools_built_once(self):
+        """Test that tool definitions and the list_tools response are cached."""
+        first = self.registry.list_tools()
+        second = self.registry.list_tools()
+
+        self.assertIs(first, second)
+        self.assertIs(self.registry.list_tools_result(), self.registry.list_tools_result())
+        self.assertEqual([tool.name for tool in first],
+                         ["jira_get_issue", "jira_transition_issue", "jsm_get_service_desks"])
+        self.jira_tools.assert_called_once()
+
+        self.registry.invalidate()
+        self.registry.list_tools()
+        self.assertEqual(self.jira_tools.call_count, 2)
+
+        print("✅ ToolRegistry builds tool definitions once")
+
+    def test_dispatch(self):
+        """Test dispatch to per-tool and family-level handlers."""
+        self.assertEqual(self.registry.dispatch("jira_get_issue", {"issue_key": "TEST-1"}), {"key": "TEST-1"})
+        self.assertEqual(self.registry.dispatch("jsm_get_service_desks", {}), {"ok": True})
+        self.jsm_handler.assert_called_once_with("jsm_get_service_desks", {})
+        self.assertEqual(self.registry.get("jsm_get_service_desks").service, "jsm")
+
+        # Tools of disabled families are unknown
+        with self.assertRaises(ValueError):
+            self.registry.get("bitbucket_list_repositories")
+
+        print("✅ ToolRegistry dispatches through its handler table")
+
+    def test_validate_arguments(self):
+        """Test argument validation against the cached schema."""
+        self.assertEqual(self.registry.validate_arguments("jira_get_issue", {"issue_key": "TEST-1", "limit": "5"}),
+                         {"issue_key": "TEST-1", "limit": "5"})
+        self.assertEqual(self.registry.validate_arguments("jira_transition_issue", None), {})
+
+        invalid = [
+            ("jira_get_issue", {}),
+            ("jira_get_issue", {"issue_key": 1}),
+            ("jira_get_issue", {"issue_key": "TEST-1", "limit": True}),
+            ("jira_get_issue", {"issue_key": "TEST-1", "limit": "five"}),
+            ("jira_transition_issue", {"state": "CLOSED"}),
+        ]
+        for name, arguments in invalid:
+            with self.assertRaises(ValueError, msg=str(arguments)):
+                self.registry.validate_arguments(name, arguments)
+
+        print("✅ ToolRegistry validates arguments against tool schemas")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Tests for background model training jobs.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.process_pool import ProcessPool
+from mcp_atlassian.training_jobs import TrainingJobs, write_progress
+
+
+def wait_for(jobs, job_id, timeout=30):
+    """Wait until a job has finished and return its status."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = jobs.get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def make_issue(n):
+    """Build a resolved issue payload as stored by the issue mirror."""
+    return {"id": str(n), "key": f"OPS-{n}", "fields": {
+        "issuetype": {"name": "Bug" if n % 2 else "Task"},
+        "priority": {"name": ["High", "Medium", "Low"][n % 3]},
+        "summary": f"Fix the flaky build number {n}",
+        "description": "Steps to reproduce " * (n % 5),
+        "assignee": {"displayName": f"User {n % 4}"},
+        "reporter": {"displayName": "Reporter"},
+        "created": "2025-01-01T10:00:00.000+0000",
+        "resolutiondate": f"2025-01-{2 + n % 5:02d}T10:00:00.000+0000",
+    }}
+
+
+class TestTrainingJobs(unittest.TestCase):
+    """Test cases for the TrainingJobs class."""
+
+    def setUp(self):
+        """Set up a job registry in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.jobs = TrainingJobs(progress_dir=self.temp_dir.name, concurrency=2)
+
+    def tearDown(self):
+        """Stop the job threads and remove the progress files."""
+        self.jobs.shutdown()
+        self.temp_dir.cleanup()
+
+    def test_job_lifecycle(self):
+        """Test that jobs return at once, report progress and record their outcome."""
+        started, release = threading.Event(), threading.Event()
+
+        def train(progress_path):
+            write_progress(progress_path, 0.4, "training")
+            started.set()
+            release.wait(10)
+            return {"accuracy": 0.9}
+
+        job = self.jobs.submit("sla_predictor", "OPS", "OPS_sla_predictor", train)
+        self.assertIn(job["status"], ("queued", "running"))
+        started.wait(10)
+
+        running = self.jobs.get(job["job_id"])
+        self.assertEqual((running["status"], running["progress"], running["stage"]), ("running", 0.4, "training"))
+        # An identical job is not started twice
+        duplicate = self.jobs.submit("sla_predictor", "OPS", "OPS_sla_predictor", train)
+        self.assertEqual(duplicate["job_id"], job["job_id"])
+
+        release.set()
+        finished = wait_for(self.jobs, job["job_id"])
+        self.assertEqual((finished["status"], finished["progress"]), ("succeeded", 1.0))
+        self.assertEqual(finished["result"], {"accuracy": 0.9})
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+        print("✅ Training jobs run in the background and report progress")
+
+    def test_failed_jobs(self):
+        """Test that exceptions and error results mark a job as failed."""
+        def crash(progress_path):
+            raise RuntimeError("worker died")
+
+        crashed = wait_for(self.jobs, self.jobs.submit("issue_classifier", "OPS", "a", crash)["job_id"])
+        refused = wait_for(self.jobs, self.jobs.submit(
+            "issue_classifier", "WEB", "b", lambda progress_path: {"error": "Insufficient training data"}
+        )["job_id"])
+
+        self.assertEqual((crashed["status"], crashed["error"]), ("failed", "worker died"))
+        self.assertEqual((refused["status"], refused["error"]), ("failed", "Insufficient training data"))
+        self.assertEqual([job["project_key"] for job in self.jobs.list()], ["WEB", "OPS"])
+        self.assertEqual(len(self.jobs.list("OPS")), 1)
+
+        print("✅ Failed training jobs record their error")
+
+    def test_unwritable_progress_dir(self):
+        """Test that a job whose progress directory cannot be created fails instead of hanging."""
+        blocker = os.path.join(self.temp_dir.name, "file")
+        open(blocker, "w").close()
+        jobs = TrainingJobs(progress_dir=os.path.join(blocker, "progress"), concurrency=1)
+        try:
+            job = wait_for(jobs, jobs.submit("sla_predictor", "OPS", "a", lambda progress_path: {})["job_id"])
+        finally:
+            jobs.shutdown()
+
+        self.assertEqual(job["status"], "failed")
+        self.assertTrue(job["error"])
+
+        print("✅ Jobs fail when their progress directory cannot be created")
+
+    def test_sla_predictor_job_swaps_model(self):
+        """Test that a finished SLA training job swaps the new model in."""
+        from mcp_atlassian import ai_capabilities
+
+        manager = ai_capabilities.AICapabilitiesManager(models_dir=self.temp_dir.name)
+        issues = [make_issue(n) for n in range(60)]
+        with patch.object(ai_capabilities.issue_mirror, "get_project_issues", return_value=issues), \
+                patch.object(ai_capabilities, "process_pool", ProcessPool(max_workers=0)), \
+                patch.object(ai_capabilities, "training_jobs", self.jobs):
+            job = manager.train_sla_predictor(client=None, project_key="OPS")
+            finished = wait_for(self.jobs, job["job_id"])
+            self.assertEqual(manager.get_training_job(job["job_id"])["status"], "succeeded")
+
+        self.assertEqual(finished["status"], "succeeded", finished["error"])
+        self.assertEqual(finished["result"]["training_data_size"], 60)
+        model_info = manager._sla_prediction_models["OPS_sla_predictor"]
+        self.assertEqual(len(model_info["model"].estimators_), ai_capabilities.FOREST_TREES)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, "OPS_sla_predictor.joblib")))
+
+        print("✅ Finished SLA training jobs swap the new model in")
+
+
+if __name__ == '__main__':
+    unittest.main()
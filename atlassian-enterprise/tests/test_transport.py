@@ -0,0 +1,72 @@
+"""
+Tests for the shared pooled HTTP transport.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.transport import HttpTransport
+
+
+class TestHttpTransport(unittest.TestCase):
+    """Test cases for the HttpTransport class."""
+
+    def setUp(self):
+        """Set up a transport with explicit settings."""
+        self.transport = HttpTransport(pool_size=7, connect_timeout=2.0, read_timeout=9.0, max_retries=1)
+
+    def tearDown(self):
+        """Close pooled sessions."""
+        self.transport.close()
+
+    def test_one_session_per_host(self):
+        """Test that sessions are shared per host and separate across hosts."""
+        jira = self.transport.get_session("https://example.atlassian.net/rest/api/3/issue/TEST-1")
+        confluence = self.transport.get_session("https://example.atlassian.net/wiki/rest/api/content")
+        bitbucket = self.transport.get_session("https://api.bitbucket.org/2.0/repositories")
+
+        self.assertIs(jira, confluence)
+        self.assertIsNot(jira, bitbucket)
+
+        adapter = jira.get_adapter("https://example.atlassian.net")
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertEqual(adapter.max_retries.total, 1)
+        self.assertIn("gzip", jira.headers["Accept-Encoding"])
+
+        print("✅ HttpTransport keeps one pooled session per host")
+
+    def test_default_timeout_applied(self):
+        """Test that requests get the default timeout unless one is given."""
+        session = MagicMock()
+        with patch.object(self.transport, "get_session", return_value=session):
+            self.transport.get("https://example.atlassian.net/rest/api/3/myself", auth=("u", "t"))
+            self.transport.post("https://example.atlassian.net/rest/api/3/issue", json={}, timeout=30)
+
+        first, second = session.request.call_args_list
+        self.assertEqual(first[0], ("GET", "https://example.atlassian.net/rest/api/3/myself"))
+        self.assertEqual(first[1]["timeout"], (2.0, 9.0))
+        self.assertEqual(first[1]["auth"], ("u", "t"))
+        self.assertEqual(second[1]["timeout"], 30)
+
+        print("✅ HttpTransport applies default timeouts")
+
+    def test_configure_resets_pools(self):
+        """Test that reconfiguring closes existing pools."""
+        session = self.transport.get_session("https://example.atlassian.net")
+
+        self.transport.configure(pool_size=3)
+
+        new_session = self.transport.get_session("https://example.atlassian.net")
+        self.assertIsNot(session, new_session)
+        self.assertEqual(new_session.get_adapter("https://example.atlassian.net")._pool_maxsize, 3)
+
+        print("✅ HttpTransport.configure rebuilds connection pools")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for the shared user cache and user mention resolution.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.user_cache import UserCache
+from mcp_atlassian.preprocessing import TextPreprocessor
+
+
+def mention(account_id):
+    """Confluence storage-format user mention."""
+    return f'<ac:link><ri:user ri:account-id="{account_id}" /></ac:link>'
+
+
+class TestUserCache(unittest.TestCase):
+    """Test cases for the UserCache class."""
+
+    def setUp(self):
+        """Set up a cache with a controllable clock."""
+        self.now = 0.0
+        self.cache = UserCache(max_size=2, ttl=60, clock=lambda: self.now)
+
+    def test_ttl_and_lru_eviction(self):
+        """Test that entries expire after the TTL and the least recently used entry is evicted."""
+        self.cache.put("a", "Alice")
+        self.cache.put("b", "Bob")
+        self.assertEqual(self.cache.get("a"), "Alice")
+
+        # "b" is now the least recently used entry
+        self.cache.put("c", "Carol")
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), "Alice")
+
+        self.now = 61
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(len(self.cache), 1)
+
+        print("✅ UserCache expires and evicts entries")
+
+    def test_resolve_bulk_then_single(self):
+        """Test that uncached IDs are fetched in bulk and only the leftovers one by one."""
+        self.cache.max_size = 10
+        self.cache.put("a", "Alice")
+        bulk_lookup = MagicMock(return_value={"b": "Bob"})
+        single_lookup = MagicMock(return_value="Carol")
+
+        resolved = self.cache.resolve(["a", "b", "b", "c"], bulk_lookup, single_lookup)
+
+        self.assertEqual(resolved, {"a": "Alice", "b": "Bob", "c": "Carol"})
+        bulk_lookup.assert_called_once_with(["b", "c"])
+        single_lookup.assert_called_once_with("c")
+
+        # Everything is cached now
+        self.cache.resolve(["a", "b", "c"], bulk_lookup, single_lookup)
+        self.assertEqual(bulk_lookup.call_count, 1)
+
+        print("✅ UserCache resolves users in bulk")
+
+
+class TestMentionResolution(unittest.TestCase):
+    """Test cases for user mentions in the Confluence and Jira preprocessors."""
+
+    def setUp(self):
+        """Set up preprocessors sharing one cache."""
+        self.cache = UserCache(max_size=100, ttl=60)
+        self.bulk_lookup = MagicMock(side_effect=lambda ids: {i: i.upper() for i in ids if i != "gone"})
+        self.confluence_client = MagicMock()
+        self.confluence_client.get_user_details_by_accountid.side_effect = Exception("User not found")
+
+        self.confluence = TextPreprocessor("https://example.atlassian.net/wiki", self.confluence_client,
+                                           user_lookup=self.bulk_lookup, cache=self.cache)
+        self.jira = TextPreprocessor("https://example.atlassian.net", user_lookup=self.bulk_lookup, cache=self.cache)
+
+    def test_confluence_mentions_prefetched(self):
+        """Test that a page's mentions are resolved with one bulk request."""
+        html = f"<p>{mention('alice')} and {mention('bob')} and {mention('alice')} and {mention('gone')}</p>"
+
+        _, markdown = self.confluence.process_html_content(html)
+
+        self.assertEqual(markdown.count("@ALICE"), 2)
+        self.assertIn("@BOB", markdown)
+        self.assertIn("@user\\_gone", markdown)
+        self.bulk_lookup.assert_called_once_with(["alice", "bob", "gone"])
+
+        print("✅ Confluence mentions are resolved with one bulk lookup")
+
+    def test_cache_shared_with_jira(self):
+        """Test that comment prefetching warms the cache used by Jira mentions."""
+        self.confluence.prefetch_users([f"<p>{mention('alice')}</p>", f"<p>{mention('bob')}</p>"])
+
+        text = self.jira.clean_jira_text("Ping [~accountid:alice] and [~accountid:bob]")
+
+        self.assertEqual(text, "Ping @ALICE and @BOB")
+        self.bulk_lookup.assert_called_once_with(["alice", "bob"])
+
+        print("✅ Jira mentions reuse the shared user cache")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Tests for the version body store and bulk Confluence version history.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.confluence import ConfluenceFetcher
+from mcp_atlassian.config import ConfluenceConfig
+from mcp_atlassian.content_management import ConfluenceContentManager
+from mcp_atlassian.version_store import VersionBodyStore
+
+SITE = "https://example.atlassian.net/wiki"
+
+
+def make_version(number):
+    """Build a version object as returned by the version listing."""
+    return {
+        "number": number,
+        "when": f"2025-01-{number:02d}T10:00:00.000Z",
+        "message": f"edit {number}",
+        "by": {"displayName": "Alice", "email": "alice@example.com", "username": "alice"},
+        "minorEdit": number % 2 == 0,
+    }
+
+
+class TestVersionBodyStore(unittest.TestCase):
+    """Test cases for VersionBodyStore."""
+
+    def test_get_or_fetch(self):
+        """Test that bodies are fetched once per site, page and version."""
+        store = VersionBodyStore(max_bytes=1024)
+        fetch = MagicMock(return_value="<p>v1</p>")
+
+        self.assertEqual(store.get_or_fetch(SITE, "1", 1, fetch), "<p>v1</p>")
+        self.assertEqual(store.get_or_fetch(SITE + "/", "1", 1, fetch), "<p>v1</p>")
+        self.assertEqual(fetch.call_count, 1)
+
+        self.assertIsNone(store.get("https://other.atlassian.net/wiki", "1", 1))
+        self.assertEqual(store.get_many(SITE, "1", [1, 2]), {1: "<p>v1</p>"})
+
+        print("✅ Version bodies are fetched once")
+
+    def test_byte_budget(self):
+        """Test LRU eviction by size and that a zero budget disables the store."""
+        store = VersionBodyStore(max_bytes=10)
+        store.put(SITE, "1", 1, "aaaa")
+        store.put(SITE, "1", 2, "bbbb")
+        store.get(SITE, "1", 1)
+        store.put(SITE, "1", 3, "cccc")
+
+        self.assertEqual(store.get_many(SITE, "1", [1, 2, 3]), {1: "aaaa", 3: "cccc"})
+        self.assertEqual(store.total_bytes(), 8)
+
+        disabled = VersionBodyStore(max_bytes=0)
+        disabled.put(SITE, "1", 1, "aaaa")
+        self.assertEqual(len(disabled), 0)
+
+        print("✅ Version store stays within its byte budget")
+
+
+class TestConfluencePageHistory(unittest.TestCase):
+    """Test bulk version history retrieval in ConfluenceFetcher."""
+
+    def setUp(self):
+        """Set up a ConfluenceFetcher with a mocked version listing."""
+        self.env_patcher = patch.dict('os.environ', {
+            'CONFLUENCE_URL': SITE,
+            'CONFLUENCE_USERNAME': 'test@example.com',
+            'CONFLUENCE_API_TOKEN': 'test-token',
+        })
+        self.env_patcher.start()
+
+        self.confluence_patcher = patch('mcp_atlassian.confluence.Confluence')
+        self.mock_confluence = self.confluence_patcher.start().return_value
+
+        self.store_patcher = patch('mcp_atlassian.confluence.version_store', VersionBodyStore(max_bytes=1024 * 1024))
+        self.store = self.store_patcher.start()
+
+        self.fetcher = ConfluenceFetcher()
+        self.requests = []
+
+        # 250 versions, listed newest first in pages of 100 linked by cursors
+        async def get_json(path, params=None):
+            self.requests.append((path, params))
+            if path == "/rest/api/content/7":
+                return {"body": {"storage": {"value": f"<p>body {params['version']}</p>"}}}
+            cursor = 0 if params else int(path.rsplit("=", 1)[1])
+            numbers = range(250 - cursor, max(250 - cursor - 100, 0), -1)
+            page = {"results": [make_version(n) for n in numbers], "_links": {}}
+            if cursor + 100 < 250:
+                page["_links"]["next"] = f"/rest/api/content/7/version?limit=100&cursor={cursor + 100}"
+            return page
+
+        self.fetcher._get_json_async = get_json
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.store_patcher.stop()
+        self.confluence_patcher.stop()
+        self.env_patcher.stop()
+
+    def test_history_follows_cursor(self):
+        """Test that the whole history takes one request per listing page."""
+        versions = self.fetcher.get_page_history("7", limit=500)
+
+        self.assertEqual([v["number"] for v in versions], list(range(250, 0, -1)))
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(versions[0]["author"]["name"], "Alice")
+        self.assertTrue(versions[0]["minor_edit"])
+        self.mock_confluence.get_page_by_id.assert_not_called()
+
+        print("✅ Page history is listed in bulk")
+
+    def test_history_range_with_bodies(self):
+        """Test a version range with bodies, reusing the version store."""
+        self.store.put(SITE, "7", 120, "<p>cached</p>")
+
+        versions = self.fetcher.get_page_history("7", limit=50, include_bodies=True,
+                                                 from_version=118, to_version=121)
+
+        self.assertEqual([v["number"] for v in versions], [121, 120, 119, 118])
+        self.assertEqual([v["body"] for v in versions],
+                         ["<p>body 121</p>", "<p>cached</p>", "<p>body 119</p>", "<p>body 118</p>"])
+
+        body_requests = [params["version"] for path, params in self.requests if path == "/rest/api/content/7"]
+        self.assertEqual(sorted(body_requests), [118, 119, 121])
+        self.assertEqual(self.fetcher.get_version_body("7", 119), "<p>body 119</p>")
+
+        print("✅ Version bodies are hydrated concurrently for a range")
+
+
+class TestContentManagerVersions(unittest.TestCase):
+    """Test compare_versions and restore_version through the version store."""
+
+    def setUp(self):
+        """Set up a content manager with a mocked API."""
+        self.store_patcher = patch('mcp_atlassian.content_management.version_store', VersionBodyStore(max_bytes=1024))
+        self.store_patcher.start()
+
+        self.manager = ConfluenceContentManager(ConfluenceConfig(url=SITE, username="u", api_token="t"))
+        bodies = {1: "<h1>Runbook</h1><p>Drain first.</p>", 2: "<h1>Runbook</h1><p>Drain and wait.</p>"}
+
+        def api_request(method, endpoint, data=None, params=None, files=None):
+            if method == "PUT":
+                return {"version": data["version"], "body": data["body"]}
+            if params and "version" in params:
+                return {"body": {"storage": {"value": bodies[params["version"]]}}}
+            return {"title": "Runbook", "type": "page", "version": {"number": 2}}
+
+        self.manager._make_api_request = MagicMock(side_effect=api_request)
+
+    def tearDown(self):
+        """Clean up patches."""
+        self.store_patcher.stop()
+
+    def test_compare_and_restore(self):
+        """Test a local diff, then a restore that reuses the stored body."""
+        comparison = self.manager.compare_versions("7", 1, 2)
+
+        self.assertEqual((comparison["lines_added"], comparison["lines_removed"]), (1, 1))
+        self.assertIn("-Drain first.", comparison["diff"])
+        self.assertIn("+Drain and wait.", comparison["diff"])
+
+        restored = self.manager.restore_version("7", 1)
+
+        self.assertEqual(restored["version"]["number"], 3)
+        self.assertEqual(restored["body"]["storage"]["value"], "<h1>Runbook</h1><p>Drain first.</p>")
+        version_fetches = [call for call in self.manager._make_api_request.call_args_list
+                           if call.kwargs.get("params") and "version" in call.kwargs["params"]]
+        self.assertEqual(len(version_fetches), 2)
+
+        print("✅ Version comparison and restore reuse stored bodies")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+"""
+Tests for incremental worklog ingestion.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from mcp_atlassian.worklog_store import WorklogStore
+
+SITE = "https://example.atlassian.net"
+
+
+class FakeWorklogs:
+    """Bulk worklog endpoints over a mutable set of worklogs."""
+
+    def __init__(self, page_size=1000):
+        self.page_size = page_size
+        self.clock = int(time.time() * 1000)
+        self.worklogs = {}
+        self.deleted = {}
+        self.listed = []
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.fail = False
+        self.listing = threading.Event()
+        self.gate = None
+
+    def log(self, worklog_id, issue_id, author, hours, started="2025-01-06T09:00:00.000+0000"):
+        self.clock += 1
+        self.worklogs[worklog_id] = {
+            "id": str(worklog_id), "issueId": str(issue_id), "author": {"displayName": author},
+            "timeSpentSeconds": hours * 3600, "started": started, "updatedTime": self.clock,
+        }
+
+    def delete(self, worklog_id):
+        self.clock += 1
+        del self.worklogs[worklog_id]
+        self.deleted[worklog_id] = self.clock
+
+    def feed(self, kind, since):
+        if self.fail:
+            raise ValueError("Jira worklog feed failed: 503")
+        changes = sorted(
+            (updated, worklog_id) for worklog_id, updated in (
+                ((w, v["updatedTime"]) for w, v in self.worklogs.items()) if kind == "updated"
+                else self.deleted.items()
+            ) if updated > since
+        )[:self.page_size]
+        return {
+            "values": [{"worklogId": worklog_id, "updatedTime": updated} for updated, worklog_id in changes],
+            "since": since,
+            "until": changes[-1][0] if changes else since,
+            "lastPage": len(changes) < self.page_size,
+        }
+
+    def list(self, ids):
+        with self.lock:
+            self.listed.extend(ids)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        self.listing.set()
+        if self.gate is not None:
+            self.gate.wait(10)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return [self.worklogs[i] for i in ids if i in self.worklogs]
+
+
+class TestWorklogStore(unittest.TestCase):
+    """Test cases for the WorklogStore class."""
+
+    def setUp(self):
+        """Set up a store in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = WorklogStore(path=os.path.join(self.temp_dir.name, "worklogs.sqlite3"),
+                                  refresh_seconds=0, concurrency=4)
+        self.jira = FakeWorklogs()
+
+    def tearDown(self):
+        """Close and remove the store."""
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def totals(self, project="OPS", issue_types=None):
+        """Get the totals of a project, syncing through the fake endpoints."""
+        return self.store.get_project_totals(SITE, project, issue_types or {1: "Bug", 2: "Task"},
+                                             self.jira.feed, self.jira.list)
+
+    def test_complete_and_incremental_totals(self):
+        """Test that every worklog counts and later syncs only fetch changed worklogs."""
+        self.jira.page_size = 50
+        for n in range(1, 301):
+            self.jira.log(n, 1 if n % 3 else 2, f"User {n % 2}", 1, f"2025-01-{n % 20 + 1:02d}T09:00:00.000+0000")
+        self.jira.log(900, 99, "Other project", 5)
+
+        totals = self.totals()
+        self.assertEqual(sum(totals["user"].values()), 300 * 3600)
+        self.assertEqual(totals["type"], {"Bug": 200 * 3600, "Task": 100 * 3600})
+        self.assertEqual(list(totals["day"]), sorted(totals["day"]))
+        self.assertEqual(sum(totals["week"].values()), 300 * 3600)
+        self.assertGreater(self.jira.peak, 1)
+
+        self.jira.listed = []
+        self.jira.log(5, 2, "User 1", 3)
+        self.jira.log(301, 1, "User 2", 2)
+        self.jira.delete(7)
+        totals = self.totals()
+
+        self.assertEqual(sorted(self.jira.listed), [5, 301])
+        self.assertEqual(totals["user"], {"User 0": 150 * 3600, "User 1": 151 * 3600, "User 2": 2 * 3600})
+        self.assertEqual(totals["type"], {"Bug": 200 * 3600, "Task": 103 * 3600})
+
+        print("✅ Worklog totals are complete and updated incrementally")
+
+    def test_issue_mapping_changes(self):
+        """Test that totals follow issues changing type or moving between projects."""
+        self.jira.log(1, 1, "Alice", 2)
+        self.jira.log(2, 2, "Bob", 1)
+        self.totals()
+
+        totals = self.totals(issue_types={1: "Story"})
+        self.assertEqual(totals["type"], {"Story": 2 * 3600})
+        self.assertEqual(totals["user"], {"Alice": 2 * 3600})
+
+        moved = self.totals(project="WEB", issue_types={2: "Task"})
+        self.assertEqual(moved["user"], {"Bob": 3600})
+
+        print("✅ Totals follow issue type and project changes")
+
+    def test_failed_sync(self):
+        """Test that a failed sync serves stored totals, or fails if nothing was synced."""
+        self.jira.log(1, 1, "Alice", 2)
+        self.jira.fail = True
+        with self.assertRaises(ValueError):
+            self.totals()
+
+        self.jira.fail = False
+        self.totals()
+        self.jira.log(2, 1, "Alice", 1)
+        self.jira.fail = True
+        self.assertEqual(self.totals()["user"], {"Alice": 2 * 3600})
+
+        self.jira.fail = False
+        self.assertEqual(self.totals()["user"], {"Alice": 3 * 3600})
+
+        print("✅ Failed syncs fall back to stored totals")
+
+    def test_first_sync_horizon(self):
+        """Test that the first sync only ingests worklogs updated within the configured history."""
+        self.store.since_days = 30
+        now = self.jira.clock
+        self.jira.clock = now - 60 * 86400 * 1000
+        self.jira.log(1, 1, "Alice", 2)
+        self.jira.clock = now
+        self.jira.log(2, 1, "Bob", 1)
+
+        self.assertEqual(self.totals()["user"], {"Bob": 3600})
+
+        print("✅ The first sync starts at the configured horizon")
+
+    def test_reads_during_sync(self):
+        """Test that reads serve stored totals while another call syncs the site."""
+        self.jira.log(1, 1, "Alice", 2)
+        self.totals()
+        self.jira.log(2, 1, "Bob", 1)
+        self.jira.listing.clear()
+        self.jira.gate = threading.Event()
+
+        syncing = threading.Thread(target=self.totals)
+        syncing.start()
+        self.assertTrue(self.jira.listing.wait(5))
+        self.assertEqual(self.totals(project="WEB", issue_types={2: "Task"})["user"], {})
+        self.assertEqual(self.totals()["user"], {"Alice": 2 * 3600})
+        self.assertTrue(syncing.is_alive())
+
+        self.jira.gate.set()
+        syncing.join(5)
+        self.assertEqual(self.totals()["user"], {"Alice": 2 * 3600, "Bob": 3600})
+
+        print("✅ Reads serve stored totals during a sync")
+
+
+if __name__ == '__main__':
+    unittest.main()